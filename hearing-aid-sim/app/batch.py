@@ -0,0 +1,452 @@
+"""
+일괄 예측 CLI
+Streamlit 없이 CSV/JSONL 입력 파일 전체를 예측하여 JSONL로 저장
+
+사용법 (hearing-aid-sim 디렉터리에서):
+    python -m app.batch score input.csv -o output.jsonl
+    python -m app.batch score input.jsonl -o output.jsonl --workers 4 --chunk-size 500
+    python -m app.batch stream input.csv -o output.jsonl --errors errors.jsonl
+    python -m app.batch compare input.jsonl --profile trial=weights.trial.json -o scores.jsonl
+    python -m app.batch calibrate outcomes.csv --target observed_satisfaction -o weights.calibrated.json
+    python -m app.batch reports input.csv -o reports.zip --workers 4 --errors report_errors.jsonl
+    python -m app.batch validate center.csv -o clean.jsonl --errors errors.jsonl
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from .core.pipeline import detect_format, iter_records, score_record, run_stream, validate_record, Throughput
+from .core.preprocess import preprocess_inputs
+from .core.weights import get_compiled_weights, DEFAULT_WEIGHTS_PATH
+from .report.bulk import write_report_zip, parse_visit_date, DEFAULT_DATE_FIELD, DEFAULT_CENTER_FIELD, DEFAULT_WRITER
+
+
+DEFAULT_CHUNK_SIZE = 500
+
+# 워커 프로세스별 가중치 (초기화 시 한 번만 로드)
+_worker_weights = None
+_worker_confidence = False
+
+
+def _init_worker(weights_path: Optional[str], confidence: bool = False):
+    """워커 프로세스 초기화 - 가중치를 한 번 로드 및 컴파일"""
+    global _worker_weights, _worker_confidence
+    _worker_weights = get_compiled_weights(weights_path)
+    _worker_confidence = confidence
+
+
+def _score_chunk(chunk: list[tuple[int, dict]]) -> list[dict]:
+    """레코드 묶음 예측 (워커 프로세스에서 실행)"""
+    results = []
+    for index, input_data in chunk:
+        result = score_record(input_data, _worker_weights, _worker_confidence)
+        result["index"] = index
+        results.append(result)
+    return results
+
+
+def chunked(records: Iterable[dict], chunk_size: int) -> Iterator[list[tuple[int, dict]]]:
+    """(레코드 번호, 레코드) 목록을 chunk_size개씩 묶기"""
+    iterator = enumerate(records)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def score_records(
+    records: Iterable[dict],
+    weights_path: Optional[str] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    confidence: bool = False
+) -> Iterator[dict]:
+    """
+    레코드 전체 예측 (입력 순서 유지)
+
+    Args:
+        records: UserInput 입력 딕셔너리 iterable
+        weights_path: 가중치 파일 경로 (None이면 기본 파일)
+        workers: 워커 프로세스 수 (None이면 CPU 수, 1 이하이면 현재 프로세스에서 실행)
+        chunk_size: 워커에 한 번에 넘길 레코드 수
+        confidence: 몬테카를로 신뢰도 추정 포함 여부
+
+    Yields:
+        score_record() 결과 + "index" (입력 순서)
+    """
+    chunks = chunked(records, chunk_size)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1:
+        _init_worker(weights_path, confidence)
+        for chunk in chunks:
+            yield from _score_chunk(chunk)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(weights_path, confidence)
+    ) as executor:
+        # 진행 중인 묶음 수를 제한하여 입력 전체를 한 번에 메모리에 올리지 않음
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_score_chunk, chunk))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def run_score(args) -> int:
+    """score 명령 실행"""
+    counter = Throughput()
+
+    records = iter_records(args.input, args.format)
+    results = score_records(
+        records,
+        weights_path=args.weights,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        confidence=args.confidence
+    )
+
+    out = open(args.output, "w", encoding="utf-8") if args.output != "-" else sys.stdout
+    try:
+        for result in results:
+            counter.add(result["ok"])
+            out.write(json.dumps(result, ensure_ascii=False) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print(f"처리 완료: {counter.format()}", file=sys.stderr)
+    return 0
+
+
+def run_stream_command(args) -> int:
+    """stream 명령 실행 (단일 프로세스, 메모리 사용량 일정)"""
+    out = open(args.output, "w", encoding="utf-8") if args.output != "-" else sys.stdout
+    errors_out = open(args.errors, "w", encoding="utf-8") if args.errors else None
+    try:
+        counter = run_stream(
+            args.input,
+            out,
+            errors_out=errors_out,
+            weights=get_compiled_weights(args.weights),
+            input_format=args.format,
+            progress=lambda c: print(f"진행 중: {c.format()}", file=sys.stderr),
+            progress_every=args.progress_every,
+            confidence=args.confidence
+        )
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        if errors_out is not None:
+            errors_out.close()
+
+    print(f"처리 완료: {counter.format()}", file=sys.stderr)
+    return 0
+
+
+def run_compare(args) -> int:
+    """compare 명령 실행 (여러 가중치 프로파일 A/B 비교)"""
+    # numpy/프로파일 모듈은 이 명령에서만 필요하므로 실행 시점에 로드
+    import numpy as np
+    from .core.profiles import WeightProfiles, summarize_profile_scores
+
+    profiles = WeightProfiles()
+    if not args.no_default:
+        profiles.add("default", DEFAULT_WEIGHTS_PATH)
+    for spec in args.profile:
+        name, sep, path = spec.partition("=")
+        if not sep:
+            name, path = None, spec
+        profiles.add(name or Path(path).stem, path)
+
+    counter = Throughput()
+    all_scores = []
+    all_scored = []
+    out = open(args.output, "w", encoding="utf-8") if args.output != "-" else sys.stdout
+    try:
+        for chunk in chunked(iter_records(args.input, args.format), args.chunk_size):
+            indices = []
+            features_list = []
+            for index, input_data in chunk:
+                user_input, _ = validate_record(input_data)
+                counter.add(user_input is not None)
+                if user_input is not None:
+                    indices.append(index)
+                    features_list.append(preprocess_inputs(user_input))
+            if not features_list:
+                continue
+
+            result = profiles.score_batch(features_list)
+            scores, scored = result["final_score"], result["scored"]
+            all_scores.append(scores)
+            all_scored.append(scored)
+            for column, index in enumerate(indices):
+                # binaural 섹션이 없는 프로파일의 단측 착용 행은 null (다른 프로파일 점수는 그대로)
+                row = {
+                    name: int(scores[p, column]) if scored[p, column] else None
+                    for p, name in enumerate(profiles.names)
+                }
+                out.write(json.dumps({"index": index, "scores": row}, ensure_ascii=False) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    if all_scores:
+        result = {
+            "profiles": profiles.names,
+            "final_score": np.concatenate(all_scores, axis=1),
+            "scored": np.concatenate(all_scored, axis=1),
+        }
+        total = result["final_score"].shape[1]
+        for item in summarize_profile_scores(result):
+            if item["mean"] is None or item["mean_delta"] is None:
+                print(f"{item['profile']}: 점수를 계산한 레코드 없음", file=sys.stderr)
+                continue
+            unscored = total - item["scored"]
+            note = f", 단측 착용 {unscored}건 제외 (binaural 설정 없음)" if unscored else ""
+            print(
+                f"{item['profile']}: 평균 {item['mean']:.1f}점 (기준 대비 {item['mean_delta']:+.2f}), "
+                f"점수 변경 {item['changed_ratio'] * 100:.1f}%{note}",
+                file=sys.stderr
+            )
+    print(f"처리 완료: {counter.format()}", file=sys.stderr)
+    return 0
+
+
+def run_calibrate(args) -> int:
+    """calibrate 명령 실행 (관측 만족도로 가중치 보정)"""
+    from .core.calibration import fit_weights, DEFAULT_FIT_TERMS
+
+    counter = Throughput()
+    features_list = []
+    observed = []
+    for input_data in iter_records(args.input, args.format):
+        target = input_data.pop(args.target, None)
+        user_input, _ = validate_record(input_data)
+        try:
+            target = float(target)
+        except (TypeError, ValueError):
+            user_input = None
+        counter.add(user_input is not None)
+        if user_input is not None:
+            features_list.append(preprocess_inputs(user_input))
+            observed.append(target)
+
+    if not features_list:
+        print(f"보정할 레코드가 없습니다. ('{args.target}' 열 확인)", file=sys.stderr)
+        return 1
+
+    terms = tuple(args.terms.split(",")) if args.terms else DEFAULT_FIT_TERMS
+    weights, report = fit_weights(
+        features_list,
+        observed,
+        base_weights=get_compiled_weights(args.weights),
+        terms=terms,
+        l2=args.l2,
+        integer=not args.no_integer
+    )
+
+    out = open(args.output, "w", encoding="utf-8") if args.output != "-" else sys.stdout
+    try:
+        json.dump(weights, out, ensure_ascii=False, indent=2)
+        out.write("\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print(
+        f"RMSE {report['rmse_before']:.2f} → {report['rmse_after']:.2f}, "
+        f"MAE {report['mae_before']:.2f} → {report['mae_after']:.2f}",
+        file=sys.stderr
+    )
+    if not report["applied"]:
+        print("보정 결과가 기존 가중치보다 나빠 기존 가중치를 그대로 저장했습니다.", file=sys.stderr)
+    print(f"처리 완료: {counter.format()}", file=sys.stderr)
+    return 0
+
+
+def visit_date_arg(value: str) -> str:
+    """--visit-date 값 확인 (YYYY-MM-DD)"""
+    if parse_visit_date(value) is None:
+        raise argparse.ArgumentTypeError(f"날짜 형식은 YYYY-MM-DD입니다: {value}")
+    return value
+
+
+def run_reports(args) -> int:
+    """reports 명령 실행 (고객별 Word 리포트 일괄 생성 → ZIP)"""
+    errors_out = open(args.errors, "w", encoding="utf-8") if args.errors else None
+
+    def on_error(error: dict):
+        if errors_out is not None:
+            errors_out.write(json.dumps(error, ensure_ascii=False) + "\n")
+
+    try:
+        counter = write_report_zip(
+            iter_records(args.input, args.format),
+            args.output,
+            per_center=args.per_center,
+            date_field=args.date_field,
+            center_field=args.center_field,
+            default_date=args.visit_date,
+            on_error=on_error,
+            progress=lambda c: print(f"진행 중: {c.format()}", file=sys.stderr),
+            progress_every=args.progress_every,
+            weights_path=args.weights,
+            workers=args.workers,
+            charts=not args.no_charts,
+            chart_type=args.chart,
+            writer=args.writer
+        )
+    finally:
+        if errors_out is not None:
+            errors_out.close()
+
+    print(f"처리 완료: {counter.format()}", file=sys.stderr)
+    return 0
+
+
+def run_validate(args) -> int:
+    """validate 명령 실행 (열 단위 일괄 검증 → 통과 행/오류 행 분리)"""
+    from .core.columnar import read_csv_columns, validate_columns, validate_records
+
+    counter = Throughput()
+    if (args.format or detect_format(args.input)) == "csv":
+        # CSV는 행 딕셔너리 없이 열 단위로 읽어서 검증
+        columns, size = read_csv_columns(args.input)
+        result = validate_columns(columns, size)
+        values = {name: column.tolist() for name, column in columns.items()}
+
+        def source(index: int) -> dict:
+            return {name: column[index] for name, column in values.items() if column[index] not in ("", None)}
+    else:
+        records = list(iter_records(args.input, args.format))
+        result = validate_records(records)
+        source = records.__getitem__
+    counter.total, counter.failed = result.size, result.n_invalid
+
+    if args.output:
+        out = open(args.output, "w", encoding="utf-8") if args.output != "-" else sys.stdout
+        try:
+            # 원본 행(방문일/센터 등 추가 열 포함)에 정리된 값과 PTA/비대칭 계산 결과를 덮어씀
+            for index, record in zip(result.index.tolist(), result.records()):
+                out.write(json.dumps({**source(index), **record}, ensure_ascii=False) + "\n")
+        finally:
+            if out is not sys.stdout:
+                out.close()
+
+    error_rows = result.error_rows()
+    if args.errors:
+        with open(args.errors, "w", encoding="utf-8") as errors_out:
+            for row in error_rows:
+                row["input"] = source(row["index"])
+                errors_out.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+    summary = Counter((error["field"], error["message"]) for error in result.errors)
+    for (field, message), count in summary.most_common(args.top_errors):
+        print(f"{count}건  {field or '(레코드)'}: {message}", file=sys.stderr)
+    print(f"검증 완료: {counter.format()}", file=sys.stderr)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """CLI 인자 파서"""
+    parser = argparse.ArgumentParser(
+        prog="python -m app.batch",
+        description="보청기 만족도 일괄 예측"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    score_parser = subparsers.add_parser("score", help="입력 파일 전체 예측")
+    score_parser.add_argument("input", help="입력 파일 (.csv 또는 .jsonl)")
+    score_parser.add_argument("-o", "--output", default="-", help="출력 JSONL 파일 (기본: 표준 출력)")
+    score_parser.add_argument("--format", choices=["csv", "jsonl"], default=None, help="입력 형식 (기본: 확장자로 판별)")
+    score_parser.add_argument("--weights", default=None, help="가중치 파일 경로 (기본: weights.default.json)")
+    score_parser.add_argument("--workers", type=int, default=None, help="워커 프로세스 수 (기본: CPU 수, 1이면 단일 프로세스)")
+    score_parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="워커당 묶음 크기")
+    score_parser.add_argument("--confidence", action="store_true", help="몬테카를로 점수 구간/신뢰도 포함")
+    score_parser.set_defaults(func=run_score)
+
+    stream_parser = subparsers.add_parser("stream", help="입력 파일을 한 건씩 스트리밍 예측 (전처리 특징 포함)")
+    stream_parser.add_argument("input", help="입력 파일 (.csv 또는 .jsonl)")
+    stream_parser.add_argument("-o", "--output", default="-", help="출력 JSONL 파일 (기본: 표준 출력)")
+    stream_parser.add_argument("--errors", default=None, help="검증 실패 레코드 JSONL 파일 (기본: 기록 안 함)")
+    stream_parser.add_argument("--format", choices=["csv", "jsonl"], default=None, help="입력 형식 (기본: 확장자로 판별)")
+    stream_parser.add_argument("--weights", default=None, help="가중치 파일 경로 (기본: weights.default.json)")
+    stream_parser.add_argument("--progress-every", type=int, default=10000, help="진행 상황 출력 간격 (건)")
+    stream_parser.add_argument("--confidence", action="store_true", help="몬테카를로 점수 구간/신뢰도 포함")
+    stream_parser.set_defaults(func=run_stream_command)
+
+    compare_parser = subparsers.add_parser("compare", help="여러 가중치 프로파일로 동시에 예측하여 비교")
+    compare_parser.add_argument("input", help="입력 파일 (.csv 또는 .jsonl)")
+    compare_parser.add_argument("--profile", action="append", default=[], help="비교할 프로파일 (이름=경로, 여러 번 지정 가능)")
+    compare_parser.add_argument("--no-default", action="store_true", help="기본 가중치(default)를 비교 대상에서 제외")
+    compare_parser.add_argument("-o", "--output", default="-", help="출력 JSONL 파일 (기본: 표준 출력)")
+    compare_parser.add_argument("--format", choices=["csv", "jsonl"], default=None, help="입력 형식 (기본: 확장자로 판별)")
+    compare_parser.add_argument("--chunk-size", type=int, default=5000, help="한 번에 비교할 레코드 수")
+    compare_parser.set_defaults(func=run_compare)
+
+    calibrate_parser = subparsers.add_parser("calibrate", help="관측 만족도로 가중치 보정")
+    calibrate_parser.add_argument("input", help="입력 파일 (.csv 또는 .jsonl, 입력 항목 + 관측 만족도)")
+    calibrate_parser.add_argument("-o", "--output", default="-", help="보정된 가중치 JSON 파일 (기본: 표준 출력)")
+    calibrate_parser.add_argument("--target", default="observed_satisfaction", help="관측 만족도 열 이름 (0~100)")
+    calibrate_parser.add_argument("--format", choices=["csv", "jsonl"], default=None, help="입력 형식 (기본: 확장자로 판별)")
+    calibrate_parser.add_argument("--weights", default=None, help="시작 가중치 파일 경로 (기본: weights.default.json)")
+    calibrate_parser.add_argument("--terms", default=None, help="보정할 항목 (쉼표 구분, 기본: experience/tinnitus를 제외한 가산 항목 전체)")
+    calibrate_parser.add_argument("--l2", type=float, default=1.0, help="기존 가중치 쪽 규제 강도")
+    calibrate_parser.add_argument("--no-integer", action="store_true", help="정수 제약 없이 실수 가중치로 저장")
+    calibrate_parser.set_defaults(func=run_calibrate)
+
+    reports_parser = subparsers.add_parser("reports", help="고객별 Word 리포트 일괄 생성 (ZIP)")
+    reports_parser.add_argument("input", help="입력 파일 (.csv 또는 .jsonl, 입력 항목 + 방문일/센터)")
+    reports_parser.add_argument("-o", "--output", required=True, help="출력 ZIP 파일 (--per-center이면 센터별 ZIP 디렉터리)")
+    reports_parser.add_argument("--per-center", action="store_true", help="센터별로 ZIP 파일 나누기")
+    reports_parser.add_argument("--errors", default=None, help="실패 레코드 JSONL 파일 (기본: 기록 안 함)")
+    reports_parser.add_argument("--format", choices=["csv", "jsonl"], default=None, help="입력 형식 (기본: 확장자로 판별)")
+    reports_parser.add_argument("--weights", default=None, help="가중치 파일 경로 (기본: weights.default.json)")
+    reports_parser.add_argument("--workers", type=int, default=None, help="워커 프로세스 수 (기본: CPU 수, 1이면 단일 프로세스)")
+    reports_parser.add_argument("--date-field", default=DEFAULT_DATE_FIELD, help="방문일 열 이름 (파일 이름/작성일용)")
+    reports_parser.add_argument("--center-field", default=DEFAULT_CENTER_FIELD, help="센터 열 이름 (폴더/ZIP 구분용)")
+    reports_parser.add_argument(
+        "--visit-date", type=visit_date_arg, default=None,
+        help="방문일 열이 없을 때 파일 이름/작성일에 쓸 날짜 (YYYY-MM-DD, 기본: 오늘)"
+    )
+    reports_parser.add_argument("--chart", choices=["bar", "gauge"], default="bar", help="점수 차트 종류")
+    reports_parser.add_argument("--no-charts", action="store_true", help="청력도/점수 차트 이미지 생략")
+    reports_parser.add_argument("--writer", choices=["python-docx", "ooxml"], default=DEFAULT_WRITER, help="Word 문서 작성 방식")
+    reports_parser.add_argument("--progress-every", type=int, default=100, help="진행 상황 출력 간격 (건)")
+    reports_parser.set_defaults(func=run_reports)
+
+    validate_parser = subparsers.add_parser("validate", help="입력 파일 전체를 열 단위로 검증 (오류 표 + 통과 행)")
+    validate_parser.add_argument("input", help="입력 파일 (.csv 또는 .jsonl)")
+    validate_parser.add_argument("-o", "--output", default=None, help="통과 행 JSONL 파일 (- 이면 표준 출력, 기본: 기록 안 함)")
+    validate_parser.add_argument("--errors", default=None, help="오류 행 JSONL 파일 (기본: 기록 안 함)")
+    validate_parser.add_argument("--format", choices=["csv", "jsonl"], default=None, help="입력 형식 (기본: 확장자로 판별)")
+    validate_parser.add_argument("--top-errors", type=int, default=10, help="요약 출력할 오류 종류 수")
+    validate_parser.set_defaults(func=run_validate)
+
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """CLI 진입점"""
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
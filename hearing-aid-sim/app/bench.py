@@ -0,0 +1,591 @@
+"""
+성능 벤치마크
+입력 검증 → 전처리 → 예측 → 요약 → 리포트/차트/Word 생성 단계별 처리 시간을
+합성 고객 집단 크기별로 측정하고 저장된 기준값과 비교
+
+사용법 (hearing-aid-sim 디렉터리에서):
+    python -m app.bench                               # 기본 크기(10, 100, 1000) 측정 + 기준값 비교
+    python -m app.bench --sizes 10,100 -o result.json  # 결과 JSON 저장
+    python -m app.bench --save-baseline               # 현재 결과를 기준값으로 저장
+    python -m app.bench --cases predict,docx --repeat 5
+    python -m app.bench --imports                     # 모듈 import 시간 측정 + 목표 시간 비교
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+from .core.schema import UserInput
+from .core.preprocess import preprocess_inputs
+from .core.predictor import predict_satisfaction, get_satisfaction_level
+from .core.summarizer import generate_summary, generate_recommendations
+from .core.report import generate_text_report, generate_json_report
+
+
+# 기준값 파일 (배포 서버에서 --save-baseline으로 생성)
+BASELINE_PATH = Path(__file__).parent.parent / "benchmarks" / "baseline.json"
+
+DEFAULT_SIZES = (10, 100, 1000)
+DEFAULT_REPEAT = 3
+# 기준값 대비 이 비율 이상 느려지면 회귀로 판단
+DEFAULT_THRESHOLD = 0.2
+# 1회 측정 최소 시간 (짧은 항목은 이 시간이 될 때까지 반복하여 측정 오차 감소)
+MIN_RUN_SECONDS = 0.05
+
+FREQUENCIES = (250, 500, 1000, 2000, 4000, 8000)
+
+# import 시간 측정 모듈 → 목표 시간 (ms, None이면 측정만)
+# 예측 핵심(app.core)은 무거운 라이브러리 없이 빠르게 로드되어야 함 (schema/pipeline은 pydantic 포함)
+IMPORT_TARGETS: dict[str, Optional[float]] = {
+    "app.core": 100,
+    "app.core.predictor": 100,
+    "app.core.pipeline": None,
+    "app.report.bundle": 100,
+    "app.report.bulk": None,
+    "app.batch": None,
+}
+# import 후 로드 여부를 함께 기록할 외부 라이브러리
+HEAVY_MODULES = ("pydantic", "numpy", "pandas", "plotly", "docx", "PIL", "kaleido", "streamlit")
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def synthetic_inputs(size: int, seed: int = 0) -> list[dict]:
+    """
+    합성 고객 입력 생성 (UserInput 입력 딕셔너리)
+
+    80%는 주파수별 청력도, 나머지는 PTA만 입력한 형태로 생성합니다.
+
+    Args:
+        size: 고객 수
+        seed: 난수 시드
+
+    Returns:
+        입력 딕셔너리 목록
+    """
+    rng = random.Random(seed)
+    records = []
+    for i in range(size):
+        record = {
+            "speech_score_left": rng.randint(20, 100),
+            "speech_score_right": rng.randint(20, 100),
+            "age": rng.randint(40, 95),
+            "lifestyle": rng.choice(["quiet", "mixed", "noisy"]),
+            "experience": rng.random() < 0.4,
+            "tinnitus": rng.random() < 0.3,
+            "desired_type": rng.choice(["BTE", "RIC", "ITE", "CIC"]),
+            "budget": rng.choice(["low", "mid", "high"]),
+            "fitting_plan": rng.choice(["bilateral", "bilateral", "unilateral_left", "unilateral_right"]),
+            "customer_name": f"고객{i + 1}",
+        }
+        if rng.random() < 0.8:
+            for side in ("left", "right"):
+                level = rng.randint(20, 85)
+                for freq in FREQUENCIES:
+                    # 고주파로 갈수록 역치 상승
+                    slope = FREQUENCIES.index(freq) * rng.randint(0, 6)
+                    record[f"audiogram_{side}_{freq}hz"] = min(120, level + slope)
+        else:
+            record["audiogram_left_pta"] = rng.randint(20, 90)
+            record["audiogram_right_pta"] = rng.randint(20, 90)
+        records.append(record)
+    return records
+
+
+def prepare_cohort(size: int, seed: int = 0) -> list[dict]:
+    """
+    단계별 측정용 고객 집단 준비 (각 단계의 입력을 미리 계산)
+
+    Returns:
+        [{"input", "input_json", "user_input", "input_dict", "features", "score", "breakdown",
+          "satisfaction_level", "summary", "recommendations"}, ...]
+    """
+    cohort = []
+    for input_data in synthetic_inputs(size, seed):
+        user_input = UserInput(**input_data)
+        features = preprocess_inputs(user_input)
+        score, breakdown = predict_satisfaction(features)
+        cohort.append({
+            "input": input_data,
+            "input_json": json.dumps(input_data, ensure_ascii=False).encode("utf-8"),
+            "user_input": user_input,
+            "input_dict": user_input.model_dump(),
+            "features": features,
+            "score": score,
+            "breakdown": breakdown,
+            "satisfaction_level": get_satisfaction_level(score),
+            "summary": generate_summary(score, features, breakdown),
+            "recommendations": generate_recommendations(score, features, breakdown),
+        })
+    return cohort
+
+
+def _report_args(item: dict) -> tuple:
+    return (
+        item["input_dict"], item["features"], item["score"], item["satisfaction_level"],
+        item["summary"], item["recommendations"], item["breakdown"]
+    )
+
+
+def _bench_user_input(cohort):
+    for item in cohort:
+        UserInput(**item["input"])
+
+
+def _bench_user_input_json(cohort):
+    from .core.ingest import validate_json_lines
+    for _ in validate_json_lines(item["input_json"] for item in cohort):
+        pass
+
+
+def _bench_user_input_json_array(cohort):
+    from .core.ingest import validate_json_array
+    validate_json_array(b"[" + b",".join(item["input_json"] for item in cohort) + b"]")
+
+
+def _bench_user_input_trusted(cohort):
+    from .core.ingest import construct_trusted
+    for item in cohort:
+        construct_trusted(item["input_dict"])
+
+
+def _bench_preprocess(cohort):
+    for item in cohort:
+        preprocess_inputs(item["user_input"])
+
+
+def _bench_predict(cohort):
+    for item in cohort:
+        predict_satisfaction(item["features"])
+
+
+def _bench_summary(cohort):
+    for item in cohort:
+        generate_summary(item["score"], item["features"], item["breakdown"])
+        generate_recommendations(item["score"], item["features"], item["breakdown"])
+
+
+def _bench_text_report(cohort):
+    for item in cohort:
+        generate_text_report(*_report_args(item))
+
+
+def _bench_json_report(cohort):
+    for item in cohort:
+        generate_json_report(*_report_args(item))
+
+
+def _bench_gauge(cohort):
+    from .viz.charts import create_gauge
+    for item in cohort:
+        create_gauge(item["score"])
+
+
+def _bench_bar(cohort):
+    from .viz.charts import create_bar
+    for item in cohort:
+        create_bar(item["score"])
+
+
+def _bench_breakdown_chart(cohort):
+    from .core.predictor import get_breakdown_summary
+    from .viz.charts import create_breakdown_chart
+    for item in cohort:
+        create_breakdown_chart(get_breakdown_summary(item["breakdown"]))
+
+
+def _bench_audiogram(cohort):
+    from .viz.charts import create_audiogram
+    for item in cohort:
+        create_audiogram(item["input_dict"])
+
+
+def _bench_audiogram_png(cohort):
+    from .viz.raster import render_audiogram
+    for item in cohort:
+        render_audiogram(item["input_dict"])
+
+
+def _bench_docx(cohort):
+    from .report.word_report import build_report_docx
+    for item in cohort:
+        build_report_docx(*_report_args(item))
+
+
+def _bench_docx_ooxml(cohort):
+    from .report.word_report import build_report_docx
+    for item in cohort:
+        build_report_docx(*_report_args(item), writer="ooxml")
+
+
+def _bench_docx_images(cohort):
+    from .report.image_cache import get_image_cache
+    from .report.word_report import build_report_docx
+    from .viz.charts import create_gauge, create_audiogram
+    # 반복 측정 시 캐시 적중만 측정하지 않도록 매번 비움 (변환 비용 포함 기준)
+    get_image_cache().clear()
+    for item in cohort:
+        build_report_docx(
+            *_report_args(item),
+            chart_fig=create_gauge(item["score"]),
+            audiogram_fig=create_audiogram(item["input_dict"])
+        )
+
+
+_image_export = None
+
+
+def image_export_available() -> bool:
+    """Plotly 이미지 변환(kaleido) 사용 가능 여부 (한 번만 확인)"""
+    global _image_export
+    if _image_export is None:
+        try:
+            import plotly.graph_objects as go
+            go.Figure().to_image(format="png", width=10, height=10)
+            _image_export = True
+        except Exception:
+            _image_export = False
+    return _image_export
+
+
+# 측정 항목: 이름 → (측정 함수, 최대 측정 건수, 실행 가능 여부 확인 함수)
+# 차트/Word 생성은 건당 시간이 길어 집단 크기와 관계없이 일부만 측정 (건당 시간으로 비교)
+BENCH_CASES: dict[str, tuple[Callable, Optional[int], Optional[Callable[[], bool]]]] = {
+    "user_input": (_bench_user_input, None, None),
+    "user_input_json": (_bench_user_input_json, None, None),
+    "user_input_json_array": (_bench_user_input_json_array, None, None),
+    "user_input_trusted": (_bench_user_input_trusted, None, None),
+    "preprocess": (_bench_preprocess, None, None),
+    "predict": (_bench_predict, None, None),
+    "summary": (_bench_summary, None, None),
+    "text_report": (_bench_text_report, None, None),
+    "json_report": (_bench_json_report, None, None),
+    "gauge": (_bench_gauge, 50, None),
+    "bar": (_bench_bar, 50, None),
+    "breakdown_chart": (_bench_breakdown_chart, 50, None),
+    "audiogram": (_bench_audiogram, 50, None),
+    "audiogram_png": (_bench_audiogram_png, 50, None),
+    "docx": (_bench_docx, 50, None),
+    "docx_ooxml": (_bench_docx_ooxml, 50, None),
+    "docx_images": (_bench_docx_images, 5, image_export_available),
+}
+
+
+def run_case(name: str, cohort: list[dict], repeat: int = DEFAULT_REPEAT) -> dict:
+    """
+    측정 항목 하나 실행
+
+    Args:
+        name: BENCH_CASES 항목 이름
+        cohort: prepare_cohort() 결과
+        repeat: 반복 횟수 (최솟값 기준으로 비교)
+
+    Returns:
+        {"case", "size", "items", "loops", "repeat", "best_s", "median_s", "per_item_ms"}
+        (best_s/median_s는 loops회 실행 1회분 기준)
+        (실행할 수 없는 항목은 {"case", "size", "skipped": 사유})
+    """
+    func, max_items, available = BENCH_CASES[name]
+    if available is not None and not available():
+        return {"case": name, "size": len(cohort), "skipped": "필요한 구성 요소를 사용할 수 없습니다."}
+
+    items = cohort if max_items is None else cohort[:max_items]
+
+    def measure(loops: int) -> float:
+        started = time.perf_counter()
+        for _ in range(loops):
+            func(items)
+        return (time.perf_counter() - started) / loops
+
+    # 첫 실행(모듈 import, 캐시 준비)은 측정에서 제외하고 반복 횟수 결정
+    first = measure(1)
+    loops = max(1, min(1000, int(MIN_RUN_SECONDS / first) if first > 0 else 1000))
+
+    timings = [measure(loops) for _ in range(repeat)]
+    best = min(timings)
+    return {
+        "case": name,
+        "size": len(cohort),
+        "items": len(items),
+        "loops": loops,
+        "repeat": repeat,
+        "best_s": best,
+        "median_s": statistics.median(timings),
+        "per_item_ms": best / len(items) * 1000 if items else 0.0,
+    }
+
+
+def measure_import(module: str, repeat: int = DEFAULT_REPEAT, target_ms: Optional[float] = None) -> dict:
+    """
+    새 인터프리터에서 모듈 import 시간 측정 (인터프리터 시작 시간 제외)
+
+    Args:
+        module: 모듈 이름 (hearing-aid-sim 디렉터리 기준, 예: "app.core")
+        repeat: 측정 횟수 (최솟값 기준으로 비교)
+        target_ms: 목표 시간 (None이면 비교하지 않음)
+
+    Returns:
+        {"module", "best_ms", "median_ms", "target_ms", "status", "loaded"}
+        - status: "ok" | "slow" | None (목표 없음)
+        - loaded: import 후 로드되어 있는 HEAVY_MODULES 목록
+    """
+    code = (
+        "import json, sys, time\n"
+        "started = time.perf_counter()\n"
+        f"import {module}\n"
+        "elapsed = time.perf_counter() - started\n"
+        f"print(json.dumps([elapsed, [name for name in {HEAVY_MODULES!r} if name in sys.modules]]))\n"
+    )
+    timings = []
+    loaded = []
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+        )
+        elapsed, loaded = json.loads(completed.stdout.strip().splitlines()[-1])
+        timings.append(elapsed * 1000)
+
+    best = min(timings)
+    status = None
+    if target_ms is not None:
+        status = "ok" if best <= target_ms else "slow"
+    return {
+        "module": module,
+        "best_ms": best,
+        "median_ms": statistics.median(timings),
+        "target_ms": target_ms,
+        "status": status,
+        "loaded": loaded,
+    }
+
+
+def run_import_benchmarks(
+    targets: Optional[dict] = None,
+    repeat: int = DEFAULT_REPEAT,
+    progress: Optional[Callable[[dict], None]] = None
+) -> list[dict]:
+    """
+    모듈별 import 시간 측정
+
+    Args:
+        targets: 모듈 이름 → 목표 시간 (ms, None이면 IMPORT_TARGETS)
+        repeat: 모듈별 측정 횟수
+        progress: 모듈별 결과 콜백 (선택)
+
+    Returns:
+        measure_import() 결과 목록
+    """
+    targets = IMPORT_TARGETS if targets is None else targets
+    results = []
+    for module, target_ms in targets.items():
+        result = measure_import(module, repeat, target_ms)
+        results.append(result)
+        if progress is not None:
+            progress(result)
+    return results
+
+
+def format_import_result(result: dict) -> str:
+    """import 측정 결과 한 줄 표시"""
+    target = f"목표 {result['target_ms']:.0f} ms {result['status']}" if result["target_ms"] is not None else "목표 없음"
+    loaded = ", ".join(result["loaded"]) or "-"
+    return f"{result['module']:<20} {result['best_ms']:8.1f} ms  ({target}, 로드: {loaded})"
+
+
+def run_benchmarks(
+    sizes: Iterable[int] = DEFAULT_SIZES,
+    cases: Optional[Iterable[str]] = None,
+    repeat: int = DEFAULT_REPEAT,
+    seed: int = 0,
+    progress: Optional[Callable[[dict], None]] = None
+) -> dict:
+    """
+    집단 크기 × 측정 항목 전체 실행
+
+    Args:
+        sizes: 합성 고객 집단 크기 목록
+        cases: 측정 항목 이름 목록 (None이면 전체)
+        repeat: 항목별 반복 횟수
+        seed: 합성 데이터 시드
+        progress: 항목별 결과 콜백 (선택)
+
+    Returns:
+        {"meta": 실행 환경 정보, "results": run_case() 결과 목록}
+    """
+    cases = list(BENCH_CASES) if cases is None else list(cases)
+    unknown = [name for name in cases if name not in BENCH_CASES]
+    if unknown:
+        raise ValueError(f"알 수 없는 측정 항목입니다: {', '.join(unknown)} (가능: {', '.join(BENCH_CASES)})")
+
+    results = []
+    for size in sizes:
+        cohort = prepare_cohort(size, seed)
+        for name in cases:
+            result = run_case(name, cohort, repeat)
+            results.append(result)
+            if progress is not None:
+                progress(result)
+
+    return {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sizes": list(sizes),
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def compare_results(report: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> list[dict]:
+    """
+    기준값과 건당 처리 시간 비교
+
+    Args:
+        report: run_benchmarks() 결과
+        baseline: 저장된 기준값 (run_benchmarks() 결과와 같은 형식)
+        threshold: 회귀 판단 기준 (0.2 → 20% 이상 느려지면 회귀)
+
+    Returns:
+        [{"case", "size", "per_item_ms", "baseline_ms", "ratio", "status"}, ...]
+        - status: "regression" | "improved" | "ok" | "new" | "skipped"
+    """
+    baseline_map = {
+        (item["case"], item["size"]): item
+        for item in baseline.get("results", [])
+        if "per_item_ms" in item
+    }
+
+    rows = []
+    for item in report["results"]:
+        row = {"case": item["case"], "size": item["size"], "per_item_ms": item.get("per_item_ms"),
+               "baseline_ms": None, "ratio": None}
+        base = baseline_map.get((item["case"], item["size"]))
+        if "skipped" in item:
+            row["status"] = "skipped"
+        elif base is None or base["per_item_ms"] <= 0:
+            row["status"] = "new"
+        else:
+            ratio = item["per_item_ms"] / base["per_item_ms"]
+            row["baseline_ms"] = base["per_item_ms"]
+            row["ratio"] = ratio
+            if ratio > 1 + threshold:
+                row["status"] = "regression"
+            elif ratio < 1 / (1 + threshold):
+                row["status"] = "improved"
+            else:
+                row["status"] = "ok"
+        rows.append(row)
+    return rows
+
+
+def format_result(result: dict) -> str:
+    """측정 결과 한 줄 표시"""
+    if "skipped" in result:
+        return f"{result['case']:<12} n={result['size']:<6} 건너뜀 ({result['skipped']})"
+    return (
+        f"{result['case']:<12} n={result['size']:<6} "
+        f"{result['per_item_ms']:9.3f} ms/건  (측정 {result['items']}건, 최소 {result['best_s']:.4f}초)"
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """CLI 인자 파서"""
+    parser = argparse.ArgumentParser(
+        prog="python -m app.bench",
+        description="예측/리포트 파이프라인 성능 벤치마크"
+    )
+    parser.add_argument("--sizes", default=",".join(str(size) for size in DEFAULT_SIZES),
+                        help="합성 고객 집단 크기 (쉼표 구분)")
+    parser.add_argument("--cases", default=None, help="측정 항목 (쉼표 구분, 기본: 전체 - " + ",".join(BENCH_CASES) + ")")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="항목별 반복 횟수")
+    parser.add_argument("--seed", type=int, default=0, help="합성 데이터 시드")
+    parser.add_argument("-o", "--output", default=None, help="결과 JSON 파일 (기본: 저장 안 함)")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH), help="기준값 JSON 파일")
+    parser.add_argument("--save-baseline", action="store_true", help="현재 결과를 기준값으로 저장")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="회귀 판단 기준 (0.2 = 20%%)")
+    parser.add_argument("--imports", action="store_true", help="모듈 import 시간만 측정 (목표 시간 초과 시 종료 코드 1)")
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    CLI 진입점
+
+    Returns:
+        종료 코드 (기준값 대비 회귀가 있으면 1)
+    """
+    args = build_parser().parse_args(argv)
+
+    if args.imports:
+        results = run_import_benchmarks(
+            repeat=args.repeat,
+            progress=lambda result: print(format_import_result(result), file=sys.stderr)
+        )
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump({"imports": results}, f, ensure_ascii=False, indent=2)
+        slow = [result for result in results if result["status"] == "slow"]
+        if slow:
+            print(f"목표 시간 초과 {len(slow)}건: {', '.join(result['module'] for result in slow)}", file=sys.stderr)
+            return 1
+        return 0
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    cases = [name.strip() for name in args.cases.split(",")] if args.cases else None
+
+    report = run_benchmarks(
+        sizes=sizes,
+        cases=cases,
+        repeat=args.repeat,
+        seed=args.seed,
+        progress=lambda result: print(format_result(result), file=sys.stderr)
+    )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(baseline_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"기준값 저장: {baseline_path}", file=sys.stderr)
+        return 0
+
+    if not baseline_path.exists():
+        print(f"기준값 파일이 없습니다: {baseline_path} (--save-baseline으로 생성)", file=sys.stderr)
+        return 0
+
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    rows = compare_results(report, baseline, args.threshold)
+    regressions = [row for row in rows if row["status"] == "regression"]
+    for row in rows:
+        if row["ratio"] is not None:
+            print(
+                f"{row['case']:<12} n={row['size']:<6} {row['baseline_ms']:9.3f} → {row['per_item_ms']:9.3f} ms/건 "
+                f"(x{row['ratio']:.2f}) {row['status']}",
+                file=sys.stderr
+            )
+    if regressions:
+        print(f"성능 회귀 {len(regressions)}건 (기준 대비 {args.threshold * 100:.0f}% 이상 느려짐)", file=sys.stderr)
+        return 1
+    print("성능 회귀 없음", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
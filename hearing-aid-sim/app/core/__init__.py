@@ -0,0 +1,65 @@
+"""
+예측 핵심 패키지 (Streamlit 없이 사용 가능)
+
+입력 검증, 전처리, 예측, 요약, 가중치 관리 등 화면/리포트와 무관한 기능을 모았습니다.
+패키지 안에서는 상대 경로로만 import하므로 `app.core`(테스트, CLI)와
+`core`(streamlit run app/main.py) 어느 쪽으로도 가져올 수 있습니다.
+
+자주 쓰는 함수는 패키지에서 바로 가져올 수 있으며, 해당 모듈은 처음 사용할 때
+로드합니다 (import core 자체는 pydantic/numpy를 로드하지 않음).
+
+사용법:
+    from app.core import UserInput, preprocess_inputs, predict_satisfaction
+
+    features = preprocess_inputs(UserInput(**input_data))
+    score, breakdown = predict_satisfaction(features)
+"""
+
+import importlib
+
+
+# 공개 이름 → 정의된 모듈
+_EXPORTS = {
+    "UserInput": ".schema",
+    "PredictionOutput": ".schema",
+    "preprocess_inputs": ".preprocess",
+    "get_feature_summary": ".preprocess",
+    "predict_satisfaction": ".predictor",
+    "get_satisfaction_level": ".predictor",
+    "get_breakdown_summary": ".predictor",
+    "generate_summary": ".summarizer",
+    "generate_recommendations": ".summarizer",
+    "generate_text_report": ".report",
+    "generate_json_report": ".report",
+    "validate_record": ".pipeline",
+    "predict_record": ".pipeline",
+    "score_record": ".pipeline",
+    "validate_json_array": ".ingest",
+    "validate_json_lines": ".ingest",
+    "construct_trusted": ".ingest",
+    "load_trusted_json": ".ingest",
+    "validate_columns": ".columnar",
+    "validate_records": ".columnar",
+    "read_csv_columns": ".columnar",
+    "estimate_confidence": ".uncertainty",
+    "sweep_scenarios": ".scenario",
+    "scenario_matrix": ".scenario",
+    "get_weights": ".weights",
+    "get_compiled_weights": ".weights",
+    "get_weights_fingerprint": ".weights",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
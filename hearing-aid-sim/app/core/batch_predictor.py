@@ -0,0 +1,415 @@
+"""
+배치 만족도 예측 모듈
+NumPy 열(column) 배열 단위로 predict_satisfaction과 동일한 규칙을 벡터 연산으로 계산
+"""
+
+from typing import Iterable, Mapping, Union
+
+import numpy as np
+
+from .weights import (
+    CompiledWeights,
+    compile_weights,
+    get_compiled_weights,
+    LOSS_LEVELS,
+    LOSS_LEVEL_INDEX,
+    DEVICE_TYPES,
+    DEVICE_TYPE_INDEX,
+    LIFESTYLES,
+    LIFESTYLE_INDEX,
+    BUDGETS,
+    BUDGET_INDEX,
+    FITTING_PLANS,
+    FITTING_PLAN_INDEX,
+)
+
+
+# 청력 손실 수준 경계 (preprocess.classify_loss_level과 동일)
+LOSS_LEVEL_BINS = (40, 55, 70)
+
+# 코드 열 이름 → 허용 코드 개수
+CODE_COLUMNS = {
+    "lifestyle": len(LIFESTYLES),
+    "budget": len(BUDGETS),
+    "desired_type": len(DEVICE_TYPES),
+    "fitting_plan": len(FITTING_PLANS),
+    "loss_level": len(LOSS_LEVELS),
+}
+
+# 결과 breakdown 열 (predict_satisfaction의 breakdown 키와 동일)
+BREAKDOWN_KEYS = (
+    "base",
+    "loss_level",
+    "speech_score",
+    "lifestyle",
+    "experience",
+    "tinnitus",
+    "asymmetry_penalty",
+    "budget",
+    "type_fit",
+    "age_adjustment",
+    "unilateral_penalty",
+)
+
+
+def _lookup_ranges(values: np.ndarray, ranges: tuple) -> np.ndarray:
+    """구간 가중치 조회 (첫 번째로 일치하는 구간, 없으면 0)"""
+    dtype = np.result_type(0, *(weight for _, _, weight in ranges))
+    result = np.zeros(values.shape, dtype=dtype)
+    matched = np.zeros(values.shape, dtype=bool)
+    for low, high, weight in ranges:
+        mask = (values >= low) & (values <= high) & ~matched
+        result[mask] = weight
+        matched |= mask
+    return result
+
+
+def _codes(columns: Mapping, name: str, size: int) -> np.ndarray:
+    """범주 코드 열 검증"""
+    codes = np.asarray(columns[name])
+    if codes.dtype.kind not in "iub":
+        raise ValueError(f"'{name}' 열은 정수 코드여야 합니다 (encode_features 참고).")
+    codes = codes.astype(np.intp, copy=False)
+    if codes.size and (codes.min() < 0 or codes.max() >= size):
+        raise ValueError(f"'{name}' 열에 잘못된 코드가 있습니다 (0~{size - 1}).")
+    return codes
+
+
+def classify_loss_level_codes(pta_avg: np.ndarray) -> np.ndarray:
+    """
+    평균 PTA 배열을 청력 손실 수준 코드(LOSS_LEVELS 인덱스)로 분류
+
+    Args:
+        pta_avg: 평균 PTA 배열 (dB HL)
+
+    Returns:
+        손실 수준 코드 배열
+    """
+    return np.digitize(np.asarray(pta_avg, dtype=float), LOSS_LEVEL_BINS)
+
+
+def encode_features(features_list: Iterable[dict]) -> dict:
+    """
+    preprocess_inputs() 결과 딕셔너리 목록을 열 배열로 변환
+
+    Args:
+        features_list: 전처리된 특징 딕셔너리 목록
+
+    Returns:
+        predict_satisfaction_batch()에 전달할 열 딕셔너리
+    """
+    features_list = list(features_list)
+
+    def column(key, dtype):
+        return np.array([features[key] for features in features_list], dtype=dtype)
+
+    def codes(key, index, default=None):
+        return np.array(
+            [index[features.get(key, default)] for features in features_list],
+            dtype=np.int8
+        )
+
+    return {
+        "pta_left": column("pta_left", float),
+        "pta_right": column("pta_right", float),
+        "asymmetry_db": column("asymmetry_db", float),
+        "speech_score": column("speech_score", float),
+        "age": column("age", float),
+        "tinnitus": column("tinnitus", bool),
+        "experience": column("experience", bool),
+        "loss_level": codes("loss_level", LOSS_LEVEL_INDEX),
+        "lifestyle": codes("lifestyle", LIFESTYLE_INDEX),
+        "budget": codes("budget", BUDGET_INDEX),
+        "desired_type": codes("desired_type", DEVICE_TYPE_INDEX),
+        "fitting_plan": codes("fitting_plan", FITTING_PLAN_INDEX, "bilateral"),
+    }
+
+
+class StackedWeights:
+    """
+    여러 가중치 설정을 프로파일 축(P)으로 쌓은 NumPy 배열 묶음
+
+    모든 배열의 첫 번째 축이 프로파일이므로 (N,) 입력 열과 브로드캐스트하면
+    (P, N) 결과를 한 번의 벡터 연산으로 얻을 수 있습니다.
+    """
+
+    def __init__(self, weights_list: Iterable[CompiledWeights]):
+        self.weights = tuple(weights_list)
+        if not self.weights:
+            raise ValueError("가중치 설정이 하나 이상 필요합니다.")
+        weights = self.weights
+
+        def column(values):
+            return np.array(values)[:, np.newaxis]
+
+        self.base = column([w.base_score for w in weights])
+        self.loss_level = np.array([w.loss_level for w in weights])
+        self.lifestyle = np.array([w.lifestyle for w in weights])
+        self.budget = np.array([w.budget for w in weights])
+        self.experience = np.array([w.experience for w in weights])
+        self.tinnitus = np.array([w.tinnitus for w in weights])
+        self.type_fit = np.array([w.type_fit for w in weights])
+
+        # 구간 테이블 (0.5 단위, 인덱스 = 값 × 2)
+        self.speech_table = np.array([w.speech_score.dense() for w in weights])
+        self.speech_ranges = [w.speech_score.ranges for w in weights]
+        self.age_table = np.array([w.age.dense() for w in weights])
+        self.age_ranges = [w.age.ranges for w in weights]
+
+        self.asymmetry_threshold = column([w.asymmetry_threshold_db for w in weights])
+        self.asymmetry_per_10db = column([w.asymmetry_penalty_per_10db for w in weights])
+        self.asymmetry_max = column([w.asymmetry_max_penalty for w in weights])
+
+        # 단측 착용 상수 (binaural 섹션이 없는 프로파일은 NaN)
+        self.has_binaural = np.array([w.binaural is not None for w in weights])
+
+        def binaural(attr):
+            return column([getattr(w.binaural, attr) if w.binaural is not None else np.nan for w in weights])
+
+        self.pta_need_threshold = binaural("threshold")
+        self.base_unilateral_penalty = binaural("base_penalty")
+        self.max_unilateral_penalty = binaural("max_penalty")
+        self.relief_start_db = binaural("relief_start_db")
+        self.relief_full_db = binaural("relief_full_db")
+        self.relief_span_db = binaural("relief_span_db")
+        self.first_time_bonus = binaural("first_time_bonus")
+        self.low_budget_relief = binaural("low_budget_relief")
+        self.lifestyle_bonus = np.array([
+            [w.binaural.lifestyle_bonus[name] if w.binaural is not None else np.nan for name in LIFESTYLES]
+            for w in weights
+        ], dtype=float)
+
+    def __len__(self) -> int:
+        return len(self.weights)
+
+
+def _lookup_tables(values: np.ndarray, tables: np.ndarray, ranges_list: list) -> np.ndarray:
+    """
+    구간 가중치 조회 (P, N)
+
+    0.5 단위 값은 테이블에서 바로 가져오고, 나머지 값만 구간 목록으로 확인합니다.
+    """
+    key = values * 2
+    in_range = (key >= 0) & (key < tables.shape[1])
+    index = np.where(in_range, key, 0).astype(np.intp)
+    exact = in_range & (index == key)
+
+    dtype = np.result_type(tables.dtype, *(
+        np.result_type(0, *(weight for _, _, weight in ranges)) for ranges in ranges_list
+    ))
+    result = np.empty((tables.shape[0], values.shape[0]), dtype=dtype)
+    result[:, exact] = tables[:, index[exact]]
+
+    rest = ~exact
+    if rest.any():
+        for p, ranges in enumerate(ranges_list):
+            result[p, rest] = _lookup_ranges(values[rest], ranges)
+    return result
+
+
+def prepare_columns(columns: Mapping[str, np.ndarray]) -> dict:
+    """
+    입력 열 검증 및 파생 열(asymmetry_db, loss_level) 계산
+
+    Args:
+        columns: encode_features() 결과 형식의 열 딕셔너리
+
+    Returns:
+        dtype을 맞춘 열 딕셔너리 (asymmetry_db, loss_level이 없으면 계산해서 추가)
+
+    Raises:
+        ValueError: 범주 코드가 범위를 벗어나거나 열 길이가 다른 경우
+    """
+    prepared = {
+        "pta_left": np.asarray(columns["pta_left"], dtype=float),
+        "pta_right": np.asarray(columns["pta_right"], dtype=float),
+        "speech_score": np.asarray(columns["speech_score"], dtype=float),
+        "age": np.asarray(columns["age"], dtype=float),
+        "tinnitus": np.asarray(columns["tinnitus"], dtype=bool),
+        "experience": np.asarray(columns["experience"], dtype=bool),
+        "lifestyle": _codes(columns, "lifestyle", CODE_COLUMNS["lifestyle"]),
+        "budget": _codes(columns, "budget", CODE_COLUMNS["budget"]),
+        "desired_type": _codes(columns, "desired_type", CODE_COLUMNS["desired_type"]),
+        "fitting_plan": _codes(columns, "fitting_plan", CODE_COLUMNS["fitting_plan"]),
+    }
+
+    if columns.get("asymmetry_db") is not None:
+        prepared["asymmetry_db"] = np.asarray(columns["asymmetry_db"], dtype=float)
+    else:
+        prepared["asymmetry_db"] = np.abs(prepared["pta_left"] - prepared["pta_right"])
+
+    if columns.get("loss_level") is not None:
+        prepared["loss_level"] = _codes(columns, "loss_level", CODE_COLUMNS["loss_level"])
+    else:
+        prepared["loss_level"] = classify_loss_level_codes((prepared["pta_left"] + prepared["pta_right"]) / 2)
+
+    n = prepared["pta_left"].shape[0]
+    if any(array.shape != (n,) for array in prepared.values()):
+        raise ValueError("모든 열은 같은 길이의 1차원 배열이어야 합니다.")
+
+    return prepared
+
+
+def _unscored_stacked(cols: dict, stacked: StackedWeights) -> np.ndarray:
+    """점수를 계산할 수 없는 (프로파일, 레코드) 여부 (P, N) - binaural 섹션이 없는 프로파일의 단측 착용 행"""
+    unilateral = cols["fitting_plan"] != FITTING_PLAN_INDEX["bilateral"]
+    return ~stacked.has_binaural[:, np.newaxis] & unilateral
+
+
+def _unilateral_penalty_stacked(cols: dict, stacked: StackedWeights) -> np.ndarray:
+    """단측 착용 페널티 (P, N, binaural 섹션이 없는 프로파일은 0)"""
+    n = cols["pta_left"].shape[0]
+    unilateral = cols["fitting_plan"] != FITTING_PLAN_INDEX["bilateral"]
+    if not unilateral.any():
+        return np.zeros((len(stacked), n), dtype=np.int64)
+
+    asymmetry_db = cols["asymmetry_db"]
+    threshold = stacked.pta_need_threshold
+    left_need = np.clip((cols["pta_left"] - threshold) / 40, 0, 1)
+    right_need = np.clip((cols["pta_right"] - threshold) / 40, 0, 1)
+    need = (left_need + right_need) / 2
+
+    need = need + stacked.lifestyle_bonus[:, cols["lifestyle"]]
+    need = need + np.where(cols["experience"], 0.0, stacked.first_time_bonus)
+    need = np.clip(need, 0, 1)
+
+    relief = np.where(
+        asymmetry_db <= stacked.relief_start_db,
+        0.0,
+        np.where(
+            asymmetry_db >= stacked.relief_full_db,
+            1.0,
+            (asymmetry_db - stacked.relief_start_db) / stacked.relief_span_db
+        )
+    )
+    budget_relief = np.where(cols["budget"] == BUDGET_INDEX["low"], stacked.low_budget_relief, 0.0)
+
+    penalty = stacked.base_unilateral_penalty * need * (1 - 0.7 * relief) * (1 - budget_relief)
+    penalty = np.clip(penalty, 0, stacked.max_unilateral_penalty)
+    penalty = -np.trunc(np.where(stacked.has_binaural[:, np.newaxis], penalty, 0.0)).astype(np.int64)
+
+    return np.where(unilateral, penalty, 0)
+
+
+def _predict_stacked(cols: dict, stacked: StackedWeights) -> dict:
+    """검증된 열과 쌓인 가중치로 (P, N) breakdown 계산"""
+    n = cols["pta_left"].shape[0]
+    loss_level = cols["loss_level"]
+    asymmetry_db = cols["asymmetry_db"]
+
+    breakdown = {}
+    breakdown["base"] = np.broadcast_to(stacked.base, (len(stacked), n))
+    breakdown["loss_level"] = stacked.loss_level[:, loss_level]
+    breakdown["speech_score"] = _lookup_tables(cols["speech_score"], stacked.speech_table, stacked.speech_ranges)
+    breakdown["lifestyle"] = stacked.lifestyle[:, cols["lifestyle"]]
+    breakdown["experience"] = stacked.experience[:, cols["experience"].astype(np.intp)]
+    breakdown["tinnitus"] = stacked.tinnitus[:, cols["tinnitus"].astype(np.intp)]
+
+    # 좌우 비대칭 페널티
+    threshold = stacked.asymmetry_threshold
+    asymmetry_penalty = np.maximum(
+        np.trunc(((asymmetry_db - threshold) / 10) * stacked.asymmetry_per_10db),
+        stacked.asymmetry_max
+    )
+    asymmetry_penalty = np.where(asymmetry_db <= threshold, 0, asymmetry_penalty)
+    breakdown["asymmetry_penalty"] = asymmetry_penalty.astype(np.int64)
+
+    breakdown["budget"] = stacked.budget[:, cols["budget"]]
+    breakdown["type_fit"] = stacked.type_fit[:, loss_level, cols["desired_type"]]
+    breakdown["age_adjustment"] = _lookup_tables(cols["age"], stacked.age_table, stacked.age_ranges)
+    breakdown["unilateral_penalty"] = _unilateral_penalty_stacked(cols, stacked)
+
+    # predict_satisfaction과 같은 순서로 합산 후 정수 변환 및 0~100 클램핑
+    score = breakdown["base"]
+    for key in BREAKDOWN_KEYS[1:]:
+        score = score + breakdown[key]
+    breakdown["final_score"] = np.clip(np.trunc(score), 0, 100).astype(np.int64)
+    breakdown["scored"] = ~_unscored_stacked(cols, stacked)
+
+    return breakdown
+
+
+def calculate_unilateral_penalty_batch(
+    pta_left: np.ndarray,
+    pta_right: np.ndarray,
+    asymmetry_db: np.ndarray,
+    lifestyle: np.ndarray,
+    experience: np.ndarray,
+    budget: np.ndarray,
+    fitting_plan: np.ndarray,
+    weights: CompiledWeights
+) -> np.ndarray:
+    """
+    단측 착용 페널티 배열 계산 (calculate_unilateral_penalty의 벡터 버전)
+
+    Returns:
+        페널티 배열 (양측 착용은 0, 단측 착용은 0 이하 정수)
+
+    Raises:
+        KeyError: 단측 착용 행이 있는데 가중치에 binaural 섹션이 없는 경우
+    """
+    if weights.binaural is None and np.any(np.asarray(fitting_plan) != FITTING_PLAN_INDEX["bilateral"]):
+        raise KeyError("binaural")
+    cols = {
+        "pta_left": np.asarray(pta_left, dtype=float),
+        "pta_right": np.asarray(pta_right, dtype=float),
+        "asymmetry_db": np.asarray(asymmetry_db, dtype=float),
+        "lifestyle": np.asarray(lifestyle, dtype=np.intp),
+        "experience": np.asarray(experience, dtype=bool),
+        "budget": np.asarray(budget, dtype=np.intp),
+        "fitting_plan": np.asarray(fitting_plan, dtype=np.intp),
+    }
+    return _unilateral_penalty_stacked(cols, StackedWeights([weights]))[0]
+
+
+def predict_satisfaction_stacked(
+    columns: Mapping[str, np.ndarray],
+    stacked: StackedWeights
+) -> dict:
+    """
+    여러 가중치 설정으로 한 번에 배치 예측
+
+    Args:
+        columns: predict_satisfaction_batch()와 같은 열 딕셔너리 (N건)
+        stacked: StackedWeights (P개 프로파일)
+
+    Returns:
+        {"final_score": (P, N) 점수 배열, <breakdown 키>: (P, N) 배열, "scored": (P, N) bool 배열} 딕셔너리
+        - scored: 점수를 계산한 (프로파일, 레코드) 여부. binaural 섹션이 없는 프로파일은 단측 착용
+          행을 계산할 수 없으므로 False이며 이때 점수 값은 사용하지 않음 (다른 프로파일 점수는 유효)
+    """
+    return _predict_stacked(prepare_columns(columns), stacked)
+
+
+def predict_satisfaction_batch(
+    columns: Mapping[str, np.ndarray],
+    weights: Union[dict, CompiledWeights, None] = None
+) -> dict:
+    """
+    열 배열 단위 만족도 예측 (predict_satisfaction과 동일한 규칙)
+
+    Args:
+        columns: 열 딕셔너리
+            - pta_left, pta_right, speech_score(좌우 평균), age: 숫자 배열
+            - tinnitus, experience: bool 배열
+            - lifestyle, budget, desired_type, fitting_plan: 정수 코드 배열
+              (weights.LIFESTYLES 등의 인덱스)
+            - asymmetry_db, loss_level: 선택 (없으면 PTA로부터 계산)
+        weights: 가중치 설정 딕셔너리 또는 CompiledWeights (None이면 캐시된 기본 가중치)
+
+    Returns:
+        {"final_score": 점수 배열, <breakdown 키>: 항목별 배열} 딕셔너리
+
+    Raises:
+        KeyError: 필수 열이 없는 경우
+        ValueError: 코드 값이나 열 길이가 잘못된 경우
+    """
+    if weights is None:
+        weights = get_compiled_weights()
+    elif not isinstance(weights, CompiledWeights):
+        weights = compile_weights(weights)
+
+    stacked = predict_satisfaction_stacked(columns, StackedWeights([weights]))
+    if not stacked.pop("scored").all():
+        raise KeyError("binaural")
+    return {key: np.array(value[0]) for key, value in stacked.items()}
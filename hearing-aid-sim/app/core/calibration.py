@@ -0,0 +1,358 @@
+"""
+가중치 보정(calibration) 모듈
+실제 만족도 결과(사후관리 COSI, 설문 등)에 맞춰 규칙 기반 가중치를 다시 추정
+"""
+
+import copy
+from datetime import date
+from typing import Iterable, Mapping, Optional, Union
+
+import numpy as np
+
+from .batch_predictor import encode_features, predict_satisfaction_batch, prepare_columns
+from .weights import (
+    CompiledWeights,
+    compile_weights,
+    get_weights,
+    LOSS_LEVELS,
+    DEVICE_TYPES,
+    LIFESTYLES,
+    BUDGETS,
+)
+
+
+# 보정 대상 항목 (predictor의 가산 항목)
+DEFAULT_FIT_TERMS = (
+    "base",
+    "loss_level",
+    "speech_score",
+    "lifestyle",
+    "budget",
+    "type_fit",
+    "age_adjustment",
+)
+OPTIONAL_FIT_TERMS = ("experience", "tinnitus")
+
+# 기본 단조 제약 (어음명료도가 높을수록 가중치가 작아지지 않음)
+DEFAULT_MONOTONIC = {"speech_score": "increasing"}
+
+
+def _range_bins(values: np.ndarray, ranges: tuple) -> np.ndarray:
+    """값이 속한 구간 번호 (첫 번째로 일치하는 구간, 없으면 -1)"""
+    bins = np.full(values.shape, -1, dtype=np.intp)
+    for i, (low, high, _) in enumerate(ranges):
+        bins[(bins < 0) & (values >= low) & (values <= high)] = i
+    return bins
+
+
+def _isotonic(targets: np.ndarray, sample_weights: np.ndarray, increasing: bool = True) -> np.ndarray:
+    """가중 등위 회귀 (pool adjacent violators)"""
+    if not increasing:
+        return -_isotonic(-targets, sample_weights, True)
+
+    blocks = []  # [평균, 가중치 합, 개수]
+    for value, weight in zip(targets, sample_weights):
+        blocks.append([value, weight, 1])
+        while len(blocks) > 1 and blocks[-2][0] > blocks[-1][0]:
+            mean_b, weight_b, count_b = blocks.pop()
+            mean_a, weight_a, count_a = blocks[-1]
+            total = weight_a + weight_b
+            blocks[-1] = [(mean_a * weight_a + mean_b * weight_b) / total, total, count_a + count_b]
+
+    return np.concatenate([np.full(count, mean) for mean, _, count in blocks])
+
+
+class _TermBlock:
+    """보정 항목 하나 (행별 파라미터 인덱스와 현재 값)"""
+
+    def __init__(self, name: str, index: np.ndarray, initial: np.ndarray, monotonic: Optional[str]):
+        self.name = name
+        self.index = np.asarray(index, dtype=np.intp)
+        self.valid = self.index >= 0
+        self.size = initial.shape[0]
+        self.prior = initial.astype(float)
+        self.values = initial.astype(float)
+        self.monotonic = monotonic
+        self.counts = np.bincount(self.index[self.valid], minlength=self.size).astype(float)
+
+    def contribution(self) -> np.ndarray:
+        result = np.zeros(self.index.shape[0])
+        result[self.valid] = self.values[self.index[self.valid]]
+        return result
+
+    def update(self, residual: np.ndarray, l2: float, integer: bool) -> np.ndarray:
+        """
+        다른 항목을 고정한 상태에서 이 항목의 최적값으로 갱신
+
+        Args:
+            residual: 관측값 - 현재 예측값
+            l2: 기존 가중치 쪽으로 당기는 규제 강도 (데이터가 적은 구간 안정화)
+            integer: 정수 가중치로 제한
+
+        Returns:
+            파라미터 변화량
+        """
+        sums = np.bincount(self.index[self.valid], weights=residual[self.valid], minlength=self.size)
+        denominator = self.counts + l2
+        target = (sums + self.counts * self.values + l2 * self.prior) / np.where(denominator > 0, denominator, 1)
+        target = np.where(denominator > 0, target, self.values)
+
+        if self.monotonic is not None:
+            target = _isotonic(target, np.maximum(denominator, 1e-9), self.monotonic == "increasing")
+        if integer:
+            target = np.round(target)
+
+        delta = target - self.values
+        self.values = target
+        return delta
+
+
+def _solve_ridge(blocks: list, target: np.ndarray, l2: float):
+    """
+    모든 블록을 동시에 푸는 능형 최소제곱 (원-핫 설계 행렬의 정규방정식)
+
+    min ||Xθ - target||² + l2·||θ - θ₀||²  (θ₀: 기존 가중치)
+    """
+    offsets = np.cumsum([0] + [block.size for block in blocks])
+    size = int(offsets[-1])
+    gram = np.zeros((size, size))
+    rhs = np.zeros(size)
+
+    for a, block_a in enumerate(blocks):
+        sa = slice(offsets[a], offsets[a + 1])
+        rhs[sa] = np.bincount(block_a.index[block_a.valid], weights=target[block_a.valid], minlength=block_a.size)
+        rhs[sa] += l2 * block_a.prior
+        for b in range(a, len(blocks)):
+            block_b = blocks[b]
+            both = block_a.valid & block_b.valid
+            joint = np.bincount(
+                block_a.index[both] * block_b.size + block_b.index[both],
+                minlength=block_a.size * block_b.size
+            ).reshape(block_a.size, block_b.size)
+            sb = slice(offsets[b], offsets[b + 1])
+            gram[sa, sb] = joint
+            gram[sb, sa] = joint.T
+
+    gram[np.diag_indices(size)] += l2
+    theta = np.linalg.lstsq(gram, rhs, rcond=None)[0]
+    for a, block in enumerate(blocks):
+        block.values = theta[offsets[a]:offsets[a + 1]]
+
+
+def fit_weights(
+    records: Union[Mapping[str, np.ndarray], Iterable[dict]],
+    observed: Iterable[float],
+    base_weights: Union[dict, CompiledWeights, None] = None,
+    terms: Iterable[str] = DEFAULT_FIT_TERMS,
+    monotonic: Optional[Mapping[str, str]] = None,
+    l2: float = 1.0,
+    integer: bool = True,
+    max_iter: int = 200,
+    tol: float = 1e-3
+) -> tuple[dict, dict]:
+    """
+    관측 만족도에 맞춰 가산 항목 가중치를 최소제곱으로 추정
+
+    구간 경계(어음명료도, 연령)와 고정 항목(비대칭, 단측 착용 페널티 등)은 기존 가중치를
+    그대로 사용하고, 보정 대상 항목의 값만 블록 좌표 하강법으로 추정합니다.
+    오차는 최종 점수와 같이 0~100으로 자르고 소수점을 버린 예측값 기준입니다.
+    각 블록은 bincount로 한 번에 갱신되므로 10만 건 이상도 수 초 안에 처리됩니다.
+
+    Args:
+        records: 전처리된 특징 딕셔너리 목록 또는 encode_features() 열 딕셔너리
+        observed: 관측 만족도 (0~100, records와 같은 순서)
+        base_weights: 시작 가중치 (None이면 캐시된 기본 가중치)
+        terms: 보정할 항목 (DEFAULT_FIT_TERMS + "experience", "tinnitus" 중 선택)
+        monotonic: 단조 제약 {항목: "increasing" | "decreasing"}
+            (None이면 어음명료도 증가 제약, 구간 순서 기준)
+        l2: 기존 가중치 쪽 규제 강도 (0이면 규제 없음)
+        integer: 정수 가중치로 제한 (가중치 파일 형식 유지)
+        max_iter: 최대 반복 횟수
+        tol: 연속값 단계 수렴 기준 (반복당 최대 가중치 변화량)
+
+    Returns:
+        (새 가중치 딕셔너리 - weights.default.json과 같은 형식, 보정 결과 요약)
+        - 보정 후 RMSE가 기존보다 크면 기존 가중치를 그대로 반환 (요약의 "applied"가 False)
+
+    Raises:
+        ValueError: 입력 길이가 맞지 않거나 알 수 없는 항목인 경우
+    """
+    if base_weights is None:
+        base_weights = get_weights()
+    compiled = base_weights if isinstance(base_weights, CompiledWeights) else compile_weights(base_weights)
+
+    terms = tuple(terms)
+    unknown = [term for term in terms if term not in DEFAULT_FIT_TERMS + OPTIONAL_FIT_TERMS]
+    if unknown:
+        raise ValueError(f"보정할 수 없는 항목입니다: {', '.join(unknown)}")
+    monotonic = DEFAULT_MONOTONIC if monotonic is None else dict(monotonic)
+
+    columns = records if isinstance(records, Mapping) else encode_features(records)
+    cols = prepare_columns(columns)
+    y = np.asarray(list(observed) if not isinstance(observed, np.ndarray) else observed, dtype=float)
+    n = cols["pta_left"].shape[0]
+    if y.shape != (n,):
+        raise ValueError("관측 만족도 개수가 레코드 수와 다릅니다.")
+    if n == 0:
+        raise ValueError("보정할 레코드가 없습니다.")
+
+    before = predict_satisfaction_batch(columns, compiled)
+
+    # 항목별 (행 → 파라미터 인덱스, 초기값)
+    term_specs = {
+        "base": (np.zeros(n, dtype=np.intp), np.array([compiled.base_score])),
+        "loss_level": (cols["loss_level"], np.array(compiled.loss_level)),
+        "speech_score": (
+            _range_bins(cols["speech_score"], compiled.speech_score.ranges),
+            np.array([weight for _, _, weight in compiled.speech_score.ranges])
+        ),
+        "lifestyle": (cols["lifestyle"], np.array(compiled.lifestyle)),
+        "budget": (cols["budget"], np.array(compiled.budget)),
+        "type_fit": (
+            cols["loss_level"] * len(DEVICE_TYPES) + cols["desired_type"],
+            np.array(compiled.type_fit).reshape(-1)
+        ),
+        "age_adjustment": (
+            _range_bins(cols["age"], compiled.age.ranges),
+            np.array([weight for _, _, weight in compiled.age.ranges])
+        ),
+        "experience": (cols["experience"].astype(np.intp), np.array(compiled.experience)),
+        "tinnitus": (cols["tinnitus"].astype(np.intp), np.array(compiled.tinnitus)),
+    }
+
+    blocks = [_TermBlock(term, *term_specs[term], monotonic.get(term)) for term in terms]
+
+    # 고정 항목 = 기존 breakdown 중 보정 대상이 아닌 항목
+    fixed = np.zeros(n)
+    for key in ("base", "loss_level", "speech_score", "lifestyle", "experience", "tinnitus",
+                "asymmetry_penalty", "budget", "type_fit", "age_adjustment", "unilateral_penalty"):
+        if key not in terms:
+            fixed += before[key]
+
+    # 최종 점수는 int()로 소수점을 버리므로 연속값 가중치는 평균 0.5점 낮게 예측됨
+    # → 연속값으로 보정할 때는 관측값 + 0.5를 목표로 함 (정수 가중치는 버림 영향 없음)
+    offset = 0.0 if integer else 0.5
+    target_y = y + offset
+    prediction = fixed + sum(block.contribution() for block in blocks)
+    residual = target_y - prediction
+
+    def clipped(residual: np.ndarray) -> np.ndarray:
+        """
+        최종 점수(0~100으로 잘림) 기준 오차
+
+        예측이 경계를 넘은 행은 경계값과의 차이만 오차로 봄 (관측값도 경계이면 0).
+        잘리기 전 예측값과의 차이를 쓰면 -20점으로 예측된 행의 관측값 3점이 23점 오차가 되어
+        다른 행의 가중치까지 끌어올립니다.
+        """
+        return target_y - np.clip(target_y - residual, offset, 100 + offset)
+
+    def run(integer_step: bool, step_tol: float, sweeps: int) -> int:
+        """블록 좌표 하강 (단조/정수 제약을 블록 단위로 정확히 반영)"""
+        nonlocal residual
+        for iteration in range(1, sweeps + 1):
+            max_change = 0.0
+            for block in blocks:
+                delta = block.update(clipped(residual), l2, integer_step)
+                if np.any(delta):
+                    change = np.zeros(n)
+                    change[block.valid] = delta[block.index[block.valid]]
+                    residual = residual - change
+                    max_change = max(max_change, float(np.abs(delta).max()))
+            if max_change <= step_tol:
+                return iteration
+        return sweeps
+
+    # 1) 연속값: 정규방정식으로 한 번에 풀고 단조 제약 위반분만 좌표 하강으로 보정
+    #    (경계를 넘은 행의 목표값은 현재 예측값 + 경계 기준 오차로 두고 경계를 넘은 행이 바뀌지 않을 때까지 반복)
+    iterations = 0
+    mask = None
+    for _ in range(max_iter):
+        target = target_y - residual + clipped(residual) - fixed
+        _solve_ridge(blocks, target, l2)
+        residual = target_y - fixed - sum(block.contribution() for block in blocks)
+        iterations += 1 + run(False, tol, 20)
+        prediction = target_y - residual
+        new_mask = (prediction < offset) | (prediction > 100 + offset)
+        if mask is not None and np.array_equal(new_mask, mask):
+            break
+        mask = new_mask
+
+    # 2) 정수값: 반올림 후 블록 단위 정수 최적화
+    if integer:
+        iterations += run(True, 0, max_iter)
+
+    fitted = {block.name: block.values for block in blocks}
+    new_weights = _build_weights(compiled.raw, fitted, integer)
+
+    after = predict_satisfaction_batch(columns, compile_weights(new_weights))
+    rmse_before = float(np.sqrt(np.mean((before["final_score"] - y) ** 2)))
+    rmse_after = float(np.sqrt(np.mean((after["final_score"] - y) ** 2)))
+    # 보정 결과가 기존 가중치보다 나쁘면 (잡음이 크고 경계에 몰린 관측값 등) 기존 가중치 유지
+    applied = rmse_after <= rmse_before
+    if not applied:
+        new_weights = copy.deepcopy(compiled.raw)
+        after, rmse_after = before, rmse_before
+
+    report = {
+        "rows": n,
+        "terms": list(terms),
+        "iterations": iterations,
+        "l2": l2,
+        "applied": applied,
+        "rmse_before": rmse_before,
+        "rmse_after": rmse_after,
+        "mae_before": float(np.mean(np.abs(before["final_score"] - y))),
+        "mae_after": float(np.mean(np.abs(after["final_score"] - y))),
+        "mean_observed": float(y.mean()),
+        "mean_predicted": float(after["final_score"].mean()),
+    }
+    new_weights["calibration"] = {
+        "description": "관측 만족도 기반 자동 보정 결과" if applied else "보정 결과가 기존보다 나빠 기존 가중치 유지",
+        "base_version": compiled.version,
+        **{key: report[key] for key in ("rows", "terms", "l2", "rmse_before", "rmse_after")},
+    }
+    return new_weights, report
+
+
+def _build_weights(raw: dict, fitted: dict, integer: bool) -> dict:
+    """보정 결과를 기존 가중치 JSON 형식에 반영"""
+    weights = copy.deepcopy(raw)
+
+    def value(x):
+        return int(x) if integer else round(float(x), 3)
+
+    if "base" in fitted:
+        weights["base_score"] = value(fitted["base"][0])
+    for term, section, names in (
+        ("loss_level", "loss_level_weights", LOSS_LEVELS),
+        ("lifestyle", "lifestyle_weights", LIFESTYLES),
+        ("budget", "budget_weights", BUDGETS),
+    ):
+        if term in fitted:
+            for name, x in zip(names, fitted[term]):
+                weights[section][name] = value(x)
+    if "type_fit" in fitted:
+        table = fitted["type_fit"].reshape(len(LOSS_LEVELS), len(DEVICE_TYPES))
+        for level, row in zip(LOSS_LEVELS, table):
+            for device, x in zip(DEVICE_TYPES, row):
+                weights["type_mismatch_penalties"][level][device] = value(x)
+    if "speech_score" in fitted:
+        for range_config, x in zip(weights["speech_score_weights"]["ranges"], fitted["speech_score"]):
+            range_config["weight"] = value(x)
+    if "age_adjustment" in fitted:
+        for range_config, x in zip(weights["age_adjustment"]["ranges"], fitted["age_adjustment"]):
+            range_config["weight"] = value(x)
+    if "experience" in fitted:
+        weights["experience_weight"]["no_experience"] = value(fitted["experience"][0])
+        weights["experience_weight"]["has_experience"] = value(fitted["experience"][1])
+    if "tinnitus" in fitted:
+        weights["tinnitus_weight"]["no_tinnitus"] = value(fitted["tinnitus"][0])
+        weights["tinnitus_weight"]["has_tinnitus"] = value(fitted["tinnitus"][1])
+
+    base_version = raw.get("version", "unknown")
+    weights["version"] = f"{base_version}+calibrated"
+    weights["updated_at"] = date.today().isoformat()
+    weights["notes"] = list(raw.get("notes", [])) + [
+        f"{date.today().isoformat()}: v{base_version} 기반 관측 만족도 자동 보정"
+    ]
+    return weights
@@ -0,0 +1,570 @@
+"""
+열 단위 일괄 검증 모듈
+센터 엑셀/CSV 같은 대량 입력을 열(NumPy 배열) 단위로 UserInput과 같은 규칙으로 검증
+
+UserInput은 한 건씩 검증하고 첫 오류에서 ValidationError를 발생시키므로,
+여러 행의 오류를 모아 보려면 행마다 예외를 처리해야 합니다. 이 모듈은 전체 열을 한 번에
+검증하여 행별 오류 표와 오류 없는 행(PTA/비대칭 계산 포함)을 함께 반환합니다.
+
+규칙은 schema.FIELD_RULES(UserInput 필드 선언에서 생성), MIN_CONSULTATION_AGE, PTA_SIDES를
+그대로 사용하므로 UserInput과 같은 행이 통과/실패합니다.
+빈 칸(None, 빈 문자열, NaN)은 값이 없는 것으로 처리합니다 (pipeline.normalize_csv_row와 같음).
+
+사용법:
+    from app.core.columnar import validate_columns, validate_records
+
+    result = validate_columns({"age": ages, "lifestyle": lifestyles, ...})
+    result = validate_columns(*read_csv_columns("center.csv"))
+    result = validate_records(iter_records("center.jsonl"))
+
+    result.errors          # [{"index", "field", "message"}, ...] (행 순서)
+    result.columns         # 오류 없는 행의 열 배열 (PTA/비대칭 계산 포함)
+    result.user_inputs()   # 오류 없는 행의 UserInput 목록 (검증 생략 생성)
+"""
+
+import csv
+import re
+from itertools import repeat, zip_longest
+from pathlib import Path
+from typing import Iterable, Mapping, Optional, Union
+
+import numpy as np
+
+from .schema import FIELD_RULES, MIN_CONSULTATION_AGE, UNDER_AGE_MESSAGE, PTA_SIDES
+from .pipeline import CSV_LIST_FIELDS, split_csv_list
+
+
+REQUIRED_MESSAGE = "필수 항목입니다."
+TYPE_MESSAGES = {
+    "float": "숫자여야 합니다.",
+    "int": "정수여야 합니다.",
+    "bool": "예/아니오 값(true/false, 1/0)이어야 합니다.",
+    "text": "문자열이어야 합니다.",
+    "text_list": "문자열 목록이어야 합니다.",
+}
+
+# 최소값 외 추가 하한 (필드 → (하한, 메시지), UserInput.validate_age와 동일)
+MIN_VALUE_RULES = {"age": (MIN_CONSULTATION_AGE, UNDER_AGE_MESSAGE)}
+
+# 불리언으로 인정하는 문자열 (대소문자 무시, pydantic 규칙과 동일)
+TRUE_STRINGS = frozenset({"1", "on", "t", "true", "y", "yes"})
+FALSE_STRINGS = frozenset({"0", "off", "f", "false", "n", "no"})
+_TRUE_VARIANTS = sorted({variant for value in TRUE_STRINGS for variant in (value, value.upper(), value.capitalize())})
+_FALSE_VARIANTS = sorted({variant for value in FALSE_STRINGS for variant in (value, value.upper(), value.capitalize())})
+
+# 정수로 인정하는 문자열 ("70", "+70", "70.0" 허용, "70.5", "1e2" 불가 - pydantic 규칙과 동일)
+_INT_PATTERN = re.compile(r"\s*[+-]?[0-9_]+(\.0+)?\s*")
+_INT_CHARS = "0123456789+-_. "
+
+_RULE_ORDER = {rule.name: order for order, rule in enumerate(FIELD_RULES)}
+# PTA 완결성 오류는 필드 오류 뒤 (UserInput은 필드 검증이 모두 통과한 행만 확인)
+_PTA_ORDER = len(FIELD_RULES)
+
+
+def _missing_mask(values: np.ndarray) -> np.ndarray:
+    """object 열의 빈 칸 (None, 빈 문자열, NaN)"""
+    return np.equal(values, None) | np.equal(values, "") | np.not_equal(values, values)
+
+
+def _isinstance_mask(values: np.ndarray, types) -> np.ndarray:
+    return np.fromiter(map(isinstance, values, repeat(types)), dtype=bool, count=len(values))
+
+
+def _parse_number(value, integer: bool) -> float:
+    """숫자 하나 변환 (변환할 수 없으면 NaN)"""
+    if isinstance(value, (bool, int, float, np.bool_, np.integer, np.floating)):
+        return float(value)
+    if isinstance(value, str):
+        if not _number_string(value, integer):
+            return np.nan
+        try:
+            return float(value)
+        except ValueError:
+            return np.nan
+    return np.nan
+
+
+def _number_string(value: str, integer: bool) -> bool:
+    """
+    UserInput이 숫자로 인정하는 문자열 여부 (float()으로 변환되는 값 중에서)
+
+    float()은 "٣", "３" 같은 유니코드 숫자도 변환하지만 UserInput에서는 오류입니다
+    (앞뒤의 유니코드 공백은 양쪽 모두 허용).
+    """
+    return value.strip().isascii() and (not integer or _INT_PATTERN.fullmatch(value) is not None)
+
+
+def _parse_bool(value) -> float:
+    """불리언 하나 변환 (1.0/0.0, 변환할 수 없으면 NaN)"""
+    if isinstance(value, (bool, np.bool_)):
+        return float(value)
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        return float(value) if value in (0, 1) else np.nan
+    if isinstance(value, str):
+        lowered = value.lower()
+        if lowered in TRUE_STRINGS:
+            return 1.0
+        if lowered in FALSE_STRINGS:
+            return 0.0
+    return np.nan
+
+
+def _is_text_list(value) -> bool:
+    return isinstance(value, (list, tuple)) and all(isinstance(item, str) for item in value)
+
+
+def _parse_numbers(values: np.ndarray, kind: str) -> np.ndarray:
+    """
+    object 열(빈 칸 제외)을 float64로 변환 (변환할 수 없는 값은 NaN)
+
+    숫자와 숫자 문자열만 있는 열(CSV 등)은 NumPy가 한 번에 변환하고,
+    변환할 수 없는 값이 섞인 열만 항목별로 확인합니다.
+    """
+    if kind == "bool":
+        return np.fromiter(map(_parse_bool, values), dtype=float, count=len(values))
+    integer = kind == "int"
+    try:
+        parsed = values.astype(float)
+    except (TypeError, ValueError):
+        return np.fromiter(map(_parse_number, values, repeat(integer)), dtype=float, count=len(values))
+
+    if not integer and _ascii_texts(values):
+        return parsed
+    is_text = _isinstance_mask(values, str)
+    if is_text.any():
+        parsed[np.flatnonzero(is_text)[~_number_strings(values[is_text].astype(str), integer)]] = np.nan
+    return parsed
+
+
+def _ascii_texts(values: np.ndarray) -> bool:
+    """문자열로만 된 열이고 모두 ASCII인지 (CSV에서 읽은 열은 대부분 한 번에 확인됨)"""
+    try:
+        return "".join(values.tolist()).isascii()
+    except TypeError:
+        return False
+
+
+def _number_strings(text: np.ndarray, integer: bool) -> np.ndarray:
+    """
+    문자열 배열 전체의 _number_string 결과
+
+    ASCII 문자열은 배열 연산으로 확인하고, 드문 비 ASCII 문자열(유니코드 숫자/공백)만
+    항목별로 다시 확인합니다.
+    """
+    width = text.dtype.itemsize // 4
+    if width == 0:
+        return np.ones(len(text), dtype=bool)
+    codes = np.ascontiguousarray(text).view(np.uint32).reshape(len(text), width)
+    ascii = np.all(codes < 128, axis=1)
+    accepted = ascii & _int_strings(text) if integer else ascii
+    rest = np.flatnonzero(~ascii)
+    if len(rest):
+        accepted[rest] = [_number_string(value, integer) for value in text[rest].tolist()]
+    return accepted
+
+
+def _int_strings(text: np.ndarray) -> np.ndarray:
+    """
+    정수로 인정하는 문자열 여부 (부호/숫자/".0"만 허용)
+
+    "1e2", "inf", "70." 등은 float()로는 변환되지만 UserInput에서는 오류입니다.
+    """
+    return (np.char.str_len(np.char.strip(text, _INT_CHARS)) == 0) & ~np.char.endswith(np.char.rstrip(text), ".")
+
+
+def _parse_digit_strings(text: np.ndarray) -> Optional[np.ndarray]:
+    """
+    숫자로만 된 문자열 배열("45", "120" 등)을 문자 코드 연산으로 한 번에 변환
+
+    NumPy의 문자열 → 실수 변환은 항목마다 파이썬 float()를 거치므로, CSV에 흔한
+    부호/소수점 없는 정수는 자릿수별 벡터 연산으로 변환합니다.
+
+    Returns:
+        float64 배열 (숫자 외 문자가 있으면 None)
+    """
+    width = text.dtype.itemsize // 4
+    if width == 0 or width > 15:
+        return None
+    codes = np.ascontiguousarray(text).view(np.uint32).reshape(len(text), width)
+    padding = codes == 0
+    digits = codes.astype(np.int64) - ord("0")
+    if not np.all(padding | ((digits >= 0) & (digits <= 9))):
+        return None
+    # 짧은 문자열은 오른쪽이 0으로 채워져 있으므로 채움 칸은 건너뜀
+    values = np.zeros(len(text), dtype=np.int64)
+    for column in range(width):
+        values = np.where(padding[:, column], values, values * 10 + digits[:, column])
+    return values.astype(float)
+
+
+def _bool_strings(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """불리언 문자열 배열 → (참, 거짓) 여부 (대소문자 무시)"""
+    truthy = np.isin(values, _TRUE_VARIANTS)
+    falsy = np.isin(values, _FALSE_VARIANTS)
+    rest = ~(truthy | falsy)
+    if rest.any():
+        # 흔한 표기(true, True, TRUE 등) 외에는 소문자로 바꿔 다시 확인
+        lowered = np.char.lower(values[rest])
+        truthy[rest] = np.isin(lowered, list(TRUE_STRINGS))
+        falsy[rest] = np.isin(lowered, list(FALSE_STRINGS))
+    return truthy, falsy
+
+
+def _check_string_column(rule, values: np.ndarray, size: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    NumPy 문자열 배열(CSV 열 등) 변환 - 파이썬 객체를 만들지 않고 배열 연산으로 처리
+
+    Returns:
+        _check_column과 같은 형식
+    """
+    missing = values == ""
+    present = ~missing
+
+    if rule.kind == "bool":
+        truthy, falsy = _bool_strings(values)
+        parsed = np.where(truthy, 1.0, np.where(falsy, 0.0, np.nan))
+        return parsed, missing, present & ~(truthy | falsy)
+
+    if rule.kind in ("float", "int"):
+        parsed = np.full(size, np.nan)
+        text = values[present]
+        digits = _parse_digit_strings(text)
+        if digits is not None:
+            parsed[present] = digits
+        else:
+            try:
+                parsed[present] = text.astype(float)
+            except ValueError:
+                parsed[present] = np.fromiter(
+                    map(_parse_number, text.tolist(), repeat(rule.kind == "int")), dtype=float, count=len(text)
+                )
+            parsed[np.flatnonzero(present)[~_number_strings(text, rule.kind == "int")]] = np.nan
+        invalid = present & np.isnan(parsed)
+        if rule.kind == "int":
+            invalid |= present & np.isfinite(parsed) & (parsed != np.floor(parsed))
+        return parsed, missing, invalid
+
+    if rule.kind == "choice":
+        invalid = present & ~np.isin(values, list(rule.choices))
+    else:
+        # 문자열 하나는 목록이 아님 (text_list)
+        invalid = present if rule.kind == "text_list" else np.zeros(size, dtype=bool)
+    objects = values.astype(object)
+    objects[missing] = None
+    return objects, missing, invalid
+
+
+def _object_array(values: list) -> np.ndarray:
+    """1차원 object 배열 (목록 값도 한 칸에 그대로 보관)"""
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
+def _as_column(values) -> np.ndarray:
+    """열을 1차원 배열로 변환 (목록 값이 든 열은 object 배열)"""
+    if isinstance(values, list) and any(isinstance(value, (list, tuple)) for value in values):
+        return _object_array(values)
+    return np.asarray(values)
+
+
+def _check_column(rule, values: Optional[np.ndarray], size: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    열 하나를 규칙의 타입으로 변환
+
+    Returns:
+        (변환된 값, 빈 칸 여부, 타입 오류 여부)
+        - float/int/bool: float64 배열 (빈 칸/오류는 NaN)
+        - choice/text/text_list: object 배열 (빈 칸은 None)
+    """
+    numeric = rule.kind in ("float", "int", "bool")
+    if values is None:
+        empty = np.full(size, np.nan) if numeric else np.full(size, None, dtype=object)
+        return empty, np.ones(size, dtype=bool), np.zeros(size, dtype=bool)
+
+    if numeric and values.dtype.kind in "biuf":
+        # 숫자 배열은 그대로 벡터 연산
+        parsed = values.astype(float)
+        missing = np.isnan(parsed)
+        if rule.kind == "bool":
+            invalid = ~missing & (parsed != 0) & (parsed != 1)
+        elif rule.kind == "int":
+            invalid = ~missing & np.isfinite(parsed) & (parsed != np.floor(parsed))
+        else:
+            invalid = np.zeros(size, dtype=bool)
+        return parsed, missing, invalid
+
+    if values.dtype.kind == "U":
+        return _check_string_column(rule, values, size)
+    if values.dtype != object:
+        values = np.array(values.tolist(), dtype=object)
+    missing = _missing_mask(values)
+    present = ~missing
+
+    if numeric:
+        parsed = np.full(size, np.nan)
+        parsed[present] = _parse_numbers(values[present], rule.kind)
+        invalid = present & np.isnan(parsed)
+        if rule.kind == "int":
+            invalid |= present & np.isfinite(parsed) & (parsed != np.floor(parsed))
+        return parsed, missing, invalid
+
+    values = values.copy()
+    values[missing] = None
+    if rule.kind == "choice":
+        invalid = present & ~np.isin(values, np.array(rule.choices, dtype=object))
+    elif rule.kind == "text":
+        invalid = present & ~_isinstance_mask(values, str)
+    else:
+        invalid = present & ~np.fromiter(map(_is_text_list, values), dtype=bool, count=size)
+    return values, missing, invalid
+
+
+class ColumnValidation:
+    """
+    열 단위 검증 결과
+
+    Attributes:
+        size: 전체 행 수
+        valid: 행별 통과 여부 (bool 배열)
+        errors: 오류 표 [{"index", "field", "message"}, ...] (행 순서, 행 안에서는 필드 선언 순서)
+        index: 통과한 행 번호 배열
+        columns: 통과한 행의 열 배열 (필드 이름 → 배열, PTA/비대칭 계산 포함)
+            - 실수 필드는 float64 (빈 칸 NaN), 정수 필드는 int64, 불리언 필드는 bool, 그 외 object (빈 칸 None)
+    """
+
+    def __init__(self, valid: np.ndarray, errors: list[dict], columns: dict):
+        self.size = len(valid)
+        self.valid = valid
+        self.errors = errors
+        self.index = np.flatnonzero(valid)
+        self.columns = columns
+
+    @property
+    def n_valid(self) -> int:
+        return len(self.index)
+
+    @property
+    def n_invalid(self) -> int:
+        return self.size - self.n_valid
+
+    def error_rows(self) -> list[dict]:
+        """행별 오류 목록 [{"index", "errors": [{"field", "message"}, ...]}, ...] (validate_record 형식)"""
+        rows = []
+        for error in self.errors:
+            if not rows or rows[-1]["index"] != error["index"]:
+                rows.append({"index": error["index"], "errors": []})
+            rows[-1]["errors"].append({"field": error["field"], "message": error["message"]})
+        return rows
+
+    def records(self) -> list[dict]:
+        """통과한 행을 UserInput 입력 딕셔너리 목록으로 변환 (빈 칸은 생략)"""
+        names = list(self.columns)
+        lists = [self.columns[name].tolist() for name in names]
+        records = []
+        for values in zip(*lists):
+            records.append({
+                name: value for name, value in zip(names, values)
+                if value is not None and value == value
+            })
+        return records
+
+    def user_inputs(self) -> list:
+        """통과한 행의 UserInput 목록 (이미 검증했으므로 검증 생략 생성)"""
+        from .ingest import construct_trusted
+        return [construct_trusted(record) for record in self.records()]
+
+
+def validate_columns(columns: Mapping, size: Optional[int] = None) -> ColumnValidation:
+    """
+    열 배열을 UserInput 규칙으로 한 번에 검증
+
+    Args:
+        columns: 필드 이름 → 열 (NumPy 배열, 리스트, pandas Series 등, 없는 열은 전부 빈 칸)
+            - UserInput 필드가 아닌 열은 무시
+        size: 행 수 (None이면 열 길이)
+
+    Returns:
+        ColumnValidation
+
+    Raises:
+        ValueError: 열 길이가 서로 다른 경우
+    """
+    arrays = {rule.name: _as_column(columns[rule.name]) for rule in FIELD_RULES if rule.name in columns}
+    lengths = {len(array) for array in arrays.values()}
+    if size is not None:
+        lengths.add(size)
+    if len(lengths) > 1:
+        raise ValueError(f"열 길이가 서로 다릅니다: {sorted(lengths)}")
+    size = lengths.pop() if lengths else 0
+
+    parsed = {}
+    missing = {}
+    # 오류 표 (행 번호 배열, 필드 순서, 필드 이름, 메시지)
+    error_parts = []
+    field_error = np.zeros(size, dtype=bool)
+
+    def add_errors(mask: np.ndarray, order: int, field: str, message: str):
+        rows = np.flatnonzero(mask)
+        if len(rows):
+            error_parts.append((rows, order, field, message))
+
+    for rule in FIELD_RULES:
+        values, empty, invalid = _check_column(rule, arrays.get(rule.name), size)
+        parsed[rule.name] = values
+        missing[rule.name] = empty
+        order = _RULE_ORDER[rule.name]
+
+        failed = invalid.copy()
+        if rule.required:
+            add_errors(empty, order, rule.name, REQUIRED_MESSAGE)
+            failed |= empty
+        type_message = _choice_message(rule) if rule.kind == "choice" else TYPE_MESSAGES[rule.kind]
+        add_errors(invalid, order, rule.name, type_message)
+
+        if rule.low is not None or rule.high is not None:
+            checked = ~empty & ~invalid
+            out_of_range = np.zeros(size, dtype=bool)
+            with np.errstate(invalid="ignore"):
+                if rule.low is not None:
+                    out_of_range |= checked & (values < rule.low)
+                if rule.high is not None:
+                    out_of_range |= checked & (values > rule.high)
+            add_errors(out_of_range, order, rule.name, _range_message(rule))
+            failed |= out_of_range
+
+            if rule.name in MIN_VALUE_RULES:
+                minimum, message = MIN_VALUE_RULES[rule.name]
+                too_low = ~empty & ~failed & (values < minimum)
+                add_errors(too_low, order, rule.name, message)
+                failed |= too_low
+
+        field_error |= failed
+
+    # PTA 완결성 (필드 오류가 없는 행만, 좌측 오류가 있으면 우측은 확인하지 않음)
+    model_error = np.zeros(size, dtype=bool)
+    for pta_field, freq_fields, message in PTA_SIDES:
+        need = ~field_error & ~model_error & missing[pta_field]
+        incomplete = need & np.logical_or.reduce([missing[name] for name in freq_fields])
+        add_errors(incomplete, _PTA_ORDER, "", message)
+        model_error |= incomplete
+
+    valid = ~field_error & ~model_error
+
+    # 통과한 행만 남기고 PTA/비대칭 계산 (UserInput.calculate_pta_and_asymmetry와 같은 순서로 계산)
+    clean = {}
+    for rule in FIELD_RULES:
+        values = parsed[rule.name][valid]
+        if rule.kind == "int":
+            values = values.astype(np.int64)
+        elif rule.kind == "bool":
+            values = values.astype(bool)
+        clean[rule.name] = values
+
+    for pta_field, freq_fields, _ in PTA_SIDES:
+        pta = clean[pta_field]
+        need = np.isnan(pta)
+        if need.any():
+            total = clean[freq_fields[0]].copy()
+            for name in freq_fields[1:]:
+                total += clean[name]
+            clean[pta_field] = np.where(need, total / 4, pta)
+
+    asymmetry = clean["asymmetry_db"]
+    clean["asymmetry_db"] = np.where(
+        np.isnan(asymmetry), np.abs(clean["audiogram_left_pta"] - clean["audiogram_right_pta"]), asymmetry
+    )
+
+    return ColumnValidation(valid, _error_table(error_parts), clean)
+
+
+def _range_message(rule) -> str:
+    if rule.low is not None and rule.high is not None:
+        return f"{rule.low:g}~{rule.high:g} 범위여야 합니다."
+    if rule.low is not None:
+        return f"{rule.low:g} 이상이어야 합니다."
+    return f"{rule.high:g} 이하여야 합니다."
+
+
+def _choice_message(rule) -> str:
+    return f"{', '.join(rule.choices)} 중 하나여야 합니다."
+
+
+def _error_table(error_parts: list[tuple]) -> list[dict]:
+    """(행 번호 배열, 필드 순서, 필드, 메시지) 묶음을 행 순서 오류 표로 정렬"""
+    if not error_parts:
+        return []
+    rows = np.concatenate([part[0] for part in error_parts])
+    orders = np.concatenate([np.full(len(part[0]), part[1]) for part in error_parts])
+    parts = np.concatenate([np.full(len(part[0]), i) for i, part in enumerate(error_parts)])
+    # 행 → 필드 순서 → 규칙 적용 순서
+    order = np.lexsort((parts, orders, rows))
+    return [
+        {"index": int(rows[i]), "field": error_parts[parts[i]][2], "message": error_parts[parts[i]][3]}
+        for i in order
+    ]
+
+
+def columns_from_records(records: Iterable[dict]) -> tuple[dict, int]:
+    """
+    입력 딕셔너리 목록을 UserInput 필드 열(object 배열)로 변환
+
+    Returns:
+        (필드 이름 → 열, 행 수)
+    """
+    records = list(records)
+    keys = set().union(*records)
+    columns = {}
+    for rule in FIELD_RULES:
+        if rule.name in keys:
+            columns[rule.name] = _object_array(list(map(dict.get, records, repeat(rule.name))))
+    return columns, len(records)
+
+
+def read_csv_columns(path: Union[str, Path]) -> tuple[dict, int]:
+    """
+    CSV 파일을 열 단위로 읽기 (행 딕셔너리를 만들지 않음)
+
+    값은 앞뒤 공백을 제거한 NumPy 문자열 배열(빈 칸은 "")이며, 목록 항목(CSV_LIST_FIELDS)은
+    나눈 목록의 object 배열입니다 (pipeline.normalize_csv_row와 같은 정리).
+
+    Returns:
+        (열 이름 → 열, 행 수) - UserInput 필드가 아닌 열(방문일, 센터 등)도 포함
+    """
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f)
+        header = [name.strip() for name in next(reader, [])]
+        rows = [row for row in reader if row]
+
+    columns = {}
+    for name, values in zip(header, zip_longest(*rows, fillvalue="")):
+        if not name:
+            continue
+        column = np.char.strip(np.array(values, dtype=str))
+        if name in CSV_LIST_FIELDS:
+            column = _object_array([split_csv_list(value) if value else None for value in column.tolist()])
+        columns[name] = column
+    return columns, len(rows)
+
+
+def validate_records(records: Iterable[dict]) -> ColumnValidation:
+    """
+    입력 딕셔너리 목록(iter_records 결과 등)을 열 단위로 검증
+
+    JSON 파싱에 실패한 행({"_parse_error": 메시지})은 해당 메시지를 오류로 기록합니다.
+    """
+    records = list(records)
+    parse_errors = {
+        index: record["_parse_error"] for index, record in enumerate(records) if "_parse_error" in record
+    }
+    if not parse_errors:
+        return validate_columns(*columns_from_records(records))
+
+    # 파싱 실패 행은 제외하고 검증한 뒤 원래 행 번호로 되돌림
+    kept = np.array([index for index in range(len(records)) if index not in parse_errors], dtype=np.intp)
+    result = validate_columns(*columns_from_records(records[index] for index in kept))
+
+    valid = np.zeros(len(records), dtype=bool)
+    valid[kept] = result.valid
+    errors = [dict(error, index=int(kept[error["index"]])) for error in result.errors]
+    errors += [{"index": index, "field": "", "message": message} for index, message in parse_errors.items()]
+    errors.sort(key=lambda error: error["index"])
+    return ColumnValidation(valid, errors, result.columns)
@@ -0,0 +1,166 @@
+"""
+대량 입력 변환 모듈
+JSON 바이트를 파이썬 딕셔너리를 거치지 않고 UserInput으로 검증하거나,
+이미 검증된 레코드를 검증 없이 UserInput으로 만드는 경로
+
+- 외부 입력 (검증 필요):
+    validate_json_array(b'[{...}, {...}]')     # 전체 배열 한 번에 검증 (하나라도 틀리면 ValidationError)
+    validate_json_lines(jsonl_bytes)           # 줄마다 검증, 실패한 줄은 오류 목록
+- 내부 기록 (UserInput.model_dump() 결과를 다시 읽는 경우 등):
+    construct_trusted(record)                  # 필드 검증 생략, PTA/비대칭 계산만 실행
+    load_trusted_json(data)                    # JSON 배열 또는 JSONL 바이트 → UserInput 목록
+
+construct_trusted는 범위/형식 검사를 하지 않으므로 외부에서 들어온 입력에 사용하면 안 됩니다.
+"""
+
+import gc
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional, Union
+
+import pydantic_core
+from pydantic import TypeAdapter, ValidationError
+
+from .schema import UserInput, derive_pta_and_asymmetry
+from .pipeline import format_validation_error
+
+
+_FIELDS = UserInput.model_fields
+_FIELD_NAMES = frozenset(_FIELDS)
+_REQUIRED = frozenset(name for name, field in _FIELDS.items() if field.is_required())
+# 필드 이름 → 기본값 (필수 항목과 default_factory 항목은 None, 필드 선언 순서)
+_DEFAULTS = {
+    name: None if field.is_required() or field.default_factory is not None else field.default
+    for name, field in _FIELDS.items()
+}
+_FACTORIES = tuple(
+    (name, field.default_factory) for name, field in _FIELDS.items() if field.default_factory is not None
+)
+
+
+@contextmanager
+def _gc_paused():
+    """
+    대량 생성 중 순환 참조 GC 일시 중지
+
+    생성한 객체를 모두 보관하므로 GC가 수집할 것은 없지만, 객체 수가 늘 때마다
+    전체 세대 검사가 반복되어 10만 건 기준 처리 시간이 1.5~2배로 늘어납니다.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+@lru_cache(maxsize=1)
+def _records_adapter() -> TypeAdapter:
+    """UserInput 목록 검증기 (처음 사용할 때 한 번만 생성)"""
+    return TypeAdapter(list[UserInput])
+
+
+def validate_json_array(data: Union[bytes, str]) -> list[UserInput]:
+    """
+    JSON 배열 바이트를 UserInput 목록으로 검증 (pydantic-core에서 파싱과 검증을 한 번에 처리)
+
+    Args:
+        data: UserInput 입력 객체의 JSON 배열
+
+    Returns:
+        UserInput 목록
+
+    Raises:
+        ValidationError: JSON 형식 오류 또는 검증 실패 (오류 위치는 (순번, 필드))
+    """
+    with _gc_paused():
+        return _records_adapter().validate_json(data)
+
+
+def validate_json_lines(
+    lines: Union[bytes, str, Iterable[Union[bytes, str]]]
+) -> Iterator[tuple[Optional[UserInput], list[dict]]]:
+    """
+    JSONL을 한 줄씩 UserInput으로 검증
+
+    Args:
+        lines: JSONL 전체(bytes/str) 또는 줄 단위 반복자 (열린 파일 등)
+
+    Yields:
+        (UserInput 또는 None, 오류 목록) - 빈 줄은 건너뜀
+    """
+    if isinstance(lines, (bytes, str)):
+        lines = lines.splitlines()
+
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            yield UserInput.model_validate_json(line), []
+        except ValidationError as e:
+            yield None, format_validation_error(e)
+
+
+def construct_trusted(record: dict) -> UserInput:
+    """
+    검증된 레코드로 UserInput 생성 (필드 검증 생략)
+
+    UserInput.model_dump() 결과처럼 이미 검증을 거친 레코드에만 사용합니다.
+    범위/형식 검사는 하지 않지만 PTA/비대칭 자동 계산은 UserInput과 같이 실행하며,
+    정의되지 않은 키는 무시합니다.
+
+    Args:
+        record: UserInput 필드 딕셔너리
+
+    Returns:
+        UserInput
+
+    Raises:
+        ValueError: 필수 항목이 없거나 PTA를 계산할 수 없는 경우
+    """
+    if not _REQUIRED <= record.keys():
+        missing = ", ".join(sorted(_REQUIRED - record.keys()))
+        raise ValueError(f"필수 항목이 없습니다: {missing}")
+
+    if record.keys() <= _FIELD_NAMES:
+        # model_dump() 결과처럼 모든 필드가 있으면 복사만 (기본값 채우기 생략)
+        values = dict(record) if len(record) == len(_DEFAULTS) else {**_DEFAULTS, **record}
+        fields_set = set(record)
+    else:
+        values = {name: record.get(name, default) for name, default in _DEFAULTS.items()}
+        fields_set = _FIELD_NAMES & record.keys()
+    for name, factory in _FACTORIES:
+        if name not in record:
+            values[name] = factory()
+
+    updates = derive_pta_and_asymmetry(values)
+    if updates:
+        values.update(updates)
+        fields_set |= updates.keys()
+
+    # BaseModel.model_construct와 같은 방식으로 생성 (기본값 처리는 위에서 완료)
+    user_input = UserInput.__new__(UserInput)
+    object.__setattr__(user_input, "__dict__", values)
+    object.__setattr__(user_input, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(user_input, "__pydantic_extra__", None)
+    object.__setattr__(user_input, "__pydantic_private__", None)
+    return user_input
+
+
+def load_trusted_json(data: Union[bytes, str]) -> list[UserInput]:
+    """
+    검증된 레코드의 JSON 배열 또는 JSONL을 UserInput 목록으로 변환 (필드 검증 생략)
+
+    Args:
+        data: JSON 배열 또는 JSONL (bytes/str)
+
+    Returns:
+        UserInput 목록
+    """
+    with _gc_paused():
+        if data.lstrip()[:1] in (b"[", "["):
+            records = pydantic_core.from_json(data)
+        else:
+            records = [pydantic_core.from_json(line) for line in data.splitlines() if line.strip()]
+        return [construct_trusted(record) for record in records]
@@ -0,0 +1,320 @@
+"""
+예측 파이프라인 모듈
+입력 레코드 검증 → 전처리 → 예측 → 요약까지 한 번에 처리 (UI 없는 일괄 처리용)
+"""
+
+import csv
+import json
+import time
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional, TextIO, Union
+
+from pydantic import ValidationError
+
+from .schema import UserInput
+from .preprocess import preprocess_inputs
+from .predictor import predict_satisfaction, get_satisfaction_level
+from .summarizer import generate_summary, generate_recommendations
+from .weights import CompiledWeights
+
+
+# CSV 열 중 목록으로 해석할 항목 ("|" 또는 ";"로 구분)
+CSV_LIST_FIELDS = ("main_complaints",)
+
+
+def split_csv_list(value: str) -> list[str]:
+    """CSV 목록 항목 나누기 ("|" 또는 ";" 구분, 빈 항목 제외)"""
+    return [item.strip() for item in value.replace(";", "|").split("|") if item.strip()]
+
+
+def normalize_csv_row(row: dict) -> dict:
+    """
+    CSV 행을 UserInput 입력 딕셔너리로 정리
+
+    빈 칸은 생략(None 처리)하고, 목록 항목은 구분자로 나눕니다.
+    숫자/불리언 문자열 변환은 UserInput 검증에 맡깁니다.
+    """
+    record = {}
+    for key, value in row.items():
+        if key is None:
+            continue
+        key = key.strip()
+        if isinstance(value, str):
+            value = value.strip()
+        if value in ("", None):
+            continue
+        if key in CSV_LIST_FIELDS:
+            value = split_csv_list(value)
+        record[key] = value
+    return record
+
+
+def detect_format(path: Union[str, Path]) -> str:
+    """파일 확장자로 입력 형식 판별 (csv/jsonl)"""
+    suffix = Path(path).suffix.lower()
+    if suffix == ".csv":
+        return "csv"
+    if suffix in (".jsonl", ".ndjson", ".json"):
+        return "jsonl"
+    raise ValueError(f"지원하지 않는 입력 형식입니다: {suffix} (csv 또는 jsonl)")
+
+
+def iter_records(path: Union[str, Path], input_format: Optional[str] = None) -> Iterator[dict]:
+    """
+    입력 파일에서 레코드를 한 건씩 읽기
+
+    Args:
+        path: CSV 또는 JSONL 파일 경로
+        input_format: "csv" 또는 "jsonl" (None이면 확장자로 판별)
+
+    Yields:
+        UserInput 입력 딕셔너리 (JSON 파싱 실패 행은 {"_parse_error": 메시지})
+    """
+    input_format = input_format or detect_format(path)
+
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        if input_format == "csv":
+            for row in csv.DictReader(f):
+                yield normalize_csv_row(row)
+        elif input_format == "jsonl":
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield {"_parse_error": f"JSON 파싱 오류: {e}"}
+                    continue
+                if not isinstance(record, dict):
+                    yield {"_parse_error": "JSON 객체가 아닙니다."}
+                    continue
+                yield record
+        else:
+            raise ValueError(f"지원하지 않는 입력 형식입니다: {input_format}")
+
+
+def format_validation_error(error: ValidationError) -> list[dict]:
+    """ValidationError를 직렬화 가능한 오류 목록으로 변환"""
+    return [
+        {
+            "field": " → ".join(str(loc) for loc in err["loc"]),
+            "message": err["msg"],
+        }
+        for err in error.errors()
+    ]
+
+
+def validate_record(input_data: dict) -> tuple[Optional[UserInput], list[dict]]:
+    """
+    입력 레코드 검증
+
+    Returns:
+        (UserInput 또는 None, 오류 목록)
+    """
+    if "_parse_error" in input_data:
+        return None, [{"field": "", "message": input_data["_parse_error"]}]
+
+    try:
+        return UserInput(**input_data), []
+    except ValidationError as e:
+        return None, format_validation_error(e)
+    except TypeError as e:
+        return None, [{"field": "", "message": str(e)}]
+
+
+def predict_record(
+    user_input: UserInput,
+    weights: Union[dict, CompiledWeights, None] = None,
+    confidence: bool = False
+) -> dict:
+    """
+    검증된 입력 한 건 전처리 → 예측 → 요약
+
+    Args:
+        user_input: 검증된 입력
+        weights: 가중치 설정 (None이면 캐시된 기본 가중치)
+        confidence: 몬테카를로 신뢰도 추정 포함 여부
+
+    Returns:
+        {"customer_name", "features", "score", "satisfaction_level",
+         "breakdown", "summary", "recommendations"}
+        (+ confidence=True이면 "confidence": estimate_confidence() 결과)
+    """
+    features = preprocess_inputs(user_input)
+    score, breakdown = predict_satisfaction(features, weights)
+
+    result = {
+        "customer_name": user_input.customer_name,
+        "features": features,
+        "score": score,
+        "satisfaction_level": get_satisfaction_level(score),
+        "breakdown": breakdown,
+        "summary": generate_summary(score, features, breakdown),
+        "recommendations": generate_recommendations(score, features, breakdown),
+    }
+    if confidence:
+        # 신뢰도 추정(numpy)은 요청한 경우에만 로드
+        from .uncertainty import estimate_confidence
+        result["confidence"] = estimate_confidence(features, weights)
+    return result
+
+
+def score_record(
+    input_data: dict,
+    weights: Union[dict, CompiledWeights, None] = None,
+    confidence: bool = False
+) -> dict:
+    """
+    입력 레코드 한 건 처리 (main.py의 예측 흐름과 동일)
+
+    Args:
+        input_data: UserInput 입력 딕셔너리
+        weights: 가중치 설정 (None이면 캐시된 기본 가중치)
+        confidence: 몬테카를로 신뢰도 추정 포함 여부
+
+    Returns:
+        성공: {"ok": True, "customer_name", "score", "satisfaction_level",
+               "breakdown", "summary", "recommendations"}
+        실패: {"ok": False, "errors": [{"field", "message"}, ...]}
+    """
+    user_input, errors = validate_record(input_data)
+    if user_input is None:
+        return {"ok": False, "errors": errors}
+
+    result = predict_record(user_input, weights, confidence)
+    del result["features"]
+    return {"ok": True, **result}
+
+
+class Throughput:
+    """처리량 카운터 (처리 건수, 실패 건수, 초당 처리량)"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.total = 0
+        self.failed = 0
+
+    def add(self, ok: bool):
+        """처리 결과 한 건 기록"""
+        self.total += 1
+        if not ok:
+            self.failed += 1
+
+    @property
+    def succeeded(self) -> int:
+        return self.total - self.failed
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    @property
+    def rate(self) -> float:
+        """초당 처리 건수"""
+        elapsed = self.elapsed
+        return self.total / elapsed if elapsed > 0 else 0.0
+
+    def format(self) -> str:
+        return f"{self.total}건 (실패 {self.failed}건), {self.elapsed:.2f}초, {self.rate:.0f}건/초"
+
+
+def stream_predictions(
+    records: Iterable[dict],
+    weights: Union[dict, CompiledWeights, None] = None,
+    on_error: Optional[Callable[[dict], None]] = None,
+    counter: Optional[Throughput] = None,
+    confidence: bool = False
+) -> Iterator[dict]:
+    """
+    레코드를 한 건씩 검증·예측하는 제너레이터 (메모리 사용량 일정)
+
+    Args:
+        records: UserInput 입력 딕셔너리 iterable (iter_records 등 지연 읽기 권장)
+        weights: 가중치 설정 (None이면 캐시된 기본 가중치)
+        on_error: 검증 실패 레코드 처리 콜백 ({"index", "errors", "input"})
+            - 실패한 레코드는 결과에서 제외되고 이 콜백으로만 전달됨
+        counter: 처리량 카운터 (선택)
+        confidence: 몬테카를로 신뢰도 추정 포함 여부
+
+    Yields:
+        {"index", "customer_name", "features", "score", "satisfaction_level",
+         "breakdown", "summary", "recommendations"}
+    """
+    for index, input_data in enumerate(records):
+        user_input, errors = validate_record(input_data)
+        if user_input is None:
+            if counter is not None:
+                counter.add(False)
+            if on_error is not None:
+                on_error({"index": index, "errors": errors, "input": input_data})
+            continue
+
+        result = predict_record(user_input, weights, confidence)
+        if counter is not None:
+            counter.add(True)
+        yield {"index": index, **result}
+
+
+def write_jsonl(items: Iterable[dict], out: TextIO) -> int:
+    """
+    결과를 한 줄씩 JSONL로 기록 (기록 즉시 다음 항목 처리)
+
+    Returns:
+        기록한 줄 수
+    """
+    count = 0
+    for item in items:
+        out.write(json.dumps(item, ensure_ascii=False) + "\n")
+        count += 1
+    return count
+
+
+def run_stream(
+    input_path: Union[str, Path],
+    out: TextIO,
+    errors_out: Optional[TextIO] = None,
+    weights: Union[dict, CompiledWeights, None] = None,
+    input_format: Optional[str] = None,
+    progress: Optional[Callable[[Throughput], None]] = None,
+    progress_every: int = 10000,
+    confidence: bool = False
+) -> Throughput:
+    """
+    입력 파일 → 예측 → JSONL 출력 스트리밍 실행
+
+    Args:
+        input_path: CSV 또는 JSONL 입력 파일
+        out: 결과 출력 스트림
+        errors_out: 검증 실패 레코드 출력 스트림 (None이면 버림)
+        weights: 가중치 설정 (None이면 캐시된 기본 가중치)
+        input_format: "csv" 또는 "jsonl" (None이면 확장자로 판별)
+        progress: 진행 상황 콜백 (progress_every건마다 호출)
+        progress_every: 진행 상황 보고 간격
+        confidence: 몬테카를로 신뢰도 추정 포함 여부
+
+    Returns:
+        처리량 카운터
+    """
+    counter = Throughput()
+
+    def on_error(error: dict):
+        if errors_out is not None:
+            errors_out.write(json.dumps(error, ensure_ascii=False) + "\n")
+
+    def report_progress(results: Iterator[dict]) -> Iterator[dict]:
+        next_report = progress_every
+        for result in results:
+            yield result
+            if counter.total >= next_report:
+                progress(counter)
+                next_report = counter.total + progress_every
+
+    results = stream_predictions(
+        iter_records(input_path, input_format), weights, on_error, counter, confidence
+    )
+    if progress is not None:
+        results = report_progress(results)
+    write_jsonl(results, out)
+
+    return counter
@@ -3,14 +3,15 @@
 규칙 기반 예측 알고리즘
 """
 
-import json
-from pathlib import Path
-from typing import Tuple
+from typing import Tuple, Union
+
+from .weights import CompiledWeights, DEFAULT_WEIGHTS_PATH, get_compiled_weights, read_weights_file
+from .tracing import traced
 
 
 def load_weights(weights_path: str = None) -> dict:
     """
-    가중치 설정 파일 로드
+    가중치 설정 파일 로드 (항상 파일을 새로 읽음, 캐시는 weights.get_weights 사용)
 
     Args:
         weights_path: 가중치 파일 경로 (None이면 기본 파일 사용)
@@ -20,13 +21,9 @@ def load_weights(weights_path: str = None) -> dict:
     """
     if weights_path is None:
         # 기본 가중치 파일 경로
-        current_dir = Path(__file__).parent
-        weights_path = current_dir / ".." / "data" / "weights.default.json"
-
-    with open(weights_path, "r", encoding="utf-8") as f:
-        weights = json.load(f)
+        weights_path = DEFAULT_WEIGHTS_PATH
 
-    return weights
+    return read_weights_file(weights_path)
 
 
 def calculate_speech_score_weight(speech_score: int, weights: dict) -> int:
@@ -101,17 +98,23 @@ def clamp(value: float, min_val: float, max_val: float) -> float:
     return max(min_val, min(max_val, value))
 
 
-def calculate_unilateral_penalty(features: dict, weights: dict) -> Tuple[int, dict]:
+def calculate_unilateral_penalty(
+    features: dict,
+    weights: Union[dict, CompiledWeights]
+) -> Tuple[int, dict]:
     """
     단측 착용 시 페널티 계산 (양측 난청인데 단측 착용하는 경우)
 
     Args:
         features: 전처리된 특징 딕셔너리
-        weights: 가중치 설정
+        weights: 가중치 설정 딕셔너리 또는 CompiledWeights
 
     Returns:
         (페널티 점수, 상세 breakdown)
     """
+    if isinstance(weights, CompiledWeights):
+        return _calculate_unilateral_penalty_compiled(features, weights)
+
     fitting_plan = features.get("fitting_plan", "bilateral")
 
     # 양측 착용이면 페널티 없음
@@ -184,19 +187,112 @@ def calculate_unilateral_penalty(features: dict, weights: dict) -> Tuple[int, di
     }
 
 
-def predict_satisfaction(features: dict, weights: dict = None) -> Tuple[int, dict]:
+def _calculate_unilateral_penalty_compiled(features: dict, weights: CompiledWeights) -> Tuple[int, dict]:
+    """calculate_unilateral_penalty의 CompiledWeights 버전 (동일한 결과)"""
+    fitting_plan = features.get("fitting_plan", "bilateral")
+
+    if fitting_plan == "bilateral":
+        return 0, {
+            "is_unilateral": False,
+            "penalty": 0
+        }
+
+    config = weights.binaural
+    if config is None:
+        raise KeyError("binaural")
+
+    threshold = config.threshold
+    left_need = clamp((features["pta_left"] - threshold) / 40, 0, 1)
+    right_need = clamp((features["pta_right"] - threshold) / 40, 0, 1)
+    need = (left_need + right_need) / 2
+    need += config.lifestyle_bonus[features["lifestyle"]]
+    if not features["experience"]:
+        need += config.first_time_bonus
+    need = clamp(need, 0, 1)
+
+    asymmetry_db = features["asymmetry_db"]
+    if asymmetry_db <= config.relief_start_db:
+        relief = 0
+    elif asymmetry_db >= config.relief_full_db:
+        relief = 1
+    else:
+        relief = (asymmetry_db - config.relief_start_db) / config.relief_span_db
+
+    budget_relief = config.low_budget_relief if features["budget"] == "low" else 0
+
+    penalty = config.base_penalty * need * (1 - 0.7 * relief) * (1 - budget_relief)
+    penalty = -int(clamp(penalty, 0, config.max_penalty))
+
+    return penalty, {
+        "is_unilateral": True,
+        "fitting_plan": fitting_plan,
+        "need": round(need, 2),
+        "asymmetry_relief": round(relief, 2),
+        "budget_relief": budget_relief,
+        "penalty": penalty
+    }
+
+
+def _predict_satisfaction_compiled(features: dict, weights: CompiledWeights) -> Tuple[int, dict]:
+    """predict_satisfaction의 CompiledWeights 버전 (동일한 breakdown)"""
+    loss_level = features["loss_level"]
+
+    base = weights.base_score
+    loss_weight = weights.loss_level_by_name[loss_level]
+    speech_weight = weights.speech_score.lookup(features["speech_score"])
+    lifestyle_weight = weights.lifestyle_by_name[features["lifestyle"]]
+    experience_weight = weights.experience[1 if features["experience"] else 0]
+    tinnitus_weight = weights.tinnitus[1 if features["tinnitus"] else 0]
+    asymmetry_penalty = weights.asymmetry_penalty(features["asymmetry_db"])
+    budget_weight = weights.budget_by_name[features["budget"]]
+    type_weight = weights.type_fit_by_name[loss_level][features["desired_type"]]
+    age_weight = weights.age.lookup(features["age"])
+    unilateral_penalty, unilateral_detail = _calculate_unilateral_penalty_compiled(features, weights)
+
+    # 딕셔너리 경로와 같은 순서로 합산 (실수 가중치에서도 동일한 결과)
+    score = base + loss_weight + speech_weight + lifestyle_weight + experience_weight
+    score = score + tinnitus_weight + asymmetry_penalty + budget_weight + type_weight
+    score = score + age_weight + unilateral_penalty
+    final_score = max(0, min(100, int(score)))
+
+    return final_score, {
+        "base": base,
+        "loss_level": loss_weight,
+        "speech_score": speech_weight,
+        "lifestyle": lifestyle_weight,
+        "experience": experience_weight,
+        "tinnitus": tinnitus_weight,
+        "asymmetry_penalty": asymmetry_penalty,
+        "budget": budget_weight,
+        "type_fit": type_weight,
+        "age_adjustment": age_weight,
+        "unilateral_penalty": unilateral_penalty,
+        "unilateral_detail": unilateral_detail,
+        "final_score": final_score
+    }
+
+
+@traced()
+def predict_satisfaction(
+    features: dict,
+    weights: Union[dict, CompiledWeights] = None
+) -> Tuple[int, dict]:
     """
     규칙 기반 만족도 예측
 
     Args:
         features: 전처리된 특징 딕셔너리
-        weights: 가중치 설정 (None이면 기본 파일 로드)
+        weights: 가중치 설정 딕셔너리 또는 CompiledWeights
+            (None이면 캐시된 기본 가중치 사용 - 파일 변경 시 자동 재로드)
 
     Returns:
         (예측 점수 0~100, 점수 breakdown 딕셔너리)
     """
     if weights is None:
-        weights = load_weights()
+        weights = get_compiled_weights()
+
+    if isinstance(weights, CompiledWeights):
+        return _predict_satisfaction_compiled(features, weights)
 
     # 점수 breakdown 초기화
     breakdown = {}
@@ -4,7 +4,8 @@
 """
 
 from typing import Literal
-from core.schema import UserInput
+from .schema import UserInput
+from .tracing import traced
 
 
 # 청력 손실 수준 분류 기준 (dB HL)
@@ -36,6 +37,7 @@ def classify_loss_level(pta: float) -> Literal["mild", "moderate", "severe", "pr
         return "profound"
 
 
+@traced()
 def preprocess_inputs(user_input: UserInput) -> dict:
     """
     사용자 입력을 예측 엔진에 사용할 특징(feature)으로 변환
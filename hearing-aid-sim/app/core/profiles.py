@@ -0,0 +1,215 @@
+"""
+가중치 프로파일 모듈
+여러 가중치 설정(기본, 브랜드별, 시범 운영 등)을 이름으로 등록하고 한 번에 비교 예측
+"""
+
+from pathlib import Path
+from typing import Iterable, Mapping, Optional, Union
+
+import numpy as np
+
+from .batch_predictor import BREAKDOWN_KEYS, StackedWeights, encode_features, predict_satisfaction_stacked
+from .preprocess import preprocess_inputs
+from .schema import UserInput
+from .weights import CompiledWeights, WeightsRegistry, compile_weights, get_registry
+
+
+ProfileSource = Union[str, Path, dict, CompiledWeights]
+
+
+def profile_name_from_path(path: Union[str, Path]) -> str:
+    """파일명에서 프로파일 이름 추출 (weights.default.json → default)"""
+    name = Path(path).name
+    if name.endswith(".json"):
+        name = name[:-len(".json")]
+    if name.startswith("weights."):
+        name = name[len("weights."):]
+    return name
+
+
+class WeightProfiles:
+    """
+    이름 있는 가중치 프로파일 모음
+
+    파일 경로로 등록한 프로파일은 WeightsRegistry 캐시를 거치므로 파일이 바뀌면
+    자동으로 다시 로드됩니다. 배치 예측은 모든 프로파일을 StackedWeights로 쌓아
+    한 번의 벡터 연산으로 (프로파일 × 레코드) 점수 행렬을 계산합니다.
+    """
+
+    def __init__(
+        self,
+        profiles: Optional[Mapping[str, ProfileSource]] = None,
+        registry: Optional[WeightsRegistry] = None
+    ):
+        self._registry = registry or get_registry()
+        self._sources: dict = {}
+        self._stacked: Optional[StackedWeights] = None
+        for name, source in (profiles or {}).items():
+            self.add(name, source)
+
+    @classmethod
+    def from_directory(
+        cls,
+        directory: Union[str, Path],
+        pattern: str = "weights.*.json",
+        registry: Optional[WeightsRegistry] = None
+    ) -> "WeightProfiles":
+        """
+        디렉터리의 가중치 파일을 모두 프로파일로 등록
+
+        Args:
+            directory: 가중치 파일 디렉터리
+            pattern: 파일명 패턴
+            registry: 가중치 캐시 (None이면 전역 레지스트리)
+
+        Returns:
+            WeightProfiles (이름은 파일명 기준, 예: weights.default.json → default)
+        """
+        paths = sorted(Path(directory).glob(pattern))
+        return cls({profile_name_from_path(path): path for path in paths}, registry)
+
+    def add(self, name: str, source: ProfileSource):
+        """
+        프로파일 등록 (같은 이름이 있으면 교체)
+
+        Args:
+            name: 프로파일 이름
+            source: 가중치 파일 경로, 가중치 딕셔너리 또는 CompiledWeights
+        """
+        if isinstance(source, dict):
+            source = compile_weights(source)
+        elif not isinstance(source, CompiledWeights):
+            source = Path(source)
+        self._sources[name] = source
+        self._stacked = None
+
+    def remove(self, name: str):
+        """프로파일 삭제"""
+        del self._sources[name]
+        self._stacked = None
+
+    @property
+    def names(self) -> list[str]:
+        """등록 순서대로 프로파일 이름"""
+        return list(self._sources)
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+    def compiled(self) -> list[CompiledWeights]:
+        """프로파일별 CompiledWeights (파일 프로파일은 캐시 확인 후 반환)"""
+        return [
+            source if isinstance(source, CompiledWeights) else self._registry.get_compiled(source)
+            for source in self._sources.values()
+        ]
+
+    def stacked(self) -> StackedWeights:
+        """프로파일 전체를 쌓은 가중치 (파일이 바뀐 경우에만 다시 구성)"""
+        if not self._sources:
+            raise ValueError("등록된 가중치 프로파일이 없습니다.")
+        compiled = self.compiled()
+        stacked = self._stacked
+        if stacked is None or any(a is not b for a, b in zip(stacked.weights, compiled)):
+            stacked = StackedWeights(compiled)
+            self._stacked = stacked
+        return stacked
+
+    def score_features(self, features: dict) -> dict:
+        """
+        전처리된 특징 한 건을 모든 프로파일로 예측
+
+        Args:
+            features: 전처리된 특징 딕셔너리 (preprocess_inputs 결과)
+
+        Returns:
+            {"profiles": 이름 목록, "scores": {이름: 점수}, "breakdowns": {이름: breakdown}}
+            - breakdown: predict_satisfaction()과 같은 키 (unilateral_detail은 is_unilateral, penalty만 포함)
+            - binaural 섹션이 없는 프로파일은 단측 착용 입력에서 점수/breakdown이 None
+        """
+        result = self.score_batch([features])
+        unilateral = features.get("fitting_plan", "bilateral") != "bilateral"
+        scores = {}
+        breakdowns = {}
+        for p, name in enumerate(result["profiles"]):
+            if not result["scored"][p, 0]:
+                scores[name] = breakdowns[name] = None
+                continue
+            breakdown = {key: result[key][p, 0].item() for key in BREAKDOWN_KEYS}
+            breakdown["unilateral_detail"] = {"is_unilateral": unilateral, "penalty": breakdown["unilateral_penalty"]}
+            breakdown["final_score"] = scores[name] = result["final_score"][p, 0].item()
+            breakdowns[name] = breakdown
+        return {"profiles": result["profiles"], "scores": scores, "breakdowns": breakdowns}
+
+    def score_input(self, input_data: dict) -> dict:
+        """
+        입력 한 건을 검증·전처리(한 번)한 뒤 모든 프로파일로 예측
+
+        Args:
+            input_data: UserInput 입력 딕셔너리
+
+        Returns:
+            score_features() 결과 + "features"
+
+        Raises:
+            ValidationError: 입력 검증 실패 시
+        """
+        features = preprocess_inputs(UserInput(**input_data))
+        return {**self.score_features(features), "features": features}
+
+    def score_batch(self, batch: Union[Mapping[str, np.ndarray], Iterable[dict]]) -> dict:
+        """
+        여러 건을 모든 프로파일로 한 번에 예측
+
+        Args:
+            batch: predict_satisfaction_batch()용 열 딕셔너리 또는 전처리된 특징 딕셔너리 목록
+
+        Returns:
+            {"profiles": 이름 목록, "final_score": (P, N) 점수 행렬,
+             <breakdown 키>: (P, N) 배열, "scored": (P, N) 점수 계산 여부}
+            - binaural 섹션이 없는 프로파일의 단측 착용 행만 scored가 False (다른 프로파일 점수는 유효)
+        """
+        columns = batch if isinstance(batch, Mapping) else encode_features(batch)
+        result = predict_satisfaction_stacked(columns, self.stacked())
+        return {"profiles": self.names, **result}
+
+
+def summarize_profile_scores(result: dict, baseline: Optional[str] = None) -> list[dict]:
+    """
+    프로파일별 점수 분포 요약 (A/B 비교용)
+
+    Args:
+        result: WeightProfiles.score_batch() 결과 ("scored"가 없으면 모든 점수를 사용)
+        baseline: 기준 프로파일 이름 (None이면 첫 번째 프로파일)
+
+    Returns:
+        [{"profile", "scored", "mean", "std", "min", "max", "mean_delta", "changed_ratio"}, ...]
+        - scored: 점수를 계산한 레코드 수 (분포는 이 레코드만으로 계산)
+        - mean_delta: 기준 대비 평균 점수 차이 (두 프로파일 모두 계산한 레코드 기준)
+        - changed_ratio: 기준과 점수가 다른 레코드 비율 (mean_delta와 같은 레코드 기준)
+    """
+    names = result["profiles"]
+    scores = result["final_score"]
+    scored = result.get("scored")
+    if scored is None:
+        scored = np.ones(scores.shape, dtype=bool)
+    baseline_index = names.index(baseline) if baseline is not None else 0
+    baseline_scores = scores[baseline_index]
+    baseline_scored = scored[baseline_index]
+
+    summary = []
+    for name, profile_scores, profile_scored in zip(names, scores, scored):
+        values = profile_scores[profile_scored]
+        both = profile_scored & baseline_scored
+        empty = values.size == 0
+        compared = both.any()
+        summary.append({
+            "profile": name,
+            "scored": int(values.size),
+            "mean": float(values.mean()) if not empty else None,
+            "std": float(values.std()) if not empty else None,
+            "min": int(values.min()) if not empty else None,
+            "max": int(values.max()) if not empty else None,
+            "mean_delta": float((profile_scores[both] - baseline_scores[both]).mean()) if compared else None,
+            "changed_ratio": float((profile_scores[both] != baseline_scores[both]).mean()) if compared else None,
+        })
+    return summary
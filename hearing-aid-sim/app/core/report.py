@@ -7,7 +7,10 @@ import json
 from datetime import datetime
 from typing import Dict, Any
 
+from .tracing import traced
 
+
+@traced()
 def generate_text_report(
     user_input_dict: dict,
     features: dict,
@@ -120,6 +123,7 @@ def generate_text_report(
     return "\n".join(report_lines)
 
 
+@traced()
 def generate_json_report(
     user_input_dict: dict,
     features: dict,
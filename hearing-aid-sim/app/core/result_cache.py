@@ -0,0 +1,155 @@
+"""
+예측 결과 캐시 모듈
+같은 입력과 같은 가중치의 예측 결과(특징, 점수, 요약, 차트, 시나리오 비교)를 재사용
+
+Streamlit 화면은 '만족도 예측하기' 버튼을 누를 때만 결과를 계산하므로(다른 위젯 조작으로
+다시 실행될 때는 결과를 다시 표시하지 않음), 이 캐시는 같은 입력으로 버튼을 다시 누른 경우
+(다른 세션 포함)에만 효과가 있습니다. 결과 묶음을 검증된 입력의 정규화 해시 + 가중치
+식별 문자열을 키로 보관하여 재사용합니다. 최근 사용한 max_entries개만 보관하므로
+오래 실행되는 서버에서도 메모리가 일정합니다.
+
+만료 시간이 없으므로 입력·가중치만으로 정해지는 값만 보관해야 합니다. 생성 시각이 들어가는
+리포트(report.bundle.ReportBundle)는 넣지 않습니다.
+
+사용법:
+    from core.result_cache import get_result_cache, input_key
+
+    key = input_key(user_input.model_dump(), get_weights_fingerprint(), chart_type="bar")
+    result = get_result_cache().get_or_build(key, lambda: run_prediction(user_input))
+
+환경 변수 HEARING_SIM_RESULT_CACHE_SIZE 로 보관 개수를 바꿀 수 있습니다 (0이면 캐시 안 함).
+캐시된 결과는 여러 세션이 공유하므로 호출 측에서 수정하면 안 됩니다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+from .tracing import span
+
+
+DEFAULT_MAX_ENTRIES = 128
+MAX_ENTRIES_ENV = "HEARING_SIM_RESULT_CACHE_SIZE"
+
+
+def input_key(user_input_dict: dict, weights_fingerprint: str, **options) -> str:
+    """
+    예측 결과 캐시 키
+
+    Args:
+        user_input_dict: 검증된 입력 (UserInput.model_dump())
+        weights_fingerprint: 가중치 식별 문자열 (weights.get_weights_fingerprint())
+        **options: 결과에 영향을 주는 화면 설정 (차트 종류 등)
+
+    Returns:
+        SHA-256 16진수 문자열 (키 순서와 관계없이 같은 입력이면 같은 값)
+    """
+    payload = json.dumps(
+        {"input": user_input_dict, "weights": weights_fingerprint, "options": options},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    예측 결과 LRU 캐시 (스레드 안전)
+
+    결과 생성은 잠금 밖에서 실행하므로 서로 다른 입력은 동시에 계산됩니다.
+    같은 키를 동시에 계산한 경우 먼저 저장된 결과를 모두에게 반환합니다.
+    생성 중 오류는 보관하지 않습니다.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Args:
+            max_entries: 보관할 결과 수 (0 이하이면 보관하지 않음)
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str):
+        """캐시된 결과 반환 (없으면 None)"""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return value
+
+    def get_or_build(self, key: str, build: Callable[[], object]):
+        """
+        캐시된 결과 반환 (없으면 build()로 생성 후 저장)
+
+        Args:
+            key: input_key() 결과
+            build: 결과 생성 함수 (None을 반환하면 안 됨)
+
+        Returns:
+            캐시된 결과 또는 새로 생성한 결과
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        with span("result_cache.build"):
+            value = build()
+
+        with self._lock:
+            self.misses += 1
+            if self.max_entries <= 0:
+                return value
+            value = self._entries.setdefault(key, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self):
+        """캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        """캐시 통계 {"entries", "hits", "misses", "evictions"}"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+# 프로세스 전역 캐시 (Streamlit 서버의 모든 세션이 공유)
+_cache = ResultCache(int(os.environ.get(MAX_ENTRIES_ENV, DEFAULT_MAX_ENTRIES)))
+
+
+def get_result_cache() -> ResultCache:
+    """프로세스 전역 예측 결과 캐시 반환"""
+    return _cache
+
+
+def set_result_cache(cache: ResultCache) -> ResultCache:
+    """
+    프로세스 전역 예측 결과 캐시 교체
+
+    Returns:
+        이전 캐시
+    """
+    global _cache
+    previous = _cache
+    _cache = cache
+    return previous
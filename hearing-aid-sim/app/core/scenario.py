@@ -0,0 +1,190 @@
+"""
+시나리오 비교 모듈
+보청기 형태/예산/착용 계획/생활 환경 대안을 한 번에 예측하여 순위표로 반환
+"""
+
+import itertools
+from typing import Iterable, Mapping, Optional, Union
+
+from .predictor import predict_satisfaction, calculate_unilateral_penalty
+from .tracing import traced
+from .weights import (
+    CompiledWeights,
+    compile_weights,
+    get_compiled_weights,
+    DEVICE_TYPES,
+    BUDGETS,
+    FITTING_PLANS,
+    LIFESTYLES,
+)
+
+
+# 비교 가능한 축과 기본 후보값
+SWEEP_AXES = {
+    "desired_type": DEVICE_TYPES,
+    "budget": BUDGETS,
+    "fitting_plan": FITTING_PLANS,
+    "lifestyle": LIFESTYLES,
+}
+
+
+def _resolve_axes(axes) -> dict:
+    """축 지정값을 {축 이름: 후보값 튜플}로 정리"""
+    if axes is None:
+        return dict(SWEEP_AXES)
+
+    if isinstance(axes, str):
+        axes = [axes]
+
+    if isinstance(axes, Mapping):
+        items = axes.items()
+    else:
+        items = ((name, None) for name in axes)
+
+    resolved = {}
+    for name, values in items:
+        if name not in SWEEP_AXES:
+            raise ValueError(f"비교할 수 없는 항목입니다: {name} (가능: {', '.join(SWEEP_AXES)})")
+        values = SWEEP_AXES[name] if values is None else tuple(values)
+        invalid = [value for value in values if value not in SWEEP_AXES[name]]
+        if invalid or not values:
+            raise ValueError(f"'{name}' 후보값이 잘못되었습니다: {invalid or values}")
+        resolved[name] = values
+    return resolved
+
+
+@traced()
+def sweep_scenarios(
+    features: dict,
+    axes: Union[Mapping[str, Iterable[str]], Iterable[str], None] = None,
+    weights: Union[dict, CompiledWeights, None] = None
+) -> list[dict]:
+    """
+    선택 항목을 바꿔 가며 만족도를 일괄 예측
+
+    한 번 계산한 항목은 재사용하고 바뀌는 축에 의존하는 항목만 다시 계산합니다.
+    (lifestyle → 생활 환경, budget → 예산, desired_type → 형태 적합성,
+    fitting_plan/lifestyle/budget → 단측 착용 페널티)
+
+    Args:
+        features: 전처리된 특징 딕셔너리 (현재 선택 기준)
+        axes: 비교할 축 - 이름 목록(전체 후보값) 또는 {이름: 후보값 목록}
+            (None이면 desired_type, budget, fitting_plan, lifestyle 전체 4×3×3×3)
+        weights: 가중치 설정 딕셔너리 또는 CompiledWeights (None이면 캐시된 기본 가중치)
+
+    Returns:
+        점수 내림차순 시나리오 목록
+        [{"rank", "desired_type", "budget", "fitting_plan", "lifestyle",
+          "score", "delta", "is_current", "breakdown"}, ...]
+    """
+    if weights is None:
+        weights = get_compiled_weights()
+    elif not isinstance(weights, CompiledWeights):
+        weights = compile_weights(weights)
+
+    axes = _resolve_axes(axes)
+    base_score, base_breakdown = predict_satisfaction(features, weights)
+
+    current = {name: features.get(name, "bilateral" if name == "fitting_plan" else None)
+               for name in SWEEP_AXES}
+    candidates = {name: axes.get(name, (current[name],)) for name in SWEEP_AXES}
+
+    # 축별 항목 캐시 (바뀌지 않는 항목은 base_breakdown 값을 그대로 사용)
+    loss_level = features["loss_level"]
+    lifestyle_terms = {value: weights.lifestyle_by_name[value] for value in candidates["lifestyle"]}
+    budget_terms = {value: weights.budget_by_name[value] for value in candidates["budget"]}
+    type_terms = {value: weights.type_fit_by_name[loss_level][value] for value in candidates["desired_type"]}
+
+    unilateral_terms = {}
+    for plan, lifestyle, budget in itertools.product(
+        candidates["fitting_plan"], candidates["lifestyle"], candidates["budget"]
+    ):
+        scenario_features = dict(features, fitting_plan=plan, lifestyle=lifestyle, budget=budget)
+        unilateral_terms[(plan, lifestyle, budget)] = calculate_unilateral_penalty(scenario_features, weights)
+
+    rows = []
+    for desired_type, budget, fitting_plan, lifestyle in itertools.product(
+        candidates["desired_type"], candidates["budget"],
+        candidates["fitting_plan"], candidates["lifestyle"]
+    ):
+        unilateral_penalty, unilateral_detail = unilateral_terms[(fitting_plan, lifestyle, budget)]
+
+        breakdown = dict(base_breakdown)
+        breakdown["lifestyle"] = lifestyle_terms[lifestyle]
+        breakdown["budget"] = budget_terms[budget]
+        breakdown["type_fit"] = type_terms[desired_type]
+        breakdown["unilateral_penalty"] = unilateral_penalty
+        breakdown["unilateral_detail"] = unilateral_detail
+
+        # predict_satisfaction과 같은 순서로 합산
+        score = breakdown["base"] + breakdown["loss_level"] + breakdown["speech_score"]
+        score = score + breakdown["lifestyle"] + breakdown["experience"] + breakdown["tinnitus"]
+        score = score + breakdown["asymmetry_penalty"] + breakdown["budget"] + breakdown["type_fit"]
+        score = score + breakdown["age_adjustment"] + breakdown["unilateral_penalty"]
+        final_score = max(0, min(100, int(score)))
+        breakdown["final_score"] = final_score
+
+        rows.append({
+            "desired_type": desired_type,
+            "budget": budget,
+            "fitting_plan": fitting_plan,
+            "lifestyle": lifestyle,
+            "score": final_score,
+            "delta": final_score - base_score,
+            "is_current": (
+                desired_type == current["desired_type"]
+                and budget == current["budget"]
+                and fitting_plan == current["fitting_plan"]
+                and lifestyle == current["lifestyle"]
+            ),
+            "breakdown": breakdown,
+        })
+
+    # 점수 내림차순 (동점이면 현재 선택 우선, 이후 생성 순서 유지)
+    rows.sort(key=lambda row: (-row["score"], not row["is_current"]))
+    for rank, row in enumerate(rows, 1):
+        row["rank"] = rank
+
+    return rows
+
+
+def scenario_matrix(
+    rows: list[dict],
+    row_axis: str = "desired_type",
+    col_axis: str = "fitting_plan",
+    fixed: Optional[Mapping[str, str]] = None
+) -> dict:
+    """
+    시나리오 목록을 2차원 비교표로 변환 (나머지 축은 최고 점수 기준)
+
+    Args:
+        rows: sweep_scenarios() 결과
+        row_axis: 행 축 이름
+        col_axis: 열 축 이름
+        fixed: 고정할 축 값 (예: {"budget": "mid"})
+
+    Returns:
+        {"rows": 행 값 목록, "columns": 열 값 목록,
+         "scores": {(행 값, 열 값): 점수}, "best": {(행 값, 열 값): 시나리오}}
+    """
+    if row_axis not in SWEEP_AXES or col_axis not in SWEEP_AXES or row_axis == col_axis:
+        raise ValueError("행/열 축은 서로 다른 비교 항목이어야 합니다.")
+
+    fixed = fixed or {}
+    best = {}
+    for row in rows:
+        if any(row[name] != value for name, value in fixed.items()):
+            continue
+        key = (row[row_axis], row[col_axis])
+        if key not in best or row["score"] > best[key]["score"]:
+            best[key] = row
+
+    row_values = [value for value in SWEEP_AXES[row_axis] if any(key[0] == value for key in best)]
+    col_values = [value for value in SWEEP_AXES[col_axis] if any(key[1] == value for key in best)]
+
+    return {
+        "rows": row_values,
+        "columns": col_values,
+        "scores": {key: row["score"] for key, row in best.items()},
+        "best": best,
+    }
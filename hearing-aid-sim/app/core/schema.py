@@ -3,10 +3,61 @@
 Pydantic을 사용한 입력/출력 데이터 검증
 """
 
-from typing import Literal, Optional
+from typing import Literal, Mapping, NamedTuple, Optional, Union, get_args, get_origin
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 
+# PTA(순음청력역치 평균) 계산에 사용하는 주파수 (Hz)
+PTA_FREQUENCIES = (500, 1000, 2000, 4000)
+
+# 상담 가능 최소 연령 (미만이면 검증 실패)
+MIN_CONSULTATION_AGE = 10
+UNDER_AGE_MESSAGE = f"{MIN_CONSULTATION_AGE}세 미만은 상담이 어렵습니다. 전문의 상담을 권장합니다."
+
+# 좌/우 → (PTA 필드, PTA 계산용 주파수 필드, 데이터 부족 시 오류 메시지)
+PTA_SIDES = tuple(
+    (
+        f"audiogram_{side}_pta",
+        tuple(f"audiogram_{side}_{freq}hz" for freq in PTA_FREQUENCIES),
+        f"{label} 청력 데이터가 부족합니다. 500Hz, 1000Hz, 2000Hz, 4000Hz 값을 모두 입력하거나 PTA 값을 직접 입력하세요.",
+    )
+    for side, label in (("left", "좌측"), ("right", "우측"))
+)
+
+
+def derive_pta_and_asymmetry(values: Mapping) -> dict:
+    """
+    PTA와 좌우 비대칭 자동 계산 (UserInput 검증과 검증 생략 생성이 함께 사용)
+
+    PTA가 없으면 500Hz, 1000Hz, 2000Hz, 4000Hz 평균으로, 비대칭이 없으면
+    좌우 PTA 차이로 계산합니다.
+
+    Args:
+        values: UserInput 필드 이름 → 값 (모든 필드 포함)
+
+    Returns:
+        새로 계산한 값 {필드 이름: 값} (이미 입력된 항목은 포함하지 않음)
+
+    Raises:
+        ValueError: PTA도 없고 주파수별 값도 부족한 경우
+    """
+    updates = {}
+    for pta_field, freq_fields, message in PTA_SIDES:
+        if values[pta_field] is None:
+            freqs = [values[name] for name in freq_fields]
+            # 모든 주파수 데이터가 있는 경우에만 계산
+            if any(f is None for f in freqs):
+                raise ValueError(message)
+            updates[pta_field] = sum(freqs) / 4
+
+    if values["asymmetry_db"] is None:
+        left = updates.get("audiogram_left_pta", values["audiogram_left_pta"])
+        right = updates.get("audiogram_right_pta", values["audiogram_right_pta"])
+        updates["asymmetry_db"] = abs(left - right)
+
+    return updates
+
+
 class UserInput(BaseModel):
     """보청기 만족도 예측을 위한 사용자 입력 데이터"""
 
@@ -143,44 +194,15 @@ class UserInput(BaseModel):
         """나이 검증"""
         if v < 0 or v > 110:
             raise ValueError("나이는 0~110세 범위여야 합니다.")
-        if v < 10:
-            raise ValueError("10세 미만은 상담이 어렵습니다. 전문의 상담을 권장합니다.")
+        if v < MIN_CONSULTATION_AGE:
+            raise ValueError(UNDER_AGE_MESSAGE)
         return v
 
     @model_validator(mode='after')
     def calculate_pta_and_asymmetry(self) -> 'UserInput':
         """주파수별 데이터로부터 PTA 자동 계산 및 좌우 청력 비대칭 자동 계산"""
-        # 좌측 PTA 계산 (500Hz, 1000Hz, 2000Hz, 4000Hz 평균)
-        if self.audiogram_left_pta is None:
-            left_freqs = [
-                self.audiogram_left_500hz,
-                self.audiogram_left_1000hz,
-                self.audiogram_left_2000hz,
-                self.audiogram_left_4000hz
-            ]
-            # 모든 주파수 데이터가 있는 경우에만 계산
-            if all(f is not None for f in left_freqs):
-                self.audiogram_left_pta = sum(left_freqs) / 4
-            else:
-                raise ValueError("좌측 청력 데이터가 부족합니다. 500Hz, 1000Hz, 2000Hz, 4000Hz 값을 모두 입력하거나 PTA 값을 직접 입력하세요.")
-
-        # 우측 PTA 계산
-        if self.audiogram_right_pta is None:
-            right_freqs = [
-                self.audiogram_right_500hz,
-                self.audiogram_right_1000hz,
-                self.audiogram_right_2000hz,
-                self.audiogram_right_4000hz
-            ]
-            if all(f is not None for f in right_freqs):
-                self.audiogram_right_pta = sum(right_freqs) / 4
-            else:
-                raise ValueError("우측 청력 데이터가 부족합니다. 500Hz, 1000Hz, 2000Hz, 4000Hz 값을 모두 입력하거나 PTA 값을 직접 입력하세요.")
-
-        # 비대칭 계산
-        if self.asymmetry_db is None:
-            self.asymmetry_db = abs(self.audiogram_left_pta - self.audiogram_right_pta)
-
+        for name, value in derive_pta_and_asymmetry(self.__dict__).items():
+            setattr(self, name, value)
         return self
 
     def get_display_dict(self) -> dict:
@@ -223,6 +245,43 @@ class UserInput(BaseModel):
         }
 
 
+class FieldRule(NamedTuple):
+    """UserInput 필드 하나의 검증 규칙 (열 단위 검증기 core.columnar가 사용)"""
+    name: str
+    kind: str                       # "float" | "int" | "bool" | "choice" | "text" | "text_list"
+    required: bool
+    low: Optional[float] = None     # 최솟값 (Field ge)
+    high: Optional[float] = None    # 최댓값 (Field le)
+    choices: tuple = ()             # 허용 값 (Literal)
+
+
+def _field_rule(name: str, field) -> FieldRule:
+    """UserInput 필드 선언(타입, Field 제약)을 FieldRule로 변환"""
+    annotation = field.annotation
+    if get_origin(annotation) is Union:
+        annotation = next(arg for arg in get_args(annotation) if arg is not type(None))
+
+    choices = ()
+    if get_origin(annotation) is Literal:
+        kind, choices = "choice", get_args(annotation)
+    elif get_origin(annotation) is list:
+        kind = "text_list"
+    else:
+        kinds = {bool: "bool", int: "int", float: "float", str: "text"}
+        if annotation not in kinds:
+            raise TypeError(f"열 단위 검증 규칙을 만들 수 없는 필드입니다: {name} ({field.annotation})")
+        kind = kinds[annotation]
+
+    low = next((m.ge for m in field.metadata if hasattr(m, "ge")), None)
+    high = next((m.le for m in field.metadata if hasattr(m, "le")), None)
+    return FieldRule(name, kind, field.is_required(), low, high, choices)
+
+
+# 필드별 검증 규칙 (UserInput 선언에서 생성하므로 모델과 항상 같음, 필드 선언 순서)
+# 나이 하한(MIN_CONSULTATION_AGE)과 PTA 완결성(PTA_SIDES)은 위 상수를 함께 사용
+FIELD_RULES = tuple(_field_rule(name, field) for name, field in UserInput.model_fields.items())
+
+
 class PredictionOutput(BaseModel):
     """만족도 예측 결과 (Phase C에서 사용 예정)"""
     satisfaction_score: float = Field(
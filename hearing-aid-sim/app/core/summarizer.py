@@ -3,7 +3,10 @@
 예측 점수를 바탕으로 텍스트 요약 생성
 """
 
+from .tracing import traced
 
+
+@traced()
 def generate_summary(score: int, features: dict, breakdown: dict) -> str:
     """
     만족도 예측 결과를 사용자 친화적인 텍스트로 요약
@@ -120,6 +123,7 @@ def generate_summary(score: int, features: dict, breakdown: dict) -> str:
     return " ".join(sentences[:6])
 
 
+@traced()
 def generate_recommendations(score: int, features: dict, breakdown: dict) -> list[str]:
     """
     만족도 점수와 특징을 기반으로 추천 사항 생성
@@ -0,0 +1,304 @@
+"""
+단계별 처리 시간 추적 모듈
+검증 → 전처리 → 예측 → 차트 → 리포트 각 단계의 실행 시간과 메모리 할당 수를 링 버퍼에 기록
+
+사용법:
+    from core.tracing import span, traced, trace_run
+
+    @traced()
+    def predict_satisfaction(...): ...
+
+    with trace_run("예측 실행"):
+        with span("UserInput"):
+            ...
+
+비활성화 상태(기본값)에서는 플래그와 현재 실행만 확인하므로 추가 비용이 거의 없습니다.
+환경 변수 HEARING_SIM_TRACE=1 이면 시작 시 활성화됩니다.
+
+enable()/disable()은 프로세스 전체 설정입니다. Streamlit 세션처럼 요청 단위로 켜고 끄려면
+전역 설정은 그대로 두고 begin_run(name, enabled=True, session=...)으로 해당 실행만 기록한 뒤
+recent_runs(session=...)으로 그 세션의 기록만 조회합니다.
+"""
+
+import functools
+import itertools
+import os
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Optional
+
+
+DEFAULT_CAPACITY = 50
+# 실행(run) 1건당 최대 단계 기록 수 (반복 호출 폭주 방지)
+MAX_SPANS_PER_RUN = 1000
+
+_enabled = os.environ.get("HEARING_SIM_TRACE", "") not in ("", "0", "false")
+_runs: deque = deque(maxlen=DEFAULT_CAPACITY)
+_lock = threading.Lock()
+_run_ids = itertools.count(1)
+
+# 현재 실행과 중첩 깊이 (스레드/세션별, 실행 중이면 전역 설정과 관계없이 단계 기록)
+_current_run: ContextVar[Optional[dict]] = ContextVar("trace_run", default=None)
+_depth: ContextVar[int] = ContextVar("trace_depth", default=0)
+
+
+def enable(capacity: Optional[int] = None):
+    """
+    추적 활성화
+
+    Args:
+        capacity: 보관할 최근 실행 수 (None이면 기존 값 유지, 바꾸면 기존 기록은 최근 것만 유지)
+    """
+    global _enabled, _runs
+    if capacity is not None and capacity != _runs.maxlen:
+        with _lock:
+            _runs = deque(_runs, maxlen=capacity)
+    _enabled = True
+
+
+def disable():
+    """추적 비활성화 (기록은 유지)"""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def clear():
+    """기록 전체 삭제"""
+    with _lock:
+        _runs.clear()
+
+
+def _new_run(name: str, session: Optional[str] = None) -> dict:
+    return {
+        "id": next(_run_ids),
+        "name": name,
+        "session": session,
+        "started_at": time.time(),
+        "total_ms": None,
+        "spans": [],
+    }
+
+
+def _record(stage: str, wall_ms: float, alloc_blocks: int, depth: int):
+    """단계 기록 (실행 중이 아니면 단독 실행 1건으로 기록)"""
+    item = {"stage": stage, "wall_ms": wall_ms, "alloc_blocks": alloc_blocks, "depth": depth}
+    run = _current_run.get()
+    if run is not None:
+        if len(run["spans"]) < MAX_SPANS_PER_RUN:
+            run["spans"].append(item)
+        return
+
+    run = _new_run(stage)
+    run["total_ms"] = wall_ms
+    run["spans"].append(item)
+    with _lock:
+        _runs.append(run)
+
+
+class _Span:
+    """단계 측정 컨텍스트 (활성화 상태에서만 생성)"""
+
+    __slots__ = ("stage", "started", "blocks", "depth_token")
+
+    def __init__(self, stage: str):
+        self.stage = stage
+
+    def __enter__(self):
+        self.depth_token = _depth.set(_depth.get() + 1)
+        self.blocks = sys.getallocatedblocks()
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        wall_ms = (time.perf_counter() - self.started) * 1000
+        alloc_blocks = sys.getallocatedblocks() - self.blocks
+        _depth.reset(self.depth_token)
+        _record(self.stage, wall_ms, alloc_blocks, _depth.get())
+        return False
+
+
+class _NullSpan:
+    """비활성화 상태용 빈 컨텍스트 (공유 인스턴스)"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(stage: str):
+    """
+    단계 측정 컨텍스트 매니저
+
+    Args:
+        stage: 단계 이름 (예: "predictor.predict_satisfaction")
+
+    Returns:
+        with 문에 사용할 컨텍스트 (비활성화 상태이고 기록 중인 실행이 없으면 빈 컨텍스트)
+    """
+    if not _enabled and _current_run.get() is None:
+        return _NULL_SPAN
+    return _Span(stage)
+
+
+def traced(stage: Optional[str] = None) -> Callable:
+    """
+    함수 실행을 단계로 기록하는 데코레이터
+
+    Args:
+        stage: 단계 이름 (None이면 "모듈명.함수명")
+    """
+    def decorator(func: Callable) -> Callable:
+        name = stage or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled and _current_run.get() is None:
+                return func(*args, **kwargs)
+            with _Span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def begin_run(name: str, enabled: Optional[bool] = None, session: Optional[str] = None):
+    """
+    실행(run) 시작 - 이후 단계 기록을 한 실행으로 묶음
+
+    Args:
+        name: 실행 이름
+        enabled: 이 실행의 기록 여부 (None이면 전역 설정, True이면 전역 설정이 꺼져 있어도
+            현재 스레드/컨텍스트의 단계를 기록)
+        session: 실행을 구분할 세션 식별자 (recent_runs(session=...) 조회용)
+
+    Returns:
+        end_run()에 전달할 토큰 (기록하지 않으면 None)
+    """
+    if not (_enabled if enabled is None else enabled):
+        return None
+    run = _new_run(name, session)
+    return run, _current_run.set(run), time.perf_counter()
+
+
+def end_run(token) -> Optional[dict]:
+    """
+    실행 종료 및 링 버퍼에 기록
+
+    Args:
+        token: begin_run() 반환값
+
+    Returns:
+        기록한 실행 (토큰이 None이면 None)
+    """
+    if token is None:
+        return None
+    run, context_token, started = token
+    _current_run.reset(context_token)
+    run["total_ms"] = (time.perf_counter() - started) * 1000
+    with _lock:
+        _runs.append(run)
+    return run
+
+
+@contextmanager
+def trace_run(name: str, enabled: Optional[bool] = None, session: Optional[str] = None):
+    """실행(run) 단위 컨텍스트 매니저 (begin_run/end_run)"""
+    token = begin_run(name, enabled, session)
+    try:
+        yield
+    finally:
+        end_run(token)
+
+
+def recent_runs(limit: Optional[int] = None, session: Optional[str] = None) -> list[dict]:
+    """
+    최근 실행 기록 (최신순)
+
+    Args:
+        limit: 최대 개수 (None이면 전체)
+        session: 지정하면 begin_run(session=...)으로 시작한 해당 세션의 실행만
+
+    Returns:
+        [{"id", "name", "session", "started_at", "total_ms",
+          "spans": [{"stage", "wall_ms", "alloc_blocks", "depth"}]}]
+    """
+    with _lock:
+        runs = list(_runs)
+    if session is not None:
+        runs = [run for run in runs if run["session"] == session]
+    runs.reverse()
+    return runs if limit is None else runs[:limit]
+
+
+def _percentile(sorted_values: list, q: float) -> float:
+    """선형 보간 백분위수 (정렬된 목록)"""
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    position = (len(sorted_values) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def stage_stats(runs: Optional[list[dict]] = None) -> list[dict]:
+    """
+    단계별 처리 시간 통계
+
+    같은 실행에서 여러 번 호출된 단계는 합산하여 실행 1건의 값으로 봅니다.
+
+    Args:
+        runs: recent_runs() 결과 (None이면 전체 기록)
+
+    Returns:
+        [{"stage", "runs", "calls", "p50_ms", "p95_ms", "max_ms", "alloc_blocks_p50"}, ...]
+        (처음 기록된 순서, 실행 전체 시간은 "(전체)" 단계)
+    """
+    if runs is None:
+        runs = recent_runs()
+
+    per_stage: dict = {}
+    for run in runs:
+        totals: dict = {}
+        for item in run["spans"]:
+            total = totals.setdefault(item["stage"], [0.0, 0, 0])
+            total[0] += item["wall_ms"]
+            total[1] += item["alloc_blocks"]
+            total[2] += 1
+        if run["total_ms"] is not None and run["name"] not in totals:
+            totals["(전체)"] = [run["total_ms"], 0, 1]
+        for stage, (wall_ms, alloc_blocks, calls) in totals.items():
+            stats = per_stage.setdefault(stage, {"wall": [], "alloc": [], "calls": 0})
+            stats["wall"].append(wall_ms)
+            stats["alloc"].append(alloc_blocks)
+            stats["calls"] += calls
+
+    result = []
+    for stage, stats in per_stage.items():
+        wall = sorted(stats["wall"])
+        alloc = sorted(stats["alloc"])
+        result.append({
+            "stage": stage,
+            "runs": len(wall),
+            "calls": stats["calls"],
+            "p50_ms": _percentile(wall, 0.5),
+            "p95_ms": _percentile(wall, 0.95),
+            "max_ms": wall[-1],
+            "alloc_blocks_p50": _percentile(alloc, 0.5),
+        })
+    return result
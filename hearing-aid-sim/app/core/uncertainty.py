@@ -0,0 +1,196 @@
+"""
+예측 불확실성 모듈
+검사 오차(PTA, 어음명료도)와 가중치 오차를 몬테카를로로 섞어 점수 구간과 신뢰도를 추정
+"""
+
+from typing import Iterable, Optional, Union
+
+import numpy as np
+
+from .batch_predictor import BREAKDOWN_KEYS, encode_features, predict_satisfaction_batch
+from .predictor import get_satisfaction_level
+from .schema import FIELD_RULES, PredictionOutput
+from .tracing import traced
+from .weights import CompiledWeights, compile_weights, get_compiled_weights
+
+
+DEFAULT_SAMPLES = 2000
+
+# 순음청력검사 재검사 오차 (dB, 95% 범위)
+PTA_ERROR_DB = 5.0
+# 어음명료도 검사 단어 수 (귀당, 이항분포 오차)
+SPEECH_WORDS = 25
+# 가중치 상대 오차 (항목별 표준편차, 0.1 = 10%)
+WEIGHT_ERROR = 0.1
+# 점수 구간 수준
+INTERVAL_LEVEL = 0.9
+
+# 만족도 등급 경계 (get_satisfaction_level과 동일)
+LEVEL_BINS = (40, 55, 70, 85)
+
+# 검사 오차를 더한 PTA도 입력 허용 범위 안으로 제한 (UserInput 필드 제약 schema.FIELD_RULES에서 읽음)
+_FIELD_RULES = {rule.name: rule for rule in FIELD_RULES}
+PTA_RANGES = {
+    column: (_FIELD_RULES[field].low, _FIELD_RULES[field].high)
+    for column, field in (("pta_left", "audiogram_left_pta"), ("pta_right", "audiogram_right_pta"))
+}
+
+
+def _perturbed_columns(
+    features_list: list[dict],
+    n_samples: int,
+    rng: np.random.Generator,
+    pta_error_db: float,
+    speech_words: int
+) -> dict:
+    """환자별 n_samples개씩 검사 오차를 더한 열 딕셔너리 (환자 순서대로 이어 붙임)"""
+    columns = encode_features(features_list)
+    m = len(features_list)
+    shape = (m, n_samples)
+
+    def tile(array):
+        return np.repeat(np.asarray(array), n_samples)
+
+    pta_sd = pta_error_db / 1.96
+    pta = {column: columns[column][:, None] + rng.normal(0, pta_sd, shape) for column in ("pta_left", "pta_right")}
+
+    # 귀별 어음명료도 = 단어 정답 수 / 단어 수 (좌우 값이 없으면 평균값 사용)
+    speech_left = np.array([f.get("speech_score_left", f["speech_score"]) for f in features_list], dtype=float)
+    speech_right = np.array([f.get("speech_score_right", f["speech_score"]) for f in features_list], dtype=float)
+    left = rng.binomial(speech_words, np.clip(speech_left / 100, 0, 1)[:, None], shape)
+    right = rng.binomial(speech_words, np.clip(speech_right / 100, 0, 1)[:, None], shape)
+    speech = (left + right) * (50 / speech_words)
+
+    perturbed = {key: tile(value) for key, value in columns.items() if key not in ("asymmetry_db", "loss_level")}
+    for column, (low, high) in PTA_RANGES.items():
+        perturbed[column] = np.clip(pta[column], low, high).reshape(-1)
+    perturbed["speech_score"] = speech.reshape(-1)
+    return perturbed
+
+
+@traced()
+def estimate_confidence_batch(
+    features_list: Iterable[dict],
+    weights: Union[dict, CompiledWeights, None] = None,
+    n_samples: int = DEFAULT_SAMPLES,
+    pta_error_db: float = PTA_ERROR_DB,
+    speech_words: int = SPEECH_WORDS,
+    weight_error: float = WEIGHT_ERROR,
+    interval_level: float = INTERVAL_LEVEL,
+    seed: Optional[int] = 0
+) -> list[dict]:
+    """
+    여러 환자의 예측 신뢰도를 한 번에 추정
+
+    환자마다 n_samples개의 표본을 만들어 (1) PTA에 재검사 오차, (2) 어음명료도에
+    단어 수 기반 이항 오차, (3) 점수 항목별 가중치 상대 오차를 적용한 뒤
+    배치 예측으로 한 번에 다시 계산합니다.
+
+    Args:
+        features_list: 전처리된 특징 딕셔너리 목록 (preprocess_inputs 결과)
+        weights: 가중치 설정 (None이면 캐시된 기본 가중치)
+        n_samples: 환자당 표본 수
+        pta_error_db: PTA 재검사 오차 (dB, 95% 범위)
+        speech_words: 귀당 어음명료도 검사 단어 수
+        weight_error: 항목별 가중치 상대 오차 (표준편차)
+        interval_level: 점수 구간 수준 (0.9 → 5~95 백분위)
+        seed: 난수 시드 (같은 입력은 같은 결과, None이면 매번 다름)
+
+    Returns:
+        환자별 [{"score", "mean", "std", "interval", "interval_level",
+                  "confidence", "level_probabilities", "samples"}, ...]
+        - score: 오차 없는 예측 점수 (predict_satisfaction과 동일)
+        - interval: [하한, 상한] 점수 구간
+        - confidence: 표본이 예측 점수와 같은 만족도 등급에 속할 확률 (0~1)
+    """
+    if weights is None:
+        weights = get_compiled_weights()
+    elif not isinstance(weights, CompiledWeights):
+        weights = compile_weights(weights)
+
+    features_list = list(features_list)
+    if not features_list:
+        return []
+    if n_samples < 1:
+        raise ValueError("표본 수는 1 이상이어야 합니다.")
+
+    rng = np.random.default_rng(seed)
+    m = len(features_list)
+
+    point = predict_satisfaction_batch(encode_features(features_list), weights)["final_score"]
+
+    columns = _perturbed_columns(features_list, n_samples, rng, pta_error_db, speech_words)
+    breakdown = predict_satisfaction_batch(columns, weights)
+
+    # 항목별 가중치 오차 (표본마다 항목 전체를 같은 비율로 변경)
+    factors = 1 + rng.normal(0, weight_error, (len(BREAKDOWN_KEYS), m * n_samples))
+    total = np.zeros(m * n_samples)
+    for key, factor in zip(BREAKDOWN_KEYS, factors):
+        total += breakdown[key] * factor
+    scores = np.clip(np.trunc(total), 0, 100).reshape(m, n_samples)
+
+    tail = (1 - interval_level) / 2 * 100
+    lower, upper = np.percentile(scores, [tail, 100 - tail], axis=1)
+    levels = np.digitize(scores, LEVEL_BINS)
+    point_levels = np.digitize(point, LEVEL_BINS)
+    level_counts = np.stack([(levels == code).mean(axis=1) for code in range(len(LEVEL_BINS) + 1)], axis=1)
+
+    results = []
+    for i in range(m):
+        results.append({
+            "score": int(point[i]),
+            "mean": float(scores[i].mean()),
+            "std": float(scores[i].std()),
+            "interval": [int(np.floor(lower[i])), int(np.ceil(upper[i]))],
+            "interval_level": interval_level,
+            "confidence": float(level_counts[i, point_levels[i]]),
+            "level_probabilities": {
+                get_satisfaction_level(bound): float(level_counts[i, code])
+                for code, bound in enumerate((0,) + LEVEL_BINS)
+            },
+            "samples": n_samples,
+        })
+    return results
+
+
+def estimate_confidence(
+    features: dict,
+    weights: Union[dict, CompiledWeights, None] = None,
+    **kwargs
+) -> dict:
+    """
+    환자 한 명의 예측 신뢰도 추정 (UI 예측마다 실행 가능한 수준, 기본 2000표본 수 ms)
+
+    Args:
+        features: 전처리된 특징 딕셔너리
+        weights: 가중치 설정 (None이면 캐시된 기본 가중치)
+        **kwargs: estimate_confidence_batch() 옵션
+
+    Returns:
+        estimate_confidence_batch() 결과 한 건
+    """
+    return estimate_confidence_batch([features], weights, **kwargs)[0]
+
+
+def build_prediction_output(
+    estimate: dict,
+    summary: str,
+    recommendations: Optional[list[str]] = None
+) -> PredictionOutput:
+    """
+    신뢰도 추정 결과로 PredictionOutput 생성
+
+    Args:
+        estimate: estimate_confidence() 결과
+        summary: 예측 요약 텍스트
+        recommendations: 추천 사항 목록
+
+    Returns:
+        PredictionOutput
+    """
+    return PredictionOutput(
+        satisfaction_score=estimate["score"],
+        confidence=estimate["confidence"],
+        summary=summary,
+        recommendations=recommendations or []
+    )
@@ -0,0 +1,434 @@
+"""
+가중치 컴파일 모듈
+JSON 가중치를 검증하고 예측 엔진용 조회 테이블로 변환
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+
+logger = logging.getLogger(__name__)
+
+# 기본 가중치 파일 경로
+DEFAULT_WEIGHTS_PATH = Path(__file__).parent.parent / "data" / "weights.default.json"
+
+# 범주형 입력값 (schema.UserInput의 Literal 순서와 동일)
+LOSS_LEVELS = ("mild", "moderate", "severe", "profound")
+DEVICE_TYPES = ("BTE", "RIC", "ITE", "CIC")
+LIFESTYLES = ("quiet", "mixed", "noisy")
+BUDGETS = ("low", "mid", "high")
+FITTING_PLANS = ("bilateral", "unilateral_left", "unilateral_right")
+
+# 범주값 → 인덱스
+LOSS_LEVEL_INDEX = {name: i for i, name in enumerate(LOSS_LEVELS)}
+DEVICE_TYPE_INDEX = {name: i for i, name in enumerate(DEVICE_TYPES)}
+LIFESTYLE_INDEX = {name: i for i, name in enumerate(LIFESTYLES)}
+BUDGET_INDEX = {name: i for i, name in enumerate(BUDGETS)}
+FITTING_PLAN_INDEX = {name: i for i, name in enumerate(FITTING_PLANS)}
+
+# 구간 테이블 범위 (어음명료도 0~100%, 연령 0~110세)
+SPEECH_SCORE_MAX = 100
+AGE_MAX = 110
+
+BINAURAL_KEYS = (
+    "pta_need_threshold_db",
+    "base_unilateral_penalty",
+    "max_unilateral_penalty",
+    "asymmetry_relief_start_db",
+    "asymmetry_relief_full_db",
+    "noisy_env_need_bonus",
+    "mixed_env_need_bonus",
+    "first_time_need_bonus",
+    "low_budget_penalty_relief",
+)
+
+
+def _require(section: dict, key: str, where: str):
+    """필수 키 확인 후 값 반환"""
+    if not isinstance(section, dict) or key not in section:
+        raise ValueError(f"가중치 설정에 '{where}{key}' 항목이 없습니다.")
+    return section[key]
+
+
+def _require_number(section: dict, key: str, where: str = ""):
+    """필수 숫자 키 확인 후 값 반환"""
+    value = _require(section, key, where)
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"가중치 설정 '{where}{key}' 값은 숫자여야 합니다: {value!r}")
+    return value
+
+
+def _compile_ranges(ranges: list, where: str) -> tuple:
+    """구간 리스트 검증 후 (min, max, weight) 튜플로 변환"""
+    if not isinstance(ranges, list):
+        raise ValueError(f"가중치 설정 '{where}ranges'는 리스트여야 합니다.")
+
+    compiled = []
+    for i, range_config in enumerate(ranges):
+        item_where = f"{where}ranges[{i}]."
+        low = _require_number(range_config, "min", item_where)
+        high = _require_number(range_config, "max", item_where)
+        weight = _require_number(range_config, "weight", item_where)
+        if low > high:
+            raise ValueError(f"가중치 설정 '{where}ranges[{i}]'의 min이 max보다 큽니다.")
+        compiled.append((low, high, weight))
+
+    return tuple(compiled)
+
+
+class RangeTable:
+    """
+    구간 가중치 조회 테이블
+
+    0.5 단위 값(좌우 평균 어음명료도 등)은 미리 계산된 테이블에서 바로 조회하고,
+    그 외 값은 원래 구간 목록을 순서대로 확인합니다 (predictor의 선형 탐색과 동일한 결과).
+    """
+
+    __slots__ = ("ranges", "_table")
+
+    def __init__(self, ranges: tuple, max_value: int):
+        self.ranges = ranges
+        self._table = tuple(self._scan(i / 2) for i in range(max_value * 2 + 1))
+
+    def _scan(self, value: float):
+        for low, high, weight in self.ranges:
+            if low <= value <= high:
+                return weight
+        return 0
+
+    def lookup(self, value: float):
+        """값이 속한 구간의 가중치 (해당 구간이 없으면 0)"""
+        key = value * 2
+        index = int(key)
+        if index == key and 0 <= index < len(self._table):
+            return self._table[index]
+        return self._scan(value)
+
+    def dense(self) -> tuple:
+        """0부터 최댓값까지 0.5 간격의 가중치 배열 (인덱스 = 값 × 2)"""
+        return self._table
+
+
+class BinauralConstants:
+    """단측 착용 페널티 계산용 상수 (weights['binaural'] 사전 계산본)"""
+
+    __slots__ = (
+        "threshold",
+        "base_penalty",
+        "max_penalty",
+        "relief_start_db",
+        "relief_full_db",
+        "relief_span_db",
+        "lifestyle_bonus",
+        "first_time_bonus",
+        "low_budget_relief",
+    )
+
+    def __init__(self, config: dict):
+        values = {key: _require_number(config, key, "binaural.") for key in BINAURAL_KEYS}
+        if values["asymmetry_relief_full_db"] <= values["asymmetry_relief_start_db"]:
+            raise ValueError("가중치 설정 'binaural.asymmetry_relief_full_db'는 start_db보다 커야 합니다.")
+
+        self.threshold = values["pta_need_threshold_db"]
+        self.base_penalty = values["base_unilateral_penalty"]
+        self.max_penalty = values["max_unilateral_penalty"]
+        self.relief_start_db = values["asymmetry_relief_start_db"]
+        self.relief_full_db = values["asymmetry_relief_full_db"]
+        self.relief_span_db = self.relief_full_db - self.relief_start_db
+        # 생활 환경별 need 보너스 (quiet는 보너스 없음)
+        self.lifestyle_bonus = {
+            "quiet": 0,
+            "mixed": values["mixed_env_need_bonus"],
+            "noisy": values["noisy_env_need_bonus"],
+        }
+        self.first_time_bonus = values["first_time_need_bonus"]
+        self.low_budget_relief = values["low_budget_penalty_relief"]
+
+
+class CompiledWeights:
+    """
+    검증 및 컴파일된 가중치
+
+    load_weights()의 JSON 딕셔너리를 한 번만 검증하여 구간별 조회 테이블과
+    범주별 인덱스 테이블로 변환합니다. predict_satisfaction()에 딕셔너리 대신
+    전달하면 동일한 breakdown을 더 적은 비용으로 계산합니다.
+    """
+
+    def __init__(self, weights: dict):
+        if not isinstance(weights, dict):
+            raise ValueError("가중치 설정은 딕셔너리여야 합니다.")
+
+        self.raw = weights
+        self.version = weights.get("version")
+        self.base_score = _require_number(weights, "base_score")
+
+        # 범주별 가중치 (LOSS_LEVELS 등의 순서를 따르는 튜플)
+        loss_config = _require(weights, "loss_level_weights", "")
+        self.loss_level = tuple(
+            _require_number(loss_config, name, "loss_level_weights.") for name in LOSS_LEVELS
+        )
+
+        lifestyle_config = _require(weights, "lifestyle_weights", "")
+        self.lifestyle = tuple(
+            _require_number(lifestyle_config, name, "lifestyle_weights.") for name in LIFESTYLES
+        )
+
+        budget_config = _require(weights, "budget_weights", "")
+        self.budget = tuple(
+            _require_number(budget_config, name, "budget_weights.") for name in BUDGETS
+        )
+
+        # 청력 손실 수준 × 보청기 형태
+        type_config = _require(weights, "type_mismatch_penalties", "")
+        self.type_fit = tuple(
+            tuple(
+                _require_number(
+                    _require(type_config, level, "type_mismatch_penalties."),
+                    device,
+                    f"type_mismatch_penalties.{level}."
+                )
+                for device in DEVICE_TYPES
+            )
+            for level in LOSS_LEVELS
+        )
+
+        experience_config = _require(weights, "experience_weight", "")
+        # (경험 없음, 경험 있음) - bool 인덱스로 조회
+        self.experience = (
+            _require_number(experience_config, "no_experience", "experience_weight."),
+            _require_number(experience_config, "has_experience", "experience_weight."),
+        )
+
+        tinnitus_config = _require(weights, "tinnitus_weight", "")
+        # (이명 없음, 이명 있음)
+        self.tinnitus = (
+            _require_number(tinnitus_config, "no_tinnitus", "tinnitus_weight."),
+            _require_number(tinnitus_config, "has_tinnitus", "tinnitus_weight."),
+        )
+
+        asymmetry_config = _require(weights, "asymmetry_penalty", "")
+        self.asymmetry_threshold_db = _require_number(asymmetry_config, "threshold_db", "asymmetry_penalty.")
+        self.asymmetry_penalty_per_10db = _require_number(asymmetry_config, "penalty_per_10db", "asymmetry_penalty.")
+        self.asymmetry_max_penalty = _require_number(asymmetry_config, "max_penalty", "asymmetry_penalty.")
+
+        # 구간 테이블
+        speech_config = _require(weights, "speech_score_weights", "")
+        self.speech_score = RangeTable(
+            _compile_ranges(_require(speech_config, "ranges", "speech_score_weights."), "speech_score_weights."),
+            SPEECH_SCORE_MAX
+        )
+        age_config = _require(weights, "age_adjustment", "")
+        self.age = RangeTable(
+            _compile_ranges(_require(age_config, "ranges", "age_adjustment."), "age_adjustment."),
+            AGE_MAX
+        )
+
+        # 양측 착용 상수 (구버전 가중치에는 없을 수 있음 - 단측 착용 계산 시 KeyError)
+        binaural_config = weights.get("binaural")
+        self.binaural: Optional[BinauralConstants] = (
+            BinauralConstants(binaural_config) if binaural_config is not None else None
+        )
+
+        # 문자열 → 가중치 직접 조회용 딕셔너리
+        self.loss_level_by_name = dict(zip(LOSS_LEVELS, self.loss_level))
+        self.lifestyle_by_name = dict(zip(LIFESTYLES, self.lifestyle))
+        self.budget_by_name = dict(zip(BUDGETS, self.budget))
+        self.type_fit_by_name = {
+            level: dict(zip(DEVICE_TYPES, row)) for level, row in zip(LOSS_LEVELS, self.type_fit)
+        }
+
+    def asymmetry_penalty(self, asymmetry_db: float) -> int:
+        """좌우 비대칭 페널티 (calculate_asymmetry_penalty와 동일)"""
+        threshold = self.asymmetry_threshold_db
+        if asymmetry_db <= threshold:
+            return 0
+        penalty = int(((asymmetry_db - threshold) / 10) * self.asymmetry_penalty_per_10db)
+        return max(penalty, self.asymmetry_max_penalty)
+
+    def __repr__(self) -> str:
+        return f"CompiledWeights(version={self.version!r}, base_score={self.base_score!r})"
+
+
+def compile_weights(weights: dict) -> CompiledWeights:
+    """
+    가중치 딕셔너리를 검증 후 컴파일
+
+    Args:
+        weights: load_weights()로 읽은 가중치 딕셔너리
+
+    Returns:
+        CompiledWeights 객체
+
+    Raises:
+        ValueError: 필수 항목이 없거나 형식이 잘못된 경우
+    """
+    return CompiledWeights(weights)
+
+
+def read_weights_file(weights_path: Union[str, Path]) -> dict:
+    """가중치 JSON 파일 읽기"""
+    with open(weights_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class _RegistryEntry:
+    """캐시된 가중치 파일 정보"""
+
+    __slots__ = ("mtime_ns", "size", "checked_at", "weights", "compiled", "rejected")
+
+    def __init__(self, mtime_ns: int, size: int, checked_at: float, weights: dict, compiled: CompiledWeights):
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.checked_at = checked_at
+        self.weights = weights
+        self.compiled = compiled
+        # 읽기/컴파일에 실패한 파일 상태 (mtime_ns, 크기) - 같은 파일을 반복해서 읽지 않음
+        self.rejected: Optional[tuple] = None
+
+
+class WeightsRegistry:
+    """
+    프로세스 단위 가중치 캐시
+
+    파일 경로별로 파싱된 가중치와 컴파일 결과를 보관하고, 파일의 mtime/크기가
+    바뀌면 다시 읽습니다. 같은 파일은 check_interval초 안에 다시 stat하지 않으므로
+    예측 경로에서는 파일 I/O가 발생하지 않습니다.
+
+    바뀐 파일은 읽기와 컴파일이 모두 성공해야 교체합니다. 저장 중인 파일이나 잘못된
+    가중치로 바뀐 경우 오류를 기록하고 마지막으로 성공한 가중치를 계속 사용하며,
+    이전에 읽은 적이 없는 경로만 오류를 발생시킵니다.
+
+    반환되는 딕셔너리는 공유 객체이므로 호출 측에서 수정하면 안 됩니다.
+    """
+
+    def __init__(self, check_interval: float = 1.0):
+        self.check_interval = check_interval
+        self._entries: dict = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(weights_path: Union[str, Path, None]) -> str:
+        if weights_path is None:
+            weights_path = DEFAULT_WEIGHTS_PATH
+        return os.path.abspath(weights_path)
+
+    def _entry(self, weights_path: Union[str, Path, None]) -> _RegistryEntry:
+        key = self._key(weights_path)
+        now = time.monotonic()
+
+        entry = self._entries.get(key)
+        if entry is not None and now - entry.checked_at < self.check_interval:
+            return entry
+
+        with self._lock:
+            entry = self._entries.get(key)
+            state = None
+            try:
+                stat = os.stat(key)
+                state = (stat.st_mtime_ns, stat.st_size)
+                if entry is not None and state in ((entry.mtime_ns, entry.size), entry.rejected):
+                    entry.checked_at = now
+                    return entry
+
+                # 새 파일이거나 변경됨 → 다시 읽고 컴파일 (성공한 경우에만 교체)
+                weights = read_weights_file(key)
+                compiled = compile_weights(weights)
+            except Exception as e:
+                if entry is None:
+                    raise
+                logger.error("가중치 파일을 다시 읽지 못해 이전 가중치를 계속 사용합니다 (%s): %s", key, e)
+                entry.rejected = state
+                entry.checked_at = now
+                return entry
+
+            entry = _RegistryEntry(*state, now, weights, compiled)
+            self._entries[key] = entry
+            return entry
+
+    def get(self, weights_path: Union[str, Path, None] = None) -> dict:
+        """
+        캐시된 가중치 딕셔너리 반환 (파일이 변경되었으면 다시 로드)
+
+        Args:
+            weights_path: 가중치 파일 경로 (None이면 기본 파일)
+
+        Returns:
+            가중치 딕셔너리
+        """
+        return self._entry(weights_path).weights
+
+    def get_compiled(self, weights_path: Union[str, Path, None] = None) -> CompiledWeights:
+        """
+        캐시된 CompiledWeights 반환 (파일이 변경되었으면 다시 로드 및 컴파일)
+
+        Args:
+            weights_path: 가중치 파일 경로 (None이면 기본 파일)
+
+        Returns:
+            CompiledWeights 객체
+        """
+        return self._entry(weights_path).compiled
+
+    def fingerprint(self, weights_path: Union[str, Path, None] = None) -> str:
+        """
+        가중치 식별 문자열 (결과 캐시 키용)
+
+        가중치 파일의 version과 mtime/크기를 합친 값이므로 version을 올리지 않고
+        파일만 수정해도 값이 바뀝니다.
+
+        Args:
+            weights_path: 가중치 파일 경로 (None이면 기본 파일)
+
+        Returns:
+            "<version>:<mtime_ns>:<크기>"
+        """
+        entry = self._entry(weights_path)
+        return f"{entry.weights.get('version')}:{entry.mtime_ns}:{entry.size}"
+
+    def invalidate(self, weights_path: Union[str, Path, None] = None, all_paths: bool = False):
+        """
+        캐시 무효화 (다음 조회 시 파일을 다시 읽음)
+
+        Args:
+            weights_path: 무효화할 가중치 파일 경로 (None이면 기본 파일)
+            all_paths: True이면 모든 경로의 캐시 삭제
+        """
+        with self._lock:
+            if all_paths:
+                self._entries.clear()
+            else:
+                self._entries.pop(self._key(weights_path), None)
+
+
+# 프로세스 전역 레지스트리
+_registry = WeightsRegistry()
+
+
+def get_registry() -> WeightsRegistry:
+    """프로세스 전역 가중치 레지스트리 반환"""
+    return _registry
+
+
+def get_weights(weights_path: Union[str, Path, None] = None) -> dict:
+    """캐시된 가중치 딕셔너리 반환 (WeightsRegistry.get 참고)"""
+    return _registry.get(weights_path)
+
+
+def get_compiled_weights(weights_path: Union[str, Path, None] = None) -> CompiledWeights:
+    """캐시된 CompiledWeights 반환 (WeightsRegistry.get_compiled 참고)"""
+    return _registry.get_compiled(weights_path)
+
+
+def get_weights_fingerprint(weights_path: Union[str, Path, None] = None) -> str:
+    """가중치 식별 문자열 반환 (WeightsRegistry.fingerprint 참고)"""
+    return _registry.fingerprint(weights_path)
+
+
+def invalidate_weights(weights_path: Union[str, Path, None] = None, all_paths: bool = False):
+    """전역 가중치 캐시 무효화 (WeightsRegistry.invalidate 참고)"""
+    _registry.invalidate(weights_path, all_paths=all_paths)
@@ -3,22 +3,26 @@
 Streamlit 메인 애플리케이션
 """
 
+import uuid
+
 import streamlit as st
 from pydantic import ValidationError
-from datetime import datetime
 
 from core.schema import UserInput
 from core.preprocess import preprocess_inputs, get_feature_summary
 from core.predictor import predict_satisfaction, get_satisfaction_level, get_breakdown_summary
 from core.summarizer import generate_summary, generate_recommendations
-from core.report import generate_text_report, generate_json_report
-from report.word_report import build_report_docx
-from viz.charts import create_gauge, create_bar, create_breakdown_chart, create_audiogram
+from core.weights import get_weights_fingerprint
+from core.result_cache import get_result_cache, input_key
+from core import tracing
+from report.bundle import ReportBundle
 from ui.components import (
     render_input_form,
     render_validation_error,
     render_input_summary,
-    render_prediction_result
+    render_prediction_result,
+    render_scenario_comparison,
+    render_trace_panel
 )
 
 # 페이지 설정
@@ -37,8 +41,10 @@ def reset_session():
         'features',
         'prediction_score',
         'breakdown',
+        'confidence',
         'summary',
         'recommendations',
+        'report_bundle',
         'input_data'
     ]
     for key in keys_to_remove:
@@ -46,6 +52,62 @@ def reset_session():
             del st.session_state[key]
 
 
+def run_prediction(user_input: UserInput, user_input_dict: dict, chart_type: str, show_breakdown_chart: bool) -> dict:
+    """
+    전처리 → 예측 → 요약 → 차트 → 시나리오 비교까지 화면에 필요한 결과 생성
+
+    결과는 입력·가중치만으로 정해지는 값만 담습니다. 생성 시각이 들어가는 리포트 묶음은
+    세션 간에 공유하면 처음 예측한 날짜가 그대로 남으므로 여기에 넣지 않고 실행마다 만듭니다.
+
+    Args:
+        user_input: 검증된 입력
+        user_input_dict: user_input.model_dump()
+        chart_type: 점수 차트 종류 ("bar" 또는 "gauge")
+        show_breakdown_chart: 점수 구성 차트 생성 여부
+
+    Returns:
+        결과 묶음 딕셔너리 (result_cache에 보관되어 세션 간 공유되므로 수정하지 않음)
+    """
+    # 차트(plotly)/신뢰도 추정(numpy)은 첫 예측 시 로드 (입력 폼만 그리는 첫 화면을 빠르게)
+    from core.scenario import sweep_scenarios, scenario_matrix
+    from core.uncertainty import estimate_confidence
+    from viz.charts import create_gauge, create_bar, create_breakdown_chart, create_audiogram
+
+    features = preprocess_inputs(user_input)
+    score, breakdown = predict_satisfaction(features)
+    satisfaction_level = get_satisfaction_level(score)
+    breakdown_summary = get_breakdown_summary(breakdown)
+    summary_text = generate_summary(score, features, breakdown)
+    recommendations = generate_recommendations(score, features, breakdown)
+
+    main_chart = create_gauge(score) if chart_type == "gauge" else create_bar(score)
+    audiogram_chart = create_audiogram(user_input_dict)
+
+    scenarios = sweep_scenarios(features, axes=["desired_type", "fitting_plan", "budget"])
+
+    return {
+        "features": features,
+        "feature_summary": get_feature_summary(features),
+        "score": score,
+        "breakdown": breakdown,
+        "satisfaction_level": satisfaction_level,
+        "breakdown_summary": breakdown_summary,
+        "confidence": estimate_confidence(features),
+        "summary": summary_text,
+        "recommendations": recommendations,
+        "main_chart": main_chart,
+        "breakdown_chart": create_breakdown_chart(breakdown_summary) if show_breakdown_chart else None,
+        "audiogram_chart": audiogram_chart,
+        "scenarios": scenarios,
+        "scenario_matrix": scenario_matrix(
+            scenarios,
+            row_axis="desired_type",
+            col_axis="fitting_plan",
+            fixed={"budget": features["budget"]}
+        ),
+    }
+
+
 def main():
     """메인 애플리케이션"""
 
@@ -66,6 +128,13 @@ def main():
         st.markdown("---")
         st.info("모든 필드는 필수 입력입니다.")
 
+        # 개발자 옵션: 단계별 처리 시간 추적 (이 세션의 실행만 기록/표시, 끄면 추적 비용 없음)
+        # 전역 추적 설정(HEARING_SIM_TRACE)은 바꾸지 않으므로 다른 세션에 영향 없음
+        show_trace = st.checkbox("개발자: 단계별 처리 시간", value=tracing.is_enabled())
+        if "trace_session" not in st.session_state:
+            st.session_state["trace_session"] = uuid.uuid4().hex
+        trace_session = st.session_state["trace_session"]
+
     # 메인 화면
     st.title("보청기 만족도 예측 시뮬레이터")
     st.markdown("환자의 청력 정보와 선호도를 바탕으로 **보청기 사용 만족도**를 예측합니다.")
@@ -86,31 +155,62 @@ def main():
 
         # 버튼 클릭 시 처리
         if input_data is not None:
+            trace_token = tracing.begin_run("만족도 예측 실행", enabled=show_trace, session=trace_session)
             try:
                 # 1. Pydantic 검증
-                user_input = UserInput(**input_data)
+                with tracing.span("schema.UserInput"):
+                    user_input = UserInput(**input_data)
+
+                # 2. 예측 결과 묶음 (같은 입력·가중치·화면 설정이면 캐시된 결과 재사용)
+                user_input_dict = user_input.model_dump()
+                cache_key = input_key(
+                    user_input_dict,
+                    get_weights_fingerprint(),
+                    chart_type=chart_type,
+                    show_breakdown_chart=show_breakdown_chart
+                )
+                with st.spinner("만족도 예측 중..."):
+                    result = get_result_cache().get_or_build(
+                        cache_key,
+                        lambda: run_prediction(user_input, user_input_dict, chart_type, show_breakdown_chart)
+                    )
 
-                # 2. 입력 요약 표시
+                features = result["features"]
+                score = result["score"]
+                breakdown = result["breakdown"]
+                confidence = result["confidence"]
+                summary_text = result["summary"]
+                recommendations = result["recommendations"]
+
+                # 리포트 묶음은 이번 실행 전용 (작성 시각/파일 이름이 예측 시각 기준)
+                # 리포트는 다운로드 버튼을 누를 때 생성되어 묶음에 보관됨
+                report_bundle = ReportBundle(
+                    user_input_dict=user_input_dict,
+                    features=features,
+                    score=score,
+                    satisfaction_level=result["satisfaction_level"],
+                    summary_text=summary_text,
+                    recommendations=recommendations,
+                    breakdown=breakdown,
+                    chart_fig=result["main_chart"],
+                    audiogram_fig=result["audiogram_chart"]
+                )
+
+                # 2-1. 입력 요약 표시
                 render_input_summary(user_input)
 
                 st.divider()
 
-                # 2-1. 청력도 그래프 표시 (주파수별 데이터가 있는 경우)
-                audiogram_chart = create_audiogram(user_input.model_dump())
-                if audiogram_chart:
+                # 2-2. 청력도 그래프 표시 (주파수별 데이터가 있는 경우)
+                if result["audiogram_chart"]:
                     st.markdown("### 청력도 (Audiogram)")
-                    st.plotly_chart(audiogram_chart, use_container_width=True)
+                    st.plotly_chart(result["audiogram_chart"], use_container_width=True)
                     st.divider()
 
-                # 3. 전처리
-                with st.spinner("데이터 전처리 중..."):
-                    features = preprocess_inputs(user_input)
-
-                # 전처리 결과 표시 (expander)
+                # 3. 전처리 결과 표시 (expander)
                 with st.expander("전처리 결과"):
-                    feature_summary = get_feature_summary(features)
                     cols = st.columns(2)
-                    items = list(feature_summary.items())
+                    items = list(result["feature_summary"].items())
                     mid = len(items) // 2
 
                     with cols[0]:
@@ -123,104 +223,62 @@ def main():
 
                 st.divider()
 
-                # 4. 만족도 예측
-                with st.spinner("만족도 예측 중..."):
-                    score, breakdown = predict_satisfaction(features)
-                    satisfaction_level = get_satisfaction_level(score)
-                    breakdown_summary = get_breakdown_summary(breakdown)
-
-                # 5. 요약 텍스트 생성
-                summary_text = generate_summary(score, features, breakdown)
-                recommendations = generate_recommendations(score, features, breakdown)
-
-                # 6. 차트 생성
-                if chart_type == "gauge":
-                    main_chart = create_gauge(score)
-                else:
-                    main_chart = create_bar(score)
-
-                breakdown_chart = create_breakdown_chart(breakdown_summary) if show_breakdown_chart else None
-
-                # 7. 예측 결과 표시
+                # 4. 예측 결과 표시
                 render_prediction_result(
                     score=score,
-                    breakdown=breakdown_summary,
-                    satisfaction_level=satisfaction_level,
+                    breakdown=result["breakdown_summary"],
+                    satisfaction_level=result["satisfaction_level"],
                     summary_text=summary_text,
                     recommendations=recommendations,
-                    chart_fig=main_chart,
-                    breakdown_chart_fig=breakdown_chart,
-                    breakdown_detail=breakdown
+                    chart_fig=result["main_chart"],
+                    breakdown_chart_fig=result["breakdown_chart"],
+                    breakdown_detail=breakdown,
+                    confidence=confidence
                 )
 
-                # 8. 리포트 다운로드 버튼
+                # 4-1. 대안 시나리오 비교 (형태/착용 계획/예산을 한 번에 계산)
+                with st.expander("대안 시나리오 비교 (보청기 형태 × 착용 계획 × 예산)"):
+                    render_scenario_comparison(result["scenarios"], result["scenario_matrix"])
+
+                # 5. 리포트 다운로드 버튼
+                # 리포트는 버튼을 누를 때 생성 (예측마다 미리 만들지 않음, 한 번 만든 리포트는 재사용)
                 st.divider()
                 st.markdown("### 리포트 다운로드")
 
+                timestamp = report_bundle.timestamp()
+
                 dl_col1, dl_col2, dl_col3 = st.columns(3)
 
                 # Word 리포트 (고객용)
                 with dl_col1:
-                    try:
-                        word_report = build_report_docx(
-                            user_input_dict=user_input.model_dump(),
-                            features=features,
-                            score=score,
-                            satisfaction_level=satisfaction_level,
-                            summary_text=summary_text,
-                            recommendations=recommendations,
-                            breakdown=breakdown,
-                            chart_fig=main_chart,
-                            audiogram_fig=audiogram_chart
-                        )
-
-                        st.download_button(
-                            label="Word 리포트 (.docx)",
-                            data=word_report.getvalue(),
-                            file_name=f"보청기_만족도_리포트_{datetime.now().strftime('%Y%m%d_%H%M%S')}.docx",
-                            mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                            use_container_width=True
-                        )
-                    except Exception as e:
-                        st.error(f"Word 리포트 생성 오류: {str(e)}")
+                    st.download_button(
+                        label="Word 리포트 (.docx)",
+                        data=report_bundle.word,
+                        file_name=f"보청기_만족도_리포트_{timestamp}.docx",
+                        mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                        on_click="ignore",
+                        use_container_width=True
+                    )
 
                 # 텍스트 리포트
                 with dl_col2:
-                    text_report = generate_text_report(
-                        user_input_dict=user_input.model_dump(),
-                        features=features,
-                        score=score,
-                        satisfaction_level=satisfaction_level,
-                        summary_text=summary_text,
-                        recommendations=recommendations,
-                        breakdown=breakdown
-                    )
-
                     st.download_button(
                         label="텍스트 리포트 (.txt)",
-                        data=text_report,
-                        file_name=f"hearing_aid_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
+                        data=report_bundle.text,
+                        file_name=f"hearing_aid_report_{timestamp}.txt",
                         mime="text/plain",
+                        on_click="ignore",
                         use_container_width=True
                     )
 
                 # JSON 리포트
                 with dl_col3:
-                    json_report = generate_json_report(
-                        user_input_dict=user_input.model_dump(),
-                        features=features,
-                        score=score,
-                        satisfaction_level=satisfaction_level,
-                        summary_text=summary_text,
-                        recommendations=recommendations,
-                        breakdown=breakdown
-                    )
-
                     st.download_button(
                         label="JSON 리포트 (.json)",
-                        data=json_report,
-                        file_name=f"hearing_aid_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                        data=report_bundle.json,
+                        file_name=f"hearing_aid_report_{timestamp}.json",
                         mime="application/json",
+                        on_click="ignore",
                         use_container_width=True
                     )
 
@@ -229,8 +287,10 @@ def main():
                 st.session_state['features'] = features
                 st.session_state['prediction_score'] = score
                 st.session_state['breakdown'] = breakdown
+                st.session_state['confidence'] = confidence
                 st.session_state['summary'] = summary_text
                 st.session_state['recommendations'] = recommendations
+                st.session_state['report_bundle'] = report_bundle
 
             except ValidationError as e:
                 # 검증 실패
@@ -248,10 +308,19 @@ def main():
                 with st.expander("오류 상세 정보"):
                     st.code(traceback.format_exc())
 
+            finally:
+                tracing.end_run(trace_token)
+
         else:
             # 입력 대기 상태
             st.info("왼쪽 입력 섹션에서 환자 정보를 입력하고 '만족도 예측하기' 버튼을 클릭하세요.")
 
+    # 개발자 패널 (이번 실행까지 포함하여 표시)
+    if show_trace:
+        with st.sidebar:
+            runs = tracing.recent_runs(20, session=trace_session)
+            render_trace_panel(runs, tracing.stage_stats(runs))
+
 
 if __name__ == "__main__":
     main()
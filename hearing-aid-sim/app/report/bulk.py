@@ -0,0 +1,364 @@
+"""
+Word 리포트 일괄 생성 모듈
+입력 레코드 전체를 예측하여 고객별 Word 리포트를 만들고 ZIP 파일로 저장
+
+센터별 하루치 상담 자료를 한 번에 만들기 위한 기능입니다 (python -m app.batch reports).
+레코드 검증 → 예측 → Word 생성은 워커 프로세스에서 실행하고, 완성된 문서는 입력 순서대로
+바로 ZIP에 기록하므로 전체 문서를 메모리에 모아 두지 않습니다.
+한 고객의 리포트 생성이 실패해도 나머지는 계속 생성하며, 실패 내역은 on_error 콜백으로 전달합니다.
+
+ZIP 안의 파일 이름은 "<방문일>_<고객명>.docx" (같은 이름은 "_2", "_3"...)이며
+문서의 작성일/평가 월도 같은 방문일을 씁니다 (생성한 날짜가 아님).
+레코드에 센터 항목이 있으면 "<센터>/" 폴더(센터별 ZIP 모드에서는 센터별 파일)로 나눕니다.
+"""
+
+import os
+import re
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional, Union
+
+try:
+    from ..core.pipeline import validate_record, predict_record, Throughput
+    from ..core.weights import get_compiled_weights
+    from .render_pool import WORKERS_ENV
+except ImportError:
+    # streamlit run app/main.py 실행 시 app/ 디렉터리가 최상위 경로
+    from core.pipeline import validate_record, predict_record, Throughput
+    from core.weights import get_compiled_weights
+    from report.render_pool import WORKERS_ENV
+
+
+DEFAULT_DATE_FIELD = "visit_date"
+DEFAULT_CENTER_FIELD = "center"
+DEFAULT_WRITER = "ooxml"
+NO_CENTER = "센터미지정"
+MAX_NAME_LENGTH = 80
+
+# 파일 이름에 쓸 수 없는 문자 (Windows 기준) 및 제어 문자
+_UNSAFE_NAME_CHARS = re.compile(r'[\\/:*?"<>|\x00-\x1f]+')
+
+# 워커 프로세스별 설정 (초기화 시 한 번만 로드)
+_worker_weights = None
+_worker_options: dict = {}
+
+
+def parse_visit_date(value) -> Optional[date]:
+    """
+    방문일 값 → date
+
+    Args:
+        value: date/datetime 또는 "YYYY-MM-DD" 문자열 ("YYYY-MM-DDTHH:MM:SS" 등 뒤에 시각이 붙어도 됨)
+
+    Returns:
+        date (None이거나 읽을 수 없으면 None)
+    """
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value).strip()[:10])
+    except ValueError:
+        return None
+
+
+def safe_file_name(value, fallback: str) -> str:
+    """
+    ZIP 항목/파일 이름으로 쓸 수 있게 정리
+
+    Args:
+        value: 원래 이름 (None이나 빈 문자열이면 fallback)
+        fallback: 대체 이름
+
+    Returns:
+        경로 구분자·예약 문자를 "_"로 바꾸고 앞뒤 공백/마침표를 제거한 이름
+    """
+    name = _UNSAFE_NAME_CHARS.sub("_", str(value if value is not None else "")).strip(" .")
+    return name[:MAX_NAME_LENGTH] or fallback
+
+
+class ReportNamer:
+    """
+    고객별 리포트 파일 이름 (입력 순서가 같으면 항상 같은 이름)
+
+    같은 폴더 안에서 이름이 겹치면 두 번째부터 "_2", "_3"...을 붙입니다.
+    """
+
+    def __init__(self, default_date: Optional[str] = None):
+        """
+        Args:
+            default_date: 방문일 항목이 없는 레코드에 쓸 날짜 (None이면 오늘, YYYY-MM-DD)
+        """
+        self.default_date = default_date or date.today().isoformat()
+        self._used: set = set()
+
+    def name(self, index: int, customer_name, visit_date=None, center=None) -> str:
+        """
+        ZIP 항목 이름
+
+        Args:
+            index: 입력 레코드 번호 (0부터, 고객명이 없을 때 사용)
+            customer_name: 고객명
+            visit_date: 방문일 (없거나 읽을 수 없으면 default_date - 문서 작성일과 같은 규칙)
+            center: 센터 (None이면 폴더 없이)
+
+        Returns:
+            "[<센터>/]<방문일 YYYY-MM-DD>_<고객명>.docx"
+        """
+        report_date = parse_visit_date(visit_date) or parse_visit_date(self.default_date)
+        stem = "_".join((
+            report_date.isoformat() if report_date is not None else safe_file_name(self.default_date, "날짜미상"),
+            safe_file_name(customer_name, f"고객{index + 1:05d}"),
+        ))
+        folder = f"{safe_file_name(center, NO_CENTER)}/" if center is not None else ""
+
+        candidate = f"{folder}{stem}.docx"
+        suffix = 1
+        while candidate.casefold() in self._used:
+            suffix += 1
+            candidate = f"{folder}{stem}_{suffix}.docx"
+        self._used.add(candidate.casefold())
+        return candidate
+
+
+def _init_worker(weights_path: Optional[str], options: dict, in_process_render: bool = True):
+    """
+    워커 프로세스 초기화 - 가중치를 한 번 로드 및 컴파일
+
+    Args:
+        in_process_render: 차트 변환을 워커 안에서 직접 할지 여부. 각 워커가 이미 별도
+            프로세스이므로 HEARING_SIM_RENDER_WORKERS 미지정 시 0으로 두어 워커마다
+            변환 프로세스를 또 띄우지 않음 (단일 프로세스 실행 시에는 False)
+    """
+    global _worker_weights, _worker_options
+    if in_process_render:
+        os.environ.setdefault(WORKERS_ENV, "0")
+    _worker_weights = get_compiled_weights(weights_path)
+    _worker_options = options
+
+
+def build_report_docx(**kwargs):
+    """Word 리포트 생성 (word_report.build_report_docx - python-docx/Plotly는 첫 리포트 생성 시 로드)"""
+    from .word_report import build_report_docx as build
+    return build(**kwargs)
+
+
+def build_customer_report(input_data: dict) -> dict:
+    """
+    레코드 한 건 검증 → 예측 → Word 리포트 생성 (워커 프로세스에서 실행)
+
+    문서의 작성일은 레코드의 방문일 항목(date_field), 없거나 읽을 수 없으면 default_date,
+    둘 다 없으면 오늘입니다.
+
+    Returns:
+        성공: {"ok": True, "score", "data": .docx 바이트}
+        실패: {"ok": False, "errors": [{"field", "message"}, ...]}
+    """
+    input_data = dict(input_data)
+    visit_date = input_data.pop(_worker_options.get("date_field", DEFAULT_DATE_FIELD), None)
+    report_date = parse_visit_date(visit_date) or parse_visit_date(_worker_options.get("default_date"))
+
+    user_input, errors = validate_record(input_data)
+    if user_input is None:
+        return {"ok": False, "errors": errors}
+
+    try:
+        result = predict_record(user_input, _worker_weights)
+        user_input_dict = user_input.model_dump()
+        chart_fig = audiogram_fig = None
+        if _worker_options.get("charts", True):
+            try:
+                from ..viz.charts import create_audiogram, create_bar, create_gauge
+            except ImportError:
+                from viz.charts import create_audiogram, create_bar, create_gauge
+            if _worker_options.get("chart_type", "bar") == "gauge":
+                chart_fig = create_gauge(result["score"])
+            else:
+                chart_fig = create_bar(result["score"])
+            audiogram_fig = create_audiogram(user_input_dict)
+
+        report = build_report_docx(
+            user_input_dict=user_input_dict,
+            features=result["features"],
+            score=result["score"],
+            satisfaction_level=result["satisfaction_level"],
+            summary_text=result["summary"],
+            recommendations=result["recommendations"],
+            breakdown=result["breakdown"],
+            chart_fig=chart_fig,
+            audiogram_fig=audiogram_fig,
+            writer=_worker_options.get("writer", DEFAULT_WRITER),
+            report_date=report_date
+        )
+    except Exception as e:
+        return {"ok": False, "errors": [{"field": "", "message": f"리포트 생성 오류 - {type(e).__name__}: {e}"}]}
+
+    return {"ok": True, "score": result["score"], "data": report.getvalue()}
+
+
+def generate_reports(
+    records: Iterable[dict],
+    weights_path: Optional[str] = None,
+    workers: Optional[int] = None,
+    charts: bool = True,
+    chart_type: str = "bar",
+    writer: str = DEFAULT_WRITER,
+    date_field: str = DEFAULT_DATE_FIELD,
+    default_date: Optional[str] = None
+) -> Iterator[dict]:
+    """
+    레코드별 Word 리포트 생성 (입력 순서 유지, 진행 중인 문서 수 제한)
+
+    Args:
+        records: UserInput 입력 딕셔너리 iterable
+        weights_path: 가중치 파일 경로 (None이면 기본 파일)
+        workers: 워커 프로세스 수 (None이면 CPU 수, 1 이하이면 현재 프로세스에서 실행)
+        charts: 청력도/점수 차트 이미지 포함 여부
+        chart_type: 점수 차트 종류 ("bar" 또는 "gauge")
+        writer: Word 문서 작성 방식 (build_report_docx 참고)
+        date_field: 문서 작성일로 쓸 방문일 항목 이름
+        default_date: 방문일이 없는 레코드의 작성일 (None이면 오늘, YYYY-MM-DD)
+
+    Yields:
+        build_customer_report() 결과 + "index" (입력 순서)
+    """
+    options = {
+        "charts": charts,
+        "chart_type": chart_type,
+        "writer": writer,
+        "date_field": date_field,
+        "default_date": default_date,
+    }
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1:
+        _init_worker(weights_path, options, in_process_render=False)
+        for index, input_data in enumerate(records):
+            yield {"index": index, **build_customer_report(input_data)}
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(weights_path, options)
+    ) as executor:
+        # 완성된 문서는 바로 기록하고, 대기 중인 문서는 워커 수의 2배까지만 유지
+        pending = deque()
+        for index, input_data in enumerate(records):
+            pending.append((index, executor.submit(build_customer_report, input_data)))
+            if len(pending) >= workers * 2:
+                done_index, future = pending.popleft()
+                yield {"index": done_index, **future.result()}
+        while pending:
+            done_index, future = pending.popleft()
+            yield {"index": done_index, **future.result()}
+
+
+class _ZipWriters:
+    """출력 ZIP 파일 (단일 파일 또는 센터별 파일)"""
+
+    def __init__(self, output: Union[str, Path], per_center: bool):
+        self.output = Path(output)
+        self.per_center = per_center
+        self._files: dict = {}
+        self._date_time = time.localtime()[:6]
+        if per_center:
+            self.output.mkdir(parents=True, exist_ok=True)
+
+    def write(self, name: str, data: bytes):
+        if self.per_center:
+            center, _, name = name.partition("/")
+            path = self.output / f"{center}.zip"
+        else:
+            path = self.output
+        archive = self._files.get(path)
+        if archive is None:
+            archive = self._files[path] = zipfile.ZipFile(path, "w")
+        # .docx는 이미 압축된 파일이므로 다시 압축하지 않음
+        info = zipfile.ZipInfo(name, date_time=self._date_time)
+        info.compress_type = zipfile.ZIP_STORED
+        archive.writestr(info, data)
+
+    def paths(self) -> list[Path]:
+        return list(self._files)
+
+    def close(self):
+        for archive in self._files.values():
+            archive.close()
+        if not self.per_center and not self._files:
+            # 성공한 리포트가 없어도 빈 ZIP 파일은 만듦
+            zipfile.ZipFile(self.output, "w").close()
+
+
+def write_report_zip(
+    records: Iterable[dict],
+    output: Union[str, Path],
+    per_center: bool = False,
+    date_field: str = DEFAULT_DATE_FIELD,
+    center_field: str = DEFAULT_CENTER_FIELD,
+    default_date: Optional[str] = None,
+    on_error: Optional[Callable[[dict], None]] = None,
+    progress: Optional[Callable[[Throughput], None]] = None,
+    progress_every: int = 100,
+    **options
+) -> Throughput:
+    """
+    레코드 전체의 Word 리포트를 ZIP 파일로 저장
+
+    Args:
+        records: UserInput 입력 딕셔너리 iterable (방문일/센터 항목 포함 가능)
+        output: ZIP 파일 경로 (per_center=True이면 센터별 ZIP을 저장할 디렉터리)
+        per_center: 센터별로 ZIP 파일을 나눌지 여부
+        date_field: 방문일 항목 이름
+        center_field: 센터 항목 이름
+        default_date: 방문일이 없는 레코드의 날짜 (None이면 오늘)
+        on_error: 실패 레코드 처리 콜백 ({"index", "file_name", "errors"})
+        progress: 진행 상황 콜백 (progress_every건마다 호출)
+        progress_every: 진행 상황 보고 간격
+        **options: generate_reports 옵션 (weights_path, workers, charts, chart_type, writer)
+
+    Returns:
+        처리량 카운터
+    """
+    counter = Throughput()
+    namer = ReportNamer(default_date)
+    names = deque()
+
+    def strip_meta(items: Iterable[dict]) -> Iterator[dict]:
+        # 파일 이름은 입력 순서대로 부모 프로세스에서 정함 (센터 항목은 검증 전에 제거,
+        # 방문일 항목은 워커에서 문서 작성일로 사용)
+        for index, input_data in enumerate(items):
+            input_data = dict(input_data)
+            visit_date = input_data.get(date_field)
+            center = input_data.pop(center_field, None)
+            if center is None and per_center:
+                center = NO_CENTER
+            names.append(namer.name(index, input_data.get("customer_name"), visit_date, center))
+            yield input_data
+
+    writers = _ZipWriters(output, per_center)
+    try:
+        next_report = progress_every
+        for result in generate_reports(
+            strip_meta(records), date_field=date_field, default_date=namer.default_date, **options
+        ):
+            name = names.popleft()
+            counter.add(result["ok"])
+            if result["ok"]:
+                writers.write(name, result["data"])
+            elif on_error is not None:
+                on_error({"index": result["index"], "file_name": name, "errors": result["errors"]})
+            if progress is not None and counter.total >= next_report:
+                progress(counter)
+                next_report = counter.total + progress_every
+    finally:
+        writers.close()
+
+    return counter
@@ -0,0 +1,128 @@
+"""
+다운로드용 리포트 묶음 모듈
+예측 1건의 Word/텍스트/JSON 리포트를 요청 시점에 한 번만 생성
+
+Streamlit 화면은 예측할 때마다 리포트를 모두 만들지 않고 ReportBundle만 만들어 두며,
+다운로드 버튼을 누를 때 해당 리포트를 생성합니다 (st.download_button의 data에
+bundle.word 등 메서드를 그대로 전달). 생성 결과는 묶음에 보관하므로 같은 버튼을
+다시 눌러도 다시 만들지 않습니다.
+
+사용법:
+    from report.bundle import ReportBundle
+
+    bundle = ReportBundle(user_input_dict, features, score, ...)
+    st.download_button("Word 리포트", data=bundle.word, ...)
+"""
+
+import threading
+from datetime import datetime
+from typing import TYPE_CHECKING, Callable, Optional
+
+try:
+    from ..core.tracing import span
+    from ..core.report import generate_text_report, generate_json_report
+except ImportError:
+    # streamlit run app/main.py 실행 시 app/ 디렉터리가 최상위 경로
+    from core.tracing import span
+    from core.report import generate_text_report, generate_json_report
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+
+def build_report_docx(**kwargs):
+    """Word 리포트 생성 (word_report.build_report_docx - python-docx/Plotly는 첫 Word 요청 시 로드)"""
+    from .word_report import build_report_docx as build
+    return build(**kwargs)
+
+
+class ReportBundle:
+    """
+    예측 1건의 리포트 묶음 (종류별로 첫 요청 시 생성 후 보관)
+
+    다운로드 콜백은 Streamlit 스크립트와 다른 스레드에서 실행되므로 생성은 잠금으로
+    직렬화합니다. 생성 중 오류는 보관하지 않으므로 다시 요청하면 다시 시도합니다.
+    """
+
+    def __init__(
+        self,
+        user_input_dict: dict,
+        features: dict,
+        score: int,
+        satisfaction_level: str,
+        summary_text: str,
+        recommendations: list[str],
+        breakdown: dict,
+        chart_fig: Optional["go.Figure"] = None,
+        audiogram_fig: Optional["go.Figure"] = None,
+        created_at: Optional[datetime] = None
+    ):
+        """
+        Args:
+            user_input_dict: 사용자 입력 원본 데이터 (UserInput.model_dump(), 수정하지 않음)
+            features: 전처리된 특징 딕셔너리
+            score: 예측 만족도 점수
+            satisfaction_level: 만족도 등급
+            summary_text: 요약 텍스트
+            recommendations: 추천 사항 리스트
+            breakdown: 점수 breakdown 딕셔너리
+            chart_fig: Word 리포트 점수 차트 (선택적)
+            audiogram_fig: Word 리포트 청력도 차트 (선택적)
+            created_at: 예측 시각 (파일 이름/Word 작성일용, None이면 현재 시각)
+        """
+        self.user_input_dict = user_input_dict
+        self.features = features
+        self.score = score
+        self.satisfaction_level = satisfaction_level
+        self.summary_text = summary_text
+        self.recommendations = recommendations
+        self.breakdown = breakdown
+        self.chart_fig = chart_fig
+        self.audiogram_fig = audiogram_fig
+        self.created_at = created_at or datetime.now()
+        self._results: dict = {}
+        self._lock = threading.Lock()
+
+    def _report_kwargs(self) -> dict:
+        return dict(
+            user_input_dict=self.user_input_dict,
+            features=self.features,
+            score=self.score,
+            satisfaction_level=self.satisfaction_level,
+            summary_text=self.summary_text,
+            recommendations=self.recommendations,
+            breakdown=self.breakdown
+        )
+
+    def _get(self, kind: str, build: Callable[[], object]):
+        with self._lock:
+            if kind not in self._results:
+                with span(f"report_bundle.{kind}"):
+                    self._results[kind] = build()
+            return self._results[kind]
+
+    def word(self) -> bytes:
+        """고객용 Word 리포트 (.docx 바이트)"""
+        return self._get("word", lambda: build_report_docx(
+            **self._report_kwargs(),
+            chart_fig=self.chart_fig,
+            audiogram_fig=self.audiogram_fig,
+            report_date=self.created_at.date()
+        ).getvalue())
+
+    def text(self) -> str:
+        """텍스트 리포트"""
+        return self._get("text", lambda: generate_text_report(**self._report_kwargs()))
+
+    def json(self) -> str:
+        """JSON 리포트"""
+        return self._get("json", lambda: generate_json_report(**self._report_kwargs()))
+
+    def is_built(self, kind: str) -> bool:
+        """리포트 생성 여부 ("word", "text", "json")"""
+        with self._lock:
+            return kind in self._results
+
+    def timestamp(self) -> str:
+        """파일 이름용 예측 시각 문자열"""
+        return self.created_at.strftime('%Y%m%d_%H%M%S')
@@ -0,0 +1,241 @@
+"""
+차트 이미지 캐시 모듈
+Plotly 차트 PNG 변환(kaleido) 결과를 차트 내용 기준으로 캐시
+
+같은 청력도/점수 차트는 다시 변환하지 않습니다. 키는 차트 JSON(키 정렬)과
+이미지 형식/크기/배율의 SHA-256 해시이며, 메모리 LRU 캐시와 선택적인 디스크 캐시
+두 단계로 조회합니다.
+
+사용법:
+    from report.image_cache import figure_to_image
+
+    png_bytes = figure_to_image(fig, width=600, height=400, scale=2)
+
+환경 변수 HEARING_SIM_IMAGE_CACHE_DIR 를 지정하면 해당 디렉터리에 PNG 파일을
+저장하여 프로세스 재시작 후에도 재사용합니다.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+import plotly.graph_objects as go
+from plotly.utils import PlotlyJSONEncoder
+
+try:
+    from ..core.tracing import span
+    from .render_pool import render_figure
+except ImportError:
+    # streamlit run app/main.py 실행 시 app/ 디렉터리가 최상위 경로
+    from core.tracing import span
+    from report.render_pool import render_figure
+
+
+DEFAULT_MAX_ENTRIES = 64
+CACHE_DIR_ENV = "HEARING_SIM_IMAGE_CACHE_DIR"
+
+
+def figure_key(fig: go.Figure, format: str = "png", width: int = 600, height: int = 400, scale: float = 2) -> str:
+    """
+    차트 이미지 캐시 키
+
+    Args:
+        fig: Plotly Figure
+        format: 이미지 형식
+        width, height: 이미지 크기 (px)
+        scale: 배율
+
+    Returns:
+        SHA-256 16진수 문자열 (같은 차트 내용과 크기이면 같은 값)
+    """
+    payload = json.dumps(
+        {
+            "figure": fig.to_plotly_json(),
+            "format": format,
+            "width": width,
+            "height": height,
+            "scale": scale,
+        },
+        cls=PlotlyJSONEncoder,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ChartImageCache:
+    """
+    차트 이미지 캐시 (메모리 LRU + 선택적 디스크)
+
+    캐시에 없는 차트는 renderer(기본값: 예열된 워커 풀, render_pool.render_figure)로
+    변환합니다. 메모리에는 최근 사용한 max_entries개만 보관하고, cache_dir가 있으면
+    "<키 앞 2자리>/<키>.<형식>" 파일로도 저장합니다. 디스크 쓰기 실패는
+    무시합니다 (캐시는 결과에 영향을 주지 않음).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        cache_dir: Union[str, Path, None] = None,
+        renderer: Optional[Callable[..., bytes]] = None
+    ):
+        self.max_entries = max_entries
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.renderer = renderer or render_figure
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _disk_path(self, key: str, format: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / key[:2] / f"{key}.{format}"
+
+    def _remember(self, key: str, data: bytes):
+        with self._lock:
+            self._entries[key] = data
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _read_disk(self, key: str, format: str) -> Optional[bytes]:
+        path = self._disk_path(key, format)
+        if path is None:
+            return None
+        try:
+            return path.read_bytes()
+        except OSError:
+            return None
+
+    def _write_disk(self, key: str, format: str, data: bytes):
+        path = self._disk_path(key, format)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # 임시 파일에 쓴 뒤 교체 (동시 실행 시 반쯤 쓴 파일을 읽지 않도록)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_name, path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except OSError:
+            pass
+
+    def get(
+        self,
+        fig: go.Figure,
+        format: str = "png",
+        width: int = 600,
+        height: int = 400,
+        scale: float = 2,
+        timeout: Optional[float] = None
+    ) -> bytes:
+        """
+        차트 이미지 반환 (캐시에 없으면 변환 후 저장)
+
+        Args:
+            fig: Plotly Figure
+            format: 이미지 형식
+            width, height: 이미지 크기 (px)
+            scale: 배율
+            timeout: 변환 최대 시간 (renderer에 전달, None이면 renderer 기본값)
+
+        Returns:
+            이미지 바이트
+        """
+        key = figure_key(fig, format, width, height, scale)
+
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return data
+
+        data = self._read_disk(key, format)
+        if data is not None:
+            with self._lock:
+                self.disk_hits += 1
+            self._remember(key, data)
+            return data
+
+        with span("image_cache.render"):
+            data = self.renderer(fig, format=format, width=width, height=height, scale=scale, timeout=timeout)
+        with self._lock:
+            self.misses += 1
+        self._remember(key, data)
+        self._write_disk(key, format, data)
+        return data
+
+    def clear(self, disk: bool = False):
+        """
+        캐시 비우기
+
+        Args:
+            disk: True이면 디스크 캐시 파일도 삭제
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.disk_hits = self.misses = 0
+        if disk and self.cache_dir is not None and self.cache_dir.exists():
+            for path in self.cache_dir.glob("*/*"):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def stats(self) -> dict:
+        """캐시 통계 {"entries", "hits", "disk_hits", "misses"}"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+            }
+
+
+# 프로세스 전역 캐시
+_cache = ChartImageCache(cache_dir=os.environ.get(CACHE_DIR_ENV) or None)
+
+
+def get_image_cache() -> ChartImageCache:
+    """프로세스 전역 차트 이미지 캐시 반환"""
+    return _cache
+
+
+def set_image_cache(cache: ChartImageCache) -> ChartImageCache:
+    """
+    프로세스 전역 차트 이미지 캐시 교체
+
+    Returns:
+        이전 캐시
+    """
+    global _cache
+    previous = _cache
+    _cache = cache
+    return previous
+
+
+def figure_to_image(
+    fig: go.Figure,
+    format: str = "png",
+    width: int = 600,
+    height: int = 400,
+    scale: float = 2,
+    timeout: Optional[float] = None
+) -> bytes:
+    """캐시된 차트 이미지 반환 (ChartImageCache.get 참고)"""
+    return _cache.get(fig, format=format, width=width, height=height, scale=scale, timeout=timeout)
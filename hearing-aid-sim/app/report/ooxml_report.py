@@ -0,0 +1,357 @@
+"""
+OOXML 직접 작성 Word 리포트 모듈
+python-docx 객체 모델 없이 document.xml 템플릿에 고객별 내용을 채워 .docx(zip)를 작성
+
+word_report.build_report_docx(writer="ooxml")에서 사용합니다. 기본 문서(_build_template)를
+한 번 저장해 document.xml을 고객별 내용 위치에서 나눠 두고, 스타일/테마/로고 등 고정 파트는
+미리 압축해 두었다가 문서마다 그대로 복사합니다. 문서마다 새로 만드는 것은
+document.xml, 관계(rels), 콘텐츠 형식 파트와 차트 이미지뿐입니다.
+
+python-docx 작성기(기준 구현)와 같은 XML을 만들도록 텍스트 이스케이프, 줄바꿈/탭,
+그림 id/rId/미디어 파일 이름 규칙을 그대로 따릅니다 (tests/test_ooxml_report.py 비교 테스트).
+"""
+
+import copy
+import hashlib
+import re
+import struct
+import threading
+import time
+import zipfile
+import zlib
+from io import BytesIO
+from typing import Optional
+from xml.sax.saxutils import escape, quoteattr
+
+from docx.image.image import Image
+from docx.shared import Pt, Twips, Emu
+
+try:
+    from ..core.tracing import traced
+    from . import word_report
+except ImportError:
+    # streamlit run app/main.py 실행 시 app/ 디렉터리가 최상위 경로
+    from core.tracing import traced
+    from report import word_report
+
+
+DOCUMENT_PART = "word/document.xml"
+RELS_PART = "word/_rels/document.xml.rels"
+CONTENT_TYPES_PART = "[Content_Types].xml"
+IMAGE_RELTYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/image"
+PNG_DEFAULT = '<Default Extension="png" ContentType="image/png"/>'
+
+# 기본 문서의 고객별 run 위치 표시 (템플릿 저장 후 이 문자열 위치에서 document.xml을 나눔)
+SLOT_SENTINEL = "@@slot:{}@@"
+
+# XML 1.0에서 허용되지 않는 문자 (lxml과 동일하게 ValueError)
+_INVALID_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+_RUN_SPLIT = re.compile(r"(\t|\r|\n)")
+_ID_ATTR = re.compile(r'\sid="(\d+)"')
+_RID = re.compile(r'Id="rId(\d+)"')
+_MEDIA_NUMBER = re.compile(r"^word/media/image(\d+)\.")
+
+_PICTURE_XML = (
+    '<w:p><w:pPr><w:jc w:val="center"/></w:pPr><w:r><w:drawing>'
+    '<wp:inline xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+    'xmlns:pic="http://schemas.openxmlformats.org/drawingml/2006/picture">'
+    '<wp:extent cx="{cx}" cy="{cy}"/><wp:docPr id="{id}" name="Picture {id}"/>'
+    '<wp:cNvGraphicFramePr><a:graphicFrameLocks noChangeAspect="1"/></wp:cNvGraphicFramePr>'
+    '<a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/picture">'
+    '<pic:pic><pic:nvPicPr><pic:cNvPr id="0" name={filename}/><pic:cNvPicPr/></pic:nvPicPr>'
+    '<pic:blipFill><a:blip r:embed="{rid}"/><a:stretch><a:fillRect/></a:stretch></pic:blipFill>'
+    '<pic:spPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"/></pic:spPr></pic:pic></a:graphicData></a:graphic></wp:inline>'
+    '</w:drawing></w:r></w:p>'
+)
+
+
+def _text_xml(text: str) -> str:
+    """
+    run 내용 XML (python-docx run.text 규칙: 탭은 <w:tab/>, 줄바꿈은 <w:br/>)
+
+    Raises:
+        ValueError: XML에 넣을 수 없는 문자가 있는 경우
+    """
+    if _INVALID_XML_CHARS.search(text):
+        raise ValueError("XML에 넣을 수 없는 제어 문자가 포함되어 있습니다.")
+    out = []
+    for piece in _RUN_SPLIT.split(text):
+        if not piece:
+            continue
+        if piece == "\t":
+            out.append("<w:tab/>")
+        elif piece in "\r\n":
+            out.append("<w:br/>")
+        elif len(piece.strip()) < len(piece):
+            out.append(f'<w:t xml:space="preserve">{escape(piece)}</w:t>')
+        else:
+            out.append(f"<w:t>{escape(piece)}</w:t>")
+    return "".join(out)
+
+
+def _run_xml(run) -> str:
+    """word_report.TextRun → <w:r> (속성 순서: b, i, color, sz)"""
+    props = []
+    if run.bold:
+        props.append("<w:b/>")
+    if run.italic:
+        props.append("<w:i/>")
+    if run.color is not None:
+        props.append('<w:color w:val="%02X%02X%02X"/>' % tuple(run.color))
+    if run.size is not None:
+        props.append(f'<w:sz w:val="{int(Pt(run.size).pt * 2)}"/>')
+    rpr = f"<w:rPr>{''.join(props)}</w:rPr>" if props else ""
+    return f"<w:r>{rpr}{_text_xml(run.text)}</w:r>"
+
+
+def _paragraph_xml(block) -> str:
+    """word_report.TextParagraph → <w:p> (문단 속성 순서: spacing, jc)"""
+    props = []
+    if block.line_spacing is not None:
+        line = Emu(block.line_spacing * Twips(240)).twips
+        props.append(f'<w:spacing w:line="{line}" w:lineRule="auto"/>')
+    if block.center:
+        props.append('<w:jc w:val="center"/>')
+    runs = "".join(_run_xml(run) for run in block.runs)
+    if not props and not runs:
+        return "<w:p/>"
+    ppr = f"<w:pPr>{''.join(props)}</w:pPr>" if props else ""
+    return f"<w:p>{ppr}{runs}</w:p>"
+
+
+class _ZipEntry:
+    """미리 압축한 zip 항목 (이름, 압축 방식, CRC, 원본 크기, 압축 데이터)"""
+
+    __slots__ = ("name", "method", "crc", "size", "data")
+
+    def __init__(self, name: str, data: bytes, compress: bool = True):
+        self.name = name.encode("utf-8")
+        self.crc = zlib.crc32(data)
+        self.size = len(data)
+        if compress:
+            compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+            self.method = 8
+            self.data = compressor.compress(data) + compressor.flush()
+        else:
+            self.method = 0
+            self.data = data
+
+
+def _dos_date_time(date_time: Optional[tuple] = None) -> tuple:
+    """
+    zip 항목 수정 시각 (DOS 형식)
+
+    Args:
+        date_time: (년, 월, 일, 시, 분, 초) - zipfile.ZipInfo.date_time 형식 (None이면 현재 시각)
+
+    Returns:
+        (DOS 시간, DOS 날짜)
+    """
+    year, month, day, hour, minute, second = (date_time or time.localtime())[:6]
+    return hour << 11 | minute << 5 | second // 2, (year - 1980) << 9 | month << 5 | day
+
+
+def _write_zip(entries: list, dos_time: int, dos_date: int) -> BytesIO:
+    """zip 파일 작성 (이미 압축된 항목을 그대로 기록)"""
+    buffer = BytesIO()
+    central = []
+    for entry in entries:
+        offset = buffer.tell()
+        buffer.write(struct.pack(
+            "<4sHHHHHLLLHH", b"PK\x03\x04", 20, 0, entry.method, dos_time, dos_date,
+            entry.crc, len(entry.data), entry.size, len(entry.name), 0
+        ))
+        buffer.write(entry.name)
+        buffer.write(entry.data)
+        central.append(struct.pack(
+            "<4sHHHHHHLLLHHHHHLL", b"PK\x01\x02", 20, 20, 0, entry.method, dos_time, dos_date,
+            entry.crc, len(entry.data), entry.size, len(entry.name), 0, 0, 0, 0, 0o600 << 16, offset
+        ) + entry.name)
+
+    directory_offset = buffer.tell()
+    directory = b"".join(central)
+    buffer.write(directory)
+    buffer.write(struct.pack(
+        "<4sHHHHLLH", b"PK\x05\x06", 0, 0, len(entries), len(entries), len(directory), directory_offset, 0
+    ))
+    buffer.seek(0)
+    return buffer
+
+
+class CompiledTemplate:
+    """
+    document.xml 조각과 미리 압축한 고정 파트
+
+    기본 문서를 저장한 zip에서 만들며, 문서마다 write()로 고객별 내용을 채웁니다.
+    """
+
+    def __init__(self, template_doc, slots: dict):
+        """
+        Args:
+            template_doc: word_report 기본 문서 (수정하지 않음)
+            slots: 고객별 run 문단 인덱스 (word_report._build_template)
+        """
+        doc = copy.deepcopy(template_doc.part).document
+        paragraphs = doc.paragraphs
+        for name, index in slots.items():
+            paragraphs[index].runs[0].text = SLOT_SENTINEL.format(name)
+        saved = BytesIO()
+        doc.save(saved)
+
+        with zipfile.ZipFile(saved) as package:
+            names = package.namelist()
+            parts = {name: package.read(name) for name in names}
+
+        # document.xml: 앞부분 / (고객별 run, 다음 조각)... / 본문 추가 위치 / sectPr 이후
+        document = parts[DOCUMENT_PART].decode("utf-8")
+        body_end = document.rindex("<w:sectPr")
+        self._document_head, self._document_tail = document[:body_end], document[body_end:]
+        self._slot_order = []
+        pieces = []
+        rest = self._document_head
+        for name in sorted(slots, key=slots.get):
+            marker = f"<w:t>{SLOT_SENTINEL.format(name)}</w:t>"
+            before, rest = rest.split(marker, 1)
+            pieces.append(before)
+            self._slot_order.append(name)
+        pieces.append(rest)
+        self._document_pieces = pieces
+        self._next_id = max((int(value) for value in _ID_ATTR.findall(document)), default=0) + 1
+
+        # 관계: 사용 중인 rId와 기존 이미지 (같은 이미지는 python-docx처럼 기존 관계 재사용)
+        rels = parts[RELS_PART].decode("utf-8")
+        self._rels_head, self._rels_tail = rels[:rels.rindex("</Relationships>")], "</Relationships>"
+        self._used_rids = {int(n) for n in _RID.findall(rels)}
+        self._image_rids = {}
+        for match in re.finditer(r'<Relationship Id="(rId\d+)" Type="([^"]+)" Target="([^"]+)"/>', rels):
+            rid, reltype, target = match.groups()
+            if reltype == IMAGE_RELTYPE and f"word/{target}" in parts:
+                self._image_rids[hashlib.sha1(parts[f"word/{target}"]).hexdigest()] = rid
+        self._media_numbers = {
+            int(match.group(1)) for match in map(_MEDIA_NUMBER.match, names) if match
+        }
+
+        content_types = parts[CONTENT_TYPES_PART].decode("utf-8")
+        if 'Extension="png"' not in content_types:
+            content_types = _with_png_default(content_types)
+        self._content_types = _ZipEntry(CONTENT_TYPES_PART, content_types.encode("utf-8"))
+
+        self._names = names
+        self._static = {
+            name: _ZipEntry(name, data, compress=not name.endswith((".png", ".jpeg")))
+            for name, data in parts.items()
+            if name not in (DOCUMENT_PART, RELS_PART, CONTENT_TYPES_PART)
+        }
+        self._rels_entry = _ZipEntry(RELS_PART, parts[RELS_PART])
+
+    def write(self, slot_texts: dict, body: list, date_time: Optional[tuple] = None) -> BytesIO:
+        """
+        고객별 내용으로 .docx 작성
+
+        Args:
+            slot_texts: 기본 문서 run 문구 (word_report._slot_texts)
+            body: 본문 블록 목록 (word_report._report_body)
+            date_time: zip 항목 수정 시각 (년, 월, 일, 시, 분, 초) - None이면 작성 시각,
+                같은 내용을 같은 바이트로 만들어야 할 때(비교 테스트 등)만 지정
+
+        Returns:
+            BytesIO: Word 문서 바이트 스트림
+        """
+        xml = [self._document_pieces[0]]
+        for name, piece in zip(self._slot_order, self._document_pieces[1:]):
+            xml.append(_text_xml(slot_texts[name]))
+            xml.append(piece)
+
+        next_id = self._next_id
+        used_rids = set(self._used_rids)
+        image_rids = dict(self._image_rids)
+        media_numbers = set(self._media_numbers)
+        new_rels = []
+        media = []
+
+        for block in body:
+            if not isinstance(block, word_report.PictureParagraph):
+                xml.append(_paragraph_xml(block))
+                continue
+
+            image = Image.from_blob(block.data)
+            digest = hashlib.sha1(block.data).hexdigest()
+            rid = image_rids.get(digest)
+            if rid is None:
+                n = 1
+                while n in used_rids:
+                    n += 1
+                used_rids.add(n)
+                rid = image_rids[digest] = f"rId{n}"
+                n = 1
+                while n in media_numbers:
+                    n += 1
+                media_numbers.add(n)
+                target = f"media/image{n}.{image.ext}"
+                new_rels.append(f'<Relationship Id="{rid}" Type="{IMAGE_RELTYPE}" Target="{target}"/>')
+                media.append(_ZipEntry(f"word/{target}", block.data, compress=False))
+
+            cx, cy = image.scaled_dimensions(block.width, None)
+            xml.append(_PICTURE_XML.format(
+                cx=cx, cy=cy, id=next_id, rid=rid, filename=quoteattr(image.filename)
+            ))
+            next_id += 1
+
+        xml.append(self._document_tail)
+        document = _ZipEntry(DOCUMENT_PART, "".join(xml).encode("utf-8"))
+        if new_rels:
+            rels = _ZipEntry(RELS_PART, (self._rels_head + "".join(new_rels) + self._rels_tail).encode("utf-8"))
+        else:
+            rels = self._rels_entry
+
+        entries = [self._content_types, document, rels]
+        entries.extend(self._static[name] for name in self._names if name in self._static)
+        entries.extend(media)
+        return _write_zip(entries, *_dos_date_time(date_time))
+
+
+def _with_png_default(content_types: str) -> str:
+    """콘텐츠 형식에 png 기본값 추가 (python-docx처럼 확장자 순서 유지)"""
+    for match in re.finditer(r'<Default Extension="([^"]+)"', content_types):
+        if match.group(1) > "png":
+            return content_types[:match.start()] + PNG_DEFAULT + content_types[match.start():]
+    index = content_types.find("<Override")
+    if index < 0:
+        index = content_types.rindex("</Types>")
+    return content_types[:index] + PNG_DEFAULT + content_types[index:]
+
+
+# 기본 문서별 컴파일 결과 (word_report 기본 문서가 다시 만들어지면 새로 컴파일)
+_compiled: Optional[tuple] = None
+_compiled_lock = threading.Lock()
+
+
+def get_compiled_template() -> CompiledTemplate:
+    """현재 기본 문서의 컴파일 결과 반환"""
+    global _compiled
+    entry = word_report._template_entry()
+    compiled = _compiled
+    if compiled is None or compiled[0] is not entry:
+        with _compiled_lock:
+            compiled = _compiled
+            if compiled is None or compiled[0] is not entry:
+                compiled = (entry, CompiledTemplate(entry[1], entry[2]))
+                _compiled = compiled
+    return compiled[1]
+
+
+@traced()
+def write_report_ooxml(slot_texts: dict, body: list, date_time: Optional[tuple] = None) -> BytesIO:
+    """
+    OOXML 직접 작성으로 리포트 생성 (word_report.build_report_docx(writer="ooxml")에서 호출)
+
+    Args:
+        slot_texts: 기본 문서 run 문구
+        body: 본문 블록 목록
+        date_time: zip 항목 수정 시각 (None이면 작성 시각, CompiledTemplate.write 참고)
+
+    Returns:
+        BytesIO: Word 문서 바이트 스트림
+    """
+    return get_compiled_template().write(slot_texts, body, date_time)
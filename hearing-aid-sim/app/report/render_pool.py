@@ -0,0 +1,439 @@
+"""
+차트 이미지 변환 워커 풀 모듈
+kaleido(Chromium)를 미리 띄워 둔 워커 프로세스에서 Plotly 차트를 PNG로 변환
+
+kaleido는 처음 변환할 때 브라우저를 시작하느라 수백 ms~수 초가 걸립니다.
+워커 프로세스는 시작 시 한 번 예열(kaleido 서버 시작 + 빈 차트 변환)한 뒤
+요청 큐에서 차트를 받아 변환하므로, 여러 Streamlit 세션과 일괄 리포트 생성이
+같은 워커를 공유하며 시작 비용을 한 번만 냅니다.
+
+사용법:
+    from report.render_pool import get_render_pool
+
+    pool = get_render_pool()
+    png_bytes = pool.render(fig, width=600, height=400, scale=2)
+    futures = [pool.submit(fig) for fig in figures]     # 비동기
+
+변환이 timeout초를 넘거나 워커 프로세스가 비정상 종료되면 해당 요청은 실패로 끝나고
+워커는 다시 시작됩니다. render()/render_many()는 앞선 요청이나 워커 시작을 기다리는 시간까지
+포함해 timeout초가 지나면 요청을 취소하고 RenderTimeout을 발생시킵니다. 환경 변수 HEARING_SIM_RENDER_WORKERS 로 워커 수를 지정하며,
+0이면 워커 없이 현재 프로세스에서 변환합니다.
+"""
+
+import atexit
+import json
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Callable, Iterable, Optional
+
+
+DEFAULT_WORKERS = 1
+# 요청 1건 최대 변환 시간 (초)
+DEFAULT_TIMEOUT = 30.0
+# 워커 시작(브라우저 예열) 최대 시간 (초)
+DEFAULT_START_TIMEOUT = 60.0
+WORKERS_ENV = "HEARING_SIM_RENDER_WORKERS"
+
+
+class RenderError(RuntimeError):
+    """차트 이미지 변환 실패 (변환 오류 또는 워커 프로세스 종료)"""
+
+
+class RenderTimeout(RenderError):
+    """차트 이미지 변환 시간 초과"""
+
+
+def kaleido_render(figure, format: str = "png", width: int = 600, height: int = 400, scale: float = 2) -> bytes:
+    """
+    kaleido로 차트 이미지 변환 (현재 프로세스)
+
+    Args:
+        figure: Plotly Figure 또는 Figure 딕셔너리
+        format: 이미지 형식
+        width, height: 이미지 크기 (px)
+        scale: 배율
+
+    Returns:
+        이미지 바이트
+    """
+    import plotly.io as pio
+    return pio.to_image(figure, format=format, width=width, height=height, scale=scale)
+
+
+def _warm_up():
+    """kaleido 브라우저 예열 (실패해도 첫 변환 시 다시 시도됨)"""
+    try:
+        import kaleido
+        # kaleido 1.x: 브라우저를 계속 띄워 두는 동기 서버 (plotly가 자동으로 사용)
+        if hasattr(kaleido, "start_sync_server"):
+            kaleido.start_sync_server(silence_warnings=True)
+        kaleido_render({"data": [], "layout": {}}, width=10, height=10, scale=1)
+    except Exception:
+        pass
+
+
+def _worker_main(conn, renderer: Optional[Callable[..., bytes]]):
+    """
+    워커 프로세스 본체
+
+    요청: (figure JSON 문자열, format, width, height, scale) 또는 None(종료)
+    응답: ("ready", None) 1회 후 요청마다 ("ok", bytes) 또는 ("error", 메시지)
+    """
+    if renderer is None:
+        _warm_up()
+        renderer = kaleido_render
+    conn.send(("ready", None))
+
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        if request is None:
+            return
+
+        figure_json, format, width, height, scale = request
+        try:
+            data = renderer(json.loads(figure_json), format=format, width=width, height=height, scale=scale)
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+        else:
+            conn.send(("ok", data))
+
+
+def _figure_json(figure) -> str:
+    """워커로 보낼 차트 JSON (Figure 검증 없이 직렬화)"""
+    import plotly.graph_objects as go
+    from plotly.utils import PlotlyJSONEncoder
+
+    if isinstance(figure, go.Figure):
+        return figure.to_json()
+    return json.dumps(figure, cls=PlotlyJSONEncoder)
+
+
+class _Worker:
+    """워커 프로세스 1개와 연결"""
+
+    __slots__ = ("process", "conn")
+
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+
+    def stop(self, graceful: bool = True):
+        if graceful and self.process.is_alive():
+            try:
+                self.conn.send(None)
+            except (OSError, ValueError):
+                pass
+            self.process.join(1.0)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(1.0)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class RenderPool:
+    """
+    예열된 차트 이미지 변환 워커 풀
+
+    워커 프로세스마다 전담 스레드가 공유 요청 큐에서 요청을 꺼내 처리합니다.
+    워커는 spawn 방식으로 시작하므로 Streamlit 등 스레드가 많은 프로세스에서도 안전합니다.
+    """
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        timeout: float = DEFAULT_TIMEOUT,
+        start_timeout: float = DEFAULT_START_TIMEOUT,
+        renderer: Optional[Callable[..., bytes]] = None
+    ):
+        """
+        Args:
+            workers: 워커 프로세스 수 (1 이상)
+            timeout: 요청 1건 최대 변환 시간 (초)
+            start_timeout: 워커 시작 최대 시간 (초)
+            renderer: 워커에서 사용할 변환 함수 (None이면 kaleido, 모듈 최상위 함수여야 함)
+        """
+        if workers < 1:
+            raise ValueError(f"워커 수는 1 이상이어야 합니다: {workers}")
+
+        self.workers = workers
+        self.timeout = timeout
+        self.start_timeout = start_timeout
+        self.renderer = renderer
+        self.restarts = 0
+        self._context = multiprocessing.get_context("spawn")
+        self._jobs: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._threads = [
+            threading.Thread(target=self._serve, name=f"render-pool-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _spawn(self) -> _Worker:
+        """워커 프로세스 시작 후 예열 완료까지 대기"""
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self.renderer),
+            name="render-worker",
+            daemon=True
+        )
+        process.start()
+        child_conn.close()
+        worker = _Worker(process, parent_conn)
+
+        try:
+            if parent_conn.poll(self.start_timeout):
+                status, _ = parent_conn.recv()
+                if status == "ready":
+                    return worker
+        except (EOFError, OSError):
+            pass
+        worker.stop(graceful=False)
+        raise RenderError("차트 변환 워커를 시작하지 못했습니다.")
+
+    def _run_job(self, worker: Optional[_Worker], request: tuple, timeout: float) -> tuple:
+        """
+        요청 1건 처리
+
+        Returns:
+            (이후 사용할 워커 또는 None, 결과 bytes 또는 예외)
+        """
+        if worker is None:
+            try:
+                worker = self._spawn()
+            except RenderError as e:
+                return None, e
+
+        try:
+            worker.conn.send(request)
+            if not worker.conn.poll(timeout):
+                worker.stop(graceful=False)
+                self._count_restart()
+                return None, RenderTimeout(f"차트 변환 시간 초과 ({timeout:g}초)")
+            status, payload = worker.conn.recv()
+        except (EOFError, OSError):
+            exitcode = worker.process.exitcode
+            worker.stop(graceful=False)
+            self._count_restart()
+            return None, RenderError(f"차트 변환 워커가 종료되었습니다 (exitcode={exitcode}).")
+
+        if status == "ok":
+            return worker, payload
+        return worker, RenderError(payload)
+
+    def _count_restart(self):
+        with self._lock:
+            self.restarts += 1
+
+    def _serve(self):
+        """워커 전담 스레드: 요청 큐 처리 및 워커 재시작"""
+        worker = None
+        try:
+            worker = self._spawn()
+        except RenderError:
+            # 첫 요청에서 다시 시도
+            pass
+
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            future, request, timeout = job
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            worker, result = self._run_job(worker, request, timeout)
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+            # 비정상 종료된 워커는 다음 요청을 기다리지 않고 바로 다시 예열
+            if worker is None and not self._closed:
+                try:
+                    worker = self._spawn()
+                except RenderError:
+                    pass
+
+        if worker is not None:
+            worker.stop()
+
+    def submit(
+        self,
+        figure,
+        format: str = "png",
+        width: int = 600,
+        height: int = 400,
+        scale: float = 2,
+        timeout: Optional[float] = None
+    ) -> Future:
+        """
+        차트 변환 요청 (비동기)
+
+        Args:
+            figure: Plotly Figure 또는 Figure 딕셔너리
+            format: 이미지 형식
+            width, height: 이미지 크기 (px)
+            scale: 배율
+            timeout: 최대 변환 시간 (None이면 풀 기본값)
+
+        Returns:
+            이미지 바이트를 결과로 갖는 Future (실패 시 RenderError)
+        """
+        if self._closed:
+            raise RenderError("닫힌 워커 풀입니다.")
+        future = Future()
+        request = (_figure_json(figure), format, width, height, scale)
+        self._jobs.put((future, request, self.timeout if timeout is None else timeout))
+        return future
+
+    def render(
+        self,
+        figure,
+        format: str = "png",
+        width: int = 600,
+        height: int = 400,
+        scale: float = 2,
+        timeout: Optional[float] = None
+    ) -> bytes:
+        """
+        차트 변환 후 결과 대기 (submit 참고)
+
+        timeout은 변환 시간뿐 아니라 큐 대기/워커 시작 시간까지 포함한 전체 대기 시간입니다.
+
+        Raises:
+            RenderTimeout: timeout초 안에 결과가 없는 경우 (아직 시작하지 않은 요청은 취소)
+            RenderError: 변환 실패
+        """
+        timeout = self.timeout if timeout is None else timeout
+        future = self.submit(figure, format=format, width=width, height=height, scale=scale, timeout=timeout)
+        return _wait([future], time.monotonic() + timeout)[0]
+
+    def render_many(
+        self,
+        figures: Iterable,
+        format: str = "png",
+        width: int = 600,
+        height: int = 400,
+        scale: float = 2,
+        timeout: Optional[float] = None
+    ) -> list[bytes]:
+        """
+        여러 차트를 워커에 나누어 변환 (입력 순서 유지)
+
+        Args:
+            timeout: 전체 최대 대기 시간 (None이면 풀 기본값, 차트별 변환 시간 제한도 같은 값)
+
+        Raises:
+            RenderTimeout: timeout초 안에 모두 끝나지 않은 경우 (남은 요청은 취소)
+            RenderError: 하나라도 실패한 경우
+        """
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        futures = [
+            self.submit(figure, format=format, width=width, height=height, scale=scale, timeout=timeout)
+            for figure in figures
+        ]
+        return _wait(futures, deadline)
+
+    def close(self):
+        """대기 중인 요청 처리 후 워커 종료"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        for _ in self._threads:
+            self._jobs.put(None)
+        for thread in self._threads:
+            thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def _wait(futures: list, deadline: float) -> list:
+    """
+    deadline(time.monotonic 기준)까지 결과 대기
+
+    시간이 지나면 아직 시작하지 않은 요청을 취소하고 RenderTimeout (이미 변환 중인 요청은
+    워커의 요청별 시간 제한으로 끝남). 실패한 요청이 있으면 남은 요청도 취소합니다.
+    """
+    try:
+        return [future.result(max(0.0, deadline - time.monotonic())) for future in futures]
+    except FutureTimeoutError:
+        raise RenderTimeout("차트 변환 대기 시간 초과") from None
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def configured_workers() -> int:
+    """환경 변수 HEARING_SIM_RENDER_WORKERS 워커 수 (없거나 잘못된 값이면 기본값)"""
+    try:
+        return max(0, int(os.environ.get(WORKERS_ENV, DEFAULT_WORKERS)))
+    except ValueError:
+        return DEFAULT_WORKERS
+
+
+# 프로세스 전역 워커 풀 (첫 사용 시 시작)
+_pool: Optional[RenderPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_render_pool() -> Optional[RenderPool]:
+    """
+    프로세스 전역 워커 풀 반환
+
+    Returns:
+        RenderPool (워커 수 설정이 0이면 None)
+    """
+    global _pool
+    if _pool is None:
+        workers = configured_workers()
+        if workers == 0:
+            return None
+        with _pool_lock:
+            if _pool is None:
+                _pool = RenderPool(workers=workers)
+                atexit.register(_pool.close)
+    return _pool
+
+
+def render_figure(
+    figure,
+    format: str = "png",
+    width: int = 600,
+    height: int = 400,
+    scale: float = 2,
+    timeout: Optional[float] = None
+) -> bytes:
+    """
+    전역 워커 풀로 차트 변환 (워커 수 설정이 0이면 현재 프로세스에서 변환)
+
+    Args:
+        timeout: 최대 변환 시간 (None이면 풀 기본값, 현재 프로세스에서 변환할 때는 적용되지 않음)
+
+    Returns:
+        이미지 바이트
+    """
+    pool = get_render_pool()
+    if pool is None:
+        return kaleido_render(figure, format=format, width=width, height=height, scale=scale)
+    return pool.render(figure, format=format, width=width, height=height, scale=scale, timeout=timeout)
@@ -3,48 +3,105 @@ Word 문서 리포트 생성 모듈
 고객용 보청기 만족도 예측 리포트를 .docx 형식으로 생성 (1페이지 줄글 요약)
 """
 
+import copy
+import os
+import threading
+import time
 from io import BytesIO
-from datetime import datetime
-from typing import Optional
+from datetime import date
+from typing import NamedTuple, Optional
 from pathlib import Path
 from docx import Document
-from docx.shared import Pt, RGBColor, Inches, Cm
+from docx.shared import Pt, RGBColor, Inches, Cm, Length
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 import plotly.graph_objects as go
 
+try:
+    from ..core.tracing import traced, span
+    from ..viz.raster import render_audiogram
+    from ..viz.sprites import score_image
+    from .image_cache import figure_to_image
+except ImportError:
+    # streamlit run app/main.py 실행 시 app/ 디렉터리가 최상위 경로
+    from core.tracing import traced, span
+    from viz.raster import render_audiogram
+    from viz.sprites import score_image
+    from report.image_cache import figure_to_image
+
 # 로고 파일 경로
 LOGO_PATH = Path(__file__).parent.parent.parent / "assets" / "logo.png"
 
+# 차트 이미지 변환 방식: auto(kaleido, 실패/지연 시 내장 렌더러), kaleido, native(내장 렌더러만)
+CHART_RENDERER_ENV = "HEARING_SIM_CHART_RENDERER"
+# auto 방식에서 kaleido 변환을 기다리는 최대 시간 (초)
+KALEIDO_TIMEOUT = 5.0
+# kaleido 실패 후 이 시간 동안은 kaleido를 건너뛰고 내장 렌더러 사용 (초)
+KALEIDO_RETRY_AFTER = 300.0
 
-def build_report_docx(
-    user_input_dict: dict,
-    features: dict,
-    score: int,
-    satisfaction_level: str,
-    summary_text: str,
-    recommendations: list[str],
-    breakdown: dict,
-    chart_fig: Optional[go.Figure] = None,
-    audiogram_fig: Optional[go.Figure] = None
-) -> BytesIO:
+# 문서 작성 방식 (build_report_docx의 writer 참고)
+DOCX_WRITER_ENV = "HEARING_SIM_DOCX_WRITER"
+DOCX_WRITERS = ("python-docx", "ooxml")
+
+_kaleido_failed_at: Optional[float] = None
+
+
+def _audiogram_png(audiogram_fig: go.Figure, user_input_dict: dict) -> Optional[bytes]:
     """
-    고객용 Word 리포트 생성 (한 페이지 줄글 요약)
+    청력도 PNG (kaleido 또는 내장 렌더러)
 
-    Args:
-        user_input_dict: 사용자 입력 원본 데이터
-        features: 전처리된 특징 딕셔너리
-        score: 예측 만족도 점수
-        satisfaction_level: 만족도 등급
-        summary_text: 요약 텍스트
-        recommendations: 추천 사항 리스트
-        breakdown: 점수 breakdown 딕셔너리
-        chart_fig: Plotly 차트 (선택적)
-        audiogram_fig: 청력도 Plotly 차트 (선택적)
+    auto 방식에서는 kaleido가 없거나 KALEIDO_TIMEOUT초 안에 끝나지 않으면
+    내장 렌더러(viz.raster)로 그리고, 한동안 kaleido를 다시 시도하지 않습니다.
+    """
+    global _kaleido_failed_at
+    mode = os.environ.get(CHART_RENDERER_ENV, "auto")
+
+    if mode == "kaleido":
+        return figure_to_image(audiogram_fig, format="png", width=600, height=400, scale=2)
+
+    if mode == "auto":
+        failed_at = _kaleido_failed_at
+        if failed_at is None or time.monotonic() - failed_at >= KALEIDO_RETRY_AFTER:
+            try:
+                # 같은 청력도는 캐시된 이미지 재사용
+                png_bytes = figure_to_image(
+                    audiogram_fig, format="png", width=600, height=400, scale=2, timeout=KALEIDO_TIMEOUT
+                )
+                _kaleido_failed_at = None
+                return png_bytes
+            except Exception:
+                _kaleido_failed_at = time.monotonic()
+
+    return render_audiogram(user_input_dict, width=600, height=400, scale=2)
+
+
+def _score_chart_png(chart_fig: go.Figure, score: int) -> tuple:
+    """
+    점수 차트 PNG (미리 그려 둔 스프라이트에서 조회, 없으면 해당 점수만 내장 렌더러로 그림)
 
     Returns:
-        BytesIO: Word 문서 바이트 스트림
+        (PNG 바이트, 삽입 너비)
+    """
+    # create_gauge는 Indicator, create_bar는 Bar 차트
+    is_gauge = bool(chart_fig.data) and chart_fig.data[0].type == "indicator"
+    mode = os.environ.get(CHART_RENDERER_ENV, "auto")
+    png_bytes = score_image("gauge" if is_gauge else "bar", score, renderer=mode)
+    return png_bytes, Cm(8) if is_gauge else Cm(10)
+
+
+def _build_template() -> tuple:
+    """
+    리포트 기본 문서 생성 (여백, 로고, 제목, 고정 안내 문단)
+
+    고객별 문구가 들어갈 run은 서식만 지정하고 비워 둡니다.
+
+    Returns:
+        (Document, {"greeting", "date", "intro", "analysis_heading": 문단 인덱스})
     """
     doc = Document()
+    slots = {}
+
+    def slot(name: str):
+        slots[name] = len(doc.paragraphs) - 1
 
     # 여백 설정
     sections = doc.sections
@@ -70,32 +127,29 @@ def build_report_docx(
         run.font.color.rgb = RGBColor(31, 41, 55)
 
     # 고객명과 날짜
-    customer_name = user_input_dict.get('customer_name', '고객')
-
     greeting_para = doc.add_paragraph()
     greeting_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    greeting_run = greeting_para.add_run(f"{customer_name}님을 위한 맞춤 분석")
+    greeting_run = greeting_para.add_run()
     greeting_run.font.size = Pt(14)
     greeting_run.font.bold = True
     greeting_run.font.color.rgb = RGBColor(59, 130, 246)
+    slot("greeting")
 
     date_para = doc.add_paragraph()
     date_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    date_run = date_para.add_run(f"작성일: {datetime.now().strftime('%Y년 %m월 %d일')}")
+    date_run = date_para.add_run()
     date_run.font.size = Pt(9)
     date_run.font.color.rgb = RGBColor(107, 114, 128)
+    slot("date")
 
     doc.add_paragraph()  # 공백
 
     # 인사말
     intro_para = doc.add_paragraph()
-    intro_text = intro_para.add_run(
-        f"{customer_name}님 안녕하세요. 청력검사를 받으신 뒤 이렇게 서면으로 인사를 드립니다. "
-        f"{customer_name}님의 현재 청력 상태와 보청기 착용 시 예상되는 만족도에 대해 자세히 알려드리고자 합니다. "
-        f"또한 {customer_name}님뿐만 아니라 주변 가족 분들께도 정보를 드리기 위해 이와 같은 맞춤 컨설팅 서비스를 제공하고 있습니다."
-    )
+    intro_text = intro_para.add_run()
     intro_text.font.size = Pt(10)
     intro_para.paragraph_format.line_spacing = 1.5
+    slot("intro")
 
     doc.add_paragraph()
 
@@ -121,10 +175,115 @@ def build_report_docx(
 
     # 청력 분석 결과
     analysis_heading = doc.add_paragraph()
-    analysis_heading_run = analysis_heading.add_run(f"{customer_name}님의 청력 분석 결과")
+    analysis_heading_run = analysis_heading.add_run()
     analysis_heading_run.font.size = Pt(12)
     analysis_heading_run.font.bold = True
     analysis_heading_run.font.color.rgb = RGBColor(31, 41, 55)
+    slot("analysis_heading")
+
+    # 저장 후 다시 열어 하위 요소 프록시가 없는 문서로 보관 (복사 시 요소 참조가 어긋나지 않도록)
+    buffer = BytesIO()
+    doc.save(buffer)
+    buffer.seek(0)
+    return Document(buffer), slots
+
+
+# 기본 문서 캐시 (로고 파일 mtime, Document, 문단 인덱스) - 직접 수정하지 않고 복사본만 사용
+_template: Optional[tuple] = None
+_template_lock = threading.Lock()
+
+
+def _template_entry() -> tuple:
+    """
+    캐시된 리포트 기본 문서 (로고 파일이 바뀌면 다시 생성)
+
+    Returns:
+        (로고 mtime, Document, 문단 인덱스) - Document는 수정하지 말 것
+    """
+    global _template
+    try:
+        logo_mtime = LOGO_PATH.stat().st_mtime_ns
+    except OSError:
+        logo_mtime = None
+
+    template = _template
+    if template is None or template[0] != logo_mtime:
+        with _template_lock:
+            template = _template
+            if template is None or template[0] != logo_mtime:
+                template = (logo_mtime, *_build_template())
+                _template = template
+    return template
+
+
+def _report_template() -> tuple:
+    """
+    리포트 기본 문서 복사본
+
+    Returns:
+        (새 Document, 문단 인덱스)
+    """
+    _, template_doc, slots = _template_entry()
+    # docx 파일을 다시 읽는 것보다 문서 파트(패키지 전체) 복사가 빠름
+    return copy.deepcopy(template_doc.part).document, slots
+
+
+class TextRun(NamedTuple):
+    """리포트 본문 run (글자 크기 pt, 색상 RGB)"""
+    text: str
+    size: Optional[float] = None
+    bold: bool = False
+    italic: bool = False
+    color: Optional[tuple] = None
+
+
+class TextParagraph(NamedTuple):
+    """리포트 본문 문단 (runs가 비어 있으면 공백 문단)"""
+    runs: tuple = ()
+    center: bool = False
+    line_spacing: Optional[float] = None
+
+
+class PictureParagraph(NamedTuple):
+    """가운데 정렬 이미지 문단"""
+    data: bytes
+    width: Length
+
+
+def _slot_texts(customer_name: str, report_date: Optional[date] = None) -> dict:
+    """기본 문서의 고객별 run 문구 (_build_template의 slot 이름별, report_date가 None이면 오늘)"""
+    report_date = report_date or date.today()
+    return {
+        "greeting": f"{customer_name}님을 위한 맞춤 분석",
+        "date": f"작성일: {report_date.strftime('%Y년 %m월 %d일')}",
+        "intro": (
+            f"{customer_name}님 안녕하세요. 청력검사를 받으신 뒤 이렇게 서면으로 인사를 드립니다. "
+            f"{customer_name}님의 현재 청력 상태와 보청기 착용 시 예상되는 만족도에 대해 자세히 알려드리고자 합니다. "
+            f"또한 {customer_name}님뿐만 아니라 주변 가족 분들께도 정보를 드리기 위해 이와 같은 맞춤 컨설팅 서비스를 제공하고 있습니다."
+        ),
+        "analysis_heading": f"{customer_name}님의 청력 분석 결과",
+    }
+
+
+def _report_body(
+    user_input_dict: dict,
+    features: dict,
+    score: int,
+    satisfaction_level: str,
+    summary_text: str,
+    recommendations: list[str],
+    chart_fig: Optional[go.Figure],
+    audiogram_fig: Optional[go.Figure],
+    report_date: Optional[date] = None
+) -> list:
+    """
+    기본 문서 뒤에 이어지는 고객별 본문 (TextParagraph / PictureParagraph 목록, report_date가 None이면 오늘)
+
+    python-docx 작성기와 OOXML 작성기(ooxml_report)가 같은 목록으로 문서를 만듭니다.
+    """
+    body = []
+    customer_name = user_input_dict.get('customer_name', '고객')
+    report_date = report_date or date.today()
 
     # 청력 정보 텍스트
     loss_level_map = {
@@ -141,98 +300,93 @@ def build_report_docx(
     right_pta = user_input_dict['audiogram_right_pta']
     left_speech = user_input_dict['speech_score_left']
     right_speech = user_input_dict['speech_score_right']
-    age = user_input_dict['age']
-
-    analysis_para = doc.add_paragraph()
-    analysis_text = analysis_para.add_run(
-        f"{customer_name}님의 청력은 {datetime.now().strftime('%Y년 %m월')}에 평가한 결과, "
-        f"우측 {right_pta:.0f}dB HL, 좌측 {left_pta:.0f}dB HL로 {loss_level} 난청을 보이고 있습니다. "
-        f"어음명료도는 좌측 {left_speech}%, 우측 {right_speech}%로 측정되었습니다. "
-        f"정상청력은 20dB 이내이며, 청력은 변화될 수 있으므로 반드시 정기적으로(연 1회) "
-        f"청력평가를 받아 청력의 변화를 관리하셔야 합니다."
-    )
-    analysis_text.font.size = Pt(10)
-    analysis_para.paragraph_format.line_spacing = 1.5
 
-    # 청력도 이미지 삽입
+    body.append(TextParagraph(
+        runs=(TextRun(
+            f"{customer_name}님의 청력은 {report_date.strftime('%Y년 %m월')}에 평가한 결과, "
+            f"우측 {right_pta:.0f}dB HL, 좌측 {left_pta:.0f}dB HL로 {loss_level} 난청을 보이고 있습니다. "
+            f"어음명료도는 좌측 {left_speech}%, 우측 {right_speech}%로 측정되었습니다. "
+            f"정상청력은 20dB 이내이며, 청력은 변화될 수 있으므로 반드시 정기적으로(연 1회) "
+            f"청력평가를 받아 청력의 변화를 관리하셔야 합니다.",
+            size=10
+        ),),
+        line_spacing=1.5
+    ))
+
+    # 청력도 이미지
     if audiogram_fig is not None:
+        body.append(TextParagraph())
+        body.append(TextParagraph(runs=(TextRun("[청력도 (Audiogram)]", size=11, bold=True),)))
         try:
-            doc.add_paragraph()
-            audiogram_heading = doc.add_paragraph()
-            audiogram_heading_run = audiogram_heading.add_run("[청력도 (Audiogram)]")
-            audiogram_heading_run.font.size = Pt(11)
-            audiogram_heading_run.font.bold = True
-
             # Plotly 차트를 이미지로 변환
-            audiogram_bytes = audiogram_fig.to_image(format="png", width=600, height=400, scale=2)
-            audiogram_stream = BytesIO(audiogram_bytes)
-
-            audiogram_para = doc.add_paragraph()
-            audiogram_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            audiogram_run = audiogram_para.add_run()
-            audiogram_run.add_picture(audiogram_stream, width=Cm(14))
-        except Exception as e:
+            with span("word_report.to_image"):
+                audiogram_bytes = _audiogram_png(audiogram_fig, user_input_dict)
+            if audiogram_bytes is not None:
+                body.append(PictureParagraph(audiogram_bytes, Cm(14)))
+        except Exception:
             # 이미지 변환 실패 시 무시
             pass
 
-    doc.add_paragraph()
+    body.append(TextParagraph())
 
     # 만족도 예측 결과
-    prediction_para = doc.add_paragraph()
-    prediction_text = prediction_para.add_run(
-        f"청력은 한 번 떨어지기 시작하면 더 이상 좋아지지 않습니다. "
-        f"그리하여 청력의 손실을 보완하는 방법으로 많은 사람들이 보청기를 사용하게 됩니다. "
-        f"보청기는 떨어지는 청신경에 자극을 주어 청력이 떨어지는 것을 보완해주는 역할을 하게 됩니다. "
-    )
-    prediction_text.font.size = Pt(10)
-    prediction_para.paragraph_format.line_spacing = 1.5
+    body.append(TextParagraph(
+        runs=(TextRun(
+            f"청력은 한 번 떨어지기 시작하면 더 이상 좋아지지 않습니다. "
+            f"그리하여 청력의 손실을 보완하는 방법으로 많은 사람들이 보청기를 사용하게 됩니다. "
+            f"보청기는 떨어지는 청신경에 자극을 주어 청력이 떨어지는 것을 보완해주는 역할을 하게 됩니다. ",
+            size=10
+        ),),
+        line_spacing=1.5
+    ))
 
     # 만족도 점수 강조
-    score_para = doc.add_paragraph()
-    score_intro = score_para.add_run(
-        f"\n현재 {customer_name}님의 청력 상태와 생활 환경, 선호도를 종합적으로 분석한 결과, "
-        f"보청기 착용 시 예상 만족도는 "
-    )
-    score_intro.font.size = Pt(10)
-
-    score_value = score_para.add_run(f"100점 만점에 {score}점")
-    score_value.font.size = Pt(12)
-    score_value.font.bold = True
     if score >= 85:
-        score_value.font.color.rgb = RGBColor(16, 185, 129)
+        score_color = (16, 185, 129)
     elif score >= 70:
-        score_value.font.color.rgb = RGBColor(59, 130, 246)
+        score_color = (59, 130, 246)
     elif score >= 55:
-        score_value.font.color.rgb = RGBColor(245, 158, 11)
+        score_color = (245, 158, 11)
     else:
-        score_value.font.color.rgb = RGBColor(239, 68, 68)
-
-    score_outro = score_para.add_run(f"으로 '{satisfaction_level}' 수준입니다. ")
-    score_outro.font.size = Pt(10)
-    score_para.paragraph_format.line_spacing = 1.5
+        score_color = (239, 68, 68)
+
+    body.append(TextParagraph(
+        runs=(
+            TextRun(
+                f"\n현재 {customer_name}님의 청력 상태와 생활 환경, 선호도를 종합적으로 분석한 결과, "
+                f"보청기 착용 시 예상 만족도는 ",
+                size=10
+            ),
+            TextRun(f"100점 만점에 {score}점", size=12, bold=True, color=score_color),
+            TextRun(f"으로 '{satisfaction_level}' 수준입니다. ", size=10),
+        ),
+        line_spacing=1.5
+    ))
+
+    # 점수 차트 이미지
+    if chart_fig is not None:
+        try:
+            with span("word_report.score_chart"):
+                chart_bytes, chart_width = _score_chart_png(chart_fig, score)
+            body.append(PictureParagraph(chart_bytes, chart_width))
+        except Exception:
+            # 이미지 생성 실패 시 무시
+            pass
 
     # 요약 내용 (간결하게)
     summary_sentences = summary_text.split('. ')
     key_summary = '. '.join(summary_sentences[:3]) + '.'
 
-    summary_para = doc.add_paragraph()
-    summary_para.add_run(key_summary)
-    for run in summary_para.runs:
-        run.font.size = Pt(10)
-    summary_para.paragraph_format.line_spacing = 1.5
+    body.append(TextParagraph(runs=(TextRun(key_summary, size=10),), line_spacing=1.5))
 
-    doc.add_paragraph()
+    body.append(TextParagraph())
 
     # 착용 계획
     fitting_plan = user_input_dict.get('fitting_plan', 'bilateral')
-    fitting_heading = doc.add_paragraph()
-    fitting_heading_run = fitting_heading.add_run("[보청기 착용 계획]")
-    fitting_heading_run.font.size = Pt(11)
-    fitting_heading_run.font.bold = True
+    body.append(TextParagraph(runs=(TextRun("[보청기 착용 계획]", size=11, bold=True),)))
 
-    fitting_para = doc.add_paragraph()
     if fitting_plan == 'bilateral':
-        fitting_text = fitting_para.add_run(
+        fitting_text = (
             f"{customer_name}님께서는 양측 착용을 계획하고 계십니다. "
             "양측 착용은 양쪽 귀에 모두 보청기를 착용하는 방식으로, "
             "소리의 방향감 유지, 소음 환경에서 청취력 향상, 양쪽 귀의 균형적인 자극으로 청각 기능 유지, "
@@ -240,73 +394,152 @@ def build_report_docx(
         )
     else:
         side = "좌측" if fitting_plan == 'unilateral_left' else "우측"
-        fitting_text = fitting_para.add_run(
+        fitting_text = (
             f"{customer_name}님께서는 {side} 단측 착용을 계획하고 계십니다. "
             "단측 착용은 초기 비용 부담이 적고 한쪽 귀에만 집중하여 적응할 수 있다는 장점이 있습니다. "
             "다만 소리의 방향감 저하, 소음 환경에서 청취력 감소, "
             "착용하지 않은 귀의 청각 기능 저하 가능성 등의 제한사항이 있을 수 있습니다. "
             "양측 난청이 있는 경우, 가능하다면 양측 착용으로 전환하는 것을 고려해보시길 권장합니다."
         )
-    fitting_text.font.size = Pt(9)
-    fitting_para.paragraph_format.line_spacing = 1.4
+    body.append(TextParagraph(runs=(TextRun(fitting_text, size=9),), line_spacing=1.4))
 
-    doc.add_paragraph()
+    body.append(TextParagraph())
 
     # 전문가 추천사항
-    rec_heading = doc.add_paragraph()
-    rec_heading_run = rec_heading.add_run("[전문가 추천사항]")
-    rec_heading_run.font.size = Pt(11)
-    rec_heading_run.font.bold = True
-
-    rec_para = doc.add_paragraph()
+    body.append(TextParagraph(runs=(TextRun("[전문가 추천사항]", size=11, bold=True),)))
     rec_text_content = " ".join(recommendations[:3])  # 최대 3개를 하나의 문단으로
-    rec_text = rec_para.add_run(rec_text_content)
-    rec_text.font.size = Pt(9)
-    rec_para.paragraph_format.line_spacing = 1.4
+    body.append(TextParagraph(runs=(TextRun(rec_text_content, size=9),), line_spacing=1.4))
 
-    doc.add_paragraph()
+    body.append(TextParagraph())
 
     # 시범 착용 안내
-    trial_para = doc.add_paragraph()
-    trial_text = trial_para.add_run(
-        "보청기를 착용하실 경우, 1개월 시범 착용을 통해 직접 경험해보시고 "
-        "마음에 드실 경우 착용하시면 되고, 만족스럽지 않을 경우 반품하실 수 있습니다. "
-        "불편사항을 모두 고려하여 최신 기술이 탑재된 보청기를 제안 드리겠습니다."
-    )
-    trial_text.font.size = Pt(9)
-    trial_text.font.bold = True
-    trial_para.paragraph_format.line_spacing = 1.4
+    body.append(TextParagraph(
+        runs=(TextRun(
+            "보청기를 착용하실 경우, 1개월 시범 착용을 통해 직접 경험해보시고 "
+            "마음에 드실 경우 착용하시면 되고, 만족스럽지 않을 경우 반품하실 수 있습니다. "
+            "불편사항을 모두 고려하여 최신 기술이 탑재된 보청기를 제안 드리겠습니다.",
+            size=9,
+            bold=True
+        ),),
+        line_spacing=1.4
+    ))
 
     # 추가 정보 (간략하게)
     main_complaints = user_input_dict.get('main_complaints', [])
     wearing_goal = user_input_dict.get('wearing_goal')
 
     if main_complaints or wearing_goal:
-        doc.add_paragraph()
-        extra_para = doc.add_paragraph()
-
+        body.append(TextParagraph())
+        extra_runs = []
         if main_complaints:
-            complaints_text = extra_para.add_run(
-                f"현재 주요 불편사항: {', '.join(main_complaints[:2])}. "
-            )
-            complaints_text.font.size = Pt(8)
-
+            extra_runs.append(TextRun(f"현재 주요 불편사항: {', '.join(main_complaints[:2])}. ", size=8))
         if wearing_goal:
-            goal_text = extra_para.add_run(f"착용 목표: {wearing_goal}.")
-            goal_text.font.size = Pt(8)
+            extra_runs.append(TextRun(f"착용 목표: {wearing_goal}.", size=8))
+        body.append(TextParagraph(runs=tuple(extra_runs)))
 
-    doc.add_paragraph()
+    body.append(TextParagraph())
 
     # 면책 조항
-    disclaimer = doc.add_paragraph()
-    disclaimer.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    disclaimer_run = disclaimer.add_run(
-        "※ 본 리포트는 참고 자료이며 의학적 진단이 아닙니다. "
-        "최종 결정은 청각 전문가와 상담 후 내리시기 바랍니다."
+    body.append(TextParagraph(
+        runs=(TextRun(
+            "※ 본 리포트는 참고 자료이며 의학적 진단이 아닙니다. "
+            "최종 결정은 청각 전문가와 상담 후 내리시기 바랍니다.",
+            size=7,
+            italic=True,
+            color=(128, 128, 128)
+        ),),
+        center=True
+    ))
+
+    return body
+
+
+def _add_block(doc, block):
+    """본문 블록을 python-docx 문서에 추가"""
+    if isinstance(block, PictureParagraph):
+        para = doc.add_paragraph()
+        para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        para.add_run().add_picture(BytesIO(block.data), width=block.width)
+        return
+
+    para = doc.add_paragraph()
+    if block.center:
+        para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    for item in block.runs:
+        run = para.add_run(item.text)
+        if item.size is not None:
+            run.font.size = Pt(item.size)
+        if item.bold:
+            run.font.bold = True
+        if item.italic:
+            run.italic = True
+        if item.color is not None:
+            run.font.color.rgb = RGBColor(*item.color)
+    if block.line_spacing is not None:
+        para.paragraph_format.line_spacing = block.line_spacing
+
+
+@traced()
+def build_report_docx(
+    user_input_dict: dict,
+    features: dict,
+    score: int,
+    satisfaction_level: str,
+    summary_text: str,
+    recommendations: list[str],
+    breakdown: dict,
+    chart_fig: Optional[go.Figure] = None,
+    audiogram_fig: Optional[go.Figure] = None,
+    writer: Optional[str] = None,
+    report_date: Optional[date] = None
+) -> BytesIO:
+    """
+    고객용 Word 리포트 생성 (한 페이지 줄글 요약)
+
+    Args:
+        user_input_dict: 사용자 입력 원본 데이터
+        features: 전처리된 특징 딕셔너리
+        score: 예측 만족도 점수
+        satisfaction_level: 만족도 등급
+        summary_text: 요약 텍스트
+        recommendations: 추천 사항 리스트
+        breakdown: 점수 breakdown 딕셔너리
+        chart_fig: Plotly 차트 (선택적)
+        audiogram_fig: 청력도 Plotly 차트 (선택적)
+        writer: 문서 작성 방식 - "python-docx"(기준 구현) 또는 "ooxml"(document.xml 직접 작성, 대량 생성용)
+            (None이면 환경 변수 HEARING_SIM_DOCX_WRITER, 없으면 "python-docx")
+        report_date: 작성일/평가 월에 쓸 날짜 (None이면 오늘, 일괄 생성 시 방문일)
+
+    Returns:
+        BytesIO: Word 문서 바이트 스트림
+    """
+    writer = writer or os.environ.get(DOCX_WRITER_ENV, "python-docx")
+    if writer not in DOCX_WRITERS:
+        raise ValueError(f"알 수 없는 문서 작성 방식입니다: {writer} (가능: {', '.join(DOCX_WRITERS)})")
+
+    customer_name = user_input_dict.get('customer_name', '고객')
+    slot_texts = _slot_texts(customer_name, report_date)
+    body = _report_body(
+        user_input_dict, features, score, satisfaction_level, summary_text, recommendations,
+        chart_fig, audiogram_fig, report_date
     )
-    disclaimer_run.font.size = Pt(7)
-    disclaimer_run.font.color.rgb = RGBColor(128, 128, 128)
-    disclaimer_run.italic = True
+
+    if writer == "ooxml":
+        try:
+            from .ooxml_report import write_report_ooxml
+        except ImportError:
+            from report.ooxml_report import write_report_ooxml
+        return write_report_ooxml(slot_texts, body)
+
+    doc, slots = _report_template()
+    paragraphs = doc.paragraphs
+
+    # 고객별 내용 채우기 (고객명, 날짜, 인사말, 청력 분석 제목)
+    for name, text in slot_texts.items():
+        paragraphs[slots[name]].runs[0].text = text
+
+    for block in body:
+        _add_block(doc, block)
 
     # BytesIO로 저장
     buffer = BytesIO()
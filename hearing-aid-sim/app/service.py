@@ -0,0 +1,756 @@
+"""
+로컬 예측 HTTP 서비스
+Streamlit 없이 CRM 화면(Next.js) 등에서 만족도 점수를 조회하기 위한 JSON API (표준 라이브러리 asyncio)
+
+엔드포인트:
+    POST /predict        입력 1건 → {"score", "satisfaction_level", "breakdown"}
+    POST /predict/batch  입력 목록 → {"results": [...]} (입력 순서, 검증 실패 항목은 "errors")
+    POST /sweep          {"input": 입력, "axes": 비교 축(선택), "top": 개수(선택)} → 대안 시나리오
+    GET  /metrics        요청/응답/배치/지연 시간 통계
+    GET  /health         상태 확인
+
+/predict 요청은 검증·전처리 후 대기열에 넣고, 이벤트 루프가 한 바퀴 도는 동안(또는 --max-delay-ms
+동안) 도착한 요청을 모아 한 번에 예측합니다 (묶음이 크면 NumPy 배치 예측). 대기열이
+가득 차면 429(Retry-After)로 응답하므로 과부하 시에도 메모리와 지연 시간이 일정합니다.
+/predict/batch는 --max-batch건씩 나눠 이벤트 루프 주기마다 처리하므로 큰 배치 요청이 다른
+연결의 응답을 오래 막지 않습니다.
+연결은 HTTP/1.1 keep-alive로 유지하며 파이프라이닝된 요청도 순서대로 응답합니다.
+가중치 파일이 바뀌면 다음 묶음부터 새 가중치를 사용합니다 (weights.get_compiled_weights).
+
+사용법 (hearing-aid-sim 디렉터리에서):
+    python -m app.service serve                          # 127.0.0.1:8765
+    python -m app.service serve --port 9000 --max-delay-ms 2 --cors-origin http://localhost:3000
+    python -m app.service load --concurrency 200 --requests 20000   # 부하 측정 (서비스 실행 중)
+
+    curl -s localhost:8765/predict -d '{"audiogram_left_pta": 45, ...}'
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from collections import deque
+from http import HTTPStatus
+from typing import Callable, Optional, Union
+
+from pydantic import ValidationError
+
+from .core.batch_predictor import BREAKDOWN_KEYS, encode_features, predict_satisfaction_batch
+from .core.pipeline import format_validation_error
+from .core.predictor import predict_satisfaction, get_satisfaction_level
+from .core.preprocess import preprocess_inputs
+from .core.scenario import sweep_scenarios
+from .core.schema import UserInput
+from .core.weights import get_compiled_weights, get_weights_fingerprint
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# 한 번에 예측할 최대 건수
+DEFAULT_MAX_BATCH = 256
+# 예측 대기열 최대 건수 (초과 시 429)
+DEFAULT_MAX_QUEUE = 4096
+# 묶음을 모으기 위해 추가로 기다리는 시간 (초, 0이면 현재 이벤트 루프 주기에 도착한 요청만)
+DEFAULT_MAX_DELAY = 0.0
+# /predict/batch 요청 1건의 최대 입력 수 (본문 JSON 파싱은 나눌 수 없으므로 이벤트 루프를 막는 시간의 상한)
+DEFAULT_MAX_BATCH_RECORDS = 2000
+DEFAULT_MAX_BODY_BYTES = 8 * 1024 * 1024
+DEFAULT_KEEPALIVE_TIMEOUT = 15.0
+MAX_HEADER_BYTES = 16 * 1024
+# 이 건수 미만의 묶음은 NumPy 배치 대신 건별 예측 (배열 준비 비용이 더 큼)
+VECTOR_MIN_BATCH = 16
+# 엔드포인트별 지연 시간 보관 개수 (/metrics 백분위 계산용)
+LATENCY_WINDOW = 10000
+
+
+def _prediction(score: int, breakdown: dict) -> dict:
+    """/predict 응답 한 건"""
+    return {
+        "score": score,
+        "satisfaction_level": get_satisfaction_level(score),
+        "breakdown": breakdown,
+    }
+
+
+def predict_features(features_list: list[dict], weights=None) -> list[dict]:
+    """
+    전처리된 특징 목록 일괄 예측 (서비스 응답 형식)
+
+    VECTOR_MIN_BATCH건 이상이면 NumPy 배치 예측, 미만이면 건별 예측을 사용합니다
+    (두 방식의 결과는 같음).
+
+    Args:
+        features_list: preprocess_inputs() 결과 목록
+        weights: CompiledWeights (None이면 캐시된 기본 가중치)
+
+    Returns:
+        [{"score", "satisfaction_level", "breakdown"}, ...] (입력 순서)
+    """
+    if weights is None:
+        weights = get_compiled_weights()
+
+    if len(features_list) < VECTOR_MIN_BATCH:
+        results = []
+        for features in features_list:
+            score, breakdown = predict_satisfaction(features, weights)
+            results.append(_prediction(score, {key: breakdown[key] for key in BREAKDOWN_KEYS}))
+        return results
+
+    columns = predict_satisfaction_batch(encode_features(features_list), weights)
+    parts = {key: columns[key].tolist() for key in BREAKDOWN_KEYS}
+    return [
+        _prediction(score, {key: parts[key][i] for key in BREAKDOWN_KEYS})
+        for i, score in enumerate(columns["final_score"].tolist())
+    ]
+
+
+class MicroBatcher:
+    """
+    예측 요청 묶음 처리기 (이벤트 루프 스레드 전용)
+
+    첫 요청이 들어오면 묶음 처리를 예약하고(max_delay가 0이면 다음 루프 주기), 그 사이
+    도착한 요청을 최대 max_batch건씩 한 번에 예측합니다. 대기 중인 요청이 max_queue건이면
+    submit()이 False를 반환합니다.
+    """
+
+    def __init__(
+        self,
+        predict_many: Callable[[list], list],
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        max_delay: float = DEFAULT_MAX_DELAY
+    ):
+        self.predict_many = predict_many
+        self.max_batch = max_batch
+        self.max_queue = max_queue
+        self.max_delay = max_delay
+        self._pending: deque = deque()
+        self._handle: Optional[asyncio.Handle] = None
+        self.batches = 0
+        self.items = 0
+        self.max_size = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def submit(self, item, callback: Callable[[Optional[dict], Optional[Exception]], None]) -> bool:
+        """
+        예측 요청 추가
+
+        Args:
+            item: predict_many에 전달할 항목
+            callback: 결과 콜백 (결과, 오류) - 둘 중 하나는 None
+
+        Returns:
+            대기열에 추가했으면 True, 가득 찼으면 False
+        """
+        if len(self._pending) >= self.max_queue:
+            return False
+        self._pending.append((item, callback))
+        if self._handle is None:
+            loop = asyncio.get_running_loop()
+            if self.max_delay > 0:
+                self._handle = loop.call_later(self.max_delay, self._flush)
+            else:
+                self._handle = loop.call_soon(self._flush)
+        return True
+
+    def _flush(self):
+        self._handle = None
+        size = min(len(self._pending), self.max_batch)
+        batch = [self._pending.popleft() for _ in range(size)]
+        # 남은 요청은 다음 루프 주기에 처리 (그 사이 다른 연결의 입출력 처리)
+        if self._pending:
+            self._handle = asyncio.get_running_loop().call_soon(self._flush)
+
+        self.batches += 1
+        self.items += size
+        self.max_size = max(self.max_size, size)
+        try:
+            results = self.predict_many([item for item, _ in batch])
+        except Exception as e:
+            for _, callback in batch:
+                callback(None, e)
+            return
+        for (_, callback), result in zip(batch, results):
+            callback(result, None)
+
+
+class ServiceMetrics:
+    """요청/응답/지연 시간 통계"""
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.connections = 0
+        self.requests: dict = {}
+        self.responses: dict = {}
+        self.rejected = 0
+        self._latencies: dict = {}
+
+    def record(self, path: str, status: int, elapsed: float):
+        self.requests[path] = self.requests.get(path, 0) + 1
+        self.responses[status] = self.responses.get(status, 0) + 1
+        latencies = self._latencies.get(path)
+        if latencies is None:
+            latencies = self._latencies[path] = deque(maxlen=LATENCY_WINDOW)
+        latencies.append(elapsed)
+
+    def latency(self) -> dict:
+        """엔드포인트별 최근 LATENCY_WINDOW건 지연 시간 백분위 (ms)"""
+        summary = {}
+        for path, latencies in self._latencies.items():
+            values = sorted(latencies)
+            pick = lambda q: values[min(len(values) - 1, int(q * len(values)))] * 1000
+            summary[path] = {
+                "count": len(values),
+                "p50_ms": pick(0.50),
+                "p95_ms": pick(0.95),
+                "p99_ms": pick(0.99),
+                "max_ms": values[-1] * 1000,
+            }
+        return summary
+
+
+class PredictionService:
+    """
+    예측 API 처리 (HTTP 연결과 무관한 부분)
+
+    handle()은 이벤트 루프 스레드에서 호출되며, 응답은 reply(상태 코드, JSON 객체, 추가 헤더)로
+    전달합니다 (/predict는 묶음 예측 후 나중에 호출).
+    """
+
+    def __init__(
+        self,
+        weights_path: Optional[str] = None,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        max_batch_records: int = DEFAULT_MAX_BATCH_RECORDS,
+        max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        cors_origin: Optional[str] = None
+    ):
+        """
+        Args:
+            weights_path: 가중치 파일 경로 (None이면 기본 파일)
+            max_batch: 한 번에 예측할 최대 건수 (/predict 묶음, /predict/batch 분할 단위)
+            max_queue: 예측 대기열 최대 건수 (초과 시 429)
+            max_delay: 묶음을 모으기 위해 기다리는 시간 (초)
+            max_batch_records: /predict/batch 요청 1건의 최대 입력 수 (초과 시 413)
+            max_body_bytes: 요청 본문 최대 크기 (초과 시 413)
+            keepalive_timeout: 유휴 연결을 닫기까지의 시간 (초)
+            cors_origin: Access-Control-Allow-Origin 값 (브라우저에서 직접 호출할 때)
+        """
+        self.weights_path = weights_path
+        self.max_batch_records = max_batch_records
+        self.max_body_bytes = max_body_bytes
+        self.keepalive_timeout = keepalive_timeout
+        self.cors_origin = cors_origin
+        self.metrics = ServiceMetrics()
+        self.batcher = MicroBatcher(self._predict_many, max_batch, max_queue, max_delay)
+        self._routes = {
+            "/predict": ("POST", self._predict),
+            "/predict/batch": ("POST", self._predict_batch),
+            "/sweep": ("POST", self._sweep),
+            "/metrics": ("GET", self._metrics),
+            "/health": ("GET", self._health),
+        }
+
+    def _predict_many(self, features_list: list[dict]) -> list[dict]:
+        return predict_features(features_list, get_compiled_weights(self.weights_path))
+
+    def handle(self, method: str, path: str, body: bytes, reply: Callable) -> None:
+        """
+        요청 1건 처리
+
+        Args:
+            method: HTTP 메서드
+            path: 요청 경로 (쿼리 문자열 제외)
+            body: 요청 본문
+            reply: 응답 함수 reply(status, payload, headers=())
+        """
+        started = time.perf_counter()
+
+        def respond(status: int, payload, headers: tuple = ()):
+            self.metrics.record(path if path in self._routes else "other", status, time.perf_counter() - started)
+            reply(status, payload, headers)
+
+        route = self._routes.get(path)
+        if route is None:
+            respond(404, {"error": f"알 수 없는 경로입니다: {path}"})
+            return
+        route_method, handler = route
+        if method == "OPTIONS" and self.cors_origin is not None:
+            respond(204, None)
+            return
+        if method != route_method:
+            respond(405, {"error": f"{route_method} 요청만 지원합니다."}, (("Allow", route_method),))
+            return
+
+        try:
+            handler(body, respond)
+        except Exception as e:
+            respond(500, {"error": f"{type(e).__name__}: {e}"})
+
+    @staticmethod
+    def _load_json(body: bytes, expected: Union[type, tuple], respond: Callable):
+        """요청 본문 JSON 파싱 (형식이 다르면 400 응답 후 None)"""
+        try:
+            value = json.loads(body)
+        except ValueError as e:
+            respond(400, {"error": f"JSON 파싱 오류: {e}"})
+            return None
+        if not isinstance(value, expected):
+            kind = "객체" if expected is dict else "배열 또는 객체"
+            respond(400, {"error": f"요청 본문은 JSON {kind}여야 합니다."})
+            return None
+        return value
+
+    @staticmethod
+    def _validate(input_data) -> tuple[Optional[dict], list[dict]]:
+        """입력 1건 검증 → (전처리된 특징 또는 None, 오류 목록)"""
+        if not isinstance(input_data, dict):
+            return None, [{"field": "", "message": "입력은 JSON 객체여야 합니다."}]
+        try:
+            user_input = UserInput(**input_data)
+        except ValidationError as e:
+            return None, format_validation_error(e)
+        return preprocess_inputs(user_input), []
+
+    def _predict(self, body: bytes, respond: Callable):
+        input_data = self._load_json(body, dict, respond)
+        if input_data is None:
+            return
+        features, errors = self._validate(input_data)
+        if features is None:
+            respond(422, {"errors": errors})
+            return
+
+        def done(result: Optional[dict], error: Optional[Exception]):
+            if error is not None:
+                respond(500, {"error": f"{type(error).__name__}: {error}"})
+            else:
+                respond(200, result)
+
+        if not self.batcher.submit(features, done):
+            self.metrics.rejected += 1
+            respond(429, {"error": "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도하세요."}, (("Retry-After", "1"),))
+
+    def _predict_batch(self, body: bytes, respond: Callable):
+        records = self._load_json(body, (list, dict), respond)
+        if records is None:
+            return
+        if isinstance(records, dict):
+            records = records.get("records")
+            if not isinstance(records, list):
+                respond(400, {"error": "요청 본문은 입력 배열 또는 {\"records\": [...]}여야 합니다."})
+                return
+        if len(records) > self.max_batch_records:
+            respond(413, {"error": f"한 번에 최대 {self.max_batch_records}건까지 예측할 수 있습니다."})
+            return
+
+        # 한 번에 max_batch건씩 검증·예측하고 나머지는 다음 루프 주기로 미뤄서
+        # 큰 배치 요청 처리 중에도 다른 연결의 요청을 처리 (가중치는 요청 시작 시점 기준)
+        weights = get_compiled_weights(self.weights_path)
+        chunk_size = self.batcher.max_batch
+        results: list = [None] * len(records)
+
+        def run_chunk(start: int):
+            stop = min(start + chunk_size, len(records))
+            try:
+                self._predict_records(records, start, stop, weights, results)
+            except Exception as e:
+                respond(500, {"error": f"{type(e).__name__}: {e}"})
+                return
+            if stop < len(records):
+                asyncio.get_running_loop().call_soon(run_chunk, stop)
+            else:
+                respond(200, {"results": results})
+
+        # 본문 파싱과 첫 묶음 예측도 서로 다른 루프 주기에 처리
+        asyncio.get_running_loop().call_soon(run_chunk, 0)
+
+    @classmethod
+    def _predict_records(cls, records: list, start: int, stop: int, weights, results: list):
+        """records[start:stop] 검증·예측 결과를 results의 같은 위치에 기록"""
+        valid_features = []
+        valid_slots = []
+        for index in range(start, stop):
+            features, errors = cls._validate(records[index])
+            if features is None:
+                results[index] = {"index": index, "ok": False, "errors": errors}
+            else:
+                valid_features.append(features)
+                valid_slots.append(index)
+
+        for index, prediction in zip(valid_slots, predict_features(valid_features, weights)):
+            results[index] = {"index": index, "ok": True, **prediction}
+
+    def _sweep(self, body: bytes, respond: Callable):
+        request = self._load_json(body, dict, respond)
+        if request is None:
+            return
+        features, errors = self._validate(request.get("input"))
+        if features is None:
+            respond(422, {"errors": errors})
+            return
+
+        top = request.get("top")
+        if top is not None and (isinstance(top, bool) or not isinstance(top, int) or top < 1):
+            respond(400, {"error": "top은 1 이상의 정수여야 합니다."})
+            return
+        try:
+            scenarios = sweep_scenarios(features, request.get("axes"), get_compiled_weights(self.weights_path))
+        except (ValueError, TypeError, KeyError) as e:
+            respond(400, {"error": f"비교 축 오류: {e}"})
+            return
+
+        respond(200, {
+            "current_score": scenarios[0]["score"] - scenarios[0]["delta"],
+            "count": len(scenarios),
+            "scenarios": scenarios[:top] if top is not None else scenarios,
+        })
+
+    def _metrics(self, body: bytes, respond: Callable):
+        metrics = self.metrics
+        batcher = self.batcher
+        respond(200, {
+            "uptime_s": time.time() - metrics.started_at,
+            "connections": metrics.connections,
+            "requests": metrics.requests,
+            "responses": {str(status): count for status, count in sorted(metrics.responses.items())},
+            "rejected": metrics.rejected,
+            "queue_depth": len(batcher),
+            "batches": batcher.batches,
+            "batched_items": batcher.items,
+            "avg_batch_size": batcher.items / batcher.batches if batcher.batches else 0.0,
+            "max_batch_size": batcher.max_size,
+            "latency": metrics.latency(),
+            "weights": get_weights_fingerprint(self.weights_path),
+        })
+
+    def _health(self, body: bytes, respond: Callable):
+        respond(200, {"status": "ok"})
+
+
+def _encode_response(
+    status: int,
+    payload,
+    keep_alive: bool,
+    headers: tuple = (),
+    cors_origin: Optional[str] = None
+) -> bytes:
+    """HTTP/1.1 응답 바이트"""
+    body = b"" if payload is None else json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    lines = [
+        f"HTTP/1.1 {status} {HTTPStatus(status).phrase}",
+        "Content-Type: application/json; charset=utf-8",
+        f"Content-Length: {len(body)}",
+        "Connection: keep-alive" if keep_alive else "Connection: close",
+    ]
+    if cors_origin is not None:
+        lines.append(f"Access-Control-Allow-Origin: {cors_origin}")
+        if status == 204:
+            lines.append("Access-Control-Allow-Methods: GET, POST, OPTIONS")
+            lines.append("Access-Control-Allow-Headers: Content-Type")
+    lines.extend(f"{name}: {value}" for name, value in headers)
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+
+class _HttpConnection(asyncio.Protocol):
+    """
+    HTTP/1.1 연결 1개 (Content-Length 본문, keep-alive, 파이프라이닝)
+
+    응답은 요청 순서대로 보내야 하므로 요청마다 응답 자리를 만들어 두고, 앞 요청의
+    응답이 준비된 만큼만 차례로 보냅니다.
+    """
+
+    def __init__(self, service: PredictionService):
+        self.service = service
+        self.transport: Optional[asyncio.Transport] = None
+        self._buffer = bytearray()
+        self._responses: deque = deque()
+        self._closing = False
+        self._idle_handle: Optional[asyncio.TimerHandle] = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.service.metrics.connections += 1
+        self._reset_idle()
+
+    def connection_lost(self, exc):
+        self.service.metrics.connections -= 1
+        if self._idle_handle is not None:
+            self._idle_handle.cancel()
+        self.transport = None
+
+    def pause_writing(self):
+        # 클라이언트가 응답을 읽지 않으면 새 요청도 읽지 않음
+        if self.transport is not None:
+            self.transport.pause_reading()
+
+    def resume_writing(self):
+        if self.transport is not None:
+            self.transport.resume_reading()
+
+    def _reset_idle(self):
+        if self._idle_handle is not None:
+            self._idle_handle.cancel()
+        loop = asyncio.get_running_loop()
+        self._idle_handle = loop.call_later(self.service.keepalive_timeout, self._close_idle)
+
+    def _close_idle(self):
+        if self.transport is not None and not self._responses:
+            self.transport.close()
+
+    def data_received(self, data: bytes):
+        if self._closing:
+            return
+        self._buffer += data
+        self._reset_idle()
+        while not self._closing:
+            request = self._next_request()
+            if request is None:
+                break
+            method, path, body, keep_alive = request
+            slot = [None, keep_alive]
+            self._responses.append(slot)
+            self.service.handle(method, path, body, self._replier(slot))
+
+    def _replier(self, slot: list) -> Callable:
+        def reply(status: int, payload, headers: tuple = ()):
+            slot[0] = _encode_response(status, payload, slot[1], headers, self.service.cors_origin)
+            self._send_ready()
+        return reply
+
+    def _send_ready(self):
+        while self._responses and self._responses[0][0] is not None:
+            data, keep_alive = self._responses.popleft()
+            if self.transport is None:
+                self._responses.clear()
+                return
+            self.transport.write(data)
+            if not keep_alive:
+                self._responses.clear()
+                self.transport.close()
+                return
+
+    def _fail(self, status: int, message: str):
+        """처리할 수 없는 요청 - 오류 응답 후 연결 종료"""
+        self._closing = True
+        self._buffer.clear()
+        slot = [None, False]
+        self._responses.append(slot)
+        self._replier(slot)(status, {"error": message})
+
+    def _next_request(self) -> Optional[tuple]:
+        """버퍼에서 완성된 요청 1건 꺼내기 (method, path, body, keep_alive)"""
+        end = self._buffer.find(b"\r\n\r\n")
+        if end < 0:
+            if len(self._buffer) > MAX_HEADER_BYTES:
+                self._fail(431, "요청 헤더가 너무 큽니다.")
+            return None
+
+        lines = self._buffer[:end].decode("latin-1").split("\r\n")
+        parts = lines[0].split(" ")
+        if len(parts) != 3 or not parts[2].startswith("HTTP/1."):
+            self._fail(400, "잘못된 요청입니다.")
+            return None
+        method, target, version = parts
+
+        headers = {}
+        for line in lines[1:]:
+            name, sep, value = line.partition(":")
+            if sep:
+                headers[name.strip().lower()] = value.strip()
+
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            self._fail(501, "chunked 전송은 지원하지 않습니다. Content-Length를 지정하세요.")
+            return None
+        try:
+            length = int(headers.get("content-length") or 0)
+        except ValueError:
+            self._fail(400, "Content-Length 값이 잘못되었습니다.")
+            return None
+        if length < 0 or length > self.service.max_body_bytes:
+            self._fail(413, f"요청 본문은 최대 {self.service.max_body_bytes}바이트입니다.")
+            return None
+
+        total = end + 4 + length
+        if len(self._buffer) < total:
+            return None
+        body = bytes(self._buffer[end + 4:total])
+        del self._buffer[:total]
+
+        connection = headers.get("connection", "").lower()
+        if version == "HTTP/1.0":
+            keep_alive = connection == "keep-alive"
+        else:
+            keep_alive = connection != "close"
+        return method, target.split("?", 1)[0], body, keep_alive
+
+
+async def start_service(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    **options
+) -> tuple[asyncio.AbstractServer, PredictionService]:
+    """
+    서비스 시작 (현재 이벤트 루프)
+
+    Args:
+        host: 바인드 주소
+        port: 포트 (0이면 임의 포트 - server.sockets[0].getsockname()으로 확인)
+        **options: PredictionService 옵션
+
+    Returns:
+        (asyncio 서버, PredictionService)
+    """
+    service = PredictionService(**options)
+    # 첫 요청에서 가중치를 읽지 않도록 미리 로드
+    get_compiled_weights(service.weights_path)
+    loop = asyncio.get_running_loop()
+    server = await loop.create_server(lambda: _HttpConnection(service), host, port, backlog=1024)
+    return server, service
+
+
+async def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, **options):
+    """서비스 실행 (종료 시까지)"""
+    server, _ = await start_service(host, port, **options)
+    address = server.sockets[0].getsockname()
+    print(f"예측 서비스 시작: http://{address[0]}:{address[1]}", file=sys.stderr)
+    async with server:
+        await server.serve_forever()
+
+
+async def _load_worker(host: str, port: int, bodies: list[bytes], count: int, latencies: list, statuses: dict):
+    """부하 측정 연결 1개 (keep-alive로 count건 순차 요청)"""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for i in range(count):
+            body = bodies[i % len(bodies)]
+            request = (
+                f"POST /predict HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n\r\n"
+            ).encode("latin-1") + body
+            started = time.perf_counter()
+            writer.write(request)
+            head = await reader.readuntil(b"\r\n\r\n")
+            status = int(head.split(b" ", 2)[1])
+            length = 0
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - started)
+            statuses[status] = statuses.get(status, 0) + 1
+    finally:
+        writer.close()
+
+
+async def load_test(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    concurrency: int = 200,
+    requests: int = 20000,
+    records: Optional[list[dict]] = None
+) -> dict:
+    """
+    /predict 부하 측정 (동시 연결 concurrency개, 연결마다 keep-alive 순차 요청)
+
+    Args:
+        host, port: 서비스 주소
+        concurrency: 동시 연결 수
+        requests: 전체 요청 수
+        records: 요청 입력 목록 (None이면 bench.synthetic_inputs 200건)
+
+    Returns:
+        {"requests", "concurrency", "elapsed_s", "rps", "statuses", "p50_ms", "p95_ms", "p99_ms"}
+        (지연 시간은 클라이언트 기준)
+    """
+    if records is None:
+        from .bench import synthetic_inputs
+        records = synthetic_inputs(200)
+    bodies = [json.dumps(record, ensure_ascii=False).encode("utf-8") for record in records]
+
+    latencies: list = []
+    statuses: dict = {}
+    per_worker, extra = divmod(requests, concurrency)
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        _load_worker(host, port, bodies, per_worker + (1 if i < extra else 0), latencies, statuses)
+        for i in range(concurrency)
+    ))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    pick = lambda q: latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000
+    return {
+        "requests": len(latencies),
+        "concurrency": concurrency,
+        "elapsed_s": elapsed,
+        "rps": len(latencies) / elapsed if elapsed > 0 else 0.0,
+        "statuses": statuses,
+        "p50_ms": pick(0.50),
+        "p95_ms": pick(0.95),
+        "p99_ms": pick(0.99),
+        "mean_ms": statistics.fmean(latencies) * 1000,
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """CLI 인자 파서"""
+    parser = argparse.ArgumentParser(prog="python -m app.service", description="로컬 예측 HTTP 서비스")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = subparsers.add_parser("serve", help="서비스 실행")
+    serve_parser.add_argument("--host", default=DEFAULT_HOST, help="바인드 주소")
+    serve_parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="포트")
+    serve_parser.add_argument("--weights", default=None, help="가중치 파일 경로 (기본: app/data/weights.default.json)")
+    serve_parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH, help="한 번에 예측할 최대 건수 (/predict/batch 분할 단위)")
+    serve_parser.add_argument("--max-queue", type=int, default=DEFAULT_MAX_QUEUE, help="예측 대기열 최대 건수 (초과 시 429)")
+    serve_parser.add_argument("--max-delay-ms", type=float, default=DEFAULT_MAX_DELAY * 1000,
+                              help="묶음을 모으기 위해 기다리는 시간 (ms, 기본 0: 같은 루프 주기에 도착한 요청만)")
+    serve_parser.add_argument("--max-batch-records", type=int, default=DEFAULT_MAX_BATCH_RECORDS,
+                              help="/predict/batch 요청 1건의 최대 입력 수")
+    serve_parser.add_argument("--keepalive-timeout", type=float, default=DEFAULT_KEEPALIVE_TIMEOUT, help="유휴 연결 유지 시간 (초)")
+    serve_parser.add_argument("--cors-origin", default=None, help="브라우저 직접 호출 허용 Origin (예: http://localhost:3000)")
+
+    load_parser = subparsers.add_parser("load", help="/predict 부하 측정 (서비스 실행 중)")
+    load_parser.add_argument("--host", default=DEFAULT_HOST, help="서비스 주소")
+    load_parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="서비스 포트")
+    load_parser.add_argument("--concurrency", type=int, default=200, help="동시 연결 수")
+    load_parser.add_argument("--requests", type=int, default=20000, help="전체 요청 수")
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """CLI 진입점"""
+    args = build_parser().parse_args(argv)
+
+    if args.command == "load":
+        result = asyncio.run(load_test(args.host, args.port, args.concurrency, args.requests))
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+        return 0 if set(result["statuses"]) == {200} else 1
+
+    try:
+        asyncio.run(serve(
+            args.host,
+            args.port,
+            weights_path=args.weights,
+            max_batch=args.max_batch,
+            max_queue=args.max_queue,
+            max_delay=args.max_delay_ms / 1000,
+            max_batch_records=args.max_batch_records,
+            keepalive_timeout=args.keepalive_timeout,
+            cors_origin=args.cors_origin
+        ))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,9 +4,11 @@ UI 컴포넌트 모듈
 """
 
 import streamlit as st
-import pandas as pd
-from typing import Optional
-import plotly.graph_objects as go
+from typing import TYPE_CHECKING, Optional
+
+# pandas/plotly는 결과 표시 시점에 로드 (입력 폼만 그리는 첫 화면에서는 불필요)
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
 
 
 def render_input_form() -> Optional[dict]:
@@ -411,9 +413,10 @@ def render_prediction_result(
     satisfaction_level: str,
     summary_text: str,
     recommendations: list[str],
-    chart_fig: go.Figure,
-    breakdown_chart_fig: go.Figure = None,
-    breakdown_detail: dict = None
+    chart_fig: "go.Figure",
+    breakdown_chart_fig: "go.Figure" = None,
+    breakdown_detail: dict = None,
+    confidence: dict = None
 ):
     """
     예측 결과 표시 (Phase D 업데이트)
@@ -427,6 +430,7 @@ def render_prediction_result(
         chart_fig: 메인 차트 (게이지 또는 바)
         breakdown_chart_fig: breakdown 차트 (선택적)
         breakdown_detail: 상세 breakdown 정보
+        confidence: 신뢰도 추정 결과 (estimate_confidence, 선택적)
     """
     st.success("만족도 예측 완료")
 
@@ -468,6 +472,19 @@ def render_prediction_result(
 
         st.metric(label="만족도 등급", value=satisfaction_level, delta=None)
 
+        # 예측 구간 및 신뢰도 (검사 오차/가중치 오차 반영)
+        if confidence:
+            low, high = confidence['interval']
+            st.metric(
+                label=f"예측 구간 ({confidence['interval_level'] * 100:.0f}%)",
+                value=f"{low}~{high}점",
+                delta=None
+            )
+            st.caption(
+                f"등급 신뢰도 {confidence['confidence'] * 100:.0f}% "
+                f"(검사 재측정 오차를 반영한 {confidence['samples']}회 모의 예측 중 같은 등급 비율)"
+            )
+
     # 단측 착용 안내 (있는 경우)
     if breakdown_detail and breakdown_detail.get('unilateral_detail', {}).get('is_unilateral', False):
         st.info(
@@ -494,6 +511,8 @@ def render_prediction_result(
 
     # 4. 점수 구성 요소 (자세히 보기)
     with st.expander("점수 구성 요소 자세히 보기"):
+        import pandas as pd
+
         # DataFrame 표시
         df = pd.DataFrame(breakdown)
         df['점수'] = df.apply(lambda row: f"{row['sign']}{row['score']}", axis=1)
@@ -521,3 +540,83 @@ def render_prediction_result(
                 st.markdown(f"**{factor}**: {score_val}점 (부정적 영향)")
             else:
                 st.markdown(f"**{factor}**: {score_val}점 (영향 없음)")
+
+
+def render_scenario_comparison(scenarios: list[dict], matrix: dict):
+    """
+    대안 시나리오 비교표 표시
+
+    Args:
+        scenarios: sweep_scenarios() 결과 (점수 내림차순)
+        matrix: scenario_matrix() 결과 (보청기 형태 × 착용 계획)
+    """
+    type_labels = {"BTE": "귀걸이형", "RIC": "오픈형", "ITE": "귓속형", "CIC": "초소형"}
+    plan_labels = {"bilateral": "양측", "unilateral_left": "좌측 단측", "unilateral_right": "우측 단측"}
+    budget_labels = {"low": "경제형", "mid": "중급형", "high": "고급형"}
+    lifestyle_labels = {"quiet": "조용함", "mixed": "혼합", "noisy": "시끄러움"}
+
+    import pandas as pd
+
+    st.caption("표는 현재 예산 기준으로 보청기 형태와 착용 계획을 바꿨을 때의 예상 만족도입니다")
+
+    df_matrix = pd.DataFrame(
+        [
+            [matrix["scores"].get((row, col)) for col in matrix["columns"]]
+            for row in matrix["rows"]
+        ],
+        index=[type_labels.get(row, row) for row in matrix["rows"]],
+        columns=[plan_labels.get(col, col) for col in matrix["columns"]]
+    )
+    st.dataframe(df_matrix, use_container_width=True)
+
+    st.markdown("#### 상위 대안 (예산 변경 포함)")
+    df_top = pd.DataFrame([
+        {
+            "순위": row["rank"],
+            "형태": type_labels.get(row["desired_type"], row["desired_type"]),
+            "착용 계획": plan_labels.get(row["fitting_plan"], row["fitting_plan"]),
+            "예산": budget_labels.get(row["budget"], row["budget"]),
+            "생활 환경": lifestyle_labels.get(row["lifestyle"], row["lifestyle"]),
+            "점수": row["score"],
+            "변화": f"{row['delta']:+d}",
+            "현재 선택": "✓" if row["is_current"] else ""
+        }
+        for row in scenarios[:10]
+    ])
+    st.dataframe(df_top, use_container_width=True, hide_index=True)
+
+
+def render_trace_panel(runs: list[dict], stats: list[dict]):
+    """
+    개발자용 단계별 처리 시간 패널 (사이드바)
+
+    Args:
+        runs: tracing.recent_runs() 결과 (최신순)
+        stats: tracing.stage_stats() 결과
+    """
+    st.markdown("#### 단계별 처리 시간")
+    if not runs:
+        st.caption("기록이 없습니다. 만족도 예측을 실행하세요.")
+        return
+
+    import pandas as pd
+
+    st.caption(f"최근 {len(runs)}회 실행 기준")
+    df_stats = pd.DataFrame([
+        {
+            "단계": item["stage"],
+            "p50 (ms)": round(item["p50_ms"], 1),
+            "p95 (ms)": round(item["p95_ms"], 1),
+            "호출": item["calls"],
+            "할당 블록": int(item["alloc_blocks_p50"])
+        }
+        for item in sorted(stats, key=lambda item: -item["p50_ms"])
+    ])
+    st.dataframe(df_stats, use_container_width=True, hide_index=True)
+
+    with st.expander("최근 실행"):
+        for run in runs:
+            st.markdown(f"**#{run['id']} {run['name']}** · {run['total_ms']:.1f} ms")
+            for item in run["spans"]:
+                indent = " " * item["depth"]
+                st.text(f"{indent}{item['stage']}: {item['wall_ms']:.1f} ms")
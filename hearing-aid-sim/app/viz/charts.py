@@ -1,12 +1,70 @@
 """
 차트 시각화 모듈
 Plotly를 사용한 게이지, 바 차트, 청력도 등
+
+Plotly는 Figure를 만들 때 모든 속성을 검증하므로 축/구간/배경 설정이 많은 차트는
+생성 비용이 큽니다 (바/청력도 수십 ms). 차트별 기본 형태를 한 번 만들어 검증된
+딕셔너리로 보관해 두고, 호출마다 복사본에 점수/색상/데이터만 바꿔 검증 없이
+Figure로 만듭니다. _build_* 함수는 기본 형태 생성에 쓰는 기준 구현이며,
+create_* 결과는 항상 _build_* 결과와 같습니다 (tests/test_charts.py).
 """
 
+import copy
+
 import plotly.graph_objects as go
-from typing import Optional
+import plotly.io as pio
+from typing import Callable, Optional
+
+try:
+    from ..core.tracing import traced
+except ImportError:
+    # streamlit run app/main.py 실행 시 app/ 디렉터리가 최상위 경로
+    from core.tracing import traced
+
+
+# 점수 구간별 (하한, 색상, 구간 설명)
+SCORE_LEVELS = [
+    (85, "#10b981", "매우 높음 (85~100점)"),  # 녹색
+    (70, "#3b82f6", "높음 (70~84점)"),  # 파란색
+    (55, "#f59e0b", "보통 (55~69점)"),  # 노란색
+    (40, "#f97316", "낮음 (40~54점)"),  # 주황색
+    (0, "#ef4444", "매우 낮음 (0~39점)"),  # 빨간색
+]
+
+AUDIOGRAM_FREQUENCIES = [250, 500, 1000, 2000, 4000, 8000]
+
+# 차트 기본 형태 (차트 이름, Plotly 기본 템플릿) → 검증된 Figure 딕셔너리
+_base_figures: dict = {}
+
+
+def _score_style(score: int) -> tuple[str, str]:
+    """점수 구간 (막대 색상, 구간 설명)"""
+    for lower, color, level_text in SCORE_LEVELS:
+        if score >= lower:
+            return color, level_text
+    return SCORE_LEVELS[-1][1], SCORE_LEVELS[-1][2]
+
 
+def _base_figure(name: str, build: Callable[[], go.Figure]) -> dict:
+    """
+    차트 기본 형태 복사본
+
+    처음 호출 시 build()로 만든 Figure를 딕셔너리로 보관합니다.
+    Plotly 기본 템플릿(pio.templates.default)이 바뀌면 다시 만듭니다.
+    """
+    key = (name, pio.templates.default)
+    base = _base_figures.get(key)
+    if base is None:
+        base = _base_figures[key] = build().to_dict()
+    return copy.deepcopy(base)
+
+
+def _to_figure(figure_dict: dict) -> go.Figure:
+    """기본 형태 딕셔너리 → Figure (생성 시 이미 검증했으므로 다시 검증하지 않음, Plotly 템플릿 로딩과 같은 방식)"""
+    return go.Figure(figure_dict, _validate=False)
 
+
+@traced()
 def create_gauge(score: int) -> go.Figure:
     """
     만족도 점수를 게이지 차트로 시각화
@@ -17,17 +75,18 @@ def create_gauge(score: int) -> go.Figure:
     Returns:
         Plotly Figure 객체
     """
+    figure_dict = _base_figure("gauge", lambda: _build_gauge(0))
+    indicator = figure_dict["data"][0]
+    indicator["value"] = score
+    indicator["gauge"]["bar"]["color"] = _score_style(score)[0]
+    indicator["gauge"]["threshold"]["value"] = score
+    return _to_figure(figure_dict)
+
+
+def _build_gauge(score: int) -> go.Figure:
+    """게이지 차트 기준 구현 (create_gauge 기본 형태)"""
     # 점수 구간별 색상 결정
-    if score >= 85:
-        bar_color = "#10b981"  # 녹색 (매우 높음)
-    elif score >= 70:
-        bar_color = "#3b82f6"  # 파란색 (높음)
-    elif score >= 55:
-        bar_color = "#f59e0b"  # 노란색 (보통)
-    elif score >= 40:
-        bar_color = "#f97316"  # 주황색 (낮음)
-    else:
-        bar_color = "#ef4444"  # 빨간색 (매우 낮음)
+    bar_color = _score_style(score)[0]
 
     fig = go.Figure(go.Indicator(
         mode="gauge+number+delta",
@@ -82,6 +141,7 @@ def create_gauge(score: int) -> go.Figure:
     return fig
 
 
+@traced()
 def create_bar(score: int) -> go.Figure:
     """
     만족도 점수를 수평 바 차트로 시각화
@@ -92,22 +152,22 @@ def create_bar(score: int) -> go.Figure:
     Returns:
         Plotly Figure 객체
     """
+    bar_color, level_text = _score_style(score)
+    figure_dict = _base_figure("bar", lambda: _build_bar(0))
+    score_bar = figure_dict["data"][1]
+    score_bar["x"] = [score]
+    score_bar["marker"]["color"] = bar_color
+    score_bar["marker"]["line"]["color"] = bar_color
+    score_bar["text"] = [f"{score}점"]
+    score_bar["hovertemplate"] = f'<b>예측 만족도</b><br>{score}점 / 100점<br>{level_text}<extra></extra>'
+    figure_dict["layout"]["title"]["text"] = f"예측 만족도: {score}점 - {level_text}"
+    return _to_figure(figure_dict)
+
+
+def _build_bar(score: int) -> go.Figure:
+    """바 차트 기준 구현 (create_bar 기본 형태)"""
     # 점수 구간별 색상 결정
-    if score >= 85:
-        bar_color = "#10b981"  # 녹색
-        level_text = "매우 높음 (85~100점)"
-    elif score >= 70:
-        bar_color = "#3b82f6"  # 파란색
-        level_text = "높음 (70~84점)"
-    elif score >= 55:
-        bar_color = "#f59e0b"  # 노란색
-        level_text = "보통 (55~69점)"
-    elif score >= 40:
-        bar_color = "#f97316"  # 주황색
-        level_text = "낮음 (40~54점)"
-    else:
-        bar_color = "#ef4444"  # 빨간색
-        level_text = "매우 낮음 (0~39점)"
+    bar_color, level_text = _score_style(score)
 
     fig = go.Figure()
 
@@ -185,6 +245,21 @@ def create_bar(score: int) -> go.Figure:
     return fig
 
 
+def _breakdown_values(breakdown: list[dict]) -> tuple[list, list, list, list]:
+    """구성 요소 차트 데이터 (항목, 점수, 색상, 표시 문구)"""
+    # 기본 점수 제외 (이미 시작점)
+    items = [item for item in breakdown if item['factor'] != '기본 점수']
+
+    factors = [item['factor'] for item in items]
+    scores = [item['score'] for item in items]
+
+    # 색상 결정 (긍정/부정)
+    colors = ['#10b981' if s > 0 else '#ef4444' if s < 0 else '#9ca3af' for s in scores]
+    texts = [f"{s:+d}" if s != 0 else "0" for s in scores]
+    return factors, scores, colors, texts
+
+
+@traced()
 def create_breakdown_chart(breakdown: list[dict]) -> go.Figure:
     """
     점수 구성 요소를 워터폴 차트로 시각화 (선택적 사용)
@@ -195,20 +270,25 @@ def create_breakdown_chart(breakdown: list[dict]) -> go.Figure:
     Returns:
         Plotly Figure 객체
     """
-    # 기본 점수 제외 (이미 시작점)
-    items = [item for item in breakdown if item['factor'] != '기본 점수']
+    factors, scores, colors, texts = _breakdown_values(breakdown)
+    figure_dict = _base_figure("breakdown", lambda: _build_breakdown_chart([]))
+    bars = figure_dict["data"][0]
+    bars["x"] = factors
+    bars["y"] = scores
+    bars["marker"]["color"] = colors
+    bars["text"] = texts
+    return _to_figure(figure_dict)
 
-    factors = [item['factor'] for item in items]
-    scores = [item['score'] for item in items]
 
-    # 색상 결정 (긍정/부정)
-    colors = ['#10b981' if s > 0 else '#ef4444' if s < 0 else '#9ca3af' for s in scores]
+def _build_breakdown_chart(breakdown: list[dict]) -> go.Figure:
+    """구성 요소 차트 기준 구현 (create_breakdown_chart 기본 형태)"""
+    factors, scores, colors, texts = _breakdown_values(breakdown)
 
     fig = go.Figure(go.Bar(
         x=factors,
         y=scores,
         marker=dict(color=colors),
-        text=[f"{s:+d}" if s != 0 else "0" for s in scores],
+        text=texts,
         textposition='outside',
         textfont=dict(size=12, color='#1f2937'),
         hovertemplate='<b>%{x}</b><br>%{y:+d}점<extra></extra>'
@@ -240,6 +320,14 @@ def create_breakdown_chart(breakdown: list[dict]) -> go.Figure:
     return fig
 
 
+def _audiogram_values(user_input_dict: dict) -> tuple[list, list]:
+    """주파수별 청력역치 (좌측, 우측, 없는 주파수는 None)"""
+    left_data = [user_input_dict.get(f'audiogram_left_{freq}hz') for freq in AUDIOGRAM_FREQUENCIES]
+    right_data = [user_input_dict.get(f'audiogram_right_{freq}hz') for freq in AUDIOGRAM_FREQUENCIES]
+    return left_data, right_data
+
+
+@traced()
 def create_audiogram(user_input_dict: dict) -> Optional[go.Figure]:
     """
     청력도(audiogram) 그래프 생성
@@ -250,22 +338,33 @@ def create_audiogram(user_input_dict: dict) -> Optional[go.Figure]:
     Returns:
         Plotly Figure 객체 또는 None (데이터 없을 시)
     """
+    left_data, right_data = _audiogram_values(user_input_dict)
+    has_left = not all(v is None for v in left_data)
+    has_right = not all(v is None for v in right_data)
+
+    # 데이터가 하나도 없으면 None 반환
+    if not has_left and not has_right:
+        return None
+
+    # 기본 형태: 좌측/우측 선 + 구간 배경 + 레이아웃 (데이터가 있는 쪽만 사용)
+    figure_dict = _base_figure("audiogram", lambda: _build_audiogram({
+        'audiogram_left_250hz': 0,
+        'audiogram_right_250hz': 0,
+    }))
+    left_trace, right_trace = figure_dict["data"]
+    left_trace["y"] = left_data
+    right_trace["y"] = right_data
+    figure_dict["data"] = [
+        trace for trace, present in ((left_trace, has_left), (right_trace, has_right)) if present
+    ]
+    return _to_figure(figure_dict)
+
+
+def _build_audiogram(user_input_dict: dict) -> Optional[go.Figure]:
+    """청력도 기준 구현 (create_audiogram 기본 형태)"""
     # 주파수 리스트
-    frequencies = [250, 500, 1000, 2000, 4000, 8000]
-
-    # 좌측 데이터 수집
-    left_data = []
-    for freq in frequencies:
-        key = f'audiogram_left_{freq}hz'
-        value = user_input_dict.get(key)
-        left_data.append(value)
-
-    # 우측 데이터 수집
-    right_data = []
-    for freq in frequencies:
-        key = f'audiogram_right_{freq}hz'
-        value = user_input_dict.get(key)
-        right_data.append(value)
+    frequencies = AUDIOGRAM_FREQUENCIES
+    left_data, right_data = _audiogram_values(user_input_dict)
 
     # 데이터가 하나도 없으면 None 반환
     if all(v is None for v in left_data) and all(v is None for v in right_data):
@@ -0,0 +1,371 @@
+"""
+내장 차트 렌더러 모듈
+브라우저(kaleido) 없이 Pillow로 청력도와 만족도 차트를 PNG로 직접 그림
+
+charts.py의 create_audiogram / create_bar / create_gauge와 같은 구성
+(O/X 마커, 위아래가 뒤집힌 dB 축, 250~8000Hz 로그 축, 점수 구간 색상)을
+수 ms 안에 그립니다. Word 리포트에서 kaleido를 사용할 수 없거나 느릴 때 사용합니다.
+
+한글 글꼴(나눔고딕, Noto Sans CJK 등)이 없으면 영문 라벨로 그립니다.
+환경 변수 HEARING_SIM_FONT 로 글꼴 파일 경로를 지정할 수 있습니다.
+"""
+
+import math
+import os
+from functools import lru_cache
+from io import BytesIO
+from typing import Optional
+
+from PIL import Image, ImageDraw, ImageFont
+
+try:
+    from ..core.tracing import traced
+except ImportError:
+    # streamlit run app/main.py 실행 시 app/ 디렉터리가 최상위 경로
+    from core.tracing import traced
+
+
+FONT_ENV = "HEARING_SIM_FONT"
+FONT_CANDIDATES = (
+    "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
+    "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc",
+    "/usr/share/fonts/noto-cjk/NotoSansCJK-Regular.ttc",
+    "/usr/share/fonts/google-noto-cjk/NotoSansCJK-Regular.ttc",
+    "/System/Library/Fonts/AppleSDGothicNeo.ttc",
+    "C:/Windows/Fonts/malgun.ttf",
+)
+
+FREQUENCIES = (250, 500, 1000, 2000, 4000, 8000)
+
+# 점수 구간: (최솟값, 색상, 한글 라벨, 영문 라벨) - charts.create_bar와 동일
+SCORE_BANDS = (
+    (85, "#10b981", "매우 높음 (85~100점)", "Very high (85-100)"),
+    (70, "#3b82f6", "높음 (70~84점)", "High (70-84)"),
+    (55, "#f59e0b", "보통 (55~69점)", "Moderate (55-69)"),
+    (40, "#f97316", "낮음 (40~54점)", "Low (40-54)"),
+    (0, "#ef4444", "매우 낮음 (0~39점)", "Very low (0-39)"),
+)
+GAUGE_STEPS = (
+    (0, 40, "#fee2e2"),
+    (40, 55, "#fed7aa"),
+    (55, 70, "#fef3c7"),
+    (70, 85, "#dbeafe"),
+    (85, 100, "#d1fae5"),
+)
+# 청력 손실 수준 배경: (시작 dB, 끝 dB, 색상, 한글, 영문) - 투명도 0.3
+AUDIOGRAM_BANDS = (
+    (0, 20, "#d1fae5", "정상", "Normal"),
+    (20, 40, "#fef3c7", "경도", "Mild"),
+    (40, 60, "#fed7aa", "중등도", "Moderate"),
+    (60, 80, "#fecaca", "고도", "Severe"),
+    (80, 120, "#fee2e2", "심도", "Profound"),
+)
+
+LABELS = {
+    "ko": {
+        "audiogram": "청력도 (Audiogram)",
+        "frequency": "주파수 (Hz)",
+        "threshold": "청력역치 (dB HL)",
+        "left": "좌측 (L)",
+        "right": "우측 (R)",
+        "score_title": "예측 만족도",
+        "points": "점",
+        "score_axis": "점수",
+        "satisfaction": "만족도",
+    },
+    "en": {
+        "audiogram": "Audiogram",
+        "frequency": "Frequency (Hz)",
+        "threshold": "Threshold (dB HL)",
+        "left": "Left (L)",
+        "right": "Right (R)",
+        "score_title": "Predicted satisfaction",
+        "points": "",
+        "score_axis": "Score",
+        "satisfaction": "Satisfaction",
+    },
+}
+
+TEXT_COLOR = "#1f2937"
+AXIS_TEXT_COLOR = "#4b5563"
+GRID_COLOR = "#e5e7eb"
+LEFT_COLOR = "#3b82f6"
+RIGHT_COLOR = "#ef4444"
+
+
+@lru_cache(maxsize=1)
+def _font_path() -> Optional[str]:
+    """한글 글꼴 파일 경로 (없으면 None)"""
+    configured = os.environ.get(FONT_ENV)
+    for path in ((configured,) if configured else ()) + FONT_CANDIDATES:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+@lru_cache(maxsize=64)
+def _font(size: int) -> ImageFont.FreeTypeFont:
+    path = _font_path()
+    if path is not None:
+        return ImageFont.truetype(path, size)
+    return ImageFont.load_default(size=size)
+
+
+def _labels() -> dict:
+    return LABELS["ko" if _font_path() is not None else "en"]
+
+
+def _blend(color: str, opacity: float) -> tuple:
+    """흰 배경 위에 opacity로 겹친 색"""
+    r, g, b = (int(color[i:i + 2], 16) for i in (1, 3, 5))
+    return tuple(round(255 + (c - 255) * opacity) for c in (r, g, b))
+
+
+def _score_band(score: int) -> tuple:
+    for band in SCORE_BANDS:
+        if score >= band[0]:
+            return band
+    return SCORE_BANDS[-1]
+
+
+def _score_text(score: int) -> str:
+    return f"{score}{_labels()['points']}"
+
+
+class _Canvas:
+    """배율을 적용하여 그리는 캔버스 (좌표는 배율 적용 전 px)"""
+
+    def __init__(self, width: int, height: int, scale: float):
+        self.scale = scale
+        self.image = Image.new("RGB", (round(width * scale), round(height * scale)), "white")
+        self.draw = ImageDraw.Draw(self.image)
+
+    def s(self, value: float) -> int:
+        return round(value * self.scale)
+
+    def line(self, points, color, width: float = 1):
+        self.draw.line([(self.s(x), self.s(y)) for x, y in points], fill=color, width=max(1, self.s(width)))
+
+    def dotted_vline(self, x: float, y0: float, y1: float, color, width: float = 1, dash: float = 3):
+        y = y0
+        while y < y1:
+            self.line([(x, y), (x, min(y + dash, y1))], color, width)
+            y += dash * 2
+
+    def rect(self, x0, y0, x1, y1, fill=None, outline=None, width: float = 1):
+        self.draw.rectangle(
+            (self.s(x0), self.s(y0), self.s(x1), self.s(y1)),
+            fill=fill, outline=outline, width=self.s(width) if outline else 0
+        )
+
+    def text(self, xy, text: str, size: float, color=TEXT_COLOR, anchor: str = "la"):
+        if text:
+            self.draw.text((self.s(xy[0]), self.s(xy[1])), text, fill=color, font=_font(self.s(size)), anchor=anchor)
+
+    def vertical_text(self, xy, text: str, size: float, color=AXIS_TEXT_COLOR):
+        """90° 회전한 텍스트 (xy는 중심)"""
+        font = _font(self.s(size))
+        left, top, right, bottom = font.getbbox(text)
+        label = Image.new("RGBA", (right - left + 2, bottom - top + 2), (255, 255, 255, 0))
+        ImageDraw.Draw(label).text((-left + 1, -top + 1), text, fill=color, font=font)
+        label = label.rotate(90, expand=True)
+        self.image.paste(label, (self.s(xy[0]) - label.width // 2, self.s(xy[1]) - label.height // 2), label)
+
+    def png(self) -> bytes:
+        buffer = BytesIO()
+        # 빠른 압축 (리포트 삽입용이므로 파일 크기보다 속도 우선)
+        self.image.save(buffer, format="PNG", compress_level=1)
+        return buffer.getvalue()
+
+
+@traced()
+def render_audiogram(user_input_dict: dict, width: int = 600, height: int = 400, scale: float = 2) -> Optional[bytes]:
+    """
+    청력도 PNG 생성 (charts.create_audiogram과 같은 구성)
+
+    Args:
+        user_input_dict: 사용자 입력 딕셔너리 (주파수별 청력 데이터 포함)
+        width, height: 이미지 크기 (px)
+        scale: 배율
+
+    Returns:
+        PNG 바이트 또는 None (데이터 없을 시)
+    """
+    left_data = [user_input_dict.get(f"audiogram_left_{freq}hz") for freq in FREQUENCIES]
+    right_data = [user_input_dict.get(f"audiogram_right_{freq}hz") for freq in FREQUENCIES]
+    if all(v is None for v in left_data) and all(v is None for v in right_data):
+        return None
+
+    labels = _labels()
+    canvas = _Canvas(width, height, scale)
+    left, right, top, bottom = 80, width - 100, 80, height - 80
+
+    # 로그 주파수 축 (양 끝 여백 포함), dB 축은 위가 -10
+    x_min, x_max = math.log10(FREQUENCIES[0]) - 0.08, math.log10(FREQUENCIES[-1]) + 0.08
+    y_min, y_max = -10, 120
+
+    def px(freq: float) -> float:
+        return left + (math.log10(freq) - x_min) / (x_max - x_min) * (right - left)
+
+    def py(db: float) -> float:
+        return top + (db - y_min) / (y_max - y_min) * (bottom - top)
+
+    # 청력 손실 수준 배경
+    for y0, y1, color, ko, en in AUDIOGRAM_BANDS:
+        canvas.rect(left, py(y0), right, py(y1), fill=_blend(color, 0.3))
+        canvas.text((right + 6, (py(y0) + py(y1)) / 2), ko if labels is LABELS["ko"] else en, 11, AXIS_TEXT_COLOR, "lm")
+
+    # 격자 및 눈금
+    for freq in FREQUENCIES:
+        canvas.line([(px(freq), top), (px(freq), bottom)], GRID_COLOR)
+        canvas.text((px(freq), bottom + 6), str(freq), 11, AXIS_TEXT_COLOR, "ma")
+    for db in range(0, 121, 20):
+        canvas.line([(left, py(db)), (right, py(db))], GRID_COLOR)
+        canvas.text((left - 6, py(db)), str(db), 11, AXIS_TEXT_COLOR, "rm")
+
+    # 좌측 X (파란색), 우측 O (빨간색) - 측정값이 없는 주파수에서는 선을 끊음
+    def draw_series(values, color, marker):
+        points = [(px(f), py(v)) if v is not None else None for f, v in zip(FREQUENCIES, values)]
+        for a, b in zip(points, points[1:]):
+            if a is not None and b is not None:
+                canvas.line([a, b], color, 2)
+        for point in points:
+            if point is None:
+                continue
+            x, y = point
+            if marker == "x":
+                canvas.line([(x - 5, y - 5), (x + 5, y + 5)], color, 2.5)
+                canvas.line([(x - 5, y + 5), (x + 5, y - 5)], color, 2.5)
+            else:
+                r = canvas.s(5)
+                canvas.draw.ellipse(
+                    (canvas.s(x) - r, canvas.s(y) - r, canvas.s(x) + r, canvas.s(y) + r),
+                    fill=color, outline=color, width=canvas.s(2)
+                )
+
+    legend = []
+    if not all(v is None for v in left_data):
+        draw_series(left_data, LEFT_COLOR, "x")
+        legend.append((labels["left"], LEFT_COLOR))
+    if not all(v is None for v in right_data):
+        draw_series(right_data, RIGHT_COLOR, "o")
+        legend.append((labels["right"], RIGHT_COLOR))
+
+    # 범례 (그래프 위 오른쪽 정렬)
+    x = right
+    for name, color in reversed(legend):
+        text_width = _font(canvas.s(12)).getlength(name) / scale
+        x -= text_width
+        canvas.text((x, top - 14), name, 12, TEXT_COLOR, "lm")
+        canvas.line([(x - 28, top - 14), (x - 8, top - 14)], color, 2)
+        x -= 44
+
+    canvas.text((width / 2, 24), labels["audiogram"], 20, TEXT_COLOR, "mt")
+    canvas.text(((left + right) / 2, bottom + 28), labels["frequency"], 14, AXIS_TEXT_COLOR, "mt")
+    canvas.vertical_text((left - 50, (top + bottom) / 2), labels["threshold"], 14)
+    canvas.rect(left, top, right, bottom, outline=GRID_COLOR)
+    return canvas.png()
+
+
+@traced()
+def render_bar(score: int, width: int = 600, height: int = 250, scale: float = 2) -> bytes:
+    """
+    만족도 수평 바 PNG 생성 (charts.create_bar와 같은 구성)
+
+    Args:
+        score: 만족도 점수 (0~100)
+        width, height: 이미지 크기 (px)
+        scale: 배율
+
+    Returns:
+        PNG 바이트
+    """
+    labels = _labels()
+    _, bar_color, level_ko, level_en = _score_band(score)
+    level_text = level_ko if labels is LABELS["ko"] else level_en
+
+    canvas = _Canvas(width, height, scale)
+    left, right, top, bottom = 80, width - 40, 80, height - 60
+
+    def px(value: float) -> float:
+        return left + value / 100 * (right - left)
+
+    center = (top + bottom) / 2
+    half = (bottom - top) * 0.4
+    canvas.rect(px(0), center - half, px(100), center + half, fill="#f3f4f6", outline="#e5e7eb", width=2)
+    if score > 0:
+        canvas.rect(px(0), center - half, px(min(score, 100)), center + half, fill=bar_color)
+        canvas.text((px(min(score, 100)) - 8, center), _score_text(score), 28, "white", "rm")
+
+    for threshold in (40, 55, 70, 85):
+        canvas.dotted_vline(px(threshold), top, bottom, "#9ca3af")
+        canvas.text((px(threshold), top - 4), str(threshold), 10, "#6b7280", "md")
+
+    for tick in range(0, 101, 20):
+        canvas.text((px(tick), bottom + 6), str(tick), 11, AXIS_TEXT_COLOR, "ma")
+
+    canvas.text((left - 8, center), labels["satisfaction"], 12, AXIS_TEXT_COLOR, "rm")
+    canvas.text(((left + right) / 2, bottom + 26), labels["score_axis"], 14, AXIS_TEXT_COLOR, "mt")
+    canvas.text((width / 2, 28), f"{labels['score_title']}: {_score_text(score)} - {level_text}", 20, TEXT_COLOR, "mt")
+    return canvas.png()
+
+
+@traced()
+def render_gauge(score: int, width: int = 600, height: int = 400, scale: float = 2) -> bytes:
+    """
+    만족도 게이지 PNG 생성 (charts.create_gauge와 같은 구성)
+
+    Args:
+        score: 만족도 점수 (0~100)
+        width, height: 이미지 크기 (px)
+        scale: 배율
+
+    Returns:
+        PNG 바이트
+    """
+    labels = _labels()
+    bar_color = _score_band(score)[1]
+
+    canvas = _Canvas(width, height, scale)
+    cx = width / 2
+    cy = height - 90
+    radius = min(width / 2 - 60, cy - 90)
+    ring = radius * 0.3
+    box = (canvas.s(cx - radius), canvas.s(cy - radius), canvas.s(cx + radius), canvas.s(cy + radius))
+
+    def angle(value: float) -> float:
+        """점수 → Pillow 호 각도 (왼쪽 180°에서 시계 방향으로 360°까지)"""
+        return 180 + 180 * max(0, min(value, 100)) / 100
+
+    for low, high, color in GAUGE_STEPS:
+        canvas.draw.arc(box, angle(low), angle(high), fill=color, width=canvas.s(ring))
+    canvas.draw.arc(box, 180, 360, fill="#e5e7eb", width=canvas.s(2))
+
+    # 점수 바 (구간 링 안쪽 75% 두께)
+    inset = ring * 0.125
+    bar_box = (box[0] + canvas.s(inset), box[1] + canvas.s(inset), box[2] - canvas.s(inset), box[3] - canvas.s(inset))
+    if score > 0:
+        canvas.draw.arc(bar_box, 180, angle(score), fill=bar_color, width=canvas.s(ring * 0.75))
+
+    # 점수 위치 표시선
+    theta = math.radians(angle(score))
+    inner, outer = radius - ring, radius
+    canvas.line(
+        [(cx + inner * math.cos(theta), cy + inner * math.sin(theta)),
+         (cx + outer * math.cos(theta), cy + outer * math.sin(theta))],
+        TEXT_COLOR, 4
+    )
+
+    for tick in range(0, 101, 20):
+        theta = math.radians(angle(tick))
+        canvas.text(
+            (cx + (radius + 14) * math.cos(theta), cy + (radius + 14) * math.sin(theta)),
+            str(tick), 14, AXIS_TEXT_COLOR, "mm"
+        )
+
+    canvas.text((cx, cy - 10), _score_text(score), 60, TEXT_COLOR, "ms")
+    delta = score - 70
+    if delta:
+        canvas.text((cx, cy + 20), f"{delta:+d}", 20, "#10b981" if delta > 0 else "#ef4444", "mt")
+    canvas.text((cx, 24), labels["score_title"], 24, TEXT_COLOR, "mt")
+    return canvas.png()
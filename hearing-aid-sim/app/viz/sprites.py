@@ -0,0 +1,488 @@
+"""
+점수 차트 스프라이트 모듈
+0~100점 게이지/바 차트 이미지 101개를 미리 그려 한 파일에 묶고, 점수로 바로 꺼내 씀
+
+create_gauge / create_bar는 점수 외에 바뀌는 값이 없으므로, 크기별로 한 번만
+변환해 두면 Word 리포트에서 변환 비용 없이 이미지를 넣을 수 있습니다.
+스프라이트 파일에는 viz/charts.py(및 내장 렌더러 viz/raster.py) 소스 해시와 렌더러가
+기록됩니다. 스프라이트는 배포 단계에서 build 명령으로 만듭니다.
+실행 중 파일이 없거나 스타일이 바뀌었으면 해당 점수 이미지 1장만 내장 렌더러로 그리고,
+경고를 남긴 뒤 백그라운드 스레드에서 내장 렌더러로 다시 만들어 저장합니다 (파일당 프로세스에서 1번,
+HEARING_SIM_SPRITE_REBUILD=0이면 경고만). 저장이 끝나면 다음 조회부터 새 파일을 사용합니다.
+
+사용법 (hearing-aid-sim 디렉터리에서):
+    python -m app.viz.sprites build                    # 배포 시 실행 (최신 파일은 건너뜀)
+    python -m app.viz.sprites build --renderer native  # 브라우저 없이 내장 렌더러로 생성
+    python -m app.viz.sprites build --force            # 최신 파일도 다시 생성
+
+    from viz.sprites import score_image
+    png_bytes = score_image("bar", 72)
+
+스프라이트 파일 형식: MAGIC + 헤더 길이(4바이트) + 헤더 JSON + PNG 101개 연속
+(헤더의 offsets[i]가 i점 이미지의 시작 위치, 마지막 값은 끝 위치)
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import struct
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional, Union
+
+try:
+    from .raster import render_bar, render_gauge
+except ImportError:
+    # streamlit run app/main.py 실행 시 app/ 디렉터리가 최상위 경로
+    from viz.raster import render_bar, render_gauge
+
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"HASPRITE"
+FORMAT_VERSION = 1
+SCORES = range(0, 101)
+
+SPRITE_DIR_ENV = "HEARING_SIM_SPRITE_DIR"
+# "0"이면 실행 중 백그라운드 재생성을 하지 않음 (읽기 전용 배포 등)
+SPRITE_REBUILD_ENV = "HEARING_SIM_SPRITE_REBUILD"
+DEFAULT_SPRITE_DIR = Path(__file__).parent.parent / "data" / "sprites"
+
+# 차트 종류별 기본 크기 (charts.py의 레이아웃 높이와 동일)
+DEFAULT_SIZES = {
+    "gauge": (600, 400),
+    "bar": (600, 250),
+}
+DEFAULT_SCALE = 2
+# kaleido로 만들 때 이미지 1개당 최대 대기 시간 (초, build 명령에서만 사용)
+KALEIDO_BUILD_TIMEOUT = 120.0
+# 저장한 스프라이트 파일 권한 (서버 프로세스가 다른 사용자로 실행되어도 읽을 수 있게)
+SPRITE_FILE_MODE = 0o644
+
+# 스타일 해시에 포함하는 소스 파일
+STYLE_SOURCES = (
+    Path(__file__).parent / "charts.py",
+    Path(__file__).parent / "raster.py",
+)
+
+NATIVE_RENDERERS = {
+    "gauge": render_gauge,
+    "bar": render_bar,
+}
+
+
+def style_hash() -> str:
+    """차트 스타일 소스 해시 (charts.py, raster.py 내용 기준)"""
+    digest = hashlib.sha256()
+    for path in STYLE_SOURCES:
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def sprite_dir() -> Path:
+    """스프라이트 저장 디렉터리 (HEARING_SIM_SPRITE_DIR 또는 app/data/sprites)"""
+    configured = os.environ.get(SPRITE_DIR_ENV)
+    return Path(configured) if configured else DEFAULT_SPRITE_DIR
+
+
+def sprite_path(kind: str, width: int, height: int, scale: float, directory: Union[str, Path, None] = None) -> Path:
+    """스프라이트 파일 경로"""
+    directory = Path(directory) if directory is not None else sprite_dir()
+    return directory / f"score_{kind}_{width}x{height}@{scale:g}.sprite"
+
+
+def _check_kind(kind: str):
+    if kind not in DEFAULT_SIZES:
+        raise ValueError(f"알 수 없는 차트 종류입니다: {kind} (가능: {', '.join(DEFAULT_SIZES)})")
+
+
+def _check_renderer(renderer: str):
+    if renderer not in ("auto", "kaleido", "native"):
+        raise ValueError(f"알 수 없는 렌더러입니다: {renderer}")
+
+
+def _size(kind: str, width: Optional[int], height: Optional[int]) -> tuple:
+    """(너비, 높이) - None이면 차트 종류별 기본 크기"""
+    default_width, default_height = DEFAULT_SIZES[kind]
+    return width or default_width, height or default_height
+
+
+def _render_kaleido(kind: str, width: int, height: int, scale: float) -> list[bytes]:
+    """Plotly 차트를 워커 풀에서 일괄 변환"""
+    try:
+        from ..report.render_pool import get_render_pool, kaleido_render
+        from .charts import create_gauge, create_bar
+    except ImportError:
+        from report.render_pool import get_render_pool, kaleido_render
+        from viz.charts import create_gauge, create_bar
+
+    create = create_gauge if kind == "gauge" else create_bar
+    figures = [create(score) for score in SCORES]
+    pool = get_render_pool()
+    if pool is None:
+        return [kaleido_render(fig, width=width, height=height, scale=scale) for fig in figures]
+
+    futures = [
+        pool.submit(fig, width=width, height=height, scale=scale, timeout=KALEIDO_BUILD_TIMEOUT)
+        for fig in figures
+    ]
+    return [future.result() for future in futures]
+
+
+def _render_native(kind: str, width: int, height: int, scale: float) -> list[bytes]:
+    render = NATIVE_RENDERERS[kind]
+    return [render(score, width=width, height=height, scale=scale) for score in SCORES]
+
+
+class ScoreSprites:
+    """점수별 차트 이미지 묶음 (0~100점)"""
+
+    __slots__ = ("kind", "width", "height", "scale", "renderer", "style_hash", "_images")
+
+    def __init__(self, kind: str, width: int, height: int, scale: float, renderer: str, style: str, images: list):
+        if len(images) != len(SCORES):
+            raise ValueError(f"스프라이트 이미지는 {len(SCORES)}개여야 합니다: {len(images)}")
+        self.kind = kind
+        self.width = width
+        self.height = height
+        self.scale = scale
+        self.renderer = renderer
+        self.style_hash = style
+        self._images = images
+
+    def image(self, score: int) -> bytes:
+        """점수 이미지 PNG (0~100 범위로 제한)"""
+        return self._images[max(0, min(100, int(score)))]
+
+    def to_bytes(self) -> bytes:
+        offsets = [0]
+        for data in self._images:
+            offsets.append(offsets[-1] + len(data))
+        header = json.dumps({
+            "version": FORMAT_VERSION,
+            "kind": self.kind,
+            "width": self.width,
+            "height": self.height,
+            "scale": self.scale,
+            "renderer": self.renderer,
+            "style_hash": self.style_hash,
+            "offsets": offsets,
+        }).encode("utf-8")
+        return MAGIC + struct.pack(">I", len(header)) + header + b"".join(self._images)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "ScoreSprites":
+        """
+        스프라이트 파일 내용 읽기
+
+        Raises:
+            ValueError: 형식이 잘못된 경우
+        """
+        if not data.startswith(MAGIC) or len(data) < len(MAGIC) + 4:
+            raise ValueError("스프라이트 파일 형식이 아닙니다.")
+        start = len(MAGIC) + 4
+        (header_size,) = struct.unpack(">I", data[len(MAGIC):start])
+        try:
+            header = json.loads(data[start:start + header_size])
+        except ValueError as e:
+            raise ValueError(f"스프라이트 헤더를 읽을 수 없습니다: {e}")
+        if header.get("version") != FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 스프라이트 버전입니다: {header.get('version')}")
+
+        body = memoryview(data)[start + header_size:]
+        offsets = header["offsets"]
+        if offsets[-1] != len(body):
+            raise ValueError("스프라이트 파일이 손상되었습니다.")
+        images = [bytes(body[offsets[i]:offsets[i + 1]]) for i in range(len(offsets) - 1)]
+        return cls(
+            header["kind"], header["width"], header["height"], header["scale"],
+            header["renderer"], header["style_hash"], images
+        )
+
+
+def build_sprites(
+    kind: str,
+    width: Optional[int] = None,
+    height: Optional[int] = None,
+    scale: float = DEFAULT_SCALE,
+    renderer: str = "auto"
+) -> ScoreSprites:
+    """
+    0~100점 차트 이미지 생성
+
+    Args:
+        kind: "gauge" 또는 "bar"
+        width, height: 이미지 크기 (None이면 차트 종류별 기본 크기)
+        scale: 배율
+        renderer: "kaleido", "native"(viz.raster) 또는 "auto"(kaleido 실패 시 native)
+
+    Returns:
+        ScoreSprites
+    """
+    _check_kind(kind)
+    _check_renderer(renderer)
+    width, height = _size(kind, width, height)
+
+    style = style_hash()
+    if renderer in ("auto", "kaleido"):
+        try:
+            images = _render_kaleido(kind, width, height, scale)
+            return ScoreSprites(kind, width, height, scale, "kaleido", style, images)
+        except Exception:
+            if renderer == "kaleido":
+                raise
+    images = _render_native(kind, width, height, scale)
+    return ScoreSprites(kind, width, height, scale, "native", style, images)
+
+
+def save_sprites(sprites: ScoreSprites, directory: Union[str, Path, None] = None) -> Path:
+    """스프라이트 파일 저장 (임시 파일에 쓴 뒤 교체, 권한 SPRITE_FILE_MODE)"""
+    path = sprite_path(sprites.kind, sprites.width, sprites.height, sprites.scale, directory)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(sprites.to_bytes())
+        # mkstemp 파일은 0600으로 만들어지므로 교체 전에 권한 변경
+        os.chmod(tmp_name, SPRITE_FILE_MODE)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+    return path
+
+
+def read_sprites(path: Union[str, Path]) -> Optional[ScoreSprites]:
+    """스프라이트 파일 읽기 (없거나 손상되었으면 None)"""
+    try:
+        return ScoreSprites.from_bytes(Path(path).read_bytes())
+    except (OSError, ValueError, KeyError, IndexError):
+        return None
+
+
+def is_current(sprites: Optional[ScoreSprites], renderer: str = "auto") -> bool:
+    """
+    저장된 스프라이트를 다시 만들 필요가 없는지 (build 명령 기준)
+
+    현재 스타일 해시로 만들었고, 요청한 렌더러로 만든 경우만 최신으로 봅니다.
+    auto는 kaleido 결과만 최신으로 보므로, kaleido 실패로 내장 렌더러 결과를 저장한
+    파일은 다음 build에서 kaleido로 다시 시도합니다.
+    """
+    if sprites is None or sprites.style_hash != style_hash():
+        return False
+    return sprites.renderer == ("native" if renderer == "native" else "kaleido")
+
+
+def _usable(sprites: Optional[ScoreSprites], style: str, renderer: str) -> bool:
+    """실행 중 조회에 사용할 수 있는지 (스타일 일치, auto는 렌더러 무관)"""
+    if sprites is None or sprites.style_hash != style:
+        return False
+    return renderer == "auto" or sprites.renderer == renderer
+
+
+def _file_state(path: Path) -> Optional[tuple]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+# 불러온 스프라이트 (키: (kind, width, height, scale, 디렉터리, 렌더러))
+_loaded: dict = {}
+# 사용할 수 없었던 파일 상태 (같은 키) - 파일이 바뀌기 전까지 다시 읽지 않음
+_missed: dict = {}
+# 경고만 남긴 스프라이트 파일 경로
+_warned: set = set()
+# 재생성을 시작한 스프라이트 파일 (키: 경로 문자열, 값: 재생성 스레드)
+_rebuilds: dict = {}
+_lock = threading.Lock()
+
+
+def _rebuild(kind: str, width: int, height: int, scale: float, directory: Path):
+    """내장 렌더러로 스프라이트를 만들어 저장 (백그라운드 스레드에서 실행)"""
+    try:
+        path = save_sprites(build_sprites(kind, width, height, scale, renderer="native"), directory)
+    except Exception as e:
+        logger.warning("스프라이트를 다시 만들지 못했습니다 (%s): %s", kind, e)
+        return
+    logger.info("스프라이트를 내장 렌더러로 다시 만들었습니다: %s", path)
+
+
+def _on_miss(kind: str, width: int, height: int, scale: float, path: Path, renderer: str, stale: bool):
+    """
+    사용할 수 없는 스프라이트 파일 처리 (_lock 안에서 호출, 파일당 프로세스에서 1번)
+
+    파일이 없거나 스타일이 바뀐 경우 백그라운드에서 내장 렌더러로 다시 만듭니다.
+    kaleido 결과만 허용하는 조회이거나 재생성을 끈 경우에는 경고만 남깁니다.
+    """
+    if not stale or renderer == "kaleido" or os.environ.get(SPRITE_REBUILD_ENV) == "0":
+        if str(path) not in _warned:
+            _warned.add(str(path))
+            logger.warning(
+                "스프라이트 파일을 사용할 수 없어 점수별로 내장 렌더러로 그립니다 (%s). "
+                "python -m app.viz.sprites build 로 다시 만드세요.", path
+            )
+        return
+    if str(path) in _rebuilds:
+        return
+    logger.warning("스프라이트 파일이 없거나 스타일이 바뀌어 백그라운드에서 다시 만듭니다: %s", path)
+    thread = threading.Thread(
+        target=_rebuild, args=(kind, width, height, scale, path.parent),
+        name=f"sprite-rebuild-{kind}", daemon=True
+    )
+    _rebuilds[str(path)] = thread
+    thread.start()
+
+
+def wait_for_rebuilds(timeout: Optional[float] = None):
+    """시작한 백그라운드 재생성이 끝날 때까지 대기 (테스트, 종료 처리용)"""
+    with _lock:
+        threads = list(_rebuilds.values())
+    for thread in threads:
+        thread.join(timeout)
+
+
+def load_sprites(
+    kind: str,
+    width: Optional[int] = None,
+    height: Optional[int] = None,
+    scale: float = DEFAULT_SCALE,
+    directory: Union[str, Path, None] = None,
+    renderer: str = "auto"
+) -> Optional[ScoreSprites]:
+    """
+    저장된 스프라이트 조회 (조회 중에는 만들지 않음)
+
+    한 번 불러온 스프라이트는 프로세스 안에서 재사용합니다. 파일이 없거나
+    스타일 해시/렌더러가 맞지 않으면 None을 반환하고, 파일이 바뀌면(build 명령,
+    백그라운드 재생성 등) 다음 조회에서 다시 읽습니다. 파일이 없거나 스타일이 바뀌었으면
+    백그라운드에서 내장 렌더러로 다시 만듭니다 (_on_miss 참고).
+
+    Args:
+        kind: "gauge" 또는 "bar"
+        width, height: 이미지 크기 (None이면 차트 종류별 기본 크기)
+        scale: 배율
+        directory: 스프라이트 디렉터리 (None이면 sprite_dir())
+        renderer: 허용할 렌더러 ("auto"이면 렌더러 무관, "kaleido"/"native"이면 해당 렌더러 결과만)
+
+    Returns:
+        ScoreSprites 또는 None
+    """
+    _check_kind(kind)
+    _check_renderer(renderer)
+    width, height = _size(kind, width, height)
+    path = sprite_path(kind, width, height, scale, directory)
+    key = (kind, width, height, scale, str(path.parent), renderer)
+
+    sprites = _loaded.get(key)
+    if sprites is not None:
+        return sprites
+
+    state = _file_state(path)
+    if _missed.get(key, False) == state:
+        return None
+
+    with _lock:
+        sprites = _loaded.get(key)
+        if sprites is not None:
+            return sprites
+        style = style_hash()
+        sprites = read_sprites(path) if state is not None else None
+        if not _usable(sprites, style, renderer):
+            _missed[key] = state
+            stale = sprites is None or sprites.style_hash != style
+            _on_miss(kind, width, height, scale, path, renderer, stale)
+            return None
+        _loaded[key] = sprites
+        _missed.pop(key, None)
+        return sprites
+
+
+def score_image(
+    kind: str,
+    score: int,
+    width: Optional[int] = None,
+    height: Optional[int] = None,
+    scale: float = DEFAULT_SCALE,
+    renderer: str = "auto"
+) -> bytes:
+    """
+    점수 차트 이미지 PNG (스프라이트에서 조회, 없으면 해당 점수만 내장 렌더러로 그림)
+
+    Args:
+        kind: "gauge" 또는 "bar"
+        score: 만족도 점수 (0~100)
+        width, height: 이미지 크기 (None이면 차트 종류별 기본 크기)
+        scale: 배율
+        renderer: 허용할 스프라이트 렌더러 (load_sprites 참고)
+
+    Returns:
+        PNG 바이트
+    """
+    sprites = load_sprites(kind, width, height, scale, renderer=renderer)
+    if sprites is not None:
+        return sprites.image(score)
+    width, height = _size(kind, width, height)
+    return NATIVE_RENDERERS[kind](max(0, min(100, int(score))), width=width, height=height, scale=scale)
+
+
+def clear_loaded():
+    """프로세스에 불러온 스프라이트 비우기 (다음 조회 시 파일 다시 확인, 진행 중인 재생성은 유지)"""
+    with _lock:
+        _loaded.clear()
+        _missed.clear()
+        _warned.clear()
+        for path, thread in list(_rebuilds.items()):
+            if not thread.is_alive():
+                del _rebuilds[path]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.viz.sprites",
+        description="0~100점 게이지/바 차트 스프라이트 생성"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build = subparsers.add_parser("build", help="스프라이트 생성 및 저장")
+    build.add_argument("--kinds", default=",".join(DEFAULT_SIZES), help="차트 종류 (쉼표 구분, 기본: gauge,bar)")
+    build.add_argument("--width", type=int, default=None, help="이미지 너비 (px, 기본: 차트 종류별)")
+    build.add_argument("--height", type=int, default=None, help="이미지 높이 (px, 기본: 차트 종류별)")
+    build.add_argument("--scale", type=float, default=DEFAULT_SCALE, help=f"배율 (기본: {DEFAULT_SCALE})")
+    build.add_argument("--renderer", choices=["auto", "kaleido", "native"], default="auto", help="렌더러 (기본: auto)")
+    build.add_argument("--dir", default=None, help="저장 디렉터리 (기본: app/data/sprites)")
+    build.add_argument("--force", action="store_true", help="최신 파일도 다시 생성")
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    kinds = [kind.strip() for kind in args.kinds.split(",") if kind.strip()]
+    try:
+        for kind in kinds:
+            _check_kind(kind)
+    except ValueError as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 2
+
+    for kind in kinds:
+        width, height = _size(kind, args.width, args.height)
+        path = sprite_path(kind, width, height, args.scale, args.dir)
+        if not args.force and is_current(read_sprites(path), args.renderer):
+            print(f"{kind}: {path} (최신 상태, 건너뜀)", file=sys.stderr)
+            continue
+        sprites = build_sprites(kind, width, height, args.scale, renderer=args.renderer)
+        path = save_sprites(sprites, args.dir)
+        size_kb = path.stat().st_size / 1024
+        print(f"{kind}: {path} ({sprites.renderer}, {size_kb:.0f} KB)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""
+공통 테스트 입력 (여러 테스트 파일에서 사용하는 고객 입력, 전처리 특징)
+"""
+
+import random
+
+import pytest
+from app.core.weights import BUDGETS, DEVICE_TYPES, FITTING_PLANS, LIFESTYLES
+
+
+VALID_RECORD = {
+    "audiogram_left_pta": 45,
+    "audiogram_right_pta": 60,
+    "speech_score_left": 70,
+    "speech_score_right": 80,
+    "age": 68,
+    "lifestyle": "mixed",
+    "experience": False,
+    "tinnitus": True,
+    "desired_type": "RIC",
+    "budget": "mid",
+    "fitting_plan": "unilateral_right",
+    "customer_name": "홍길동"
+}
+
+
+def build_records(count: int, invalid_every: int = 7, **fields) -> list[dict]:
+    """
+    유효/무효 레코드가 섞인 테스트 입력
+
+    Args:
+        count: 레코드 수
+        invalid_every: 이 간격마다 (순번 % invalid_every == 3) 10세 미만 → 검증 실패
+        **fields: 추가/변경할 항목 (함수이면 순번을 받아 값 생성)
+
+    Returns:
+        고객명 "고객<순번>", 연령 20~99세가 돌아가며 들어간 레코드 목록
+    """
+    records = []
+    for i in range(count):
+        record = dict(VALID_RECORD, age=20 + i % 80, customer_name=f"고객{i}")
+        for name, value in fields.items():
+            record[name] = value(i) if callable(value) else value
+        if i % invalid_every == 3:
+            record["age"] = 5
+        records.append(record)
+    return records
+
+
+def random_features(rng: random.Random) -> dict:
+    """무작위 전처리 특징 딕셔너리 (preprocess_inputs와 같은 형태)"""
+    pta_left = rng.choice([rng.randint(0, 120), rng.randint(0, 240) / 2])
+    pta_right = rng.choice([rng.randint(0, 120), rng.randint(0, 240) / 4])
+    pta_avg = (pta_left + pta_right) / 2
+    if pta_avg < 40:
+        loss_level = "mild"
+    elif pta_avg < 55:
+        loss_level = "moderate"
+    elif pta_avg < 70:
+        loss_level = "severe"
+    else:
+        loss_level = "profound"
+
+    return {
+        "pta_avg": pta_avg,
+        "pta_left": pta_left,
+        "pta_right": pta_right,
+        "loss_level": loss_level,
+        "asymmetry_db": abs(pta_left - pta_right),
+        "speech_score": (rng.randint(0, 100) + rng.randint(0, 100)) / 2,
+        "tinnitus": rng.random() < 0.5,
+        "experience": rng.random() < 0.5,
+        "lifestyle": rng.choice(LIFESTYLES),
+        "budget": rng.choice(BUDGETS),
+        "desired_type": rng.choice(DEVICE_TYPES),
+        "fitting_plan": rng.choice(FITTING_PLANS),
+        "age": rng.randint(10, 110)
+    }
+
+
+@pytest.fixture
+def valid_record() -> dict:
+    """검증을 통과하는 입력 1건 (테스트마다 새 복사본)"""
+    return dict(VALID_RECORD)
+
+
+@pytest.fixture
+def make_records():
+    """build_records 함수 (테스트마다 변형 인자를 지정해 사용)"""
+    return build_records
+
+
+@pytest.fixture(scope="session")
+def make_features():
+    """random_features 함수 (모듈 범위 fixture에서도 사용할 수 있도록 세션 범위)"""
+    return random_features
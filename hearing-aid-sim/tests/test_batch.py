@@ -0,0 +1,154 @@
+"""
+일괄 예측 CLI 테스트
+"""
+
+import csv
+import json
+
+from app.batch import main, score_records
+from app.core.pipeline import (
+    iter_records,
+    normalize_csv_row,
+    score_record,
+    stream_predictions,
+    Throughput
+)
+
+
+class TestBatch:
+    """일괄 예측 테스트"""
+
+    def test_score_record(self, valid_record):
+        """레코드 한 건 예측 테스트"""
+        result = score_record(valid_record)
+        assert result["ok"]
+        assert result["customer_name"] == "홍길동"
+        assert 0 <= result["score"] <= 100
+        assert result["breakdown"]["final_score"] == result["score"]
+        assert result["summary"]
+        assert result["recommendations"]
+
+    def test_score_record_invalid(self, valid_record):
+        """검증 실패 레코드 테스트"""
+        result = score_record(dict(valid_record, age=5))
+        assert not result["ok"]
+        assert any(error["field"] == "age" for error in result["errors"])
+
+    def test_process_pool_preserves_order(self, make_records):
+        """프로세스 풀 결과가 단일 프로세스와 같은 순서/값인지 테스트"""
+        records = make_records(200)
+        serial = list(score_records(records, workers=1, chunk_size=16))
+        parallel = list(score_records(records, workers=2, chunk_size=16))
+
+        assert [r["index"] for r in parallel] == list(range(200))
+        assert parallel == serial
+
+    def test_normalize_csv_row(self):
+        """CSV 행 정리 테스트"""
+        row = {"age": " 70 ", "audiogram_left_250hz": "", "main_complaints": "TV 시청; 전화 통화"}
+        assert normalize_csv_row(row) == {"age": "70", "main_complaints": ["TV 시청", "전화 통화"]}
+
+    def test_cli_csv(self, valid_record, make_records, tmp_path):
+        """CSV 입력 → JSONL 출력 CLI 테스트"""
+        input_path = tmp_path / "input.csv"
+        output_path = tmp_path / "output.jsonl"
+        records = make_records(20)
+        with open(input_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(valid_record))
+            writer.writeheader()
+            writer.writerows(records)
+
+        assert main(["score", str(input_path), "-o", str(output_path), "--workers", "1"]) == 0
+
+        results = [json.loads(line) for line in output_path.read_text(encoding="utf-8").splitlines()]
+        assert len(results) == 20
+        for record, result in zip(records, results):
+            expected = score_record(record)
+            assert result["ok"] == expected["ok"]
+            if result["ok"]:
+                assert result["score"] == expected["score"]
+
+    def test_iter_records_jsonl_parse_error(self, valid_record, tmp_path):
+        """JSONL 파싱 오류 행 처리 테스트"""
+        input_path = tmp_path / "input.jsonl"
+        input_path.write_text(json.dumps(valid_record) + "\n{broken\n\n", encoding="utf-8")
+
+        records = list(iter_records(input_path))
+        assert len(records) == 2
+        assert not score_record(records[1])["ok"]
+
+
+class TestStreamPipeline:
+    """스트리밍 파이프라인 테스트"""
+
+    def test_stream_predictions_errors_side_channel(self, make_records):
+        """검증 실패 레코드가 오류 콜백으로만 전달되는지 테스트"""
+        records = make_records(30)
+        errors = []
+        counter = Throughput()
+
+        results = list(stream_predictions(iter(records), on_error=errors.append, counter=counter))
+
+        failed = [i for i in range(30) if i % 7 == 3]
+        assert [error["index"] for error in errors] == failed
+        assert len(results) == 30 - len(failed)
+        assert counter.total == 30
+        assert counter.failed == len(failed)
+        assert all("features" in result for result in results)
+
+    def test_stream_is_lazy(self, make_records):
+        """입력을 한 건씩 소비하는지 테스트"""
+        consumed = []
+
+        def records():
+            for i, record in enumerate(make_records(10)):
+                consumed.append(i)
+                yield record
+
+        results = stream_predictions(records())
+        next(results)
+        assert consumed == [0]
+
+    def test_cli_stream(self, make_records, tmp_path):
+        """stream 명령 테스트"""
+        input_path = tmp_path / "input.jsonl"
+        output_path = tmp_path / "output.jsonl"
+        errors_path = tmp_path / "errors.jsonl"
+        input_path.write_text(
+            "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in make_records(20)),
+            encoding="utf-8"
+        )
+
+        assert main([
+            "stream", str(input_path), "-o", str(output_path),
+            "--errors", str(errors_path), "--progress-every", "5"
+        ]) == 0
+
+        results = output_path.read_text(encoding="utf-8").splitlines()
+        errors = errors_path.read_text(encoding="utf-8").splitlines()
+        assert len(results) + len(errors) == 20
+        assert json.loads(errors[0])["index"] == 3
+
+    def test_cli_validate(self, valid_record, make_records, tmp_path):
+        """validate 명령 테스트 (통과 행 + 행별 오류 표)"""
+        input_path = tmp_path / "input.csv"
+        output_path = tmp_path / "clean.jsonl"
+        errors_path = tmp_path / "errors.jsonl"
+        records = make_records(20)
+        with open(input_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(valid_record))
+            writer.writeheader()
+            writer.writerows(records)
+
+        assert main([
+            "validate", str(input_path), "-o", str(output_path), "--errors", str(errors_path)
+        ]) == 0
+
+        clean = [json.loads(line) for line in output_path.read_text(encoding="utf-8").splitlines()]
+        errors = [json.loads(line) for line in errors_path.read_text(encoding="utf-8").splitlines()]
+        assert [error["index"] for error in errors] == [3, 10, 17]
+        assert errors[0]["errors"][0]["field"] == "age"
+        assert errors[0]["input"]["customer_name"] == "고객3"
+        assert len(clean) == 17
+        assert clean[0]["customer_name"] == "고객0"
+        assert clean[0]["age"] == 20 and clean[0]["experience"] is False
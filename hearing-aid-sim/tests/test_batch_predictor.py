@@ -0,0 +1,68 @@
+"""
+배치 예측 엔진 단위 테스트
+"""
+
+import random
+
+import numpy as np
+import pytest
+from app.core.predictor import predict_satisfaction, load_weights
+from app.core.batch_predictor import (
+    predict_satisfaction_batch,
+    encode_features,
+    classify_loss_level_codes,
+    BREAKDOWN_KEYS
+)
+from app.core.weights import compile_weights, LOSS_LEVELS
+
+
+class TestBatchPredictor:
+    """predict_satisfaction_batch 테스트"""
+
+    def test_matches_scalar_predictor(self, make_features):
+        """무작위 코호트에서 predict_satisfaction과 동일한 결과 테스트"""
+        rng = random.Random(1234)
+        features_list = [make_features(rng) for _ in range(3000)]
+        weights = load_weights()
+
+        result = predict_satisfaction_batch(encode_features(features_list), weights)
+
+        for i, features in enumerate(features_list):
+            score, breakdown = predict_satisfaction(features, weights)
+            assert result['final_score'][i] == score
+            for key in BREAKDOWN_KEYS:
+                assert result[key][i] == breakdown[key], (key, features)
+
+    def test_derived_columns(self, make_features):
+        """asymmetry_db/loss_level 열 생략 시 PTA로부터 계산 테스트"""
+        rng = random.Random(99)
+        features_list = [make_features(rng) for _ in range(500)]
+        columns = encode_features(features_list)
+        expected = predict_satisfaction_batch(columns, compile_weights(load_weights()))
+
+        del columns['asymmetry_db']
+        del columns['loss_level']
+        result = predict_satisfaction_batch(columns)
+
+        np.testing.assert_array_equal(result['final_score'], expected['final_score'])
+
+    def test_classify_loss_level_codes(self):
+        """손실 수준 코드 분류 경계 테스트"""
+        codes = classify_loss_level_codes([0, 39.9, 40, 54.9, 55, 69.9, 70, 120])
+        assert [LOSS_LEVELS[c] for c in codes] == [
+            'mild', 'mild', 'moderate', 'moderate', 'severe', 'severe', 'profound', 'profound'
+        ]
+
+    def test_invalid_codes(self, make_features):
+        """잘못된 범주 코드 ValueError 테스트"""
+        rng = random.Random(7)
+        columns = encode_features([make_features(rng) for _ in range(10)])
+        columns['budget'] = np.full(10, 3)
+
+        with pytest.raises(ValueError):
+            predict_satisfaction_batch(columns)
+
+    def test_empty(self):
+        """빈 입력 테스트"""
+        result = predict_satisfaction_batch(encode_features([]))
+        assert result['final_score'].shape == (0,)
@@ -0,0 +1,110 @@
+"""
+성능 벤치마크 테스트
+"""
+
+import json
+
+import pytest
+from app import bench
+from app.bench import compare_results, main, measure_import, run_benchmarks, run_import_benchmarks, synthetic_inputs
+from app.core.schema import UserInput
+
+
+@pytest.fixture(autouse=True)
+def fast_runs(monkeypatch):
+    """테스트에서는 측정 반복을 최소화"""
+    monkeypatch.setattr(bench, "MIN_RUN_SECONDS", 0.0)
+
+
+class TestBench:
+    """벤치마크 실행 및 기준값 비교 테스트"""
+
+    def test_synthetic_inputs_valid(self):
+        """합성 입력은 모두 UserInput 검증 통과"""
+        records = synthetic_inputs(50, seed=1)
+        assert len(records) == 50
+        for record in records:
+            UserInput(**record)
+        assert synthetic_inputs(5, seed=1) == records[:5]
+
+    def test_run_benchmarks(self):
+        """크기 × 항목별 결과"""
+        report = run_benchmarks(sizes=[2, 3], cases=["predict", "docx"], repeat=1)
+        assert [(r["case"], r["size"]) for r in report["results"]] == [
+            ("predict", 2), ("docx", 2), ("predict", 3), ("docx", 3)
+        ]
+        for result in report["results"]:
+            assert result["per_item_ms"] > 0
+        json.dumps(report)
+
+    def test_unknown_case(self):
+        with pytest.raises(ValueError):
+            run_benchmarks(sizes=[1], cases=["unknown"])
+
+    def test_compare_results(self):
+        """기준값 대비 상태 분류"""
+        baseline = {"results": [
+            {"case": "a", "size": 10, "per_item_ms": 1.0},
+            {"case": "b", "size": 10, "per_item_ms": 1.0},
+            {"case": "c", "size": 10, "per_item_ms": 1.0},
+        ]}
+        report = {"results": [
+            {"case": "a", "size": 10, "per_item_ms": 1.5},
+            {"case": "b", "size": 10, "per_item_ms": 0.5},
+            {"case": "c", "size": 10, "per_item_ms": 1.1},
+            {"case": "d", "size": 10, "per_item_ms": 1.0},
+            {"case": "e", "size": 10, "skipped": "없음"},
+        ]}
+        statuses = [row["status"] for row in compare_results(report, baseline, threshold=0.2)]
+        assert statuses == ["regression", "improved", "ok", "new", "skipped"]
+
+    def test_cli_baseline_roundtrip(self, tmp_path):
+        """기준값 저장 후 비교 실행"""
+        baseline_path = tmp_path / "baseline.json"
+        output_path = tmp_path / "result.json"
+        args = ["--sizes", "2", "--cases", "predict,summary", "--repeat", "1", "--baseline", str(baseline_path)]
+
+        assert main(args + ["--save-baseline"]) == 0
+        assert baseline_path.exists()
+
+        # 기준값을 매우 작게 바꾸면 회귀로 판단
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+        for result in baseline["results"]:
+            result["per_item_ms"] = 1e-9
+        baseline_path.write_text(json.dumps(baseline), encoding="utf-8")
+
+        assert main(args + ["-o", str(output_path)]) == 1
+        assert len(json.loads(output_path.read_text(encoding="utf-8"))["results"]) == 2
+
+
+class TestImportBench:
+    """모듈 import 시간 측정 테스트"""
+
+    def test_core_is_light(self):
+        """app.core 패키지는 무거운 라이브러리 없이 로드"""
+        result = measure_import("app.core", repeat=1, target_ms=1000)
+        assert result["status"] == "ok"
+        assert result["loaded"] == []
+
+    @pytest.mark.parametrize("module", ["app.core.pipeline", "app.report.bundle", "app.report.bulk", "app.batch"])
+    def test_heavy_libraries_load_on_first_use(self, module):
+        """리포트/차트 라이브러리는 import 시점에 로드하지 않음"""
+        loaded = measure_import(module, repeat=1)["loaded"]
+        assert not {"pandas", "plotly", "docx", "PIL", "kaleido", "streamlit"} & set(loaded)
+
+    def test_batch_cli_is_light(self):
+        """일괄 처리 CLI는 numpy 없이 로드 (compare/calibrate/validate 실행 시 로드)"""
+        loaded = measure_import("app.batch", repeat=1)["loaded"]
+        assert "numpy" not in loaded
+
+    def test_lazy_exports(self):
+        """패키지에서 바로 가져온 함수는 원래 모듈의 함수"""
+        import app.core
+        from app.core.predictor import predict_satisfaction
+        assert app.core.predict_satisfaction is predict_satisfaction
+        with pytest.raises(AttributeError):
+            app.core.missing_name
+
+    def test_slow_target(self):
+        results = run_import_benchmarks({"app.core": 0.0, "app.core.weights": None}, repeat=1)
+        assert [(r["module"], r["status"]) for r in results] == [("app.core", "slow"), ("app.core.weights", None)]
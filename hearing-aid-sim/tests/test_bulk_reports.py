@@ -0,0 +1,162 @@
+"""
+Word 리포트 일괄 생성 테스트
+"""
+
+import json
+import zipfile
+from datetime import datetime
+from functools import partial
+from io import BytesIO
+
+import pytest
+from docx import Document
+from app.batch import main
+from app.report import bulk
+from app.report.bulk import ReportNamer, generate_reports, safe_file_name, write_report_zip
+
+
+@pytest.fixture
+def make_records(make_records):
+    """센터 2곳, 방문일 포함 (4번째마다 검증 실패)"""
+    return partial(
+        make_records,
+        invalid_every=4,
+        center=lambda i: "강남" if i % 2 else "부산",
+        visit_date="2026-10-17"
+    )
+
+
+def document_text(data: bytes) -> str:
+    return "\n".join(p.text for p in Document(BytesIO(data)).paragraphs)
+
+
+class TestReportNamer:
+    """파일 이름 규칙 테스트"""
+
+    def test_name(self):
+        namer = ReportNamer(default_date="2026-10-17")
+        assert namer.name(0, "홍길동", "2026-10-16") == "2026-10-16_홍길동.docx"
+        assert namer.name(1, "홍길동") == "2026-10-17_홍길동.docx"
+        assert namer.name(2, None, center="강남") == "강남/2026-10-17_고객00003.docx"
+
+    def test_duplicates(self):
+        """같은 이름은 입력 순서대로 번호 추가 (폴더별)"""
+        namer = ReportNamer(default_date="2026-10-17")
+        names = [namer.name(i, "홍길동") for i in range(3)] + [namer.name(3, "홍길동", center="강남")]
+        assert names == [
+            "2026-10-17_홍길동.docx",
+            "2026-10-17_홍길동_2.docx",
+            "2026-10-17_홍길동_3.docx",
+            "강남/2026-10-17_홍길동.docx",
+        ]
+
+    def test_unsafe_characters(self):
+        assert safe_file_name("../a/b:c*?", "x") == "_a_b_c_"
+        assert safe_file_name("  ", "대체") == "대체"
+
+
+class TestBulkReports:
+    """일괄 생성/ZIP 기록 테스트"""
+
+    def test_process_pool_preserves_order(self, make_records):
+        records = make_records(8)
+        serial = list(generate_reports(records, workers=1, charts=False))
+        parallel = list(generate_reports(records, workers=2, charts=False))
+
+        assert [r["index"] for r in parallel] == list(range(8))
+        assert [r["ok"] for r in parallel] == [r["ok"] for r in serial] == [i % 4 != 3 for i in range(8)]
+        for result, record in zip(parallel, records):
+            if result["ok"]:
+                assert f"{record['customer_name']}님을 위한 맞춤 분석" in document_text(result["data"])
+
+    def test_failure_does_not_abort(self, make_records, tmp_path, monkeypatch):
+        """리포트 생성 오류는 해당 고객만 실패로 기록"""
+        original = bulk.build_report_docx
+
+        def flaky(**kwargs):
+            if kwargs["user_input_dict"]["customer_name"] == "고객1":
+                raise RuntimeError("문서 오류")
+            return original(**kwargs)
+
+        monkeypatch.setattr(bulk, "build_report_docx", flaky)
+        errors = []
+        output = tmp_path / "reports.zip"
+        counter = write_report_zip(make_records(6), output, on_error=errors.append, workers=1, charts=False)
+
+        assert (counter.total, counter.failed) == (6, 2)
+        assert [(e["index"], e["file_name"]) for e in errors] == [
+            (1, "강남/2026-10-17_고객1.docx"),
+            (3, "강남/2026-10-17_고객3.docx"),
+        ]
+        assert "문서 오류" in errors[0]["errors"][0]["message"]
+        assert errors[1]["errors"][0]["field"] == "age"
+
+        with zipfile.ZipFile(output) as archive:
+            assert archive.namelist() == [
+                "부산/2026-10-17_고객0.docx",
+                "부산/2026-10-17_고객2.docx",
+                "부산/2026-10-17_고객4.docx",
+                "강남/2026-10-17_고객5.docx",
+            ]
+            assert "고객4님" in document_text(archive.read("부산/2026-10-17_고객4.docx"))
+
+    def test_document_date_follows_visit_date(self, make_records):
+        """문서 작성일/평가 월은 생성한 날이 아니라 방문일 (없으면 default_date)"""
+        records = make_records(3, visit_date=lambda i: ["2025-03-04", None, "잘못된 날짜"][i])
+        results = list(generate_reports(records, workers=1, charts=False, default_date="2025-12-31"))
+
+        texts = [document_text(result["data"]) for result in results]
+        assert "작성일: 2025년 03월 04일" in texts[0]
+        assert "2025년 03월에 평가한 결과" in texts[0]
+        assert "작성일: 2025년 12월 31일" in texts[1]
+        assert "작성일: 2025년 12월 31일" in texts[2]
+
+    def test_file_name_follows_document_date(self, valid_record, tmp_path):
+        """파일 이름의 날짜와 문서 작성일은 같은 방문일 (시각이 붙은 값, 읽을 수 없는 값 포함)"""
+        visit_dates = ["2026-03-05T10:00:00", "3/5/2026", datetime(2026, 3, 6, 9, 30)]
+        records = [dict(valid_record, customer_name=f"고객{i}", visit_date=value) for i, value in enumerate(visit_dates)]
+        output = tmp_path / "reports.zip"
+        write_report_zip(records, output, default_date="2026-10-18", workers=1, charts=False)
+
+        with zipfile.ZipFile(output) as archive:
+            assert archive.namelist() == ["2026-03-05_고객0.docx", "2026-10-18_고객1.docx", "2026-03-06_고객2.docx"]
+            texts = [document_text(archive.read(name)) for name in archive.namelist()]
+        assert "작성일: 2026년 03월 05일" in texts[0]
+        assert "작성일: 2026년 10월 18일" in texts[1]
+        assert "작성일: 2026년 03월 06일" in texts[2]
+
+    def test_per_center(self, valid_record, make_records, tmp_path):
+        """센터별 ZIP 파일"""
+        output = tmp_path / "packets"
+        records = make_records(4) + [dict(valid_record)]
+        write_report_zip(records, output, per_center=True, default_date="2026-10-18", workers=1, charts=False)
+
+        assert sorted(path.name for path in output.iterdir()) == ["강남.zip", "부산.zip", "센터미지정.zip"]
+        with zipfile.ZipFile(output / "부산.zip") as archive:
+            assert archive.namelist() == ["2026-10-17_고객0.docx", "2026-10-17_고객2.docx"]
+        with zipfile.ZipFile(output / "센터미지정.zip") as archive:
+            assert archive.namelist() == ["2026-10-18_홍길동.docx"]
+
+    def test_cli(self, make_records, tmp_path):
+        input_path = tmp_path / "input.jsonl"
+        input_path.write_text(
+            "\n".join(json.dumps(record, ensure_ascii=False) for record in make_records(5)) + "\n{잘못된 줄\n",
+            encoding="utf-8"
+        )
+        output = tmp_path / "reports.zip"
+        errors = tmp_path / "errors.jsonl"
+
+        assert main([
+            "reports", str(input_path), "-o", str(output), "--errors", str(errors),
+            "--workers", "2", "--no-charts"
+        ]) == 0
+
+        with zipfile.ZipFile(output) as archive:
+            assert len(archive.namelist()) == 4
+            assert all(info.compress_type == zipfile.ZIP_STORED for info in archive.infolist())
+        failed = [json.loads(line) for line in errors.read_text(encoding="utf-8").splitlines()]
+        assert [item["index"] for item in failed] == [3, 5]
+
+    def test_cli_invalid_visit_date(self, tmp_path):
+        with pytest.raises(SystemExit):
+            main(["reports", str(tmp_path / "input.jsonl"), "-o", str(tmp_path / "r.zip"), "--visit-date", "10/17"])
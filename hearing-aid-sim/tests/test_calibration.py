@@ -0,0 +1,172 @@
+"""
+가중치 보정 단위 테스트
+"""
+
+import copy
+import json
+import random
+
+import numpy as np
+import pytest
+from app.batch import main
+from app.core.batch_predictor import encode_features, predict_satisfaction_batch
+from app.core.calibration import fit_weights, _isotonic
+from app.core.predictor import load_weights
+from app.core.weights import compile_weights
+
+
+def make_true_weights() -> dict:
+    """관측값 생성용 가중치 (기본 가중치에서 일부 항목 변경)"""
+    weights = copy.deepcopy(load_weights())
+    weights['base_score'] = 40
+    weights['lifestyle_weights']['noisy'] -= 6
+    weights['budget_weights']['high'] += 4
+    for range_config in weights['speech_score_weights']['ranges']:
+        range_config['weight'] += 2
+    return weights
+
+
+@pytest.fixture(scope='module')
+def cohort(make_features):
+    rng = random.Random(8)
+    columns = encode_features(make_features(rng) for _ in range(5000))
+    observed = predict_satisfaction_batch(columns, compile_weights(make_true_weights()))['final_score']
+    return columns, observed
+
+
+class TestIsotonic:
+    """등위 회귀 테스트"""
+
+    def test_already_monotonic(self):
+        """이미 단조인 값은 그대로"""
+        values = np.array([-3.0, 0.0, 2.0])
+        assert np.allclose(_isotonic(values, np.ones(3)), values)
+
+    def test_pools_violations(self):
+        """역전된 구간은 가중 평균으로 합침"""
+        result = _isotonic(np.array([0.0, 4.0, 2.0]), np.array([1.0, 1.0, 3.0]))
+        assert np.allclose(result, [0.0, 2.5, 2.5])
+
+    def test_decreasing(self):
+        """감소 제약"""
+        result = _isotonic(np.array([1.0, 3.0]), np.ones(2), increasing=False)
+        assert np.allclose(result, [2.0, 2.0])
+
+
+class TestFitWeights:
+    """fit_weights 테스트"""
+
+    def test_recovers_exact_observations(self, cohort):
+        """규칙으로 생성한 관측값은 오차 없이 재현"""
+        columns, observed = cohort
+        weights, report = fit_weights(columns, observed)
+
+        assert report['rmse_before'] > 0
+        assert report['rmse_after'] == 0
+        after = predict_satisfaction_batch(columns, compile_weights(weights))['final_score']
+        assert np.array_equal(after, observed)
+
+    def test_output_schema(self, cohort):
+        """기존 가중치 파일 형식 유지 (정수 가중치, 구간 경계 유지)"""
+        columns, observed = cohort
+        base = load_weights()
+        weights, _ = fit_weights(columns, observed, base_weights=base)
+
+        compile_weights(weights)
+        assert set(base) <= set(weights)
+        assert weights['binaural'] == base['binaural']
+        assert weights['asymmetry_penalty'] == base['asymmetry_penalty']
+        assert weights['version'] == f"{base['version']}+calibrated"
+        assert isinstance(weights['base_score'], int)
+        for fitted, original in zip(weights['speech_score_weights']['ranges'], base['speech_score_weights']['ranges']):
+            assert (fitted['min'], fitted['max']) == (original['min'], original['max'])
+            assert isinstance(fitted['weight'], int)
+        assert weights['calibration']['rows'] == len(observed)
+        json.dumps(weights, ensure_ascii=False)
+
+    def test_monotonic_speech_weights(self, cohort):
+        """어음명료도 구간 가중치는 단조 증가"""
+        columns, observed = cohort
+        # 어음명료도와 반대 방향인 관측값
+        noisy = np.clip(observed - columns['speech_score'] * 0.3, 0, 100)
+        weights, _ = fit_weights(columns, noisy)
+
+        speech = [r['weight'] for r in weights['speech_score_weights']['ranges']]
+        assert speech == sorted(speech)
+
+    def test_fixed_terms_untouched(self, cohort):
+        """보정 대상이 아닌 항목은 기존 값 유지"""
+        columns, observed = cohort
+        base = load_weights()
+        weights, report = fit_weights(columns, observed, base_weights=base, terms=['base', 'lifestyle'])
+
+        assert weights['budget_weights'] == base['budget_weights']
+        assert weights['type_mismatch_penalties'] == base['type_mismatch_penalties']
+        assert report['rmse_after'] < report['rmse_before']
+
+    def test_continuous_weights(self, cohort):
+        """정수 제약 해제"""
+        columns, observed = cohort
+        noisy = np.clip(observed + np.random.default_rng(0).normal(0, 2, len(observed)), 0, 100)
+        weights, report = fit_weights(columns, noisy, integer=False)
+
+        assert isinstance(weights['base_score'], float)
+        assert report['rmse_after'] < report['rmse_before']
+
+    @pytest.mark.parametrize('integer', [True, False])
+    def test_rmse_never_worse(self, cohort, integer):
+        """기존 가중치 예측 + 잡음(0~100으로 자름)이면 보정해도 나아지지 않으므로 기존 가중치 유지"""
+        columns, _ = cohort
+        base = load_weights()
+        predicted = predict_satisfaction_batch(columns, compile_weights(base))['final_score']
+        noisy = np.clip(predicted + np.random.default_rng(1).normal(0, 5, len(predicted)), 0, 100)
+        weights, report = fit_weights(columns, noisy, base_weights=base, integer=integer)
+
+        assert report['rmse_after'] <= report['rmse_before']
+        assert not report['applied']
+        assert {key: value for key, value in weights.items() if key != 'calibration'} == base
+        assert weights['calibration']['rmse_after'] == report['rmse_before']
+
+    def test_continuous_mean_not_truncated(self, cohort):
+        """연속값 가중치도 최종 점수의 소수점 버림을 반영해 평균이 관측값과 같음"""
+        columns, observed = cohort
+        noisy = np.clip(observed + np.random.default_rng(2).integers(-3, 4, len(observed)), 0, 100)
+        _, report = fit_weights(columns, noisy, integer=False)
+
+        assert report['applied']
+        assert abs(report['mean_predicted'] - report['mean_observed']) < 0.1
+
+    def test_invalid_inputs(self, cohort):
+        """잘못된 항목/길이"""
+        columns, observed = cohort
+        with pytest.raises(ValueError):
+            fit_weights(columns, observed, terms=['asymmetry_penalty'])
+        with pytest.raises(ValueError):
+            fit_weights(columns, observed[:-1])
+
+
+class TestCalibrateCommand:
+    """calibrate CLI 테스트"""
+
+    def test_calibrate(self, valid_record, tmp_path):
+        rng = random.Random(3)
+        input_path = tmp_path / 'outcomes.jsonl'
+        with open(input_path, 'w', encoding='utf-8') as f:
+            for i in range(200):
+                record = dict(
+                    valid_record,
+                    audiogram_left_pta=rng.randint(20, 90),
+                    lifestyle=rng.choice(['quiet', 'mixed', 'noisy']),
+                    observed_satisfaction=rng.randint(30, 90)
+                )
+                if i == 0:
+                    del record['observed_satisfaction']
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+        output_path = tmp_path / 'weights.calibrated.json'
+        assert main(['calibrate', str(input_path), '-o', str(output_path)]) == 0
+
+        with open(output_path, encoding='utf-8') as f:
+            weights = json.load(f)
+        assert weights['calibration']['rows'] == 199
+        compile_weights(weights)
@@ -0,0 +1,55 @@
+"""
+차트 시각화 테스트 (기본 형태 재사용 결과 = 기준 구현 결과)
+"""
+
+import plotly.io as pio
+import pytest
+from app.viz import charts
+
+
+BREAKDOWN = [
+    {"factor": "기본 점수", "score": 50},
+    {"factor": "청력 손실", "score": -8},
+    {"factor": "어음명료도", "score": 6},
+    {"factor": "이명", "score": 0},
+]
+
+AUDIOGRAMS = [
+    {"audiogram_left_500hz": 40, "audiogram_left_1000hz": 45, "audiogram_right_2000hz": 50},
+    {"audiogram_left_250hz": 20, "audiogram_left_8000hz": 85.5},
+    {"audiogram_right_4000hz": 70},
+]
+
+
+class TestChartTemplates:
+    """create_* 결과가 _build_* (Plotly 검증 포함 전체 생성)와 같은지 테스트"""
+
+    @pytest.mark.parametrize("score", [0, 39, 40, 54, 55, 69, 70, 84, 85, 100])
+    def test_gauge_and_bar(self, score):
+        assert charts.create_gauge(score).to_dict() == charts._build_gauge(score).to_dict()
+        assert charts.create_bar(score).to_dict() == charts._build_bar(score).to_dict()
+
+    def test_breakdown_chart(self):
+        for breakdown in (BREAKDOWN, BREAKDOWN[:1]):
+            expected = charts._build_breakdown_chart(breakdown).to_dict()
+            assert charts.create_breakdown_chart(breakdown).to_dict() == expected
+
+    def test_audiogram(self):
+        for user_input_dict in AUDIOGRAMS:
+            expected = charts._build_audiogram(user_input_dict).to_dict()
+            assert charts.create_audiogram(user_input_dict).to_dict() == expected
+        assert charts.create_audiogram({}) is None
+
+    def test_returned_figure_is_independent(self):
+        """반환된 Figure를 수정해도 다음 호출에 영향 없음"""
+        fig = charts.create_bar(50)
+        fig.update_layout(height=999)
+        fig.data[1].marker.color = "black"
+        assert charts.create_bar(50).to_dict() == charts._build_bar(50).to_dict()
+
+    def test_template_change_rebuilds(self, monkeypatch):
+        """Plotly 기본 템플릿이 바뀌면 기본 형태를 다시 만듦"""
+        charts.create_gauge(70)
+        monkeypatch.setattr(pio.templates, "default", "simple_white")
+        assert charts.create_gauge(70).to_dict() == charts._build_gauge(70).to_dict()
+        assert ("gauge", "simple_white") in charts._base_figures
@@ -0,0 +1,186 @@
+"""
+열 단위 일괄 검증 테스트 (결과 = UserInput 한 건씩 검증 결과)
+"""
+
+import csv
+import random
+from typing import get_args
+
+import numpy as np
+import pytest
+from app.bench import synthetic_inputs
+from app.core.columnar import (
+    columns_from_records,
+    read_csv_columns,
+    validate_columns,
+    validate_records,
+    REQUIRED_MESSAGE
+)
+from app.core.pipeline import iter_records, validate_record
+from app.core.schema import FIELD_RULES, UNDER_AGE_MESSAGE, PTA_SIDES, UserInput
+
+
+# 잘못된 값 후보 (범위 밖, 형식 오류, 빈 칸, pydantic이 허용하는 문자열 등)
+JUNK_VALUES = [
+    None, "", "abc", -1, 5, 9, 10, 110, 111, 120, 121, 0, 70.5, "70", "70.0", "70.5", "1e2", "+70", " 45 ",
+    True, "yes", "Off", "t", 2, 1.0, "RIC", "loud", float("nan"), float("inf"), ["TV 시청"], [1], 3.0,
+]
+
+
+def messy_records(count: int, seed: int) -> list[dict]:
+    """합성 입력의 일부 항목을 잘못된 값으로 바꾼 레코드"""
+    rng = random.Random(seed)
+    names = list(UserInput.model_fields)
+    records = []
+    for record in synthetic_inputs(count, seed=seed):
+        for _ in range(rng.choice([0, 0, 1, 2, 3])):
+            record[rng.choice(names)] = rng.choice(JUNK_VALUES)
+        records.append(record)
+    return records
+
+
+def without_blanks(record: dict) -> dict:
+    """빈 칸(None, 빈 문자열, NaN)을 생략한 입력 (normalize_csv_row 결과와 같은 형태)"""
+    return {
+        key: value for key, value in record.items()
+        if not (value is None or value == "" or (isinstance(value, float) and value != value))
+    }
+
+
+class TestFieldRules:
+    """공통 규칙 정의 테스트"""
+
+    def test_rules_follow_model(self):
+        fields = UserInput.model_fields
+        assert [rule.name for rule in FIELD_RULES] == list(fields)
+        rules = {rule.name: rule for rule in FIELD_RULES}
+        assert (rules["age"].kind, rules["age"].low, rules["age"].high) == ("int", 0, 110)
+        assert rules["audiogram_left_500hz"][1:5] == ("float", False, 0, 120)
+        assert rules["lifestyle"].choices == get_args(fields["lifestyle"].annotation)
+        assert rules["experience"].kind == "bool" and rules["experience"].required
+        assert rules["main_complaints"].kind == "text_list"
+
+
+class TestValidateColumns:
+    """열 단위 검증 테스트"""
+
+    def test_matches_user_input(self):
+        """통과/실패 행, 오류 필드, 정리된 값이 UserInput과 같음"""
+        records = messy_records(1500, seed=21)
+        result = validate_records(records)
+        errors = {row["index"]: row["errors"] for row in result.error_rows()}
+        clean = iter(result.user_inputs())
+
+        for index, record in enumerate(records):
+            user_input, expected_errors = validate_record(without_blanks(record))
+            assert bool(result.valid[index]) == (user_input is not None), (index, record)
+            if user_input is not None:
+                assert next(clean).model_dump() == user_input.model_dump()
+            else:
+                # pydantic은 목록 항목 오류 위치를 "필드 → 순번"으로 표시
+                expected = [error["field"].split(" → ")[0] for error in expected_errors]
+                assert [error["field"] for error in errors[index]] == expected, (index, record)
+        assert result.n_valid + result.n_invalid == len(records)
+        assert 0 < result.n_invalid < len(records)
+
+    def test_typed_columns_match_object_columns(self):
+        """숫자 배열 열과 object 열의 결과가 같음"""
+        records = synthetic_inputs(300, seed=22)
+        records[5]["age"] = 7
+        records[9]["speech_score_left"] = 101
+        records[12]["tinnitus"] = 2
+        columns, size = columns_from_records(records)
+        typed = {}
+        for name, column in columns.items():
+            values = [np.nan if value is None else value for value in column]
+            typed[name] = np.array(values) if name not in ("customer_name",) else column
+
+        expected = validate_columns(columns, size)
+        result = validate_columns(typed)
+        assert result.errors == expected.errors
+        assert np.array_equal(result.valid, expected.valid)
+        assert result.records() == expected.records()
+        assert [error["index"] for error in result.errors] == [5, 9, 12]
+
+    @pytest.mark.parametrize("field", ["audiogram_left_500hz", "age"])
+    def test_unicode_numbers_match_user_input(self, valid_record, field):
+        """float()은 변환하지만 UserInput은 거부하는 유니코드 숫자 (앞뒤 유니코드 공백은 양쪽 모두 허용)"""
+        values = ["٣", "３", "٤٥", "４５.５", "45.٣", "𝟒𝟓", "\xa045", "45　", "45", 45]
+        records = [dict(valid_record, **{field: value}) for value in values]
+        expected = [validate_record(record)[0] is not None for record in records]
+        assert expected == [False] * 6 + [True] * 4
+
+        columns, size = columns_from_records(records)
+        text = dict(columns, **{field: np.array([str(value) for value in values])})
+        assert validate_records(records).valid.tolist() == expected
+        assert validate_columns(text, size).valid.tolist() == expected
+
+    def test_error_table(self):
+        records = [
+            {"age": 5, "lifestyle": "loud"},
+            dict(synthetic_inputs(1, seed=23)[0], audiogram_left_pta=None, audiogram_left_500hz=None,
+                 audiogram_right_pta=None, audiogram_right_500hz=None),
+        ]
+        result = validate_records(records)
+        first = [(error["field"], error["message"]) for error in result.errors if error["index"] == 0]
+        assert first[0] == ("speech_score_left", REQUIRED_MESSAGE)
+        assert ("age", UNDER_AGE_MESSAGE) in first
+        assert [field for field, _ in first] == [
+            "speech_score_left", "speech_score_right", "age", "lifestyle",
+            "experience", "tinnitus", "desired_type", "budget", "fitting_plan",
+        ]
+        # 필드 오류가 있는 행은 PTA 완결성을 확인하지 않고, 좌측 오류가 있으면 우측은 확인하지 않음
+        second = [error for error in result.errors if error["index"] == 1]
+        assert second == [{"index": 1, "field": "", "message": PTA_SIDES[0][2]}]
+        assert result.n_valid == 0
+
+    def test_clean_columns(self):
+        records = synthetic_inputs(50, seed=24)
+        records[0]["age"] = 3
+        result = validate_records(records)
+        assert result.index.tolist() == list(range(1, 50))
+        assert result.columns["age"].dtype == np.int64
+        assert result.columns["tinnitus"].dtype == bool
+        expected = [UserInput(**record) for record in records[1:]]
+        assert result.columns["audiogram_left_pta"].tolist() == [item.audiogram_left_pta for item in expected]
+        assert result.columns["asymmetry_db"].tolist() == [item.asymmetry_db for item in expected]
+
+    def test_parse_errors_and_lengths(self):
+        records = synthetic_inputs(3, seed=25)
+        result = validate_records([records[0], {"_parse_error": "JSON 파싱 오류"}, records[1]])
+        assert result.valid.tolist() == [True, False, True]
+        assert result.errors == [{"index": 1, "field": "", "message": "JSON 파싱 오류"}]
+        assert result.index.tolist() == [0, 2]
+
+        with pytest.raises(ValueError, match="열 길이"):
+            validate_columns({"age": [70, 71], "lifestyle": ["quiet"]})
+        assert validate_columns({}).size == 0
+
+
+class TestCsvColumns:
+    """CSV 열 단위 읽기 테스트"""
+
+    def test_matches_iter_records(self, tmp_path):
+        """read_csv_columns + validate_columns = iter_records + UserInput"""
+        records = messy_records(800, seed=26)
+        names = list(UserInput.model_fields) + ["visit_date"]
+        path = tmp_path / "center.csv"
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=names, extrasaction="ignore")
+            writer.writeheader()
+            for record in records:
+                writer.writerow(dict(record, visit_date=" 2024-05-01 "))
+
+        columns, size = read_csv_columns(path)
+        assert size == len(records)
+        assert columns["age"].dtype.kind == "U"
+        assert columns["visit_date"][0] == "2024-05-01"
+        result = validate_columns(columns, size)
+
+        rows = list(iter_records(path))
+        expected = validate_records(rows)
+        assert result.errors == expected.errors
+        assert result.records() == expected.records()
+        for index, row in enumerate(rows):
+            user_input, _ = validate_record(row)
+            assert bool(result.valid[index]) == (user_input is not None), (index, row)
@@ -0,0 +1,164 @@
+"""
+차트 이미지 캐시 테스트
+"""
+
+import struct
+import zlib
+
+import pytest
+from app.report import image_cache, word_report
+from app.report.image_cache import ChartImageCache, figure_key
+from app.report.word_report import build_report_docx
+from app.viz.charts import create_audiogram, create_gauge
+
+
+def tiny_png() -> bytes:
+    """1×1 흰색 PNG"""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    header = struct.pack(">IIBBBBB", 1, 1, 8, 2, 0, 0, 0)
+    pixels = zlib.compress(b"\x00\xff\xff\xff")
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", pixels) + chunk(b"IEND", b"")
+
+
+class CountingRenderer:
+    """호출 횟수를 세는 변환 함수 (kaleido 대신 사용)"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, fig, format, width, height, scale, timeout=None):
+        self.calls.append((format, width, height, scale))
+        return tiny_png()
+
+
+AUDIOGRAM_INPUT = {
+    "audiogram_left_500hz": 40, "audiogram_left_1000hz": 45, "audiogram_left_2000hz": 55,
+    "audiogram_right_500hz": 35, "audiogram_right_1000hz": 40, "audiogram_right_2000hz": 50,
+}
+
+
+class TestChartImageCache:
+    """캐시 키 및 메모리/디스크 캐시 테스트"""
+
+    def test_key_depends_on_content_and_size(self):
+        """같은 내용은 같은 키, 내용/크기/배율이 다르면 다른 키"""
+        key = figure_key(create_gauge(70))
+        assert key == figure_key(create_gauge(70))
+        assert key != figure_key(create_gauge(71))
+        assert key != figure_key(create_gauge(70), width=800)
+        assert key != figure_key(create_gauge(70), scale=1)
+
+    def test_memory_hit(self):
+        """같은 차트는 한 번만 변환"""
+        renderer = CountingRenderer()
+        cache = ChartImageCache(renderer=renderer)
+
+        first = cache.get(create_audiogram(AUDIOGRAM_INPUT))
+        second = cache.get(create_audiogram(AUDIOGRAM_INPUT))
+
+        assert first == second
+        assert renderer.calls == [("png", 600, 400, 2)]
+        assert cache.stats() == {"entries": 1, "hits": 1, "disk_hits": 0, "misses": 1}
+
+    def test_lru_eviction(self):
+        """최대 개수를 넘으면 가장 오래 사용하지 않은 항목 제거"""
+        renderer = CountingRenderer()
+        cache = ChartImageCache(max_entries=2, renderer=renderer)
+
+        cache.get(create_gauge(10))
+        cache.get(create_gauge(20))
+        cache.get(create_gauge(10))   # 10을 최근 사용으로
+        cache.get(create_gauge(30))   # 20 제거
+        assert len(renderer.calls) == 3
+
+        cache.get(create_gauge(10))
+        assert len(renderer.calls) == 3
+        cache.get(create_gauge(20))
+        assert len(renderer.calls) == 4
+
+    def test_disk_tier(self, tmp_path):
+        """디스크 캐시는 새 캐시 인스턴스(프로세스 재시작)에서도 재사용"""
+        renderer = CountingRenderer()
+        ChartImageCache(cache_dir=tmp_path, renderer=renderer).get(create_gauge(55))
+        assert len(list(tmp_path.glob("*/*.png"))) == 1
+
+        cache = ChartImageCache(cache_dir=tmp_path, renderer=renderer)
+        assert cache.get(create_gauge(55)) == tiny_png()
+        assert len(renderer.calls) == 1
+        assert cache.stats()["disk_hits"] == 1
+
+        cache.clear(disk=True)
+        assert list(tmp_path.glob("*/*.png")) == []
+
+    def test_render_error_not_cached(self):
+        """변환 실패는 캐시하지 않음"""
+        def failing(fig, **kwargs):
+            raise RuntimeError("kaleido 없음")
+
+        cache = ChartImageCache(renderer=failing)
+        with pytest.raises(RuntimeError):
+            cache.get(create_gauge(50))
+        assert cache.stats()["entries"] == 0
+
+
+class TestWordReportCache:
+    """Word 리포트의 청력도 이미지 캐시 사용 테스트"""
+
+    USER_INPUT = {
+        **AUDIOGRAM_INPUT,
+        "customer_name": "홍길동",
+        "audiogram_left_pta": 46.7,
+        "audiogram_right_pta": 41.7,
+        "speech_score_left": 80,
+        "speech_score_right": 76,
+        "age": 68,
+    }
+
+    @pytest.fixture(autouse=True)
+    def reset_fallback(self, monkeypatch):
+        monkeypatch.delenv(word_report.CHART_RENDERER_ENV, raising=False)
+        monkeypatch.setattr(word_report, "_kaleido_failed_at", None)
+
+    @pytest.fixture
+    def renderer(self):
+        renderer = CountingRenderer()
+        previous = image_cache.set_image_cache(ChartImageCache(renderer=renderer))
+        yield renderer
+        image_cache.set_image_cache(previous)
+
+    def build(self) -> bytes:
+        args = (self.USER_INPUT, {"loss_level": "moderate"}, 72, "높음", "요약입니다. 두번째.", ["추천"], {})
+        report = build_report_docx(*args, audiogram_fig=create_audiogram(self.USER_INPUT)).getvalue()
+        assert report[:2] == b"PK"
+        return report
+
+    def test_same_audiogram_rendered_once(self, renderer):
+        """같은 청력도로 리포트를 다시 만들어도 이미지 변환은 한 번"""
+        for _ in range(2):
+            self.build()
+        assert len(renderer.calls) == 1
+
+    def test_native_mode(self, renderer, monkeypatch):
+        """native 방식은 kaleido를 사용하지 않고 내장 렌더러로 이미지 삽입"""
+        monkeypatch.setenv(word_report.CHART_RENDERER_ENV, "native")
+        report = self.build()
+        assert renderer.calls == []
+        assert b"word/media/" in report
+
+    def test_fallback_when_kaleido_fails(self):
+        """kaleido 실패 시 내장 렌더러로 대체하고 한동안 kaleido를 건너뜀"""
+        calls = []
+
+        def failing(fig, **kwargs):
+            calls.append(kwargs["timeout"])
+            raise RuntimeError("kaleido 없음")
+
+        previous = image_cache.set_image_cache(ChartImageCache(renderer=failing))
+        try:
+            assert b"word/media/" in self.build()
+            assert b"word/media/" in self.build()
+        finally:
+            image_cache.set_image_cache(previous)
+        assert calls == [word_report.KALEIDO_TIMEOUT]
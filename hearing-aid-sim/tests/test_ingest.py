@@ -0,0 +1,89 @@
+"""
+대량 입력 변환 테스트 (JSON 바이트 검증, 검증 생략 생성)
+"""
+
+import gc
+import json
+
+import pytest
+from pydantic import ValidationError
+from app.bench import synthetic_inputs
+from app.core.ingest import construct_trusted, load_trusted_json, validate_json_array, validate_json_lines
+from app.core.schema import UserInput
+
+
+def encode(record) -> bytes:
+    return json.dumps(record, ensure_ascii=False).encode("utf-8")
+
+
+class TestValidateJson:
+    """JSON 바이트 검증 결과 = UserInput(**dict) 결과"""
+
+    def test_array_matches_dict_path(self):
+        records = synthetic_inputs(50, seed=1)
+        data = b"[" + b",".join(encode(record) for record in records) + b"]"
+        results = validate_json_array(data)
+        assert [item.model_dump() for item in results] == [UserInput(**record).model_dump() for record in records]
+        assert gc.isenabled()
+
+    def test_array_error_location(self):
+        records = synthetic_inputs(3, seed=2)
+        records[1] = dict(records[1], age=5)
+        with pytest.raises(ValidationError) as excinfo:
+            validate_json_array(json.dumps(records))
+        assert excinfo.value.errors()[0]["loc"] == (1, "age")
+        assert gc.isenabled()
+
+    def test_lines_collect_errors(self):
+        records = synthetic_inputs(4, seed=3)
+        lines = [encode(records[0]), b"", b"{", encode(dict(records[1], lifestyle="loud")), encode(records[2])]
+        results = list(validate_json_lines(b"\n".join(lines)))
+        assert len(results) == 4
+        assert results[0][0].model_dump() == UserInput(**records[0]).model_dump()
+        assert results[1][0] is None and results[1][1][0]["field"] == ""
+        assert results[2][0] is None and results[2][1][0]["field"] == "lifestyle"
+        assert results[3][1] == []
+
+
+class TestTrusted:
+    """검증 생략 생성 테스트"""
+
+    def test_model_dump_round_trip(self):
+        """검증된 레코드는 검증 경로와 같은 결과"""
+        for record in synthetic_inputs(50, seed=4):
+            expected = UserInput(**record)
+            trusted = construct_trusted(expected.model_dump())
+            assert trusted == expected
+            assert trusted.model_dump_json() == expected.model_dump_json()
+
+    def test_derives_pta_and_asymmetry(self):
+        """PTA/비대칭이 없으면 UserInput과 같이 계산"""
+        for record in synthetic_inputs(50, seed=5):
+            expected = UserInput(**record)
+            trusted = construct_trusted(record)
+            assert trusted.model_dump() == expected.model_dump()
+            assert trusted.model_fields_set == expected.model_fields_set
+
+    def test_defaults_and_extra_keys(self):
+        record = dict(synthetic_inputs(1, seed=6)[0], visit_date="2024-01-01")
+        first = construct_trusted(record)
+        second = construct_trusted(record)
+        assert not hasattr(first, "visit_date")
+        assert first.main_complaints == [] and first.main_complaints is not second.main_complaints
+        assert list(first.model_dump()) == list(UserInput.model_fields)
+
+    def test_errors(self):
+        record = synthetic_inputs(1, seed=7)[0]
+        with pytest.raises(ValueError, match="필수 항목"):
+            construct_trusted({key: value for key, value in record.items() if key != "age"})
+        with pytest.raises(ValueError, match="좌측 청력 데이터가 부족합니다"):
+            construct_trusted({"audiogram_right_pta": 40, **{key: value for key, value in record.items()
+                                                          if not key.startswith("audiogram_left")}})
+
+    def test_load_json_array_and_lines(self):
+        expected = [UserInput(**record) for record in synthetic_inputs(20, seed=8)]
+        jsonl = "\n".join(item.model_dump_json() for item in expected) + "\n"
+        array = "[" + ",".join(item.model_dump_json() for item in expected) + "]"
+        for data in (jsonl, jsonl.encode("utf-8"), array.encode("utf-8")):
+            assert [item.model_dump() for item in load_trusted_json(data)] == [item.model_dump() for item in expected]
+        assert gc.isenabled()
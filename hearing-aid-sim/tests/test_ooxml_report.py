@@ -0,0 +1,128 @@
+"""
+OOXML 직접 작성 Word 리포트 테스트 (python-docx 작성기와 결과 비교)
+"""
+
+import time
+import zipfile
+from io import BytesIO
+
+import pytest
+from docx import Document
+from app.report import word_report
+from app.report.ooxml_report import write_report_ooxml
+from app.report.word_report import build_report_docx, CHART_RENDERER_ENV, DOCX_WRITER_ENV
+from app.viz import sprites
+from app.viz.charts import create_audiogram, create_bar, create_gauge
+
+
+@pytest.fixture(scope="module")
+def sprite_dir(tmp_path_factory):
+    return tmp_path_factory.mktemp("sprites")
+
+
+@pytest.fixture(autouse=True)
+def native_charts(sprite_dir, monkeypatch):
+    """kaleido 없이 내장 렌더러로 차트 이미지 생성"""
+    monkeypatch.setenv(sprites.SPRITE_DIR_ENV, str(sprite_dir))
+    monkeypatch.setenv(CHART_RENDERER_ENV, "native")
+    monkeypatch.delenv(DOCX_WRITER_ENV, raising=False)
+    sprites.clear_loaded()
+    yield
+    sprites.clear_loaded()
+
+
+def user_input(customer_name: str = "김철수", **extra) -> dict:
+    data = {
+        "customer_name": customer_name,
+        "audiogram_left_pta": 46.7,
+        "audiogram_right_pta": 41.7,
+        "speech_score_left": 80,
+        "speech_score_right": 76,
+        "age": 68,
+        "audiogram_left_500hz": 40,
+        "audiogram_left_1000hz": 45,
+        "audiogram_right_2000hz": 50,
+    }
+    data.update(extra)
+    return data
+
+
+def build(writer: str, data: dict, score: int = 72, summary: str = "요약입니다. 둘째. 셋째. 넷째", **charts) -> dict:
+    report = build_report_docx(
+        data, {"loss_level": "moderate"}, score, "높음", summary, ["추천 1", "추천 2"], {},
+        writer=writer, **charts
+    )
+    with zipfile.ZipFile(BytesIO(report.getvalue())) as package:
+        assert package.testzip() is None
+        return {name: package.read(name) for name in package.namelist()}
+
+
+def assert_same_package(data: dict, **kwargs):
+    expected = build("python-docx", data, **kwargs)
+    actual = build("ooxml", data, **kwargs)
+    assert sorted(actual) == sorted(expected)
+    for name in expected:
+        assert actual[name] == expected[name], name
+
+
+class TestOoxmlWriter:
+    """python-docx 작성기(기준 구현)와 같은 문서 생성"""
+
+    def test_same_as_python_docx_with_charts(self):
+        """청력도 + 바 차트"""
+        data = user_input(fitting_plan="unilateral_left", main_complaints=["소음", "TV"], wearing_goal="대화")
+        assert_same_package(data, chart_fig=create_bar(72), audiogram_fig=create_audiogram(data))
+
+    def test_same_as_python_docx_gauge(self):
+        """게이지 차트, 점수별 색상"""
+        data = user_input()
+        for score in (40, 90):
+            assert_same_package(data, score=score, chart_fig=create_gauge(score))
+
+    def test_same_as_python_docx_without_charts(self):
+        assert_same_package(user_input(wearing_goal="가족과 대화"))
+
+    def test_escaping(self):
+        """XML 특수 문자, 탭/줄바꿈, 앞뒤 공백"""
+        data = user_input(" <홍&길동> ", main_complaints=["\"따옴표\" & '작은따옴표'"], wearing_goal="줄\n바꿈\t탭")
+        assert_same_package(data, summary=" 앞 공백. <b>태그</b>\r\n다음 줄")
+
+        text = "\n".join(p.text for p in Document(BytesIO(
+            build_report_docx(data, {}, 70, "보통", "요약", [], {}, writer="ooxml").getvalue()
+        )).paragraphs)
+        assert " <홍&길동> 님을 위한 맞춤 분석" in text
+        assert "줄\n바꿈\t탭" in text
+
+    def test_invalid_xml_character(self):
+        """XML에 넣을 수 없는 문자는 두 작성기 모두 ValueError"""
+        data = user_input("홍\x01길동")
+        for writer in ("python-docx", "ooxml"):
+            with pytest.raises(ValueError):
+                build(writer, data)
+
+    def test_writer_from_env(self, monkeypatch):
+        calls = []
+        monkeypatch.setenv(DOCX_WRITER_ENV, "ooxml")
+        monkeypatch.setattr(word_report, "_report_template", lambda: calls.append(1))
+        assert build_report_docx(user_input(), {}, 70, "보통", "요약", [], {}).getvalue()
+        assert calls == []
+
+    def test_unknown_writer(self):
+        with pytest.raises(ValueError, match="문서 작성 방식"):
+            build_report_docx(user_input(), {}, 70, "보통", "요약", [], {}, writer="pdf")
+
+    def test_zip_timestamp_per_document(self):
+        """zip 항목 시각은 문서마다 작성 시각, 지정하면 같은 내용은 같은 바이트"""
+        slot_texts = word_report._slot_texts("홍길동")
+        body = word_report._report_body(user_input(), {}, 70, "보통", "요약", [], None, None)
+
+        with zipfile.ZipFile(write_report_ooxml(slot_texts, body)) as package:
+            written = {info.date_time for info in package.infolist()}
+        assert len(written) == 1
+        assert abs(time.mktime(written.pop() + (0, 0, -1)) - time.time()) < 60
+
+        fixed = (2026, 10, 17, 9, 30, 0)
+        first = write_report_ooxml(slot_texts, body, date_time=fixed).getvalue()
+        assert write_report_ooxml(slot_texts, body, date_time=fixed).getvalue() == first
+        with zipfile.ZipFile(BytesIO(first)) as package:
+            assert {info.date_time for info in package.infolist()} == {fixed}
@@ -0,0 +1,154 @@
+"""
+가중치 프로파일 단위 테스트
+"""
+
+import copy
+import json
+import random
+
+import numpy as np
+import pytest
+from app.batch import main
+from app.core import profiles as profiles_module
+from app.core.predictor import predict_satisfaction, load_weights
+from app.core.profiles import WeightProfiles, summarize_profile_scores, profile_name_from_path
+from app.core.weights import DEFAULT_WEIGHTS_PATH, WeightsRegistry
+
+
+def make_variant(base_score: int, speech_shift: int = 0) -> dict:
+    """기본 가중치에서 파생한 테스트용 가중치"""
+    weights = copy.deepcopy(load_weights())
+    weights['base_score'] = base_score
+    for range_config in weights['speech_score_weights']['ranges']:
+        range_config['weight'] += speech_shift
+    return weights
+
+
+class TestWeightProfiles:
+    """WeightProfiles 테스트"""
+
+    def test_score_batch_matches_scalar(self, make_features):
+        """프로파일 × 레코드 점수 행렬이 프로파일별 단건 예측과 동일한지 테스트"""
+        variants = {'default': load_weights(), 'trial_a': make_variant(50, 3), 'trial_b': make_variant(40, -2)}
+        profiles = WeightProfiles(variants)
+
+        rng = random.Random(42)
+        features_list = [make_features(rng) for _ in range(1000)]
+        features_list[0]['speech_score'] = 70.25  # 0.5 단위가 아닌 값
+        result = profiles.score_batch(features_list)
+
+        assert result['profiles'] == ['default', 'trial_a', 'trial_b']
+        assert result['final_score'].shape == (3, 1000)
+        for p, weights in enumerate(variants.values()):
+            for i, features in enumerate(features_list):
+                score, breakdown = predict_satisfaction(features, weights)
+                assert result['final_score'][p, i] == score
+                assert result['speech_score'][p, i] == breakdown['speech_score']
+
+    def test_score_features(self, make_features):
+        """특징 한 건 다중 프로파일 예측 테스트"""
+        profiles = WeightProfiles({'default': load_weights(), 'trial': make_variant(60)})
+        features = make_features(random.Random(1))
+
+        expected = {name: predict_satisfaction(features, weights) for name, weights in
+                    (('default', load_weights()), ('trial', make_variant(60)))}
+        result = profiles.score_features(features)
+        for name, (score, breakdown) in expected.items():
+            detail = breakdown.pop('unilateral_detail')
+            assert result['scores'][name] == score
+            assert {key: value for key, value in result['breakdowns'][name].items() if key != 'unilateral_detail'} == breakdown
+            assert result['breakdowns'][name]['unilateral_detail'] == {
+                'is_unilateral': detail['is_unilateral'], 'penalty': detail['penalty']
+            }
+
+    def test_score_features_stacked(self, monkeypatch, make_features):
+        """단건도 프로파일별 예측 대신 쌓은 가중치로 한 번에 계산"""
+        profiles = WeightProfiles({'default': load_weights(), 'trial': make_variant(60)})
+        calls = []
+        original = profiles_module.predict_satisfaction_stacked
+        monkeypatch.setattr(profiles_module, 'predict_satisfaction_stacked',
+                            lambda *args: calls.append(args) or original(*args))
+        result = profiles.score_features(make_features(random.Random(2)))
+
+        assert len(calls) == 1
+        assert all(isinstance(score, int) for score in result['scores'].values())
+
+    def test_missing_binaural(self, make_features):
+        """binaural 섹션이 없는 프로파일은 단측 착용 행만 제외, 다른 프로파일 점수는 유지"""
+        no_binaural = make_variant(50)
+        del no_binaural['binaural']
+        profiles = WeightProfiles({'default': load_weights(), 'no_binaural': no_binaural})
+
+        rng = random.Random(7)
+        features_list = [make_features(rng) for _ in range(300)]
+        unilateral = np.array([features['fitting_plan'] != 'bilateral' for features in features_list])
+        assert unilateral.any() and not unilateral.all()
+        result = profiles.score_batch(features_list)
+
+        assert result['scored'][0].all()
+        assert np.array_equal(result['scored'][1], ~unilateral)
+        for i, features in enumerate(features_list):
+            assert result['final_score'][0, i] == predict_satisfaction(features, load_weights())[0]
+            if not unilateral[i]:
+                assert result['final_score'][1, i] == predict_satisfaction(features, no_binaural)[0]
+
+        summary = {item['profile']: item for item in summarize_profile_scores(result)}
+        assert summary['default']['scored'] == 300
+        assert summary['no_binaural']['scored'] == int((~unilateral).sum())
+
+        single = profiles.score_features(features_list[int(np.argmax(unilateral))])
+        assert single['scores']['no_binaural'] is None and single['breakdowns']['no_binaural'] is None
+        assert isinstance(single['scores']['default'], int)
+
+    def test_compare_missing_binaural(self, valid_record, tmp_path):
+        """compare: binaural 설정이 없는 프로파일은 단측 착용 행만 null"""
+        no_binaural = make_variant(50)
+        del no_binaural['binaural']
+        weights_path = tmp_path / 'weights.trial.json'
+        weights_path.write_text(json.dumps(no_binaural), encoding='utf-8')
+        input_path = tmp_path / 'input.jsonl'
+        plans = ['bilateral', 'unilateral_left', 'bilateral', 'unilateral_right']
+        input_path.write_text('\n'.join(
+            json.dumps(dict(valid_record, fitting_plan=plan), ensure_ascii=False) for plan in plans
+        ), encoding='utf-8')
+        output = tmp_path / 'scores.jsonl'
+
+        assert main(['compare', str(input_path), '--profile', f'trial={weights_path}', '-o', str(output)]) == 0
+        rows = [json.loads(line) for line in output.read_text(encoding='utf-8').splitlines()]
+        assert [row['scores']['trial'] is None for row in rows] == [False, True, False, True]
+        assert all(isinstance(row['scores']['default'], int) for row in rows)
+
+    def test_file_profiles_reload(self, tmp_path, make_features):
+        """파일 프로파일이 변경 시 다시 로드되는지 테스트"""
+        path = tmp_path / 'weights.trial.json'
+        path.write_text(json.dumps(make_variant(40)), encoding='utf-8')
+        profiles = WeightProfiles.from_directory(tmp_path, registry=WeightsRegistry(check_interval=0))
+        assert profiles.names == ['trial']
+
+        features = [make_features(random.Random(3))]
+        first = profiles.score_batch(features)['base'][0, 0]
+
+        path.write_text(json.dumps(make_variant(41)), encoding='utf-8')
+        profiles._registry.invalidate(path)
+        assert profiles.score_batch(features)['base'][0, 0] == first + 1
+
+    def test_summary(self, make_features):
+        """A/B 요약 테스트"""
+        profiles = WeightProfiles({'default': load_weights(), 'plus5': make_variant(load_weights()['base_score'] + 5)})
+        rng = random.Random(5)
+        result = profiles.score_batch([make_features(rng) for _ in range(200)])
+
+        summary = {item['profile']: item for item in summarize_profile_scores(result)}
+        assert summary['default']['mean_delta'] == 0
+        assert summary['plus5']['mean_delta'] > 0
+        assert summary['plus5']['changed_ratio'] > 0
+
+    def test_profile_name(self):
+        """파일명 → 프로파일 이름 테스트"""
+        assert profile_name_from_path(DEFAULT_WEIGHTS_PATH) == 'default'
+        assert profile_name_from_path('weights.custom.example.json') == 'custom.example'
+
+    def test_empty(self, make_features):
+        """프로파일 없음 ValueError 테스트"""
+        with pytest.raises(ValueError):
+            WeightProfiles().score_batch([make_features(random.Random(1))])
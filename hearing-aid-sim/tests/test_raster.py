@@ -0,0 +1,47 @@
+"""
+내장 차트 렌더러 테스트
+"""
+
+from io import BytesIO
+
+import pytest
+from PIL import Image
+from app.viz.raster import render_audiogram, render_bar, render_gauge
+
+
+def open_png(data: bytes) -> Image.Image:
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    return Image.open(BytesIO(data))
+
+
+class TestRaster:
+    """PNG 크기 및 내용 테스트"""
+
+    def test_audiogram(self):
+        """청력도는 배율을 적용한 크기의 PNG, 좌/우 색상 포함"""
+        data = render_audiogram(
+            {"audiogram_left_500hz": 40, "audiogram_left_1000hz": 50, "audiogram_right_2000hz": 60},
+            width=600, height=400, scale=2
+        )
+        image = open_png(data).convert("RGB")
+        assert image.size == (1200, 800)
+        colors = {color for _, color in image.getcolors(maxcolors=1 << 16)}
+        assert (0x3b, 0x82, 0xf6) in colors  # 좌측 (파란색)
+        assert (0xef, 0x44, 0x44) in colors  # 우측 (빨간색)
+
+    def test_audiogram_without_data(self):
+        """주파수별 데이터가 없으면 None (create_audiogram과 동일)"""
+        assert render_audiogram({"audiogram_left_pta": 40}) is None
+
+    @pytest.mark.parametrize("score", [0, 39, 55, 70, 85, 100])
+    def test_score_charts(self, score):
+        """점수 구간 경계값에서도 PNG 생성"""
+        assert open_png(render_bar(score, width=600, height=250, scale=1)).size == (600, 250)
+        assert open_png(render_gauge(score, width=600, height=400, scale=1)).size == (600, 400)
+
+    def test_bar_color_by_score(self):
+        """바 색상은 점수 구간을 따름"""
+        high = open_png(render_bar(90, scale=1)).convert("RGB")
+        low = open_png(render_bar(30, scale=1)).convert("RGB")
+        assert high.getpixel((120, 125)) == (0x10, 0xb9, 0x81)
+        assert low.getpixel((120, 125)) == (0xef, 0x44, 0x44)
@@ -0,0 +1,102 @@
+"""
+차트 이미지 변환 워커 풀 테스트
+"""
+
+import os
+import time
+
+import pytest
+from app.report.render_pool import RenderError, RenderPool, RenderTimeout
+from app.viz.charts import create_gauge
+
+
+# 크기에 따라 동작이 달라지는 변환 함수 (kaleido 대신 워커 프로세스에서 실행)
+CRASH_WIDTH = 13
+SLOW_WIDTH = 17
+ERROR_WIDTH = 19
+
+
+def fake_render(figure, format, width, height, scale):
+    if width == CRASH_WIDTH:
+        os._exit(3)
+    if width == SLOW_WIDTH:
+        time.sleep(10)
+    if width == ERROR_WIDTH:
+        raise ValueError("변환 불가")
+    return f"{format}:{width}x{height}@{scale}:{len(figure['data'])}:{os.getpid()}".encode()
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with RenderPool(workers=2, timeout=2.0, renderer=fake_render) as pool:
+        yield pool
+
+
+class TestRenderPool:
+    """워커 풀 변환/오류/재시작 테스트"""
+
+    def test_render(self, pool):
+        """워커 프로세스에서 변환 결과 반환"""
+        data = pool.render(create_gauge(70), width=600, height=400, scale=2)
+        format_size, traces, pid = data.decode().rsplit(":", 2)
+        assert format_size == "png:600x400@2"
+        assert traces == "1"
+        assert int(pid) != os.getpid()
+
+    def test_render_many_keeps_order(self, pool):
+        """여러 차트 변환 시 입력 순서 유지, 워커 재사용"""
+        results = pool.render_many([create_gauge(score) for score in range(10)], width=100, height=50)
+        assert len(results) == 10
+        assert all(item.startswith(b"png:100x50@2:1:") for item in results)
+        assert len({item.rsplit(b":", 1)[1] for item in results}) <= 2
+
+    def test_render_error(self, pool):
+        """변환 오류는 RenderError, 워커는 계속 사용"""
+        with pytest.raises(RenderError, match="변환 불가"):
+            pool.render(create_gauge(50), width=ERROR_WIDTH)
+        assert pool.render(create_gauge(50), width=10)
+
+    def test_crash_restarts_worker(self, pool):
+        """워커가 비정상 종료되면 요청은 실패하고 워커는 다시 시작"""
+        restarts = pool.restarts
+        with pytest.raises(RenderError, match="종료"):
+            pool.render(create_gauge(50), width=CRASH_WIDTH)
+        assert pool.restarts == restarts + 1
+        assert pool.render_many([create_gauge(50)] * 4, width=10)
+
+    def test_timeout_restarts_worker(self, pool):
+        """시간 초과 시 RenderTimeout, 워커는 다시 시작"""
+        restarts = pool.restarts
+        future = pool.submit(create_gauge(50), width=SLOW_WIDTH, timeout=0.5)
+        with pytest.raises(RenderTimeout):
+            future.result()
+        assert pool.restarts == restarts + 1
+        assert pool.render(create_gauge(50), width=10)
+
+    def test_timeout_includes_queue_wait(self):
+        """앞선 요청을 기다리는 시간도 timeout에 포함 (시작하지 못한 요청은 취소)"""
+        with RenderPool(workers=1, timeout=2.0, renderer=fake_render) as pool:
+            assert pool.render(create_gauge(50), width=10)
+            for wait in (
+                lambda: pool.render(create_gauge(50), width=10, timeout=0.3),
+                lambda: pool.render_many([create_gauge(50)] * 3, width=10, timeout=0.3),
+            ):
+                busy = pool.submit(create_gauge(50), width=SLOW_WIDTH, timeout=1.0)
+                started = time.monotonic()
+                with pytest.raises(RenderTimeout):
+                    wait()
+                assert time.monotonic() - started < 0.9
+                with pytest.raises(RenderTimeout):
+                    busy.result()
+            assert pool.render(create_gauge(50), width=10)
+
+    def test_closed_pool(self):
+        """닫힌 풀에는 요청 불가"""
+        pool = RenderPool(workers=1, renderer=fake_render)
+        pool.close()
+        with pytest.raises(RenderError):
+            pool.submit(create_gauge(50))
+
+    def test_invalid_workers(self):
+        with pytest.raises(ValueError):
+            RenderPool(workers=0)
@@ -0,0 +1,111 @@
+"""
+다운로드용 리포트 묶음 테스트
+"""
+
+import json
+import threading
+import time
+from datetime import datetime
+from io import BytesIO
+
+import pytest
+from docx import Document
+from app.bench import prepare_cohort
+from app.report import bundle as bundle_module
+from app.report.bundle import ReportBundle
+
+
+@pytest.fixture(scope="module")
+def prediction():
+    item = prepare_cohort(1)[0]
+    item["input_dict"]["customer_name"] = "홍길동"
+    return item
+
+
+@pytest.fixture
+def make_bundle(prediction):
+    def make() -> ReportBundle:
+        return ReportBundle(
+            prediction["input_dict"], prediction["features"], prediction["score"],
+            prediction["satisfaction_level"], prediction["summary"], prediction["recommendations"],
+            prediction["breakdown"]
+        )
+    return make
+
+
+@pytest.fixture
+def word_calls(monkeypatch):
+    """Word 리포트 생성 횟수 기록"""
+    calls = []
+    original = bundle_module.build_report_docx
+
+    def counting(**kwargs):
+        calls.append(threading.get_ident())
+        time.sleep(0.05)
+        return original(**kwargs)
+
+    monkeypatch.setattr(bundle_module, "build_report_docx", counting)
+    return calls
+
+
+class TestReportBundle:
+    """요청 시 생성 및 재사용 테스트"""
+
+    def test_nothing_built_until_requested(self, make_bundle, word_calls):
+        bundle = make_bundle()
+        assert word_calls == []
+        assert not any(bundle.is_built(kind) for kind in ("word", "text", "json"))
+
+    def test_reports(self, make_bundle):
+        bundle = make_bundle()
+        paragraphs = [p.text for p in Document(BytesIO(bundle.word())).paragraphs]
+        assert "홍길동님을 위한 맞춤 분석" in paragraphs
+        assert "보청기 만족도 예측 리포트" in bundle.text()
+        assert json.loads(bundle.json())
+        assert all(bundle.is_built(kind) for kind in ("word", "text", "json"))
+
+    def test_built_once(self, make_bundle, word_calls):
+        """같은 리포트를 다시 요청하면 보관한 결과 반환"""
+        bundle = make_bundle()
+        first = bundle.word()
+        assert bundle.word() is first
+        assert len(word_calls) == 1
+        assert not bundle.is_built("text")
+
+    def test_concurrent_requests_build_once(self, make_bundle, word_calls):
+        """다운로드 콜백이 동시에 실행되어도 한 번만 생성"""
+        bundle = make_bundle()
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(bundle.word())) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(word_calls) == 1
+        assert len({id(result) for result in results}) == 1
+
+    def test_error_not_cached(self, make_bundle, monkeypatch):
+        """생성 오류는 보관하지 않고 다음 요청에서 다시 시도"""
+        bundle = make_bundle()
+        monkeypatch.setattr(bundle_module, "generate_text_report", lambda **kwargs: 1 / 0)
+        with pytest.raises(ZeroDivisionError):
+            bundle.text()
+        assert not bundle.is_built("text")
+
+        monkeypatch.setattr(bundle_module, "generate_text_report", lambda **kwargs: "리포트")
+        assert bundle.text() == "리포트"
+
+    def test_timestamp(self, make_bundle):
+        bundle = make_bundle()
+        assert bundle.timestamp() == bundle.created_at.strftime("%Y%m%d_%H%M%S")
+
+    def test_word_dated_by_bundle(self, prediction):
+        """Word 작성일은 묶음을 만든(예측한) 날짜와 같음 (파일 이름과 일치)"""
+        bundle = ReportBundle(
+            prediction["input_dict"], prediction["features"], prediction["score"],
+            prediction["satisfaction_level"], prediction["summary"], prediction["recommendations"],
+            prediction["breakdown"], created_at=datetime(2025, 3, 4, 9, 30)
+        )
+        paragraphs = [p.text for p in Document(BytesIO(bundle.word())).paragraphs]
+        assert "작성일: 2025년 03월 04일" in paragraphs
+        assert bundle.timestamp() == "20250304_093000"
@@ -0,0 +1,81 @@
+"""
+예측 결과 캐시 테스트
+"""
+
+import threading
+import time
+
+import pytest
+from app.core.result_cache import ResultCache, input_key
+
+
+INPUT = {"age": 68, "budget": "mid", "main_complaints": ["소음"], "asymmetry_db": None}
+
+
+class TestInputKey:
+    """캐시 키 테스트"""
+
+    def test_canonical(self):
+        """키 순서가 달라도 같은 키"""
+        reordered = dict(reversed(list(INPUT.items())))
+        assert input_key(INPUT, "1.0:1:2", chart_type="bar") == input_key(reordered, "1.0:1:2", chart_type="bar")
+
+    def test_changes(self):
+        """입력, 가중치, 화면 설정이 다르면 다른 키"""
+        key = input_key(INPUT, "1.0:1:2", chart_type="bar")
+        assert input_key(dict(INPUT, age=69), "1.0:1:2", chart_type="bar") != key
+        assert input_key(INPUT, "1.0:1:3", chart_type="bar") != key
+        assert input_key(INPUT, "1.0:1:2", chart_type="gauge") != key
+
+
+class TestResultCache:
+    """LRU 보관 및 재사용 테스트"""
+
+    def test_reuse(self):
+        cache = ResultCache()
+        calls = []
+        build = lambda: calls.append(1) or {"score": 70}
+        first = cache.get_or_build("a", build)
+        assert cache.get_or_build("a", build) is first
+        assert len(calls) == 1
+        assert cache.stats() == {"entries": 1, "hits": 1, "misses": 1, "evictions": 0}
+
+    def test_eviction(self):
+        """가장 오래 사용하지 않은 결과부터 삭제"""
+        cache = ResultCache(max_entries=2)
+        cache.get_or_build("a", lambda: "A")
+        cache.get_or_build("b", lambda: "B")
+        cache.get("a")
+        cache.get_or_build("c", lambda: "C")
+        assert cache.get("b") is None
+        assert cache.get("a") == "A" and cache.get("c") == "C"
+        assert cache.stats()["evictions"] == 1
+
+    def test_disabled(self):
+        """max_entries=0이면 보관하지 않음"""
+        cache = ResultCache(max_entries=0)
+        assert cache.get_or_build("a", lambda: "A") == "A"
+        assert cache.get("a") is None
+
+    def test_error_not_cached(self):
+        cache = ResultCache()
+        with pytest.raises(ZeroDivisionError):
+            cache.get_or_build("a", lambda: 1 / 0)
+        assert cache.get_or_build("a", lambda: "A") == "A"
+
+    def test_concurrent_same_key_shares_result(self):
+        """같은 키를 동시에 계산해도 모두 같은 결과 객체를 받음"""
+        cache = ResultCache()
+        results = []
+
+        def build():
+            time.sleep(0.02)
+            return object()
+
+        threads = [threading.Thread(target=lambda: results.append(cache.get_or_build("a", build))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len({id(result) for result in results}) == 1
+        assert cache.get("a") is results[0]
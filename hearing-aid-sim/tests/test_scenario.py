@@ -0,0 +1,81 @@
+"""
+시나리오 비교 단위 테스트
+"""
+
+import pytest
+from app.core.predictor import predict_satisfaction, load_weights
+from app.core.scenario import sweep_scenarios, scenario_matrix
+
+
+BASE_FEATURES = {
+    'pta_avg': 52.5,
+    'pta_left': 45.0,
+    'pta_right': 60.0,
+    'loss_level': 'moderate',
+    'asymmetry_db': 15.0,
+    'speech_score': 72.5,
+    'tinnitus': True,
+    'experience': False,
+    'lifestyle': 'noisy',
+    'budget': 'low',
+    'desired_type': 'CIC',
+    'fitting_plan': 'unilateral_left',
+    'age': 72
+}
+
+
+class TestScenarioSweep:
+    """sweep_scenarios 테스트"""
+
+    def test_full_grid_matches_predictor(self):
+        """전체 4×3×3×3 조합이 predict_satisfaction과 동일한지 테스트"""
+        weights = load_weights()
+        rows = sweep_scenarios(BASE_FEATURES, weights=weights)
+
+        assert len(rows) == 4 * 3 * 3 * 3
+        for row in rows:
+            features = dict(
+                BASE_FEATURES,
+                desired_type=row['desired_type'],
+                budget=row['budget'],
+                fitting_plan=row['fitting_plan'],
+                lifestyle=row['lifestyle']
+            )
+            score, breakdown = predict_satisfaction(features, weights)
+            assert row['score'] == score
+            assert row['breakdown'] == breakdown
+
+    def test_ranking(self):
+        """점수 내림차순 순위 및 현재 선택 표시 테스트"""
+        rows = sweep_scenarios(BASE_FEATURES)
+        scores = [row['score'] for row in rows]
+
+        assert scores == sorted(scores, reverse=True)
+        assert [row['rank'] for row in rows] == list(range(1, len(rows) + 1))
+        current = [row for row in rows if row['is_current']]
+        assert len(current) == 1
+        assert current[0]['delta'] == 0
+
+    def test_partial_axes(self):
+        """일부 축과 후보값 지정 테스트"""
+        rows = sweep_scenarios(BASE_FEATURES, axes={'desired_type': ['RIC', 'BTE'], 'budget': None})
+        assert len(rows) == 2 * 3
+        assert {row['fitting_plan'] for row in rows} == {'unilateral_left'}
+
+    def test_invalid_axis(self):
+        """잘못된 축 ValueError 테스트"""
+        with pytest.raises(ValueError):
+            sweep_scenarios(BASE_FEATURES, axes=['age'])
+        with pytest.raises(ValueError):
+            sweep_scenarios(BASE_FEATURES, axes={'budget': ['premium']})
+
+    def test_matrix(self):
+        """비교표 변환 테스트"""
+        rows = sweep_scenarios(BASE_FEATURES, axes=['desired_type', 'fitting_plan', 'budget'])
+        matrix = scenario_matrix(rows, 'desired_type', 'fitting_plan', fixed={'budget': 'low'})
+
+        assert matrix['rows'] == ['BTE', 'RIC', 'ITE', 'CIC']
+        assert matrix['columns'] == ['bilateral', 'unilateral_left', 'unilateral_right']
+        for (device, plan), score in matrix['scores'].items():
+            features = dict(BASE_FEATURES, desired_type=device, fitting_plan=plan)
+            assert score == predict_satisfaction(features)[0]
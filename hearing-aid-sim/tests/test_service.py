@@ -0,0 +1,283 @@
+"""
+로컬 예측 HTTP 서비스 테스트
+"""
+
+import asyncio
+import json
+
+import pytest
+from app import service
+from app.bench import synthetic_inputs
+from app.core.batch_predictor import BREAKDOWN_KEYS
+from app.core.predictor import predict_satisfaction, get_satisfaction_level
+from app.core.preprocess import preprocess_inputs
+from app.core.schema import UserInput
+from app.service import predict_features, start_service
+
+
+def expected_prediction(record: dict) -> dict:
+    score, breakdown = predict_satisfaction(preprocess_inputs(UserInput(**record)))
+    return {
+        "score": score,
+        "satisfaction_level": get_satisfaction_level(score),
+        "breakdown": {key: breakdown[key] for key in BREAKDOWN_KEYS},
+    }
+
+
+def encode_request(method: str, path: str, payload=None, raw: bytes = None, headers: str = "") -> bytes:
+    body = raw if raw is not None else (b"" if payload is None else json.dumps(payload).encode("utf-8"))
+    return (
+        f"{method} {path} HTTP/1.1\r\nHost: test\r\n{headers}Content-Length: {len(body)}\r\n\r\n"
+    ).encode("latin-1") + body
+
+
+async def read_response(reader) -> tuple[int, dict, object]:
+    head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+    status = int(head[0].split(" ")[1])
+    headers = {}
+    for line in head[1:]:
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    body = await reader.readexactly(int(headers.get("content-length", 0)))
+    return status, headers, json.loads(body) if body else None
+
+
+def run_with_service(scenario, **options):
+    """임의 포트로 서비스를 띄우고 scenario(host, port, service) 실행"""
+    async def main():
+        server, svc = await start_service("127.0.0.1", 0, **options)
+        host, port = server.sockets[0].getsockname()[:2]
+        try:
+            return await scenario(host, port, svc)
+        finally:
+            server.close()
+            await server.wait_closed()
+    return asyncio.run(main())
+
+
+async def request(host, port, method, path, payload=None, **kwargs):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write(encode_request(method, path, payload, **kwargs))
+        return await read_response(reader)
+    finally:
+        writer.close()
+
+
+class TestPredictFeatures:
+    """묶음 예측 결과 테스트"""
+
+    def test_vector_path_matches_scalar(self):
+        """NumPy 배치 예측과 건별 예측 결과가 같음"""
+        records = synthetic_inputs(service.VECTOR_MIN_BATCH * 3, seed=3)
+        features = [preprocess_inputs(UserInput(**record)) for record in records]
+        vector = predict_features(features)
+        scalar = [predict_features([item])[0] for item in features]
+        assert vector == scalar
+        assert json.dumps(vector) == json.dumps(scalar)
+        assert scalar[0] == expected_prediction(records[0])
+
+
+class TestService:
+    """HTTP 엔드포인트 테스트"""
+
+    def test_predict(self, valid_record):
+        async def scenario(host, port, svc):
+            return await request(host, port, "POST", "/predict", valid_record)
+
+        status, headers, body = run_with_service(scenario)
+        assert status == 200
+        assert headers["connection"] == "keep-alive"
+        assert body == expected_prediction(valid_record)
+
+    def test_errors(self, valid_record):
+        async def scenario(host, port, svc):
+            return [
+                await request(host, port, "POST", "/predict", dict(valid_record, age=5)),
+                await request(host, port, "POST", "/predict", raw=b"{"),
+                await request(host, port, "POST", "/predict", [valid_record]),
+                await request(host, port, "GET", "/predict"),
+                await request(host, port, "GET", "/unknown"),
+            ]
+
+        results = run_with_service(scenario)
+        assert [status for status, _, _ in results] == [422, 400, 400, 405, 404]
+        assert results[0][2]["errors"][0]["field"] == "age"
+        assert results[3][1]["allow"] == "POST"
+
+    def test_batch_endpoint(self):
+        """입력 순서대로 결과, 실패 항목은 오류 목록"""
+        records = synthetic_inputs(40, seed=5)
+        records[3] = dict(records[3], age=5)
+        records[7] = "잘못된 항목"
+
+        async def scenario(host, port, svc):
+            return await request(host, port, "POST", "/predict/batch", {"records": records})
+
+        status, _, body = run_with_service(scenario)
+        assert status == 200
+        results = body["results"]
+        assert [item["index"] for item in results] == list(range(40))
+        assert [i for i, item in enumerate(results) if not item["ok"]] == [3, 7]
+        assert results[3]["errors"][0]["field"] == "age"
+        for item, record in zip(results, records):
+            if item["ok"]:
+                assert {key: item[key] for key in ("score", "satisfaction_level", "breakdown")} == expected_prediction(record)
+
+    def test_batch_limit(self, valid_record):
+        async def scenario(host, port, svc):
+            return await request(host, port, "POST", "/predict/batch", [valid_record] * 3)
+
+        status, _, _ = run_with_service(scenario, max_batch_records=2)
+        assert status == 413
+
+    def test_batch_is_chunked(self, monkeypatch):
+        """큰 배치 요청은 max_batch건씩 나눠 처리하고 그 사이 다른 요청에 응답"""
+        records = synthetic_inputs(45, seed=11)
+        records[12] = dict(records[12], age=5)
+        chunks = []
+        monkeypatch.setattr(service, "predict_features", lambda features, weights: (
+            chunks.append(len(features)) or predict_features(features, weights)
+        ))
+
+        async def scenario():
+            svc = service.PredictionService(max_batch=10)
+            replies = []
+            reply = lambda name: lambda status, payload, headers=(): replies.append((name, status, payload))
+            svc.handle("POST", "/predict/batch", json.dumps(records).encode("utf-8"), reply("batch"))
+            svc.handle("GET", "/health", b"", reply("health"))
+            while len(replies) < 2:
+                await asyncio.sleep(0)
+            return replies
+
+        replies = asyncio.run(scenario())
+        assert [(name, status) for name, status, _ in replies] == [("health", 200), ("batch", 200)]
+        assert chunks == [10, 9, 10, 10, 5]
+        results = replies[1][2]["results"]
+        assert [item["index"] for item in results] == list(range(45))
+        assert results[12]["errors"][0]["field"] == "age"
+        for item, record in zip(results, records):
+            if item["ok"]:
+                assert {key: item[key] for key in ("score", "satisfaction_level", "breakdown")} == expected_prediction(record)
+
+    def test_batch_chunk_error(self, monkeypatch):
+        """나눠 처리하던 중 오류가 나면 500 한 번만 응답"""
+        records = synthetic_inputs(25, seed=13)
+        calls = []
+
+        def failing(features, weights):
+            calls.append(len(features))
+            if len(calls) == 2:
+                raise RuntimeError("예측 실패")
+            return predict_features(features, weights)
+
+        monkeypatch.setattr(service, "predict_features", failing)
+
+        async def scenario():
+            svc = service.PredictionService(max_batch=10)
+            replies = []
+            svc.handle("POST", "/predict/batch", json.dumps(records).encode("utf-8"),
+                       lambda status, payload, headers=(): replies.append((status, payload)))
+            for _ in range(10):
+                await asyncio.sleep(0)
+            return replies
+
+        replies = asyncio.run(scenario())
+        assert calls == [10, 10]
+        assert replies == [(500, {"error": "RuntimeError: 예측 실패"})]
+
+    def test_sweep(self, valid_record):
+        async def scenario(host, port, svc):
+            return [
+                await request(host, port, "POST", "/sweep", {"input": valid_record, "axes": ["budget"], "top": 2}),
+                await request(host, port, "POST", "/sweep", {"input": valid_record, "axes": ["unknown"]}),
+            ]
+
+        (status, _, body), (error_status, _, _) = run_with_service(scenario)
+        assert status == 200
+        assert body["count"] == 3
+        assert len(body["scenarios"]) == 2
+        assert body["current_score"] == expected_prediction(valid_record)["score"]
+        assert error_status == 400
+
+    def test_keep_alive_and_pipelining(self, valid_record):
+        """한 연결에서 여러 요청을 한꺼번에 보내도 요청 순서대로 응답"""
+        records = synthetic_inputs(5, seed=7)
+
+        async def scenario(host, port, svc):
+            reader, writer = await asyncio.open_connection(host, port)
+            writer.write(b"".join(
+                [encode_request("POST", "/predict", record) for record in records]
+                + [encode_request("GET", "/health"), encode_request("POST", "/predict", valid_record)]
+            ))
+            responses = [await read_response(reader) for _ in range(len(records) + 2)]
+            writer.write(encode_request("GET", "/health", headers="Connection: close\r\n"))
+            last = await read_response(reader)
+            closed = await reader.read() == b""
+            writer.close()
+            return responses, last, closed
+
+        responses, last, closed = run_with_service(scenario)
+        assert [body for _, _, body in responses[:5]] == [expected_prediction(record) for record in records]
+        assert responses[5][2] == {"status": "ok"}
+        assert responses[6][2] == expected_prediction(valid_record)
+        assert last[1]["connection"] == "close"
+        assert closed
+
+    def test_concurrent_requests_are_batched(self):
+        """동시에 도착한 요청은 한 번에 예측"""
+        records = synthetic_inputs(64, seed=9)
+
+        async def scenario(host, port, svc):
+            results = await asyncio.gather(*(request(host, port, "POST", "/predict", record) for record in records))
+            metrics = (await request(host, port, "GET", "/metrics"))[2]
+            return results, metrics
+
+        results, metrics = run_with_service(scenario, max_delay=0.005)
+        assert [body for _, _, body in results] == [expected_prediction(record) for record in records]
+        assert metrics["batched_items"] == 64
+        assert metrics["batches"] < 64
+        assert metrics["max_batch_size"] > 1
+        assert metrics["requests"]["/predict"] == 64
+        assert metrics["latency"]["/predict"]["count"] == 64
+
+    def test_backpressure(self, valid_record):
+        """대기열이 가득 차면 429"""
+        async def scenario(host, port, svc):
+            return await asyncio.gather(*(request(host, port, "POST", "/predict", valid_record) for _ in range(6)))
+
+        results = run_with_service(scenario, max_queue=2, max_delay=0.2)
+        statuses = sorted(status for status, _, _ in results)
+        assert statuses == [200, 200, 429, 429, 429, 429]
+        rejected = next(headers for status, headers, _ in results if status == 429)
+        assert rejected["retry-after"] == "1"
+
+    def test_body_limit_closes_connection(self):
+        async def scenario(host, port, svc):
+            reader, writer = await asyncio.open_connection(host, port)
+            writer.write(b"POST /predict HTTP/1.1\r\nContent-Length: 100\r\n\r\n")
+            response = await read_response(reader)
+            closed = await reader.read() == b""
+            writer.close()
+            return response, closed
+
+        (status, headers, _), closed = run_with_service(scenario, max_body_bytes=10)
+        assert status == 413
+        assert headers["connection"] == "close"
+        assert closed
+
+    def test_cors(self, valid_record):
+        async def scenario(host, port, svc):
+            return [
+                await request(host, port, "OPTIONS", "/predict"),
+                await request(host, port, "POST", "/predict", valid_record),
+            ]
+
+        (preflight, preflight_headers, _), (status, headers, _) = run_with_service(
+            scenario, cors_origin="http://localhost:3000"
+        )
+        assert preflight == 204
+        assert "POST" in preflight_headers["access-control-allow-methods"]
+        assert status == 200
+        assert headers["access-control-allow-origin"] == "http://localhost:3000"
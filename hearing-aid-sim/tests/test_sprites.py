@@ -0,0 +1,202 @@
+"""
+점수 차트 스프라이트 테스트
+"""
+
+import os
+import stat
+from io import BytesIO
+
+import pytest
+from docx import Document
+from app.report.word_report import build_report_docx, CHART_RENDERER_ENV
+from app.viz import sprites
+from app.viz.charts import create_bar
+from app.viz.raster import render_bar
+from app.viz.sprites import (
+    ScoreSprites,
+    build_sprites,
+    load_sprites,
+    read_sprites,
+    save_sprites,
+    score_image,
+    sprite_path
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_sprites():
+    sprites.clear_loaded()
+    yield
+    sprites.wait_for_rebuilds()
+    sprites.clear_loaded()
+
+
+@pytest.fixture(scope="module")
+def bar_sprites():
+    """작은 크기 바 스프라이트 (내장 렌더러)"""
+    return build_sprites("bar", width=300, height=200, scale=1, renderer="native")
+
+
+class TestSprites:
+    """스프라이트 생성/저장/조회 테스트"""
+
+    def test_build(self, bar_sprites):
+        """0~100점 이미지가 점수별 렌더링 결과와 동일"""
+        assert bar_sprites.renderer == "native"
+        assert bar_sprites.style_hash == sprites.style_hash()
+        for score in (0, 39, 72, 100):
+            assert bar_sprites.image(score) == render_bar(score, width=300, height=200, scale=1)
+        # 범위 밖 점수는 0~100으로 제한
+        assert bar_sprites.image(130) == bar_sprites.image(100)
+        assert bar_sprites.image(-5) == bar_sprites.image(0)
+
+    def test_file_roundtrip(self, bar_sprites, tmp_path):
+        """저장한 파일을 다시 읽으면 같은 이미지 (다른 사용자도 읽을 수 있는 권한)"""
+        path = save_sprites(bar_sprites, tmp_path)
+        assert path == sprite_path("bar", 300, 200, 1, tmp_path)
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
+
+        loaded = read_sprites(path)
+        assert (loaded.kind, loaded.width, loaded.height, loaded.scale) == ("bar", 300, 200, 1)
+        assert all(loaded.image(score) == bar_sprites.image(score) for score in range(101))
+
+    def test_corrupt_file(self, tmp_path):
+        """손상된 파일은 None"""
+        path = tmp_path / "broken.sprite"
+        path.write_bytes(b"HASPRITE\x00\x00\x00\x02{}")
+        assert read_sprites(path) is None
+        assert read_sprites(tmp_path / "missing.sprite") is None
+
+    def test_load_uses_saved_file(self, bar_sprites, tmp_path, monkeypatch):
+        """스타일 해시가 같으면 저장된 파일 사용 (다시 그리지 않음)"""
+        save_sprites(bar_sprites, tmp_path)
+        monkeypatch.setattr(sprites, "build_sprites", pytest.fail)
+        loaded = load_sprites("bar", 300, 200, 1, directory=tmp_path)
+        assert loaded.image(50) == bar_sprites.image(50)
+        assert load_sprites("bar", 300, 200, 1, directory=tmp_path) is loaded
+
+    def test_miss_renders_single_score(self, bar_sprites, tmp_path, monkeypatch):
+        """파일이 없거나 스타일/렌더러가 다르면 해당 점수만 내장 렌더러로 그림 (재생성을 끈 경우)"""
+        monkeypatch.setattr(sprites, "build_sprites", pytest.fail)
+        monkeypatch.setenv(sprites.SPRITE_DIR_ENV, str(tmp_path))
+        monkeypatch.setenv(sprites.SPRITE_REBUILD_ENV, "0")
+        assert load_sprites("bar", 300, 200, 1) is None
+        assert score_image("bar", 50, 300, 200, 1) == bar_sprites.image(50)
+
+        stale = ScoreSprites("bar", 300, 200, 1, "native", "old-hash", [b"x"] * 101)
+        path = save_sprites(stale, tmp_path)
+        assert load_sprites("bar", 300, 200, 1) is None
+        assert score_image("bar", 50, 300, 200, 1) == bar_sprites.image(50)
+        assert read_sprites(path).style_hash == "old-hash"
+
+        # 렌더러를 지정하면 다른 렌더러로 만든 파일은 사용하지 않음
+        save_sprites(bar_sprites, tmp_path)
+        assert load_sprites("bar", 300, 200, 1, renderer="kaleido") is None
+        assert load_sprites("bar", 300, 200, 1).image(50) == bar_sprites.image(50)
+
+    def test_miss_rebuilds_in_background(self, bar_sprites, tmp_path, monkeypatch, caplog):
+        """파일이 없거나 스타일이 바뀌었으면 백그라운드에서 내장 렌더러로 한 번만 다시 만들고 경고"""
+        monkeypatch.setenv(sprites.SPRITE_DIR_ENV, str(tmp_path))
+        path = sprite_path("bar", 300, 200, 1)
+        save_sprites(ScoreSprites("bar", 300, 200, 1, "kaleido", "old-hash", [b"x"] * 101), tmp_path)
+
+        assert score_image("bar", 50, 300, 200, 1) == bar_sprites.image(50)
+        assert load_sprites("bar", 300, 200, 1) is None
+        sprites.wait_for_rebuilds()
+        rebuilt = load_sprites("bar", 300, 200, 1)
+        assert (rebuilt.renderer, rebuilt.style_hash) == ("native", sprites.style_hash())
+        assert rebuilt.image(50) == bar_sprites.image(50)
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
+        assert [record.levelname for record in caplog.records if "백그라운드" in record.getMessage()] == ["WARNING"]
+
+        # 없는 파일도 다시 만듦, kaleido 결과만 허용하는 조회는 경고만 (파일당 한 번)
+        caplog.clear()
+        assert load_sprites("bar", 320, 200, 1, renderer="kaleido") is None
+        assert load_sprites("bar", 320, 200, 1, renderer="kaleido") is None
+        assert not sprite_path("bar", 320, 200, 1).exists()
+        assert len(caplog.records) == 1 and "sprites build" in caplog.records[0].getMessage()
+        assert load_sprites("bar", 320, 200, 1) is None
+        sprites.wait_for_rebuilds()
+        assert load_sprites("bar", 320, 200, 1).renderer == "native"
+
+    def test_rebuild_failure_is_logged(self, tmp_path, monkeypatch, caplog):
+        """다시 만들지 못하면 경고만 남기고 점수별 그리기 계속"""
+        def fail(*args, **kwargs):
+            raise OSError("읽기 전용")
+
+        monkeypatch.setattr(sprites, "save_sprites", fail)
+        monkeypatch.setattr(sprites, "build_sprites", lambda *args, **kwargs: None)
+        monkeypatch.setenv(sprites.SPRITE_DIR_ENV, str(tmp_path))
+        assert load_sprites("bar", 300, 200, 1) is None
+        sprites.wait_for_rebuilds()
+        assert "읽기 전용" in caplog.text
+        assert score_image("bar", 50, 300, 200, 1)
+
+    def test_unknown_kind(self):
+        with pytest.raises(ValueError):
+            build_sprites("pie", renderer="native")
+
+    def test_cli_build(self, tmp_path):
+        """build 명령으로 스프라이트 파일 생성"""
+        code = sprites.main([
+            "build", "--kinds", "bar", "--width", "300", "--height", "200",
+            "--scale", "1", "--renderer", "native", "--dir", str(tmp_path)
+        ])
+        assert code == 0
+        assert read_sprites(sprite_path("bar", 300, 200, 1, tmp_path)) is not None
+
+    def test_cli_build_replaces_native_fallback(self, bar_sprites, tmp_path, monkeypatch):
+        """auto: kaleido 실패로 저장한 내장 렌더러 결과는 다음 build에서 kaleido로 교체, 최신 파일은 건너뜀"""
+        args = ["build", "--kinds", "bar", "--width", "300", "--height", "200", "--scale", "1", "--dir", str(tmp_path)]
+        path = sprite_path("bar", 300, 200, 1, tmp_path)
+
+        def kaleido_unavailable(*args):
+            raise RuntimeError("kaleido 없음")
+
+        monkeypatch.setattr(sprites, "_render_kaleido", kaleido_unavailable)
+        assert sprites.main(args) == 0
+        assert read_sprites(path).renderer == "native"
+        assert not sprites.is_current(read_sprites(path))
+        assert sprites.is_current(read_sprites(path), "native")
+
+        monkeypatch.setattr(sprites, "_render_kaleido", lambda kind, *size: [bar_sprites.image(i) for i in range(101)])
+        assert sprites.main(args) == 0
+        assert read_sprites(path).renderer == "kaleido"
+
+        built = []
+        monkeypatch.setattr(sprites, "build_sprites", lambda *args, **kwargs: built.append(args) or bar_sprites)
+        assert sprites.main(args) == 0
+        assert built == []
+        assert sprites.main(args + ["--force"]) == 0
+        assert len(built) == 1
+
+
+class TestWordReportScoreChart:
+    """Word 리포트 점수 차트 삽입 테스트"""
+
+    def test_score_chart_from_sprites(self, tmp_path, monkeypatch):
+        """점수 차트는 스프라이트 이미지를 그대로 삽입"""
+        monkeypatch.setenv(sprites.SPRITE_DIR_ENV, str(tmp_path))
+        monkeypatch.setenv(sprites.SPRITE_REBUILD_ENV, "0")
+        monkeypatch.setenv(CHART_RENDERER_ENV, "native")
+        user_input_dict = {
+            "customer_name": "홍길동",
+            "audiogram_left_pta": 45,
+            "audiogram_right_pta": 40,
+            "speech_score_left": 80,
+            "speech_score_right": 76,
+            "age": 68,
+        }
+        report = build_report_docx(
+            user_input_dict, {"loss_level": "moderate"}, 72, "높음", "요약입니다.", ["추천"], {},
+            chart_fig=create_bar(72)
+        )
+
+        images = [
+            rel.target_part.blob
+            for rel in Document(BytesIO(report.getvalue())).part.rels.values()
+            if "image" in rel.reltype
+        ]
+        assert score_image("bar", 72) in images
+        # 재생성을 끄면 스프라이트 파일을 만들지 않음
+        assert list(tmp_path.iterdir()) == []
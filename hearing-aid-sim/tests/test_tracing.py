@@ -0,0 +1,163 @@
+"""
+단계별 처리 시간 추적 테스트
+"""
+
+import random
+import threading
+
+import pytest
+from app.core import tracing
+from app.core.predictor import predict_satisfaction
+
+
+@pytest.fixture(autouse=True)
+def reset_tracing():
+    """테스트마다 추적 상태 초기화"""
+    was_enabled = tracing.is_enabled()
+    tracing.enable(capacity=tracing.DEFAULT_CAPACITY)
+    tracing.clear()
+    yield
+    tracing.clear()
+    if not was_enabled:
+        tracing.disable()
+
+
+@tracing.traced("test.add")
+def add(a, b):
+    return a + b
+
+
+class TestTracing:
+    """추적 API 테스트"""
+
+    def test_disabled_records_nothing(self):
+        """비활성화 상태에서는 기록하지 않고 결과는 그대로"""
+        tracing.disable()
+        assert tracing.span("x") is tracing.span("y")
+        with tracing.trace_run("run"):
+            assert add(1, 2) == 3
+        assert tracing.recent_runs() == []
+
+    def test_standalone_span(self):
+        """실행 밖의 단계는 단독 실행으로 기록"""
+        assert add(1, 2) == 3
+        runs = tracing.recent_runs()
+        assert len(runs) == 1
+        assert runs[0]["name"] == "test.add"
+        assert runs[0]["spans"][0]["wall_ms"] >= 0
+
+    def test_run_groups_spans(self):
+        """실행 안의 단계는 한 실행으로 묶이고 중첩 깊이 기록"""
+        with tracing.trace_run("예측"):
+            with tracing.span("outer"):
+                add(1, 2)
+            add(3, 4)
+
+        runs = tracing.recent_runs()
+        assert len(runs) == 1
+        spans = runs[0]["spans"]
+        assert [(item["stage"], item["depth"]) for item in spans] == [
+            ("test.add", 1), ("outer", 0), ("test.add", 0)
+        ]
+        assert runs[0]["total_ms"] >= spans[1]["wall_ms"]
+
+    def test_default_stage_name(self, make_features):
+        """데코레이터 기본 이름은 모듈명.함수명"""
+        predict_satisfaction(make_features(random.Random(0)))
+        assert tracing.recent_runs()[0]["name"] == "predictor.predict_satisfaction"
+
+    def test_exception_still_recorded(self):
+        """예외가 나도 단계와 실행 기록"""
+        with pytest.raises(ValueError):
+            with tracing.trace_run("실패"):
+                with tracing.span("raise"):
+                    raise ValueError("x")
+        assert tracing.recent_runs()[0]["spans"][0]["stage"] == "raise"
+
+    def test_ring_buffer(self):
+        """최근 capacity건만 보관 (최신순 반환)"""
+        tracing.enable(capacity=3)
+        for i in range(5):
+            with tracing.trace_run(f"run{i}"):
+                pass
+        assert [run["name"] for run in tracing.recent_runs()] == ["run4", "run3", "run2"]
+        assert len(tracing.recent_runs(2)) == 2
+
+    def test_stage_stats(self):
+        """단계별 p50/p95 (실행 내 반복 호출은 합산)"""
+        runs = [
+            {"name": "run", "total_ms": float(10 * i), "spans": [
+                {"stage": "a", "wall_ms": float(i), "alloc_blocks": i, "depth": 0},
+                {"stage": "a", "wall_ms": float(i), "alloc_blocks": 0, "depth": 0},
+            ]}
+            for i in range(1, 11)
+        ]
+        stats = {item["stage"]: item for item in tracing.stage_stats(runs)}
+        assert stats["a"]["runs"] == 10
+        assert stats["a"]["calls"] == 20
+        assert stats["a"]["p50_ms"] == pytest.approx(11.0)
+        assert stats["a"]["p95_ms"] == pytest.approx(19.1)
+        assert stats["a"]["max_ms"] == 20.0
+        assert stats["(전체)"]["p50_ms"] == pytest.approx(55.0)
+
+    def test_threads_are_isolated(self):
+        """스레드별 실행은 서로 섞이지 않음"""
+        barrier = threading.Barrier(2)
+
+        def worker(name):
+            with tracing.trace_run(name):
+                barrier.wait()
+                with tracing.span(f"{name}.stage"):
+                    pass
+
+        threads = [threading.Thread(target=worker, args=(name,)) for name in ("a", "b")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for run in tracing.recent_runs():
+            assert [item["stage"] for item in run["spans"]] == [f"{run['name']}.stage"]
+
+    def test_run_enabled_per_context(self):
+        """전역 설정이 꺼져 있어도 enabled=True 실행은 기록하고 다른 스레드는 기록하지 않음"""
+        tracing.disable()
+        started = threading.Event()
+        finished = threading.Event()
+
+        def other_session():
+            started.wait()
+            add(5, 6)
+            with tracing.trace_run("다른 세션", session="b"):
+                add(7, 8)
+            finished.set()
+
+        thread = threading.Thread(target=other_session)
+        thread.start()
+        with tracing.trace_run("예측", enabled=True, session="a"):
+            started.set()
+            finished.wait()
+            assert add(1, 2) == 3
+        thread.join()
+
+        assert not tracing.is_enabled()
+        runs = tracing.recent_runs()
+        assert [(run["name"], run["session"]) for run in runs] == [("예측", "a")]
+        assert [item["stage"] for item in runs[0]["spans"]] == ["test.add"]
+        assert tracing.span("x") is tracing.span("y")
+
+    def test_session_filter(self):
+        """세션별 조회"""
+        with tracing.trace_run("a1", session="a"):
+            add(1, 2)
+        with tracing.trace_run("b1", session="b"):
+            add(1, 2)
+        with tracing.trace_run("a2", session="a"):
+            add(1, 2)
+        with tracing.trace_run("전역 끔", enabled=False, session="a"):
+            pass
+        add(1, 2)
+
+        assert [run["name"] for run in tracing.recent_runs(session="a")] == ["a2", "a1"]
+        assert [run["name"] for run in tracing.recent_runs(1, session="b")] == ["b1"]
+        assert len(tracing.recent_runs()) == 4
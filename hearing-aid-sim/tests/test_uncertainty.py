@@ -0,0 +1,125 @@
+"""
+예측 신뢰도 추정 단위 테스트
+"""
+
+import json
+import random
+import time
+
+import numpy as np
+import pytest
+from app.batch import main
+from app.core.pipeline import score_record
+from app.core.predictor import predict_satisfaction
+from app.core.schema import FIELD_RULES, PredictionOutput
+from app.core.uncertainty import (
+    estimate_confidence,
+    estimate_confidence_batch,
+    build_prediction_output,
+    PTA_RANGES,
+    _perturbed_columns
+)
+
+
+@pytest.fixture
+def features_list(make_features):
+    rng = random.Random(9)
+    return [make_features(rng) for _ in range(20)]
+
+
+class TestEstimateConfidence:
+    """estimate_confidence 테스트"""
+
+    def test_point_score_matches_predictor(self, features_list):
+        """score는 오차 없는 예측 점수와 동일"""
+        for features in features_list:
+            estimate = estimate_confidence(features, n_samples=200)
+            score, _ = predict_satisfaction(features)
+            assert estimate['score'] == score
+
+    def test_result_ranges(self, features_list):
+        """구간/신뢰도/등급 확률 범위"""
+        for features in features_list:
+            estimate = estimate_confidence(features, n_samples=500)
+            low, high = estimate['interval']
+            assert 0 <= low <= high <= 100
+            assert 0 <= estimate['confidence'] <= 1
+            assert sum(estimate['level_probabilities'].values()) == pytest.approx(1)
+            assert estimate['samples'] == 500
+
+    def test_no_error_is_certain(self, features_list):
+        """오차가 없으면 구간 폭 0, 신뢰도 1"""
+        features = dict(features_list[0], speech_score_left=100, speech_score_right=100, speech_score=100)
+        estimate = estimate_confidence(features, pta_error_db=0, weight_error=0, n_samples=100)
+        assert estimate['interval'] == [estimate['score'], estimate['score']]
+        assert estimate['confidence'] == 1
+        assert estimate['std'] == 0
+
+    def test_pta_range_follows_schema(self, features_list):
+        """오차를 더한 PTA는 입력 허용 범위(UserInput 필드 제약) 안으로 제한"""
+        rules = {rule.name: rule for rule in FIELD_RULES}
+        assert PTA_RANGES['pta_left'] == (rules['audiogram_left_pta'].low, rules['audiogram_left_pta'].high)
+        assert PTA_RANGES['pta_right'] == (rules['audiogram_right_pta'].low, rules['audiogram_right_pta'].high)
+
+        edge = dict(features_list[0], pta_left=0, pta_right=120, asymmetry_db=120)
+        columns = _perturbed_columns([edge], 500, np.random.default_rng(0), pta_error_db=10, speech_words=25)
+        for column, (low, high) in PTA_RANGES.items():
+            assert low <= columns[column].min() and columns[column].max() <= high
+        assert columns['pta_left'].min() == 0 and columns['pta_right'].max() == 120
+
+    def test_more_error_wider_interval(self, features_list):
+        """오차가 클수록 구간이 넓어짐"""
+        features = features_list[0]
+        narrow = estimate_confidence(features, pta_error_db=1, weight_error=0.01)
+        wide = estimate_confidence(features, pta_error_db=20, weight_error=0.3)
+        assert wide['std'] > narrow['std']
+
+    def test_deterministic_seed(self, features_list):
+        """같은 시드는 같은 결과"""
+        assert estimate_confidence(features_list[1]) == estimate_confidence(features_list[1])
+
+    def test_batch_matches_shape(self, features_list):
+        """배치 결과는 환자 순서 유지"""
+        estimates = estimate_confidence_batch(features_list, n_samples=100)
+        assert len(estimates) == len(features_list)
+        for features, estimate in zip(features_list, estimates):
+            assert estimate['score'] == predict_satisfaction(features)[0]
+        assert estimate_confidence_batch([]) == []
+
+    def test_latency(self, features_list):
+        """환자 한 명당 20ms 이내 (기본 표본 수)"""
+        estimate_confidence(features_list[0])
+        started = time.perf_counter()
+        for features in features_list:
+            estimate_confidence(features)
+        assert (time.perf_counter() - started) / len(features_list) < 0.02
+
+    def test_build_prediction_output(self, features_list):
+        """PredictionOutput.confidence 채우기"""
+        estimate = estimate_confidence(features_list[0])
+        output = build_prediction_output(estimate, "요약", ["추천"])
+        assert isinstance(output, PredictionOutput)
+        assert output.confidence == estimate['confidence']
+        assert output.satisfaction_score == estimate['score']
+
+
+class TestPipelineConfidence:
+    """파이프라인 신뢰도 옵션 테스트"""
+
+    def test_score_record_confidence(self, valid_record):
+        result = score_record(valid_record, confidence=True)
+        assert result['ok']
+        assert result['confidence']['score'] == result['score']
+
+        assert 'confidence' not in score_record(valid_record)
+
+    def test_cli_score_confidence(self, valid_record, tmp_path):
+        """score --confidence 결과는 단건 추정과 동일"""
+        input_path = tmp_path / "input.jsonl"
+        output_path = tmp_path / "output.jsonl"
+        input_path.write_text(json.dumps(valid_record, ensure_ascii=False) + "\n", encoding="utf-8")
+
+        assert main(["score", str(input_path), "-o", str(output_path), "--workers", "1", "--confidence"]) == 0
+
+        result = json.loads(output_path.read_text(encoding="utf-8"))
+        assert result["confidence"] == score_record(valid_record, confidence=True)["confidence"]
@@ -0,0 +1,226 @@
+"""
+가중치 컴파일 단위 테스트
+"""
+
+import copy
+import itertools
+import json
+import os
+
+import pytest
+from app.core.predictor import (
+    predict_satisfaction,
+    calculate_speech_score_weight,
+    calculate_age_adjustment,
+    load_weights
+)
+from app.core.weights import (
+    CompiledWeights,
+    WeightsRegistry,
+    compile_weights,
+    get_compiled_weights,
+    LOSS_LEVELS,
+    DEVICE_TYPES,
+    LIFESTYLES,
+    BUDGETS,
+    FITTING_PLANS
+)
+
+
+def make_features(**overrides) -> dict:
+    """테스트용 특징 딕셔너리"""
+    features = {
+        'pta_avg': 52.5,
+        'pta_left': 45.0,
+        'pta_right': 60.0,
+        'loss_level': 'moderate',
+        'asymmetry_db': 15.0,
+        'speech_score': 72.5,
+        'tinnitus': False,
+        'experience': True,
+        'lifestyle': 'mixed',
+        'budget': 'mid',
+        'desired_type': 'RIC',
+        'fitting_plan': 'bilateral',
+        'age': 65
+    }
+    features.update(overrides)
+    return features
+
+
+class TestCompiledWeights:
+    """CompiledWeights 테스트"""
+
+    def test_compile_default(self):
+        """기본 가중치 컴파일 테스트"""
+        weights = load_weights()
+        compiled = compile_weights(weights)
+        assert isinstance(compiled, CompiledWeights)
+        assert compiled.base_score == weights['base_score']
+        assert compiled.binaural is not None
+
+    def test_range_lookup_matches_scan(self):
+        """구간 테이블 조회가 선형 탐색과 동일한지 테스트"""
+        weights = load_weights()
+        compiled = compile_weights(weights)
+
+        for i in range(-4, 2 * 105):
+            value = i / 2
+            assert compiled.speech_score.lookup(value) == calculate_speech_score_weight(value, weights)
+        for value in (30.25, 50.7, 70.9, 100.1):
+            assert compiled.speech_score.lookup(value) == calculate_speech_score_weight(value, weights)
+        for age in range(0, 115):
+            assert compiled.age.lookup(age) == calculate_age_adjustment(age, weights)
+
+    def test_identical_breakdown_grid(self):
+        """범주 조합 전체에서 딕셔너리 경로와 동일한 breakdown 테스트"""
+        weights = load_weights()
+        compiled = compile_weights(weights)
+
+        grid = itertools.product(
+            LOSS_LEVELS, DEVICE_TYPES, LIFESTYLES, BUDGETS, FITTING_PLANS,
+            (True, False), (True, False)
+        )
+        for loss_level, device, lifestyle, budget, plan, experience, tinnitus in grid:
+            for pta_left, pta_right, speech, age in ((30, 72.5, 50.5, 12), (55, 60, 85.5, 80)):
+                features = make_features(
+                    pta_left=pta_left,
+                    pta_right=pta_right,
+                    asymmetry_db=abs(pta_left - pta_right),
+                    speech_score=speech,
+                    age=age,
+                    loss_level=loss_level,
+                    desired_type=device,
+                    lifestyle=lifestyle,
+                    budget=budget,
+                    fitting_plan=plan,
+                    experience=experience,
+                    tinnitus=tinnitus
+                )
+                assert predict_satisfaction(features, compiled) == predict_satisfaction(features, weights)
+
+    def test_missing_section_rejected(self):
+        """필수 항목 누락 시 ValueError 테스트"""
+        weights = copy.deepcopy(load_weights())
+        del weights['type_mismatch_penalties']['severe']['CIC']
+
+        with pytest.raises(ValueError):
+            compile_weights(weights)
+
+    def test_invalid_range_rejected(self):
+        """잘못된 구간 설정 시 ValueError 테스트"""
+        weights = copy.deepcopy(load_weights())
+        weights['age_adjustment']['ranges'][0]['min'] = 200
+
+        with pytest.raises(ValueError):
+            compile_weights(weights)
+
+    def test_without_binaural(self):
+        """binaural 섹션이 없는 구버전 가중치 테스트"""
+        weights = copy.deepcopy(load_weights())
+        del weights['binaural']
+        compiled = compile_weights(weights)
+
+        features = make_features()
+        assert predict_satisfaction(features, compiled) == predict_satisfaction(features, weights)
+
+        with pytest.raises(KeyError):
+            predict_satisfaction(make_features(fitting_plan='unilateral_left'), compiled)
+
+
+class TestWeightsRegistry:
+    """가중치 캐시 테스트"""
+
+    def write_weights(self, path, base_score):
+        weights = copy.deepcopy(load_weights())
+        weights['base_score'] = base_score
+        path.write_text(json.dumps(weights), encoding='utf-8')
+
+    def test_cached_instance(self):
+        """같은 파일은 같은 객체 반환 테스트"""
+        registry = WeightsRegistry()
+        assert registry.get() is registry.get()
+        assert registry.get_compiled() is registry.get_compiled()
+        assert get_compiled_weights() is get_compiled_weights()
+
+    def test_reload_on_change(self, tmp_path):
+        """파일 변경 시 자동 재로드 테스트"""
+        path = tmp_path / 'weights.json'
+        self.write_weights(path, 40)
+        registry = WeightsRegistry(check_interval=0)
+        assert registry.get_compiled(path).base_score == 40
+
+        self.write_weights(path, 400)
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert registry.get_compiled(path).base_score == 400
+
+    def test_check_interval(self, tmp_path):
+        """check_interval 안에서는 파일을 다시 확인하지 않음 테스트"""
+        path = tmp_path / 'weights.json'
+        self.write_weights(path, 40)
+        registry = WeightsRegistry(check_interval=3600)
+        assert registry.get(path)['base_score'] == 40
+
+        self.write_weights(path, 400)
+        assert registry.get(path)['base_score'] == 40
+
+        registry.invalidate(path)
+        assert registry.get(path)['base_score'] == 400
+
+    def test_fingerprint_changes_with_file(self, tmp_path):
+        """version이 같아도 파일이 바뀌면 식별 문자열 변경 테스트"""
+        path = tmp_path / 'weights.json'
+        self.write_weights(path, 40)
+        registry = WeightsRegistry(check_interval=0)
+        first = registry.fingerprint(path)
+        assert first == registry.fingerprint(path)
+        assert first.startswith(f"{load_weights().get('version')}:")
+
+        self.write_weights(path, 400)
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert registry.fingerprint(path) != first
+
+    def test_broken_file_keeps_last_good(self, tmp_path, caplog):
+        """잘못된 파일로 바뀌면 이전 가중치 유지, 고친 파일은 다시 반영 테스트"""
+        path = tmp_path / 'weights.json'
+        self.write_weights(path, 40)
+        registry = WeightsRegistry(check_interval=0)
+        good = registry.get_compiled(path)
+        fingerprint = registry.fingerprint(path)
+
+        def touch(seconds):
+            stat = os.stat(path)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 1_000_000_000))
+
+        # 저장 중인 JSON (파싱 실패)
+        path.write_text('{"base_score": ', encoding='utf-8')
+        touch(1)
+        assert registry.get_compiled(path) is good
+        assert registry.get(path)['base_score'] == 40
+        assert registry.fingerprint(path) == fingerprint
+        assert "이전 가중치" in caplog.text
+
+        # 파싱은 되지만 컴파일 실패 (필수 항목 누락)
+        weights = copy.deepcopy(load_weights())
+        del weights['age_adjustment']
+        path.write_text(json.dumps(weights), encoding='utf-8')
+        touch(2)
+        assert registry.get_compiled(path) is good
+
+        self.write_weights(path, 400)
+        touch(3)
+        assert registry.get_compiled(path).base_score == 400
+
+    def test_broken_file_without_previous(self, tmp_path):
+        """이전에 읽은 적이 없으면 오류 테스트"""
+        path = tmp_path / 'weights.json'
+        path.write_text('{', encoding='utf-8')
+        with pytest.raises(ValueError):
+            WeightsRegistry().get(path)
+
+    def test_missing_file(self, tmp_path):
+        """파일 없음 오류 테스트"""
+        with pytest.raises(FileNotFoundError):
+            WeightsRegistry().get(tmp_path / 'missing.json')
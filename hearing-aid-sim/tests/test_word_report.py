@@ -0,0 +1,73 @@
+"""
+Word 리포트 생성 테스트
+"""
+
+from io import BytesIO
+
+from docx import Document
+from app.report import word_report
+from app.report.word_report import build_report_docx
+
+
+def report_args(customer_name: str, score: int = 72) -> tuple:
+    user_input_dict = {
+        "customer_name": customer_name,
+        "audiogram_left_pta": 46.7,
+        "audiogram_right_pta": 41.7,
+        "speech_score_left": 80,
+        "speech_score_right": 76,
+        "age": 68,
+    }
+    return user_input_dict, {"loss_level": "moderate"}, score, "높음", "요약입니다. 두번째.", ["추천"], {}
+
+
+def document_text(report: BytesIO) -> str:
+    return "\n".join(p.text for p in Document(BytesIO(report.getvalue())).paragraphs)
+
+
+class TestReportTemplate:
+    """기본 문서 복사 테스트"""
+
+    def test_customer_fields_filled(self):
+        """고객별 문구가 기본 문서의 빈 run에 채워짐"""
+        text = document_text(build_report_docx(*report_args("홍길동")))
+        assert "홍길동님을 위한 맞춤 분석" in text
+        assert "작성일: " in text
+        assert "홍길동님 안녕하세요." in text
+        assert "[1:1 맞춤 만족도 예측 서비스]" in text
+        assert "홍길동님의 청력 분석 결과" in text
+
+    def test_reports_do_not_share_state(self):
+        """연속 생성한 리포트끼리, 그리고 기본 문서와 내용이 섞이지 않음"""
+        first = document_text(build_report_docx(*report_args("김철수", 60)))
+        second = document_text(build_report_docx(*report_args("이영희", 90)))
+
+        assert "김철수" in first and "이영희" not in first
+        assert "이영희" in second and "김철수" not in second
+        assert first.count("100점 만점에") == second.count("100점 만점에") == 1
+
+        template, slots = word_report._report_template()
+        assert all(template.paragraphs[index].text == "" for index in slots.values())
+
+    def test_template_built_once(self, monkeypatch):
+        """기본 문서는 로고 파일이 바뀌지 않으면 다시 만들지 않음"""
+        build_report_docx(*report_args("홍길동"))
+        calls = []
+        original = word_report._build_template
+        monkeypatch.setattr(word_report, "_build_template", lambda: calls.append(1) or original())
+
+        build_report_docx(*report_args("홍길동"))
+        assert calls == []
+
+        monkeypatch.setattr(word_report, "_template", None)
+        build_report_docx(*report_args("홍길동"))
+        assert calls == [1]
+
+    def test_logo_embedded_once(self):
+        """로고 이미지는 리포트마다 한 번만 포함"""
+        if not word_report.LOGO_PATH.exists():
+            return
+        document = Document(BytesIO(build_report_docx(*report_args("홍길동")).getvalue()))
+        images = [rel for rel in document.part.rels.values() if "image" in rel.reltype]
+        assert len(images) == 1
+        assert images[0].target_part.blob == word_report.LOGO_PATH.read_bytes()